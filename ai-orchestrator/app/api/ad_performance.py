@@ -0,0 +1,129 @@
+"""
+Ad Performance API endpoints.
+
+Provides HTTP endpoints for ad performance functionality,
+including batch anomaly detection for Celery tasks.
+"""
+
+import time
+from datetime import UTC, datetime
+from typing import Literal
+
+import numpy as np
+import structlog
+from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import BaseModel, Field
+
+from app.core.auth import validate_service_token
+from app.modules.ad_performance.analyzers import AnomalyDetector
+from app.modules.ad_performance.models import Anomaly
+
+logger = structlog.get_logger(__name__)
+
+router = APIRouter(prefix="/ad-performance", tags=["ad-performance"])
+
+
+class AnomalyScanRequest(BaseModel):
+    """Request model for batch anomaly detection"""
+
+    entity_type: Literal["campaign", "adset", "ad"]
+    entity_ids: list[str] = Field(..., max_length=10000)
+    entity_names: list[str] | None = None
+    series: dict[str, list[list[float | None]]] = Field(
+        ...,
+        description="Metric name to rows of values, one row per entity in "
+        "entity_ids order; the last value of each row is scored against "
+        "the earlier ones, null marks missing points",
+    )
+    sensitivity: Literal["low", "medium", "high"] = "medium"
+    method: Literal["zscore", "mad"] = "zscore"
+    window: int | None = Field(None, ge=3)
+
+
+class AnomalyScanResponse(BaseModel):
+    """Response model for batch anomaly detection"""
+
+    status: str
+    entities_scanned: int
+    anomalies: list[Anomaly]
+    elapsed_ms: float
+
+
+@router.post("/anomalies/detect", response_model=AnomalyScanResponse)
+async def detect_anomalies(
+    request: AnomalyScanRequest,
+    _token: str = Depends(validate_service_token),
+) -> AnomalyScanResponse:
+    """
+    Detect anomalies for many entities and metrics in one call.
+
+    This endpoint is called by the daily Celery anomaly detection task
+    with each tenant's per-entity daily series. Each metric is scored as
+    one (entities x time) array.
+
+    Args:
+        request: Entities and their metric series
+        _token: Service authentication token (from dependency)
+
+    Returns:
+        AnomalyScanResponse: Flagged anomalies only
+    """
+    if request.entity_names is not None and len(request.entity_names) != len(
+        request.entity_ids
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="entity_names must match entity_ids",
+        )
+
+    started = time.perf_counter()
+    detector = AnomalyDetector()
+    detected_at = datetime.now(UTC).isoformat()
+    anomalies: list[Anomaly] = []
+
+    for metric, rows in request.series.items():
+        if len(rows) != len(request.entity_ids):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"series[{metric}] must have one row per entity",
+            )
+        if not rows:
+            continue
+
+        width = max(len(row) for row in rows)
+        values = np.full((len(rows), width), np.nan)
+        for i, row in enumerate(rows):
+            if row:
+                # Right-align so the last value of every row is the current one
+                values[i, width - len(row):] = np.array(row, dtype=float)
+
+        anomalies.extend(
+            detector.detect_batch(
+                metric=metric,
+                entity_type=request.entity_type,
+                entity_ids=request.entity_ids,
+                values=values,
+                entity_names=request.entity_names,
+                sensitivity=request.sensitivity,
+                method=request.method,
+                window=request.window,
+                detected_at=detected_at,
+            )
+        )
+
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+    logger.info(
+        "anomaly_scan_complete",
+        entity_type=request.entity_type,
+        entities_scanned=len(request.entity_ids),
+        metrics=len(request.series),
+        anomalies=len(anomalies),
+        elapsed_ms=elapsed_ms,
+    )
+
+    return AnomalyScanResponse(
+        status="success",
+        entities_scanned=len(request.entity_ids),
+        anomalies=anomalies,
+        elapsed_ms=elapsed_ms,
+    )
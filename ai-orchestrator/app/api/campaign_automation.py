@@ -25,6 +25,7 @@ class RuleCheckResponse(BaseModel):
     actions_taken: int
     results: list[dict]
     message: str
+    stats: dict = {}
 
 
 @router.post("/check-rules", response_model=RuleCheckResponse)
@@ -65,18 +66,24 @@ async def check_rules(
             for result in results
         )
         
+        stats = rule_engine.last_run_stats
+        rules_checked = stats.get("rules_checked", len(results))
+
         logger.info(
             "check_rules_complete",
-            rules_checked=len(results),
+            rules_checked=rules_checked,
             actions_taken=actions_taken,
+            rules_per_second=stats.get("rules_per_second"),
+            phase_ms=stats.get("phase_ms"),
         )
         
         return RuleCheckResponse(
             status="success",
-            rules_checked=len(results),
+            rules_checked=rules_checked,
             actions_taken=actions_taken,
             results=results,
-            message=f"Checked {len(results)} rules, took {actions_taken} actions",
+            message=f"Checked {rules_checked} rules, took {actions_taken} actions",
+            stats=stats,
         )
         
     except Exception as e:
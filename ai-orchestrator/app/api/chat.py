@@ -17,91 +17,13 @@ from fastapi import APIRouter, Header
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from app.core.agent_pool import get_agent_pool
 from app.core.i18n import detect_language, get_message
-from app.core.strands_enhanced_agent import StrandsEnhancedReActAgent
-from app.tools.registry import ToolRegistry
-# Tool factory imports
-from app.tools.strands_builtin_tools import create_strands_builtin_tools
-from app.tools.creative_tools import create_creative_tools
-from app.tools.campaign_tools import create_campaign_tools
-from app.tools.landing_page_tools import create_landing_page_tools
-from app.tools.market_tools import create_market_tools
-from app.tools.performance_tools import create_performance_tools
-from app.tools.mcp_tools import create_mcp_tools
-# Gemini Files API service
-from app.services.gemini_files import gemini_files_service
+from app.services.attachment_ingestion import AttachmentSource, ingest_attachments
 
 logger = structlog.get_logger(__name__)
 
 
-def _create_agent_with_tools(
-    model_provider: str = "gemini",
-    model_name: str | None = None,
-) -> StrandsEnhancedReActAgent:
-    """Create StrandsEnhancedReActAgent with all tools loaded.
-
-    This creates an Enhanced Strands Agent with full ReAct intelligence:
-    - Explicit Planner for task decomposition
-    - Explicit Evaluator for risk assessment and HITL
-    - Enhanced Memory for long-term learning
-    - Perceive logic for self-assessment
-    - 100% LangChain-free architecture
-
-    Tools are organized in 3 categories:
-    1. Strands built-in tools (no LangChain): google_search, calculator, datetime
-    2. Agent custom tools (5 capability modules):
-       - Creative: generate_image, generate_video, analyze_creative, extract_product_info
-       - Campaign: create_campaign, update_campaign, pause_campaign, get_campaigns
-       - Landing Page: generate_landing_page, preview_landing_page
-       - Market: analyze_competitors, get_market_trends, analyze_audience
-       - Performance: get_performance_report, analyze_anomalies, get_recommendations
-    3. MCP tools: Tools that interact with backend via MCP protocol
-
-    Args:
-        model_provider: AI model provider (gemini or bedrock)
-        model_name: Specific model ID to use
-    """
-    registry = ToolRegistry()
-
-    # 1. Register Strands built-in tools (LangChain-free)
-    builtin_tools = create_strands_builtin_tools()
-    registry.register_batch(builtin_tools)
-
-    # 2. Register Agent custom tools (5 capability modules)
-    creative_tools = create_creative_tools()
-    registry.register_batch(creative_tools)
-
-    campaign_tools = create_campaign_tools()
-    registry.register_batch(campaign_tools)
-
-    landing_page_tools = create_landing_page_tools()
-    registry.register_batch(landing_page_tools)
-
-    market_tools = create_market_tools()
-    registry.register_batch(market_tools)
-
-    performance_tools = create_performance_tools()
-    registry.register_batch(performance_tools)
-
-    # 3. Register MCP Server tools (backend data interaction)
-    mcp_tools = create_mcp_tools()
-    registry.register_batch(mcp_tools)
-
-    logger.info(
-        "enhanced_agent_tools_loaded",
-        total_tools=len(registry.get_all_tools()),
-        stats=registry.get_stats(),
-        model_provider=model_provider,
-        model_name=model_name,
-        architecture="Strands Enhanced ReAct",
-    )
-
-    return StrandsEnhancedReActAgent(
-        model_provider=model_provider,
-        model_name=model_name,
-        tool_registry=registry,
-    )
-
 router = APIRouter()
 
 
@@ -190,6 +112,7 @@ async def chat_stream(
         - type: "thought" - Agent's reasoning process (streaming)
         - type: "action" - Agent executing a tool
         - type: "observation" - Tool execution result
+        - type: "progress" - Partial tool result, sent while the tool runs
         - type: "text" - Final response text
         - type: "user_input_request" - Needs user confirmation/input
         - type: "done" - Response complete
@@ -218,6 +141,9 @@ async def chat_stream(
     # Handle processed attachments, temp attachments, and new format attachments
     attachments = []
 
+    # Attachments still to be ingested into the Gemini Files API, by index
+    pending: dict[int, AttachmentSource] = {}
+
     # Process new-format attachments (with gcs_path)
     if last_message_obj and last_message_obj.attachments:
         log.info("Processing attachments", count=len(last_message_obj.attachments))
@@ -234,122 +160,62 @@ async def chat_stream(
                 "type": content_type.split('/')[0] if '/' in content_type else 'other',
             }
 
-            # Check if we need to upload to Gemini (new format without geminiFileUri)
-            if not att.geminiFileUri:
-                # Priority 1: Use download_url (signed HTTPS URL) - more reliable
-                if att.download_url:
-                    log.info(
-                        "Uploading attachment to Gemini via download_url",
-                        filename=att.filename,
-                        download_url=att.download_url[:100] + "...",
-                    )
-
-                    # Download from URL and upload to Gemini Files API
-                    gemini_result = gemini_files_service.upload_from_url(
-                        url=att.download_url,
-                        mime_type=content_type,
-                        display_name=att.filename,
-                    )
-
-                    if gemini_result:
-                        attachment_info["geminiFileUri"] = gemini_result["uri"]
-                        attachment_info["geminiFileName"] = gemini_result["name"]
-                        log.info(
-                            "Uploaded to Gemini via download_url",
-                            filename=att.filename,
-                            gemini_uri=gemini_result["uri"],
-                        )
-                    else:
-                        log.warning(
-                            "Failed to upload to Gemini via download_url",
-                            filename=att.filename,
-                        )
-
-                # Priority 2: Fallback to GCS SDK if download_url not available
-                elif att.gcs_path:
-                    from app.core.config import get_settings
-                    settings = get_settings()
-                    gcs_uri = f"gs://{settings.gcs_bucket_uploads}/{att.gcs_path}"
-
-                    log.info(
-                        "Uploading attachment to Gemini via GCS",
-                        filename=att.filename,
-                        gcs_path=att.gcs_path,
-                    )
-
-                    # Upload to Gemini Files API
-                    gemini_result = gemini_files_service.upload_from_gcs(
-                        gcs_uri=gcs_uri,
-                        mime_type=content_type,
-                        display_name=att.filename,
-                    )
-
-                    if gemini_result:
-                        attachment_info["geminiFileUri"] = gemini_result["uri"]
-                        attachment_info["geminiFileName"] = gemini_result["name"]
-                        log.info(
-                            "Uploaded to Gemini via GCS",
-                            filename=att.filename,
-                            gemini_uri=gemini_result["uri"],
-                        )
-                    else:
-                        log.warning(
-                            "Failed to upload to Gemini via GCS",
-                            filename=att.filename,
-                            gcs_uri=gcs_uri,
-                        )
-            elif att.geminiFileUri:
+            if att.geminiFileUri:
                 # Already has Gemini URI (legacy or pre-uploaded)
                 attachment_info["geminiFileUri"] = att.geminiFileUri
                 attachment_info["geminiFileName"] = att.geminiFileName
+            elif att.gcs_path or att.download_url:
+                # gcs_path is the object key in the creatives bucket; the
+                # signed download_url is the fallback
+                pending[len(attachments)] = AttachmentSource(
+                    filename=att.filename,
+                    mime_type=content_type,
+                    s3_key=att.gcs_path,
+                    url=att.download_url,
+                    size=file_size,
+                )
 
             attachments.append(attachment_info)
 
     # Process temp attachments (legacy format) - kept for backward compatibility
     if last_message_obj and last_message_obj.tempAttachments:
         log.info("Processing temp attachments (legacy)", count=len(last_message_obj.tempAttachments))
-        from app.core.config import get_settings
-        settings = get_settings()
-
         for temp_att in last_message_obj.tempAttachments:
-            # Construct GCS URI (legacy temp bucket)
-            gcs_uri = f"gs://{settings.gcs_bucket_uploads}/{temp_att.fileKey}"
-
-            # Upload to Gemini Files API
-            gemini_result = gemini_files_service.upload_from_gcs(
-                gcs_uri=gcs_uri,
+            pending[len(attachments)] = AttachmentSource(
+                filename=temp_att.filename,
                 mime_type=temp_att.contentType,
-                display_name=temp_att.filename,
+                s3_key=temp_att.fileKey,
+                size=temp_att.size,
             )
-
-            # Build attachment info
-            attachment_info = {
+            attachments.append({
                 "fileId": temp_att.fileId,
                 "filename": temp_att.filename,
                 "contentType": temp_att.contentType,
                 "size": temp_att.size,
                 "type": temp_att.contentType.split('/')[0] if '/' in temp_att.contentType else 'other',
-            }
-
+                "geminiFileUri": None,
+                "geminiFileName": None,
+            })
+
+    # Upload to Gemini Files API concurrently; known files are reused
+    if pending:
+        results = await ingest_attachments(list(pending.values()))
+        for index, gemini_result in zip(pending, results, strict=True):
+            attachment_info = attachments[index]
             if gemini_result:
                 attachment_info["geminiFileUri"] = gemini_result["uri"]
                 attachment_info["geminiFileName"] = gemini_result["name"]
                 log.info(
-                    "Uploaded temp attachment to Gemini",
-                    filename=temp_att.filename,
+                    "Attachment available in Gemini",
+                    filename=attachment_info["filename"],
                     gemini_uri=gemini_result["uri"],
                 )
             else:
-                attachment_info["geminiFileUri"] = None
-                attachment_info["geminiFileName"] = None
                 log.warning(
-                    "Failed to upload temp attachment to Gemini",
-                    filename=temp_att.filename,
-                    gcs_uri=gcs_uri,
+                    "Failed to upload attachment to Gemini",
+                    filename=attachment_info["filename"],
                 )
 
-            attachments.append(attachment_info)
-
     # Extract model preferences (default to Gemini if not provided)
     model_provider = "gemini"
     model_name = "gemini-2.5-flash"
@@ -387,8 +253,8 @@ async def chat_stream(
             # Flush the event to client
             await asyncio.sleep(0)
 
-            # Now create agent with user's model preferences (this may take a moment)
-            agent = _create_agent_with_tools(
+            # Shared agent for the user's model preferences; built on first use
+            agent = get_agent_pool().get_agent(
                 model_provider=model_provider,
                 model_name=model_name,
             )
@@ -467,6 +333,10 @@ async def chat_stream(
 
                     yield f"data: {json.dumps(observation_data, ensure_ascii=False)}\n\n"
 
+                elif event_type == "progress":
+                    # Partial tool result (e.g. a landing page version), streamed as it completes
+                    yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+
                 elif event_type == "text":
                     # Final response text
                     yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
@@ -12,7 +12,9 @@ from typing import Any
 import structlog
 from fastapi import APIRouter
 
+from app.core.cache import get_cache_stats
 from app.core.config import get_settings
+from app.core.rate_limiter import get_rate_limit_stats
 from app.core.redis_client import RedisConnectionError
 from app.core.redis_client import ping as redis_ping
 from app.services.mcp_client import MCPClient, MCPError
@@ -133,6 +135,8 @@ async def health_check() -> dict[str, Any]:
     response = {
         "status": overall_status,
         "checks": checks,
+        "caches": get_cache_stats(),
+        "rate_limits": get_rate_limit_stats(),
         "timestamp": datetime.now(UTC).isoformat(),
         "environment": settings.environment,
         "version": "1.0.0",
@@ -0,0 +1,92 @@
+"""Video operation status endpoints.
+
+Video operations are tracked by the shared video operation tracker.
+Services holding an operation handle read its state here or subscribe
+to the SSE stream, which pushes every update until the video is done.
+
+Requirements: Video generation capability
+"""
+
+import json
+from typing import Any
+
+import structlog
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from app.core.auth import validate_service_token
+from app.services.video_operation_tracker import get_video_operation_tracker
+
+logger = structlog.get_logger(__name__)
+
+router = APIRouter(prefix="/video-operations", tags=["video-operations"])
+
+# Seconds between SSE keep-alive comments while nothing changes
+HEARTBEAT_INTERVAL = 15.0
+
+
+def _public_view(record: dict[str, Any]) -> dict[str, Any]:
+    """Fields of an operation record that are returned to clients."""
+    return {
+        "id": record["id"],
+        "status": record["status"],
+        "progress": record.get("progress", 0),
+        "result": record.get("result"),
+        "error": record.get("error"),
+        "created_at": record["created_at"],
+        "updated_at": record["updated_at"],
+    }
+
+
+async def _get_owned_operation(handle: str, user_id: str) -> dict[str, Any]:
+    """Load an operation, raising 404 unless it belongs to the user."""
+    record = await get_video_operation_tracker().get(handle)
+    if record is None or record.get("user_id") != user_id:
+        raise HTTPException(status_code=404, detail="Video operation not found")
+    return record
+
+
+@router.get("/{handle}")
+async def get_video_operation(
+    handle: str,
+    user_id: str = Query(..., description="User identifier"),
+    _token: str = Depends(validate_service_token),
+) -> dict[str, Any]:
+    """Get the current state of a video operation."""
+    return _public_view(await _get_owned_operation(handle, user_id))
+
+
+@router.get("/{handle}/events")
+async def stream_video_operation(
+    handle: str,
+    user_id: str = Query(..., description="User identifier"),
+    _token: str = Depends(validate_service_token),
+) -> StreamingResponse:
+    """Stream video operation updates with Server-Sent Events.
+
+    Emits one "video_operation" event with the current state, then one per
+    change, and closes after the completed, failed or timeout event.
+    """
+    await _get_owned_operation(handle, user_id)
+    tracker = get_video_operation_tracker()
+
+    async def generate():
+        try:
+            async for record in tracker.events(handle, heartbeat=HEARTBEAT_INTERVAL):
+                if record is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                event = {"type": "video_operation", **_public_view(record)}
+                yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+        except KeyError:
+            yield f"data: {json.dumps({'type': 'error', 'error': 'Video operation expired'})}\n\n"
+
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -0,0 +1,149 @@
+"""App-lifetime pool of ready-to-use chat agents.
+
+Building an agent used to happen inside every /chat request: a fresh
+ToolRegistry, every create_*_tools() factory with its own clients, a new
+model, and the Strands conversion of ~40 tools. None of that depends on
+the request, so the registry is built once per process and agents are
+kept per (provider, model). Request state (user, session, history,
+model preferences) is passed to the agent on each call instead.
+"""
+
+from collections import OrderedDict
+
+import structlog
+
+from app.core.strands_enhanced_agent import StrandsEnhancedReActAgent
+from app.tools.campaign_tools import create_campaign_tools
+from app.tools.creative_tools import create_creative_tools
+from app.tools.landing_page_tools import create_landing_page_tools
+from app.tools.market_tools import create_market_tools
+from app.tools.mcp_tools import create_mcp_tools
+from app.tools.performance_tools import create_performance_tools
+from app.tools.registry import ToolRegistry
+from app.tools.strands_builtin_tools import create_strands_builtin_tools
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_PROVIDER = "gemini"
+DEFAULT_MODEL = "gemini-2.5-flash"
+
+# Distinct (provider, model) agents kept before the least recently used
+# one is dropped; model names come from user preferences
+MAX_AGENTS = 16
+
+
+def build_tool_registry() -> ToolRegistry:
+    """Create a ToolRegistry with all tools loaded.
+
+    Tools are organized in 3 categories:
+    1. Strands built-in tools (no LangChain): google_search, calculator, datetime
+    2. Agent custom tools (5 capability modules):
+       - Creative: generate_image, generate_video, analyze_creative, extract_product_info
+       - Campaign: create_campaign, update_campaign, pause_campaign, get_campaigns
+       - Landing Page: generate_landing_page, preview_landing_page
+       - Market: analyze_competitors, get_market_trends, analyze_audience
+       - Performance: get_performance_report, analyze_anomalies, get_recommendations
+    3. MCP tools: Tools that interact with backend via MCP protocol
+    """
+    registry = ToolRegistry()
+
+    # 1. Register Strands built-in tools (LangChain-free)
+    registry.register_batch(create_strands_builtin_tools())
+
+    # 2. Register Agent custom tools (5 capability modules)
+    registry.register_batch(create_creative_tools())
+    registry.register_batch(create_campaign_tools())
+    registry.register_batch(create_landing_page_tools())
+    registry.register_batch(create_market_tools())
+    registry.register_batch(create_performance_tools())
+
+    # 3. Register MCP Server tools (backend data interaction)
+    registry.register_batch(create_mcp_tools())
+
+    logger.info(
+        "enhanced_agent_tools_loaded",
+        total_tools=len(registry.get_all_tools()),
+        stats=registry.get_stats(),
+        architecture="Strands Enhanced ReAct",
+    )
+    return registry
+
+
+class AgentPool:
+    """Shares one tool registry and one agent per (provider, model).
+
+    Example:
+        agent = get_agent_pool().get_agent("gemini", "gemini-2.5-flash")
+        async for event in agent.process_message_stream(...):
+            ...
+    """
+
+    def __init__(self, max_agents: int = MAX_AGENTS):
+        self.max_agents = max_agents
+        self._registry: ToolRegistry | None = None
+        self._agents: OrderedDict[tuple[str, str | None], StrandsEnhancedReActAgent] = (
+            OrderedDict()
+        )
+
+    @property
+    def registry(self) -> ToolRegistry:
+        if self._registry is None:
+            self._registry = build_tool_registry()
+        return self._registry
+
+    def get_agent(
+        self,
+        model_provider: str = DEFAULT_PROVIDER,
+        model_name: str | None = None,
+    ) -> StrandsEnhancedReActAgent:
+        """Get the shared agent for a provider and model, building it once."""
+        key = (model_provider, model_name)
+        agent = self._agents.get(key)
+        if agent is not None:
+            self._agents.move_to_end(key)
+            return agent
+
+        agent = StrandsEnhancedReActAgent(
+            model_provider=model_provider,
+            model_name=model_name,
+            tool_registry=self.registry,
+        )
+        agent.warm_up()
+        self._agents[key] = agent
+        if len(self._agents) > self.max_agents:
+            # Not closed here: the evicted agent may still be serving a stream
+            self._agents.popitem(last=False)
+
+        logger.info(
+            "agent_pool_agent_created",
+            model_provider=model_provider,
+            model_name=model_name,
+            pooled_agents=len(self._agents),
+        )
+        return agent
+
+    def warm_up(self) -> None:
+        """Build the registry and the default agent before the first request."""
+        self.get_agent(DEFAULT_PROVIDER, DEFAULT_MODEL)
+
+    async def close(self) -> None:
+        """Close every agent's clients."""
+        agents = list(self._agents.values())
+        self._agents.clear()
+        for agent in agents:
+            try:
+                await agent.close()
+            except Exception as e:
+                logger.warning("agent_pool_close_failed", error=str(e))
+
+
+# Global agent pool instance
+_pool: AgentPool | None = None
+
+
+def get_agent_pool() -> AgentPool:
+    """Get the process-wide agent pool."""
+    global _pool
+    if _pool is None:
+        _pool = AgentPool()
+    return _pool
@@ -0,0 +1,471 @@
+"""Shared two-level cache for module data.
+
+Values are kept in a small in-process LRU (L1) in front of Redis (L2).
+Each Redis entry stores the value with the time it was cached and the
+time it stops being fresh; the key itself lives on for an extra stale
+window. Within that window get_or_fetch() returns the stale value at once
+and refreshes it in the background; if the refresh fails the stale value
+keeps being served until the window ends.
+
+Only one caller fetches a missing key at a time: concurrent callers in a
+process share one fetch, and across processes a Redis lock with an owner
+token lets one replica fetch while the others wait for its result.
+
+Values are serialized with orjson, which is compact and, unlike msgpack,
+safe with the decode_responses=True client. Each namespace records hits,
+misses and fetch latency, reported by get_cache_stats().
+"""
+
+import asyncio
+import fnmatch
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import orjson
+import structlog
+from redis.asyncio import Redis
+
+from app.core.rate_limiter import Priority, rate_limit_priority
+from app.core.redis_client import get_redis
+
+logger = structlog.get_logger(__name__)
+
+# Entries kept in process per namespace, and the longest they are trusted
+# without checking Redis (bounds staleness after another replica writes)
+L1_MAX_ENTRIES = 1024
+L1_MAX_AGE = 60.0
+
+# Seconds a cross-process fetch lock is held, and how often waiters poll
+LOCK_TIMEOUT = 30.0
+LOCK_POLL_INTERVAL = 0.05
+
+LOCK_KEY_PREFIX = "cache_lock:"
+
+# Release the fetch lock only while this caller still owns it
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class CacheSerializationError(ValueError):
+    """Raised when a value cannot be serialized for the cache."""
+
+
+@dataclass
+class CacheStats:
+    """Counters for one cache namespace."""
+
+    l1_hits: int = 0
+    l2_hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    fetches: int = 0
+    fetch_errors: int = 0
+    errors: int = 0
+    fetch_seconds: float = 0.0
+    l2_seconds: float = 0.0
+    l2_requests: int = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        data = asdict(self)
+        lookups = self.l1_hits + self.l2_hits + self.stale_hits + self.misses
+        data["hit_ratio"] = round((lookups - self.misses) / lookups, 4) if lookups else 0.0
+        data["avg_fetch_ms"] = (
+            round(self.fetch_seconds / self.fetches * 1000, 2) if self.fetches else 0.0
+        )
+        data["avg_l2_ms"] = (
+            round(self.l2_seconds / self.l2_requests * 1000, 2) if self.l2_requests else 0.0
+        )
+        return data
+
+
+_stats: dict[str, CacheStats] = {}
+
+
+def get_cache_stats() -> dict[str, dict[str, Any]]:
+    """Hit/miss/latency counters of every namespace in this process."""
+    return {name: stats.snapshot() for name, stats in _stats.items()}
+
+
+@dataclass
+class CacheEntry:
+    """A cached value with its timestamps (epoch seconds)."""
+
+    value: Any
+    cached_at: float
+    fresh_until: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.fresh_until
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.cached_at
+
+
+def dumps(entry: CacheEntry) -> str:
+    try:
+        return orjson.dumps(
+            {"v": entry.value, "t": entry.cached_at, "f": entry.fresh_until}
+        ).decode()
+    except TypeError as e:
+        raise CacheSerializationError(str(e)) from e
+
+
+def loads(raw: str | bytes) -> CacheEntry:
+    data = orjson.loads(raw)
+    return CacheEntry(value=data["v"], cached_at=data["t"], fresh_until=data["f"])
+
+
+class Cache:
+    """One cache namespace: L1 LRU + Redis, single-flight, stale-while-revalidate.
+
+    Keys are used in Redis as given, so callers keep their own key layout.
+
+    Args:
+        namespace: Name reported in stats and logs
+        redis: Redis client; the shared client is used when None
+        ttl: Default seconds a value is fresh
+        stale_ttl: Seconds a value is kept after it stops being fresh
+        l1_max_entries: In-process entries kept; 0 disables L1
+
+    Example:
+        cache = Cache("market_trends", ttl=86400, stale_ttl=604800)
+        trends = await cache.get_or_fetch(key, lambda: fetch_trends(...))
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        redis: Redis | None = None,
+        ttl: int = 300,
+        stale_ttl: int = 0,
+        l1_max_entries: int = L1_MAX_ENTRIES,
+        l1_max_age: float = L1_MAX_AGE,
+        lock_timeout: float = LOCK_TIMEOUT,
+    ):
+        self.namespace = namespace
+        self.redis = redis
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.l1_max_entries = l1_max_entries
+        self.l1_max_age = l1_max_age
+        self.lock_timeout = lock_timeout
+        self.stats = _stats.setdefault(namespace, CacheStats())
+
+        # key -> (entry, monotonic time it was stored in L1)
+        self._l1: OrderedDict[str, tuple[CacheEntry, float]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._refreshing: set[str] = set()
+        self._refreshes: set[asyncio.Task] = set()
+
+    # =========================================================================
+    # Reads and writes
+    # =========================================================================
+
+    async def get(self, key: str) -> Any | None:
+        """Get a fresh value, or None."""
+        entry = await self.get_entry(key)
+        if entry is None or not entry.is_fresh:
+            self.stats.misses += 1
+            return None
+        return entry.value
+
+    async def get_stale(self, key: str, max_age: float | None = None) -> Any | None:
+        """Get a value even past its freshness, if it is younger than max_age."""
+        entry = await self.get_entry(key)
+        if entry is None or (max_age is not None and entry.age >= max_age):
+            return None
+        if not entry.is_fresh:
+            self.stats.stale_hits += 1
+        return entry.value
+
+    async def get_entry(self, key: str) -> CacheEntry | None:
+        """Look a key up in L1, then Redis; counts hits, not misses."""
+        entry = self._l1_get(key)
+        if entry is not None and entry.is_fresh:
+            self.stats.l1_hits += 1
+            return entry
+
+        redis = await self._get_redis()
+        if redis is None:
+            return entry
+
+        start = time.perf_counter()
+        try:
+            raw = await redis.get(key)
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning("cache_get_error", namespace=self.namespace, key=key, error=str(e))
+            return entry
+        finally:
+            self._record_l2(start)
+
+        if raw is None:
+            self._l1.pop(key, None)
+            return None
+
+        try:
+            entry = loads(raw)
+        except (orjson.JSONDecodeError, KeyError, TypeError) as e:
+            self.stats.errors += 1
+            logger.warning("cache_parse_error", namespace=self.namespace, key=key, error=str(e))
+            await self._delete_quietly(redis, key)
+            return None
+
+        self._l1_put(key, entry)
+        if entry.is_fresh:
+            self.stats.l2_hits += 1
+        return entry
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        """Store a value, fresh for ttl seconds plus the stale window.
+
+        Raises:
+            CacheSerializationError: If the value is not serializable
+        """
+        now = time.time()
+        entry = CacheEntry(value=value, cached_at=now, fresh_until=now + (ttl or self.ttl))
+        raw = dumps(entry)
+        self._l1_put(key, entry)
+
+        redis = await self._get_redis()
+        if redis is None:
+            return False
+
+        start = time.perf_counter()
+        try:
+            await redis.set(key, raw, ex=(ttl or self.ttl) + self.stale_ttl)
+            return True
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning("cache_set_error", namespace=self.namespace, key=key, error=str(e))
+            return False
+        finally:
+            self._record_l2(start)
+
+    async def delete(self, *keys: str) -> int:
+        """Remove keys; returns how many existed in Redis."""
+        for key in keys:
+            self._l1.pop(key, None)
+        redis = await self._get_redis()
+        if redis is None or not keys:
+            return 0
+        return await redis.delete(*keys)
+
+    async def delete_matching(self, pattern: str) -> int:
+        """Remove keys matching a glob pattern; returns how many existed in Redis."""
+        for key in [k for k in self._l1 if fnmatch.fnmatchcase(k, pattern)]:
+            del self._l1[key]
+
+        redis = await self._get_redis()
+        if redis is None:
+            return 0
+        keys = [key async for key in redis.scan_iter(match=pattern)]
+        if not keys:
+            return 0
+        return await redis.delete(*keys)
+
+    # =========================================================================
+    # Fetch-through
+    # =========================================================================
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: int | None = None,
+        max_stale: float | None = None,
+    ) -> Any:
+        """Get a value, fetching it at most once per key across callers.
+
+        A fresh value is returned directly. A stale one is returned too,
+        and refreshed in the background, if it expired less than max_stale
+        seconds ago (default: anywhere in the stale window); older values
+        count as a miss. On a miss one caller fetches and the rest wait
+        for its result.
+
+        Raises:
+            Exception: Whatever fetch raised on a miss
+        """
+        entry = await self.get_entry(key)
+        if entry is not None:
+            if entry.is_fresh:
+                return entry.value
+            if max_stale is None or time.time() - entry.fresh_until < max_stale:
+                self.stats.stale_hits += 1
+                self._schedule_refresh(key, fetch, ttl)
+                return entry.value
+
+        self.stats.misses += 1
+        return await self._fetch_once(key, fetch, ttl)
+
+    async def _fetch_once(
+        self, key: str, fetch: Callable[[], Awaitable[Any]], ttl: int | None
+    ) -> Any:
+        """Share one in-flight fetch per key within this process."""
+        future = self._inflight.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._fetch_locked(key, fetch, ttl)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception retrieved when no other caller was waiting
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _fetch_locked(
+        self, key: str, fetch: Callable[[], Awaitable[Any]], ttl: int | None
+    ) -> Any:
+        """Fetch under the cross-process lock, or wait for the lock holder's value."""
+        redis = await self._get_redis()
+        token = uuid.uuid4().hex
+        lock_key = LOCK_KEY_PREFIX + key
+        locked = await self._acquire_lock(redis, lock_key, token)
+
+        if not locked:
+            # Another replica is fetching: wait for its value
+            deadline = time.monotonic() + self.lock_timeout
+            while time.monotonic() < deadline:
+                await asyncio.sleep(LOCK_POLL_INTERVAL)
+                entry = await self.get_entry(key)
+                if entry is not None and entry.is_fresh:
+                    return entry.value
+                locked = await self._acquire_lock(redis, lock_key, token)
+                if locked:
+                    break
+
+        try:
+            return await self._fetch_and_store(key, fetch, ttl)
+        finally:
+            if locked:
+                await self._release_lock(redis, lock_key, token)
+
+    async def _fetch_and_store(
+        self, key: str, fetch: Callable[[], Awaitable[Any]], ttl: int | None
+    ) -> Any:
+        self.stats.fetches += 1
+        start = time.perf_counter()
+        try:
+            value = await fetch()
+        except Exception as e:
+            self.stats.fetch_errors += 1
+            logger.warning("cache_fetch_failed", namespace=self.namespace, key=key, error=str(e))
+            raise
+        finally:
+            self.stats.fetch_seconds += time.perf_counter() - start
+
+        try:
+            await self.set(key, value, ttl)
+        except CacheSerializationError as e:
+            self.stats.errors += 1
+            logger.warning("cache_serialization_error", namespace=self.namespace, key=key, error=str(e))
+        return value
+
+    def _schedule_refresh(
+        self, key: str, fetch: Callable[[], Awaitable[Any]], ttl: int | None
+    ) -> None:
+        """Refresh a stale key in the background, once per key."""
+        if key in self._refreshing or key in self._inflight:
+            return
+
+        async def refresh() -> None:
+            redis = await self._get_redis()
+            token = uuid.uuid4().hex
+            lock_key = LOCK_KEY_PREFIX + key
+            # Another replica already refreshing is as good as refreshing here
+            if not await self._acquire_lock(redis, lock_key, token):
+                return
+            try:
+                # Nobody waits on a refresh: let interactive requests go first
+                with rate_limit_priority(Priority.BACKGROUND):
+                    await self._fetch_and_store(key, fetch, ttl)
+            except Exception:
+                pass  # logged in _fetch_and_store; the stale value stays
+            finally:
+                await self._release_lock(redis, lock_key, token)
+
+        def done(task: asyncio.Task) -> None:
+            self._refreshes.discard(task)
+            self._refreshing.discard(key)
+
+        self._refreshing.add(key)
+        task = asyncio.create_task(refresh())
+        self._refreshes.add(task)
+        task.add_done_callback(done)
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    async def _get_redis(self) -> Redis | None:
+        if self.redis is not None:
+            return self.redis
+        try:
+            return await get_redis()
+        except Exception:
+            return None
+
+    async def _acquire_lock(self, redis: Redis | None, lock_key: str, token: str) -> bool:
+        if redis is None:
+            return True
+        try:
+            return bool(
+                await redis.set(lock_key, token, nx=True, px=int(self.lock_timeout * 1000))
+            )
+        except Exception as e:
+            logger.warning("cache_lock_error", namespace=self.namespace, error=str(e))
+            return True
+
+    async def _release_lock(self, redis: Redis | None, lock_key: str, token: str) -> None:
+        if redis is None:
+            return
+        try:
+            await redis.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        except Exception as e:
+            logger.warning("cache_lock_release_error", namespace=self.namespace, error=str(e))
+
+    async def _delete_quietly(self, redis: Redis, key: str) -> None:
+        try:
+            await redis.delete(key)
+        except Exception:
+            pass
+
+    def _record_l2(self, start: float) -> None:
+        self.stats.l2_requests += 1
+        self.stats.l2_seconds += time.perf_counter() - start
+
+    def _l1_get(self, key: str) -> CacheEntry | None:
+        item = self._l1.get(key)
+        if item is None:
+            return None
+        entry, stored_at = item
+        if time.monotonic() - stored_at > self.l1_max_age:
+            del self._l1[key]
+            return None
+        self._l1.move_to_end(key)
+        return entry
+
+    def _l1_put(self, key: str, entry: CacheEntry) -> None:
+        if self.l1_max_entries <= 0:
+            return
+        self._l1[key] = (entry, time.monotonic())
+        self._l1.move_to_end(key)
+        while len(self._l1) > self.l1_max_entries:
+            self._l1.popitem(last=False)
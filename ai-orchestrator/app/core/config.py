@@ -56,6 +56,10 @@ class Settings(BaseSettings):
         default="gemini-3-pro-image-preview",
         description="Gemini 3 Pro Image for high-quality image generation (up to 4K)",
     )
+    gemini_image_requests_per_minute: int = Field(
+        default=30,
+        description="Image generation requests per minute across all replicas",
+    )
 
     # Video generation models (Veo 3.1)
     # Reference: https://ai.google.dev/gemini-api/docs/video
@@ -98,6 +102,9 @@ class Settings(BaseSettings):
     sagemaker_region: str = Field(default="us-west-2", description="AWS SageMaker region")
     sagemaker_qwen_image_endpoint: str = Field(default="", description="SageMaker Qwen-Image endpoint name")
     sagemaker_wan_video_endpoint: str = Field(default="", description="SageMaker Wan2.2 video endpoint name")
+    sagemaker_requests_per_minute: int = Field(
+        default=30, description="Invocations per minute per SageMaker endpoint across all replicas"
+    )
 
     # Web Platform integration
     web_platform_url: str = Field(
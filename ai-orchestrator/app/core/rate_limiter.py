@@ -0,0 +1,388 @@
+"""Cluster-wide token-bucket rate limiting for external providers.
+
+Each limiter is a token bucket kept in Redis and updated by one Lua
+script, so the rate holds across every orchestrator replica. Waiters
+queue in a Redis sorted set and only take a token when every waiter
+ahead of them can be served too, so requests are admitted in order
+instead of whichever poller wakes first. The queue is ordered by priority
+class and arrival: a background waiter yields to interactive requests
+that arrive up to PRIORITY_DELAY_MS later, so chat is served first while
+background work still can't be starved.
+
+Waiters wait without holding any lock, and the limiter falls back to an
+in-process bucket with the same rules when Redis is unavailable. Wait
+times are recorded per limiter and priority, reported by
+get_rate_limit_stats().
+
+Example:
+    await get_rate_limiter("pytrends").acquire()
+
+    with rate_limit_priority(Priority.BACKGROUND):
+        await fetcher.get_market_trends(...)
+"""
+
+import asyncio
+import bisect
+import math
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any
+
+import structlog
+
+from app.core.config import get_settings
+from app.core.redis_client import RedisConnectionError, get_redis
+
+logger = structlog.get_logger(__name__)
+
+
+class Priority(IntEnum):
+    """Request classes, most urgent first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+# Milliseconds a waiter of each class yields to later interactive waiters
+PRIORITY_DELAY_MS = {
+    Priority.INTERACTIVE: 0,
+    Priority.BACKGROUND: 30_000,
+}
+
+# Longest sleep between queue checks; queue order can change meanwhile
+MAX_POLL_INTERVAL = 1.0
+# A waiter that has not checked in for this long has left the queue
+WAITER_TTL_MS = 5_000
+
+# Upper bounds (seconds) of the wait-time histogram buckets
+WAIT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+KEY_PREFIX = "token_bucket:"
+
+# KEYS: bucket hash, waiter queue (zset by position), waiter heartbeats
+# ARGV: tokens per ms, capacity, ticket, priority delay ms, waiter ttl ms,
+#       1 to queue until served / 0 to only try
+# Returns {granted (0/1), ms until this waiter can expect a token}
+TOKEN_BUCKET_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local ticket = ARGV[3]
+local delay = tonumber(ARGV[4])
+local waiter_ttl = tonumber(ARGV[5])
+local queue = tonumber(ARGV[6]) == 1
+
+local dead = redis.call('ZRANGEBYSCORE', KEYS[3], '-inf', now - waiter_ttl, 'LIMIT', 0, 100)
+if #dead > 0 then
+    redis.call('ZREM', KEYS[2], unpack(dead))
+    redis.call('ZREM', KEYS[3], unpack(dead))
+end
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local ahead
+if queue then
+    redis.call('ZADD', KEYS[2], 'NX', now + delay, ticket)
+    redis.call('ZADD', KEYS[3], now, ticket)
+    ahead = redis.call('ZRANK', KEYS[2], ticket)
+else
+    ahead = redis.call('ZCOUNT', KEYS[2], '-inf', '(' .. (now + delay))
+end
+
+local granted = 0
+local wait = 0
+if tokens >= ahead + 1 then
+    tokens = tokens - 1
+    granted = 1
+    redis.call('ZREM', KEYS[2], ticket)
+    redis.call('ZREM', KEYS[3], ticket)
+else
+    wait = math.ceil((ahead + 1 - tokens) / rate)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+local ttl = math.ceil(capacity / rate) + waiter_ttl
+redis.call('PEXPIRE', KEYS[1], ttl)
+redis.call('PEXPIRE', KEYS[2], ttl)
+redis.call('PEXPIRE', KEYS[3], ttl)
+return {granted, wait}
+"""
+
+_priority: ContextVar[Priority] = ContextVar("rate_limit_priority", default=Priority.INTERACTIVE)
+
+
+@contextmanager
+def rate_limit_priority(priority: Priority) -> Iterator[None]:
+    """Run the enclosed provider calls (and tasks started in it) at a priority."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> Priority:
+    return _priority.get()
+
+
+class RateLimitTimeoutError(TimeoutError):
+    """Raised when a token was not granted within the caller's timeout."""
+
+
+@dataclass
+class WaitHistogram:
+    """Distribution of time spent waiting for a token."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(WAIT_BUCKETS) + 1))
+    total: int = 0
+    sum_seconds: float = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(WAIT_BUCKETS, seconds)] += 1
+        self.total += 1
+        self.sum_seconds += seconds
+
+    def snapshot(self) -> dict[str, Any]:
+        buckets = {}
+        cumulative = 0
+        for bound, count in zip((*WAIT_BUCKETS, math.inf), self.counts):
+            cumulative += count
+            buckets[f"le_{bound}"] = cumulative
+        return {
+            "buckets": buckets,
+            "count": self.total,
+            "sum_seconds": round(self.sum_seconds, 3),
+            "avg_seconds": round(self.sum_seconds / self.total, 3) if self.total else 0.0,
+        }
+
+
+_histograms: dict[str, dict[Priority, WaitHistogram]] = {}
+
+
+def get_rate_limit_stats() -> dict[str, dict[str, Any]]:
+    """Wait-time histograms per limiter and priority in this process."""
+    return {
+        name: {priority.name.lower(): hist.snapshot() for priority, hist in by_priority.items()}
+        for name, by_priority in _histograms.items()
+    }
+
+
+class _LocalBucket:
+    """In-process version of TOKEN_BUCKET_SCRIPT, used without Redis."""
+
+    def __init__(self, rate_per_ms: float, capacity: int):
+        self.rate = rate_per_ms
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.ts = time.monotonic() * 1000
+        self.queue: dict[str, float] = {}
+
+    def take(self, ticket: str, delay_ms: int, queue: bool) -> tuple[bool, int]:
+        now = time.monotonic() * 1000
+        self.tokens = min(self.capacity, self.tokens + max(0.0, now - self.ts) * self.rate)
+        self.ts = now
+
+        if queue:
+            position = self.queue.setdefault(ticket, now + delay_ms)
+            ahead = sum(1 for score in self.queue.values() if score < position)
+        else:
+            ahead = sum(1 for score in self.queue.values() if score < now + delay_ms)
+
+        if self.tokens >= ahead + 1:
+            self.tokens -= 1
+            self.queue.pop(ticket, None)
+            return True, 0
+        return False, math.ceil((ahead + 1 - self.tokens) / self.rate)
+
+    def leave(self, ticket: str) -> None:
+        self.queue.pop(ticket, None)
+
+
+class TokenBucketLimiter:
+    """Token bucket shared by every replica through Redis.
+
+    Args:
+        name: Limiter name; replicas using the same name share the bucket
+        rate: Tokens added per second
+        capacity: Bucket size, i.e. the largest burst
+        distributed: Keep the bucket in Redis (falls back to in-process
+            when Redis is unavailable); in-process only when False
+    """
+
+    def __init__(self, name: str, rate: float, capacity: int, distributed: bool = True):
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self.distributed = distributed
+        self._keys = [
+            f"{KEY_PREFIX}{name}",
+            f"{KEY_PREFIX}{name}:queue",
+            f"{KEY_PREFIX}{name}:waiters",
+        ]
+        self._local = _LocalBucket(rate / 1000, capacity)
+        self._script: Any = None
+        self._histograms = _histograms.setdefault(name, {})
+
+        logger.info(
+            "token_bucket_initialized",
+            name=name,
+            rate_per_second=rate,
+            capacity=capacity,
+            distributed=distributed,
+        )
+
+    async def acquire(
+        self,
+        priority: Priority | None = None,
+        timeout: float | None = None,
+    ) -> float:
+        """Wait for a token, in queue order.
+
+        Args:
+            priority: Request class (default: the current rate_limit_priority)
+            timeout: Seconds to wait at most
+
+        Returns:
+            Seconds waited
+
+        Raises:
+            RateLimitTimeoutError: If no token was granted within timeout
+        """
+        priority = current_priority() if priority is None else priority
+        ticket = uuid.uuid4().hex
+        start = time.monotonic()
+        granted = False
+        used_redis = False
+        try:
+            while True:
+                result = await self._take_redis(ticket, priority, queue=True)
+                used_redis = result is not None
+                if result is None:
+                    result = self._local.take(ticket, PRIORITY_DELAY_MS[priority], queue=True)
+                granted, wait_ms = result
+                if granted:
+                    break
+
+                sleep = min(wait_ms / 1000, MAX_POLL_INTERVAL)
+                if timeout is not None:
+                    remaining = timeout - (time.monotonic() - start)
+                    if remaining <= 0:
+                        raise RateLimitTimeoutError(f"Rate limit wait exceeded {timeout}s for {self.name}")
+                    sleep = min(sleep, remaining)
+                await asyncio.sleep(max(sleep, 0.001))
+        finally:
+            if not granted:
+                await self._leave(ticket, used_redis)
+
+        waited = time.monotonic() - start
+        self._observe(priority, waited)
+        if waited >= 0.5:
+            logger.info(
+                "rate_limit_waited",
+                name=self.name,
+                priority=priority.name.lower(),
+                wait_seconds=round(waited, 2),
+            )
+        return waited
+
+    async def try_acquire(self, priority: Priority | None = None) -> bool:
+        """Take a token only if one is free and nobody ahead is waiting for it."""
+        priority = current_priority() if priority is None else priority
+        ticket = uuid.uuid4().hex
+        result = await self._take_redis(ticket, priority, queue=False)
+        if result is None:
+            result = self._local.take(ticket, PRIORITY_DELAY_MS[priority], queue=False)
+        if result[0]:
+            self._observe(priority, 0.0)
+        return result[0]
+
+    async def _take_redis(
+        self, ticket: str, priority: Priority, queue: bool
+    ) -> tuple[bool, int] | None:
+        """Run the bucket script; None if Redis is not available."""
+        if not self.distributed:
+            return None
+        try:
+            redis = await get_redis()
+            if self._script is None:
+                self._script = redis.register_script(TOKEN_BUCKET_SCRIPT)
+            granted, wait_ms = await self._script(
+                keys=self._keys,
+                args=[
+                    self.rate / 1000,
+                    self.capacity,
+                    ticket,
+                    PRIORITY_DELAY_MS[priority],
+                    WAITER_TTL_MS,
+                    1 if queue else 0,
+                ],
+                client=redis,
+            )
+            return bool(granted), int(wait_ms)
+        except RedisConnectionError:
+            return None
+        except Exception as e:
+            logger.warning("token_bucket_redis_error", name=self.name, error=str(e))
+            return None
+
+    async def _leave(self, ticket: str, used_redis: bool) -> None:
+        """Give up a place in the queue (timeout or cancellation)."""
+        self._local.leave(ticket)
+        if not used_redis:
+            return
+        try:
+            redis = await get_redis()
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.zrem(self._keys[1], ticket)
+                pipe.zrem(self._keys[2], ticket)
+                await pipe.execute()
+        except Exception as e:
+            # The ticket expires from the queue after WAITER_TTL_MS anyway
+            logger.warning("token_bucket_leave_failed", name=self.name, error=str(e))
+
+    def _observe(self, priority: Priority, seconds: float) -> None:
+        histogram = self._histograms.get(priority)
+        if histogram is None:
+            histogram = self._histograms[priority] = WaitHistogram()
+        histogram.observe(seconds)
+
+
+def _limit_config(name: str) -> tuple[float, int]:
+    """(tokens per second, burst) for a limiter name like "sagemaker:<endpoint>"."""
+    settings = get_settings()
+    family = name.split(":", 1)[0]
+    if family == "pytrends":
+        return 5 / 60, 5
+    if family == "tiktok":
+        return 30 / 60, 30
+    if family == "gemini_image":
+        per_minute = settings.gemini_image_requests_per_minute
+        return per_minute / 60, max(1, per_minute // 6)
+    if family == "sagemaker":
+        per_minute = settings.sagemaker_requests_per_minute
+        return per_minute / 60, max(1, per_minute // 6)
+    raise KeyError(f"No rate limit configured for {name}")
+
+
+_limiters: dict[str, TokenBucketLimiter] = {}
+
+
+def get_rate_limiter(name: str) -> TokenBucketLimiter:
+    """Get the shared limiter for an external provider.
+
+    Known families: pytrends, tiktok, gemini_image, sagemaker:<endpoint>.
+    """
+    limiter = _limiters.get(name)
+    if limiter is None:
+        rate, capacity = _limit_config(name)
+        limiter = _limiters[name] = TokenBucketLimiter(name, rate, capacity)
+    return limiter
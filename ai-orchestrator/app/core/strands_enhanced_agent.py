@@ -33,6 +33,7 @@ from enum import Enum
 from typing import Any, AsyncIterator
 
 import structlog
+from google import genai
 from strands import Agent, tool, ToolContext
 from strands.models import BedrockModel
 from strands.models.gemini import GeminiModel
@@ -204,6 +205,23 @@ class AgentState:
         )
 
 
+async def _drain_progress(
+    progress: asyncio.Queue,
+    execution: asyncio.Task,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield progress events from a running tool until it finishes."""
+    while not execution.done():
+        next_event = asyncio.ensure_future(progress.get())
+        await asyncio.wait({next_event, execution}, return_when=asyncio.FIRST_COMPLETED)
+        if not next_event.done():
+            next_event.cancel()
+            break
+        yield next_event.result()
+
+    while not progress.empty():
+        yield progress.get_nowait()
+
+
 class StrandsEnhancedReActAgent:
     """Enhanced Strands Agent with full ReAct intelligence.
 
@@ -265,8 +283,12 @@ class StrandsEnhancedReActAgent:
         self.memory = AgentMemory(state_ttl=state_ttl)
         self.human_in_loop_handler = HumanInLoopHandler()
 
-        # Strands Agent will be created per-request
-        self._strands_agent: Agent | None = None
+        # The model and tool wrappers hold no per-request state, so they are
+        # built once and shared; only the Strands Agent (which keeps the
+        # conversation) is created per request
+        self._genai_client: genai.Client | None = None
+        self._model = None
+        self._strands_tools: list[Any] | None = None
 
         logger.info(
             "strands_enhanced_agent_initialized",
@@ -276,14 +298,26 @@ class StrandsEnhancedReActAgent:
         )
 
     def _get_model(self):
-        """Get AI model for Strands Agent."""
+        """Get AI model for Strands Agent, creating it on first use."""
+        if self._model is None:
+            self._model = self._create_model()
+        return self._model
+
+    def _get_genai_client(self) -> genai.Client:
+        """Shared Gemini client so streams reuse its connection pool."""
+        if self._genai_client is None:
+            self._genai_client = genai.Client(api_key=get_settings().gemini_api_key)
+        return self._genai_client
+
+    def _create_model(self):
+        """Create AI model for Strands Agent."""
         settings = get_settings()
 
         if self.model_provider == "gemini":
             model_id = self.model_name or "gemini-2.5-flash"
             logger.info("creating_gemini_model", model_id=model_id)
             return GeminiModel(
-                client_args={"api_key": settings.gemini_api_key},
+                client=self._get_genai_client(),
                 model_id=model_id,
                 params={"temperature": 0.7, "max_output_tokens": 4096},
             )
@@ -309,7 +343,7 @@ class StrandsEnhancedReActAgent:
             # Fallback to Gemini
             logger.warning("unknown_model_provider_fallback", provider=self.model_provider)
             return GeminiModel(
-                client_args={"api_key": settings.gemini_api_key},
+                client=self._get_genai_client(),
                 model_id="gemini-2.5-flash",
                 params={"temperature": 0.7, "max_output_tokens": 4096},
             )
@@ -350,6 +384,9 @@ Always be helpful, concise, and action-oriented. Use tools when needed."""
             system_prompt=system_prompt,
             tools=tools,
             model=model,
+            # Events are consumed from stream_async; the default handler
+            # would also print every token to stdout
+            callback_handler=None,
         )
 
     async def process_message_stream(
@@ -416,14 +453,19 @@ Always be helpful, concise, and action-oriented. Use tools when needed."""
                 model_name=None,
             )
 
-            # Get tools
+            # Get tools in Strands format; registry tools are converted once
             if loaded_tools is None:
-                loaded_tools = self.tool_registry.get_all_tools() if self.tool_registry else []
-
-            # Convert tools to Strands format (pass conversation_history for tool context)
-            strands_tools = self._convert_tools_to_strands(
-                loaded_tools, user_id, session_id, model_preferences, conversation_history
-            )
+                strands_tools = self._get_strands_tools()
+            else:
+                strands_tools = self._convert_tools_to_strands(loaded_tools)
+
+            # Per-request context reaches the tool wrappers through invocation state
+            invocation_state = {
+                "user_id": user_id,
+                "session_id": session_id,
+                "conversation_history": conversation_history or [],
+                "model_preferences": model_preferences,
+            }
 
             # Create Strands Agent (this will use user's model preferences)
             strands_agent = self._create_strands_agent(strands_tools)
@@ -468,7 +510,9 @@ Always be helpful, concise, and action-oriented. Use tools when needed."""
                 tool_announced = set()  # Track which tools have been announced to avoid duplicates
 
                 # Call Strands Agent with message (including history in context)
-                async for chunk in strands_agent.stream_async(user_message_with_context):
+                async for chunk in strands_agent.stream_async(
+                    user_message_with_context, invocation_state=invocation_state
+                ):
                     # Strands Agent returns dict chunks with different structures
                     if not isinstance(chunk, dict):
                         continue
@@ -503,6 +547,10 @@ Always be helpful, concise, and action-oriented. Use tools when needed."""
                             )
                             yield tool_stream_data
                             continue
+                        if isinstance(tool_stream_data, dict) and tool_stream_data.get("type") == "progress":
+                            # Partial tool result, e.g. a landing page version
+                            yield tool_stream_data
+                            continue
 
                     # Check for current_tool_use field mentioned in docs
                     if "current_tool_use" in chunk:
@@ -971,15 +1019,34 @@ Respond in JSON:
                 "final_answer": None,
             }
 
-    def _convert_tools_to_strands(
-        self,
-        agent_tools: list[AgentTool],
-        user_id: str,
-        session_id: str,
-        model_preferences: Any = None,
-        conversation_history: list[dict[str, str]] | None = None,
-    ) -> list[Any]:
-        """Convert AgentTool to Strands tool functions."""
+    def _get_strands_tools(self) -> list[Any]:
+        """Registry tools in Strands format, converted on first use."""
+        if self._strands_tools is None:
+            agent_tools = self.tool_registry.get_all_tools() if self.tool_registry else []
+            self._strands_tools = self._convert_tools_to_strands(agent_tools)
+        return self._strands_tools
+
+    def warm_up(self) -> None:
+        """Build the model and tool wrappers ahead of the first request."""
+        self._get_model()
+        self._get_strands_tools()
+
+    async def close(self) -> None:
+        """Close the clients owned by this agent."""
+        if self.gemini_client:
+            await self.gemini_client.close()
+        if self._genai_client is not None:
+            await self._genai_client.aio.aclose()
+            self._genai_client.close()
+            self._genai_client = None
+
+    def _convert_tools_to_strands(self, agent_tools: list[AgentTool]) -> list[Any]:
+        """Convert AgentTool to Strands tool functions.
+
+        The wrappers are shared across requests: user_id, session_id,
+        conversation_history and model_preferences are read from the
+        invocation state passed to stream_async.
+        """
         strands_tools = []
 
         def make_tool_wrapper(captured_tool: AgentTool):
@@ -1025,24 +1092,38 @@ Respond in JSON:
                     # Use kwargs as-is
                     params = kwargs
 
+                # Tools report partial results (e.g. landing page sections)
+                # through on_progress; they are streamed while the tool runs
+                progress: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+                async def on_progress(event: dict[str, Any]) -> None:
+                    progress.put_nowait({**event, "type": "progress", "tool": captured_tool.name})
+
+                invocation_state = tool_context.invocation_state
+                context = {
+                    "user_id": invocation_state.get("user_id"),
+                    "session_id": invocation_state.get("session_id"),
+                    "conversation_history": invocation_state.get("conversation_history") or [],
+                    "model_preferences": invocation_state.get("model_preferences"),
+                    "on_progress": on_progress,
+                }
+
                 # Log tool execution
                 logger.info(
                     "tool_execution_start",
                     tool_name=captured_tool.name,
                     params=params,
-                    user_id=user_id,
-                    session_id=session_id,
+                    user_id=context["user_id"],
+                    session_id=context["session_id"],
                 )
 
-                context = {
-                    "user_id": tool_context.invocation_state.get("user_id", user_id),
-                    "session_id": tool_context.invocation_state.get("session_id", session_id),
-                    "conversation_history": conversation_history or [],
-                    "model_preferences": model_preferences,
-                }
-
+                execution = asyncio.create_task(
+                    captured_tool.execute(parameters=params, context=context)
+                )
                 try:
-                    result = await captured_tool.execute(parameters=params, context=context)
+                    async for event in _drain_progress(progress, execution):
+                        yield event
+                    result = await execution
                     logger.info(
                         "tool_execution_success",
                         tool_name=captured_tool.name,
@@ -1144,6 +1225,10 @@ Respond in JSON:
                     # Yield final error result
                     logger.info("yielding_exception_result", tool=captured_tool.name)
                     yield error_result
+                finally:
+                    # The stream was closed before the tool finished
+                    if not execution.done():
+                        execution.cancel()
 
             return tool_fn
 
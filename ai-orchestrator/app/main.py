@@ -13,10 +13,13 @@ import structlog
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.core.agent_pool import get_agent_pool
 from app.core.config import get_settings
 from app.core.logging import configure_logging, set_request_id
 from app.core.redis_client import close_redis_pool, init_redis_pool
+from app.services.gemini_files import gemini_files_service
 from app.services.mcp_client import MCPClient
+from app.services.video_operation_tracker import get_video_operation_tracker
 
 logger = structlog.get_logger(__name__)
 
@@ -72,15 +75,18 @@ async def lifespan(app: FastAPI):
         # Don't fail startup - MCP might become available later
         logger.warning("mcp_client_will_retry_on_first_request")
 
-    # Initialize Strands ReAct Agent (tools are loaded dynamically on demand)
+    # Build the tool registry and default agent before the first chat request
     try:
-        from app.core.strands_agent import StrandsReActAgent
-        # Agent initialization is lazy - happens on first request
+        get_agent_pool().warm_up()
         logger.info("strands_agent_ready")
     except Exception as e:
         logger.error("strands_agent_initialization_failed", error=str(e))
         raise
 
+    # Start the shared poller for in-flight video operations
+    get_video_operation_tracker().start()
+    logger.info("video_operation_tracker_started")
+
     logger.info("application_startup_complete")
 
     yield
@@ -88,6 +94,17 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("application_shutdown_begin")
 
+    # Stop the video operation poller before Redis goes away
+    await get_video_operation_tracker().stop()
+    logger.info("video_operation_tracker_stopped")
+
+    # Close pooled agents' model clients
+    await get_agent_pool().close()
+    logger.info("agent_pool_closed")
+
+    # Close the Gemini Files API upload client
+    await gemini_files_service.close()
+
     # Close MCP client
     if _mcp_client:
         await _mcp_client.close()
@@ -197,11 +214,15 @@ def create_app() -> FastAPI:
     from app.api.health import router as health_router
     from app.api.campaign_automation import router as campaign_automation_router
     from app.api.media import router as media_router
+    from app.api.ad_performance import router as ad_performance_router
+    from app.api.video_operations import router as video_operations_router
 
     app.include_router(health_router, tags=["Health"])
     app.include_router(chat_router, prefix="/api/v1", tags=["Chat"])
     app.include_router(campaign_automation_router, prefix="/api", tags=["Campaign Automation"])
     app.include_router(media_router, prefix="/api/v1", tags=["Media"])
+    app.include_router(ad_performance_router, prefix="/api", tags=["Ad Performance"])
+    app.include_router(video_operations_router, prefix="/api/v1", tags=["Video Operations"])
 
     return app
 
@@ -10,7 +10,6 @@ Supports:
 Requirements: Video generation capability
 """
 
-import asyncio
 import uuid
 from datetime import datetime
 from typing import Any
@@ -19,6 +18,7 @@ import httpx
 import structlog
 
 from app.services.gemini_client import GeminiClient, GeminiAPIError
+from app.services.video_operation_tracker import get_video_operation_tracker
 
 logger = structlog.get_logger(__name__)
 
@@ -446,48 +446,72 @@ Generate a high-quality, professional advertising video that captures the essenc
         except GeminiAPIError as e:
             raise VideoGenerationError(str(e), code="POLL_FAILED", retryable=e.retryable)
 
+    async def track(
+        self,
+        operation_id: str,
+        user_id: str | None = None,
+        session_id: str | None = None,
+    ) -> dict:
+        """Hand an operation to the shared video operation tracker.
+
+        Returns at once; the tracker's background poller checks the
+        operation and stores the finished video.
+
+        Args:
+            operation_id: The operation ID from generation
+            user_id: Owner of the generated video
+            session_id: Session the video belongs to
+
+        Returns:
+            Operation record whose "id" is the tracking handle
+        """
+        tracker = get_video_operation_tracker()
+        return await tracker.register(
+            operation_id,
+            "gemini",
+            user_id=user_id,
+            session_id=session_id,
+        )
+
     async def wait_for_completion(
         self,
         operation_id: str,
-        poll_interval: int = 10,
         max_wait: int = 360,  # 6 minutes max
     ) -> dict:
         """Wait for video generation to complete.
 
+        Status checks are done by the shared tracker, so waiting callers
+        only listen for its completion event.
+
         Args:
             operation_id: The operation ID
-            poll_interval: Seconds between polls
             max_wait: Maximum wait time in seconds
 
         Returns:
-            Final status with video URL
+            Final operation record with the stored video
         """
         log = logger.bind(operation_id=operation_id)
         log.info("wait_for_completion_start", max_wait=max_wait)
 
-        elapsed = 0
-        while elapsed < max_wait:
-            result = await self.check_status(operation_id)
-
-            if result.get("status") == "completed":
-                log.info("video_generation_completed", video_uri=result.get("video_uri"))
-                return result
-
-            if result.get("status") == "failed":
-                raise VideoGenerationError(
-                    result.get("error", "Video generation failed"),
-                    code="GENERATION_FAILED",
-                    retryable=False,
-                )
+        operation = await self.track(operation_id)
+        tracker = get_video_operation_tracker()
+        try:
+            result = await tracker.wait(operation["id"], timeout=max_wait)
+        except TimeoutError:
+            raise VideoGenerationError(
+                f"Video generation timed out after {max_wait} seconds",
+                code="TIMEOUT",
+                retryable=True,
+            )
 
-            await asyncio.sleep(poll_interval)
-            elapsed += poll_interval
-            log.info("polling_video_status", elapsed=elapsed, progress=result.get("progress"))
+        if result["status"] == "completed":
+            log.info("video_generation_completed", handle=operation["id"])
+            return result
 
         raise VideoGenerationError(
-            f"Video generation timed out after {max_wait} seconds",
-            code="TIMEOUT",
-            retryable=True,
+            result.get("error", "Video generation failed"),
+            code="TIMEOUT" if result["status"] == "timeout" else "GENERATION_FAILED",
+            retryable=result["status"] == "timeout",
         )
 
     def _validate_duration(self, duration: int) -> int:
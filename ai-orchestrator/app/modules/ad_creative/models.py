@@ -99,6 +99,7 @@ class CreditCheckResult(BaseModel):
     allowed: bool = Field(..., description="是否允许操作")
     required_credits: float = Field(..., description="所需 Credit")
     available_credits: float = Field(..., description="可用 Credit")
+    reservation_id: str | None = Field(None, description="Credit 预留 ID")
     error_code: str | None = Field(None, description="错误码")
     error_message: str | None = Field(None, description="错误消息")
 
@@ -7,15 +7,19 @@ to reduce API calls and improve performance.
 Requirements: Non-functional requirements - Cost control
 - Product information cache: 1 hour TTL
 - Analysis results cache: 24 hours TTL
+
+Storage goes through the shared cache layer (app.core.cache), which keeps
+recent entries in process as well.
 """
 
 import hashlib
-import json
-from typing import Any
 
 import structlog
+from pydantic import ValidationError
 from redis.asyncio import Redis
 
+from app.core.cache import Cache, CacheSerializationError
+
 from ..models import ProductInfo, CompetitorAnalysis
 
 logger = structlog.get_logger(__name__)
@@ -52,6 +56,15 @@ class CacheManager:
         """
         self.redis = redis_client
         self._enabled = redis_client is not None
+        self._product_cache = Cache(
+            "ad_creative.product", redis_client, ttl=self.PRODUCT_INFO_TTL
+        )
+        self._analysis_cache = Cache(
+            "ad_creative.analysis", redis_client, ttl=self.ANALYSIS_RESULT_TTL
+        )
+        self._score_cache = Cache(
+            "ad_creative.score", redis_client, ttl=self.CREATIVE_SCORE_TTL
+        )
 
         logger.info(
             "ad_creative_cache_manager_initialized",
@@ -99,25 +112,21 @@ class CacheManager:
             cache_key=cache_key,
         )
 
-        try:
-            cached_value = await self.redis.get(cache_key)
-
-            if cached_value:
-                log.info("product_info_cache_hit")
-                data = json.loads(cached_value)
-                return ProductInfo(**data)
-            else:
-                log.debug("product_info_cache_miss")
-                return None
+        # Read errors and corrupted entries come back as misses
+        data = await self._product_cache.get(cache_key)
+        if data is None:
+            log.debug("product_info_cache_miss")
+            return None
 
-        except json.JSONDecodeError as e:
+        try:
+            result = ProductInfo(**data)
+        except ValidationError as e:
             log.warning("product_info_cache_parse_error", error=str(e))
-            await self.redis.delete(cache_key)
+            await self._product_cache.delete(cache_key)
             return None
 
-        except Exception as e:
-            log.error("product_info_cache_get_error", error=str(e))
-            return None
+        log.info("product_info_cache_hit")
+        return result
 
     async def cache_product_info(
         self,
@@ -145,33 +154,20 @@ class CacheManager:
         )
 
         try:
-            # Serialize to JSON
-            json_data = json.dumps(
-                product_info.model_dump(mode="json"),
-                ensure_ascii=False,
-            )
-
-            # Store in Redis with TTL
-            result = await self.redis.setex(
+            result = await self._product_cache.set(
                 cache_key,
+                product_info.model_dump(mode="json"),
                 self.PRODUCT_INFO_TTL,
-                json_data,
             )
-
-            if result:
-                log.info("product_info_cache_set_success")
-                return True
-            else:
-                log.warning("product_info_cache_set_failed")
-                return False
-
-        except (TypeError, ValueError) as e:
+        except CacheSerializationError as e:
             log.error("product_info_cache_serialization_error", error=str(e))
             return False
 
-        except Exception as e:
-            log.error("product_info_cache_set_error", error=str(e))
-            return False
+        if result:
+            log.info("product_info_cache_set_success")
+        else:
+            log.warning("product_info_cache_set_failed")
+        return result
 
     # =========================================================================
     # Competitor Analysis Cache
@@ -199,25 +195,21 @@ class CacheManager:
             cache_key=cache_key,
         )
 
-        try:
-            cached_value = await self.redis.get(cache_key)
-
-            if cached_value:
-                log.info("competitor_analysis_cache_hit")
-                data = json.loads(cached_value)
-                return CompetitorAnalysis(**data)
-            else:
-                log.debug("competitor_analysis_cache_miss")
-                return None
+        # Read errors and corrupted entries come back as misses
+        data = await self._analysis_cache.get(cache_key)
+        if data is None:
+            log.debug("competitor_analysis_cache_miss")
+            return None
 
-        except json.JSONDecodeError as e:
+        try:
+            result = CompetitorAnalysis(**data)
+        except ValidationError as e:
             log.warning("competitor_analysis_cache_parse_error", error=str(e))
-            await self.redis.delete(cache_key)
+            await self._analysis_cache.delete(cache_key)
             return None
 
-        except Exception as e:
-            log.error("competitor_analysis_cache_get_error", error=str(e))
-            return None
+        log.info("competitor_analysis_cache_hit")
+        return result
 
     async def cache_competitor_analysis(
         self,
@@ -245,33 +237,20 @@ class CacheManager:
         )
 
         try:
-            # Serialize to JSON
-            json_data = json.dumps(
-                analysis.model_dump(mode="json"),
-                ensure_ascii=False,
-            )
-
-            # Store in Redis with TTL
-            result = await self.redis.setex(
+            result = await self._analysis_cache.set(
                 cache_key,
+                analysis.model_dump(mode="json"),
                 self.ANALYSIS_RESULT_TTL,
-                json_data,
             )
-
-            if result:
-                log.info("competitor_analysis_cache_set_success")
-                return True
-            else:
-                log.warning("competitor_analysis_cache_set_failed")
-                return False
-
-        except (TypeError, ValueError) as e:
+        except CacheSerializationError as e:
             log.error("competitor_analysis_cache_serialization_error", error=str(e))
             return False
 
-        except Exception as e:
-            log.error("competitor_analysis_cache_set_error", error=str(e))
-            return False
+        if result:
+            log.info("competitor_analysis_cache_set_success")
+        else:
+            log.warning("competitor_analysis_cache_set_failed")
+        return result
 
     # =========================================================================
     # Creative Score Cache
@@ -299,24 +278,14 @@ class CacheManager:
             cache_key=cache_key,
         )
 
-        try:
-            cached_value = await self.redis.get(cache_key)
-
-            if cached_value:
-                log.info("creative_score_cache_hit")
-                return json.loads(cached_value)
-            else:
-                log.debug("creative_score_cache_miss")
-                return None
-
-        except json.JSONDecodeError as e:
-            log.warning("creative_score_cache_parse_error", error=str(e))
-            await self.redis.delete(cache_key)
+        # Read errors and corrupted entries come back as misses
+        data = await self._score_cache.get(cache_key)
+        if data is None:
+            log.debug("creative_score_cache_miss")
             return None
 
-        except Exception as e:
-            log.error("creative_score_cache_get_error", error=str(e))
-            return None
+        log.info("creative_score_cache_hit")
+        return data
 
     async def cache_creative_score(
         self,
@@ -344,30 +313,20 @@ class CacheManager:
         )
 
         try:
-            # Serialize to JSON
-            json_data = json.dumps(score_data, ensure_ascii=False)
-
-            # Store in Redis with TTL
-            result = await self.redis.setex(
+            result = await self._score_cache.set(
                 cache_key,
+                score_data,
                 self.CREATIVE_SCORE_TTL,
-                json_data,
             )
-
-            if result:
-                log.info("creative_score_cache_set_success")
-                return True
-            else:
-                log.warning("creative_score_cache_set_failed")
-                return False
-
-        except (TypeError, ValueError) as e:
+        except CacheSerializationError as e:
             log.error("creative_score_cache_serialization_error", error=str(e))
             return False
 
-        except Exception as e:
-            log.error("creative_score_cache_set_error", error=str(e))
-            return False
+        if result:
+            log.info("creative_score_cache_set_success")
+        else:
+            log.warning("creative_score_cache_set_failed")
+        return result
 
     # =========================================================================
     # Cache Invalidation
@@ -388,7 +347,7 @@ class CacheManager:
         cache_key = f"{self.PREFIX_PRODUCT}:{self._hash_url(product_url)}"
 
         try:
-            result = await self.redis.delete(cache_key)
+            result = await self._product_cache.delete(cache_key)
             logger.info(
                 "product_info_cache_invalidated",
                 product_url=product_url[:50],
@@ -415,7 +374,7 @@ class CacheManager:
         cache_key = f"{self.PREFIX_ANALYSIS}:{self._hash_url(ad_url)}"
 
         try:
-            result = await self.redis.delete(cache_key)
+            result = await self._analysis_cache.delete(cache_key)
             logger.info(
                 "competitor_analysis_cache_invalidated",
                 ad_url=ad_url[:50],
@@ -442,7 +401,7 @@ class CacheManager:
         cache_key = f"{self.PREFIX_SCORE}:{creative_id}"
 
         try:
-            result = await self.redis.delete(cache_key)
+            result = await self._score_cache.delete(cache_key)
             logger.info(
                 "creative_score_cache_invalidated",
                 creative_id=creative_id,
@@ -1,7 +1,7 @@
 """
 Credit balance checker and manager for Ad Creative module.
 
-Implements credit checking, reservation, deduction, and refund operations
+Implements credit reservation, settlement, and release operations
 through MCP communication with Web Platform.
 
 Requirements: 9.1, 9.2, 9.3, 9.4, 9.5
@@ -39,14 +39,14 @@ class CreditCheckerError(Exception):
 
 
 class CreditDeductionError(CreditCheckerError):
-    """Raised when credit deduction fails."""
+    """Raised when settling reserved credits fails."""
 
     def __init__(self, message: str = "Credit deduction failed"):
         super().__init__(message, error_code="6012")
 
 
 class CreditRefundError(CreditCheckerError):
-    """Raised when credit refund fails."""
+    """Raised when releasing reserved credits fails."""
 
     def __init__(self, message: str = "Credit refund failed"):
         super().__init__(message, error_code="6013")
@@ -62,9 +62,9 @@ class CreditChecker:
     - Competitor analysis: 1.0 credits
 
     Implements:
-    - check_and_reserve(): Check balance and reserve credits before operation
-    - deduct(): Deduct credits after successful operation
-    - refund(): Refund credits after failed operation
+    - check_and_reserve(): Reserve credits before operation
+    - settle(): Deduct reserved credits after successful operation
+    - release(): Release reserved credits after failed operation
     - calculate_cost(): Calculate cost with bulk discount support
     """
 
@@ -146,23 +146,27 @@ class CreditChecker:
         user_id: str,
         operation: str,
         count: int = 1,
+        operation_id: str | None = None,
     ) -> CreditCheckResult:
-        """Check credit balance and verify sufficient credits for operation.
+        """Reserve credits for an operation before it starts.
 
-        This method checks if the user has enough credits for the requested
-        operation. It does NOT actually reserve or deduct credits - that
-        happens in the deduct() method after successful operation.
+        The hold is taken from the Web Platform's credit ledger in one
+        call, without locking the user's row. Call settle() with the
+        returned reservation_id after the operation succeeds, or
+        release() if it fails.
 
         Args:
             user_id: User ID
             operation: Operation type (image_generation, creative_analysis, etc.)
             count: Number of items
+            operation_id: Unique operation ID for tracking. If None, one is generated.
 
         Returns:
             CreditCheckResult with:
-            - allowed: True if user has sufficient credits
+            - allowed: True if the credits were reserved
             - required_credits: Credits needed for operation
-            - available_credits: User's current balance
+            - available_credits: User's balance after the reservation
+            - reservation_id: ID to settle or release the hold with
             - error_code: "6011" if insufficient credits
             - error_message: User-friendly error message
 
@@ -172,44 +176,41 @@ class CreditChecker:
         required = self.calculate_cost(operation, count)
         mcp_operation_type = self._get_mcp_operation_type(operation)
 
+        if operation_id is None:
+            operation_id = self._generate_operation_id()
+
         log = logger.bind(
             user_id=user_id,
             operation=operation,
             count=count,
             required_credits=required,
+            operation_id=operation_id,
         )
-        log.info("credit_check_start")
+        log.info("credit_reserve_start")
 
         try:
             mcp = await self._get_mcp_client()
-            result = await mcp.check_credit(
+            result = await mcp.reserve_credit(
                 user_id=user_id,
-                estimated_credits=required,
+                credits=required,
                 operation_type=mcp_operation_type,
+                operation_id=operation_id,
             )
 
-            available = float(result.get("available", 0))
-            sufficient = result.get("sufficient", False)
+            reservation_id = result.get("reservation_id")
+            available = float(result.get("available_after", 0))
 
             log.info(
-                "credit_check_complete",
-                sufficient=sufficient,
+                "credit_reserve_complete",
+                reservation_id=reservation_id,
                 available=available,
             )
 
-            if not sufficient:
-                return CreditCheckResult(
-                    allowed=False,
-                    required_credits=required,
-                    available_credits=available,
-                    error_code="6011",
-                    error_message="Credit 余额不足，请充值后继续使用",
-                )
-
             return CreditCheckResult(
                 allowed=True,
                 required_credits=required,
                 available_credits=available,
+                reservation_id=reservation_id,
             )
 
         except InsufficientCreditsError as e:
@@ -227,162 +228,128 @@ class CreditChecker:
             )
 
         except MCPError as e:
-            log.error("credit_check_failed", error=str(e), code=e.code)
+            log.error("credit_reserve_failed", error=str(e), code=e.code)
             raise CreditCheckerError(
-                message=f"Credit check failed: {e.message}",
+                message=f"Credit reservation failed: {e.message}",
                 error_code=e.code,
                 details=e.details,
             )
 
 
-    async def deduct(
+    async def settle(
         self,
         user_id: str,
-        operation_id: str | None = None,
+        reservation_id: str,
         credits: float | None = None,
-        operation: str = "image_generation",
-        count: int = 1,
         details: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Deduct credits after successful operation.
+        """Deduct reserved credits after successful operation.
 
         Should be called after the operation completes successfully.
-        If the operation fails, call refund() instead.
+        If the operation fails, call release() instead.
 
         Args:
             user_id: User ID
-            operation_id: Unique operation ID for tracking. If None, one is generated.
-            credits: Amount to deduct. If None, calculated from operation and count.
-            operation: Operation type (used if credits is None)
-            count: Number of items (used if credits is None)
+            reservation_id: Reservation ID from check_and_reserve()
+            credits: Final cost. If None, the reserved amount is deducted.
+                     May be lower than the reservation, e.g. when only
+                     part of a batch was generated.
             details: Additional details to store with transaction
 
         Returns:
-            Transaction details including:
-            - transaction_id: Unique transaction ID
+            Settlement details including:
+            - reservation_id: Settled reservation ID
             - amount: Amount deducted
             - balance_after: Balance after deduction
-            - operation_id: Operation ID for refund tracking
 
         Raises:
-            InsufficientCreditsError: If user doesn't have enough credits
-            CreditDeductionError: If deduction fails
+            InsufficientCreditsError: If credits exceeds what the user can cover
+            CreditDeductionError: If settlement fails
         """
-        if credits is None:
-            credits = self.calculate_cost(operation, count)
-
-        if operation_id is None:
-            operation_id = self._generate_operation_id()
-
-        mcp_operation_type = self._get_mcp_operation_type(operation)
-
         log = logger.bind(
             user_id=user_id,
-            operation_id=operation_id,
+            reservation_id=reservation_id,
             credits=credits,
-            operation=operation,
         )
-        log.info("credit_deduct_start")
+        log.info("credit_settle_start")
 
         try:
             mcp = await self._get_mcp_client()
-            result = await mcp.deduct_credit(
+            result = await mcp.settle_credit(
                 user_id=user_id,
+                reservation_id=reservation_id,
                 credits=credits,
-                operation_type=mcp_operation_type,
-                operation_id=operation_id,
                 details=details,
             )
 
             log.info(
-                "credit_deduct_complete",
-                transaction_id=result.get("transaction_id"),
+                "credit_settle_complete",
+                deducted=result.get("deducted"),
                 balance_after=result.get("balance_after"),
             )
 
             return {
-                "transaction_id": result.get("transaction_id"),
-                "amount": credits,
+                "reservation_id": reservation_id,
+                "amount": float(result.get("deducted", credits or 0)),
                 "balance_after": float(result.get("balance_after", 0)),
-                "operation_id": operation_id,
             }
 
         except InsufficientCreditsError:
-            log.warning("credit_deduct_insufficient")
+            log.warning("credit_settle_insufficient")
             raise
 
         except MCPError as e:
-            log.error("credit_deduct_failed", error=str(e), code=e.code)
+            log.error("credit_settle_failed", error=str(e), code=e.code)
             raise CreditDeductionError(
-                f"Credit deduction failed: {e.message}"
+                f"Credit settlement failed: {e.message}"
             )
 
 
-    async def refund(
+    async def release(
         self,
         user_id: str,
-        operation_id: str,
-        credits: float,
+        reservation_id: str,
         reason: str | None = None,
-        operation: str = "image_generation",
     ) -> dict[str, Any]:
-        """Refund credits after failed operation.
+        """Release reserved credits after failed operation.
 
-        Should be called when an operation fails after credits were deducted.
-        Uses the operation_id from the original deduction for tracking.
+        Nothing is charged; the held credits become available again.
 
         Args:
             user_id: User ID
-            operation_id: Original operation ID from deduct()
-            credits: Amount to refund
-            reason: Reason for the refund (e.g., "generation_failed")
-            operation: Operation type for MCP
+            reservation_id: Reservation ID from check_and_reserve()
+            reason: Reason for the release (e.g., "generation_failed"), logged only
 
         Returns:
-            Transaction details including:
-            - transaction_id: Refund transaction ID
-            - amount: Amount refunded
-            - balance_after: Balance after refund
+            Release details including:
+            - reservation_id: Released reservation ID
+            - released: True
 
         Raises:
-            CreditRefundError: If refund fails
+            CreditRefundError: If release fails
         """
-        mcp_operation_type = self._get_mcp_operation_type(operation)
-
         log = logger.bind(
             user_id=user_id,
-            operation_id=operation_id,
-            credits=credits,
+            reservation_id=reservation_id,
             reason=reason,
         )
-        log.info("credit_refund_start")
+        log.info("credit_release_start")
 
         try:
             mcp = await self._get_mcp_client()
-            result = await mcp.refund_credit(
+            await mcp.release_credit(
                 user_id=user_id,
-                credits=credits,
-                operation_type=mcp_operation_type,
-                operation_id=operation_id,
-                reason=reason,
+                reservation_id=reservation_id,
             )
 
-            log.info(
-                "credit_refund_complete",
-                transaction_id=result.get("transaction_id"),
-                balance_after=result.get("balance_after"),
-            )
+            log.info("credit_release_complete")
 
-            return {
-                "transaction_id": result.get("transaction_id"),
-                "amount": credits,
-                "balance_after": float(result.get("balance_after", 0)),
-            }
+            return {"reservation_id": reservation_id, "released": True}
 
         except MCPError as e:
-            log.error("credit_refund_failed", error=str(e), code=e.code)
+            log.error("credit_release_failed", error=str(e), code=e.code)
             raise CreditRefundError(
-                f"Credit refund failed: {e.message}"
+                f"Credit release failed: {e.message}"
             )
 
     async def get_balance(self, user_id: str) -> dict[str, Any]:
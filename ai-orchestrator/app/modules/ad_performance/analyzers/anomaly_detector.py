@@ -2,10 +2,17 @@
 Anomaly detection for ad performance metrics.
 """
 
+import warnings
 from typing import Literal
 import numpy as np
 from app.modules.ad_performance.models import Anomaly
 
+# 历史数据点少于该值时不做判断
+MIN_HISTORY_POINTS = 3
+
+# 正态分布下 MAD 到标准差的换算系数
+MAD_SCALE = 1.4826
+
 
 class AnomalyDetector:
     """异常检测器 - 使用统计方法检测指标异常"""
@@ -85,6 +92,104 @@ class AnomalyDetector:
 
         return None
 
+    def detect_batch(
+        self,
+        metric: str,
+        entity_type: Literal["campaign", "adset", "ad"],
+        entity_ids: list[str],
+        values: np.ndarray,
+        entity_names: list[str] | None = None,
+        sensitivity: str = "medium",
+        method: Literal["zscore", "mad"] = "zscore",
+        window: int | None = None,
+        detected_at: str = "",
+    ) -> list[Anomaly]:
+        """
+        批量检测同一指标在多个实体上的异常
+
+        每行是一个实体的时间序列，最后一列是当前值，之前的列（最多
+        window 列）是历史值。所有实体的期望值、离散度和 Z-score 用一次
+        数组运算算出，只为超过阈值的实体生成 Anomaly。
+
+        Args:
+            metric: 指标名称 (roas, cpa, ctr)
+            entity_type: 实体类型
+            entity_ids: 实体ID列表，与 values 的行对应
+            values: 形状为 (实体数, 时间点数) 的数组，缺失值为 NaN
+            entity_names: 实体名称列表，默认使用实体ID
+            sensitivity: 敏感度 (low, medium, high)
+            method: zscore 使用均值/标准差，mad 使用中位数/MAD（对离群点更稳健）
+            window: 参与计算的历史时间点数，默认使用全部历史
+            detected_at: 写入异常对象的检测时间
+
+        Returns:
+            检测到的异常列表（按行顺序）
+        """
+        values = np.asarray(values, dtype=float)
+        if values.ndim != 2 or values.shape[0] != len(entity_ids):
+            raise ValueError("values must have one row per entity")
+        if values.shape[1] <= MIN_HISTORY_POINTS:
+            return []
+
+        current = values[:, -1]
+        history = values[:, :-1]
+        if window is not None:
+            history = history[:, -window:]
+
+        # 全部为 NaN 的行会触发 "Mean of empty slice" 等警告，结果本身为 NaN
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            if method == "mad":
+                expected = np.nanmedian(history, axis=1)
+                scale = MAD_SCALE * np.nanmedian(
+                    np.abs(history - expected[:, None]), axis=1
+                )
+            else:
+                expected = np.nanmean(history, axis=1)
+                scale = np.nanstd(history, axis=1)
+
+        valid = (
+            (np.count_nonzero(~np.isnan(history), axis=1) >= MIN_HISTORY_POINTS)
+            & ~np.isnan(current)
+            & (scale > 0)
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z_scores = np.abs(current - expected) / scale
+            deviation_pcts = (current - expected) / expected * 100
+
+        threshold = self.sensitivity_thresholds.get(sensitivity, 2.5)
+        flagged = np.flatnonzero(valid & (z_scores > threshold))
+
+        anomalies = []
+        for i in flagged:
+            deviation_pct = float(deviation_pcts[i])
+            severity = self._calculate_severity(
+                metric,
+                float(z_scores[i]),
+                deviation_pct,
+                float(current[i]),
+                float(expected[i]),
+            )
+            anomalies.append(
+                Anomaly(
+                    metric=metric,
+                    entity_type=entity_type,
+                    entity_id=entity_ids[i],
+                    entity_name=entity_names[i] if entity_names else entity_ids[i],
+                    current_value=float(current[i]),
+                    expected_value=float(expected[i]),
+                    deviation=f"{deviation_pct:+.1f}%",
+                    severity=severity,
+                    detected_at=detected_at,
+                    recommendation=self._generate_recommendation(
+                        metric, entity_type, severity, deviation_pct
+                    ),
+                )
+            )
+
+        return anomalies
+
     def calculate_expected_value(
         self, historical_values: list[float]
     ) -> tuple[float, float]:
@@ -2,11 +2,17 @@
 Recommendation engine for generating optimization recommendations.
 """
 
+import asyncio
 from typing import Any
 from datetime import date, timedelta
 
+import numpy as np
+
 from ..models import Recommendation, RecommendationTarget, ExpectedImpact
 
+# Entity IDs per get_entity_history call
+HISTORY_BATCH_SIZE = 500
+
 
 class RecommendationEngine:
     """
@@ -16,14 +22,16 @@ class RecommendationEngine:
     fatigue, and generates actionable recommendations with confidence scores.
     """
     
-    def __init__(self, mcp_client: Any = None):
+    def __init__(self, mcp_client: Any = None, user_id: str | None = None):
         """
         Initialize the recommendation engine.
         
         Args:
             mcp_client: MCP client for fetching historical data
+            user_id: Owner of the entities, sent with history requests
         """
         self.mcp_client = mcp_client
+        self.user_id = user_id
         self.min_days_for_trend = 3  # Minimum days to establish a trend
     
     async def generate(
@@ -140,6 +148,9 @@ class RecommendationEngine:
         """
         Identify underperforming entities based on ROAS threshold.
         
+        History for all candidates is fetched in one batch and checked in
+        a single NumPy pass.
+
         Args:
             entities: List of entity metrics (adsets)
             threshold: Minimum acceptable ROAS
@@ -147,22 +158,32 @@ class RecommendationEngine:
         Returns:
             List of underperforming entities with consistent poor performance
         """
-        underperforming = []
+        candidates = [e for e in entities if e.get("roas", 0) < threshold]
+        if not candidates:
+            return []
         
-        for entity in entities:
-            roas = entity.get("roas", 0)
+        if not self.mcp_client:
+            # If no MCP client, assume consistent (for testing)
+            consistent = np.ones(len(candidates), dtype=bool)
+        else:
+            entity_ids = [e["entity_id"] for e in candidates]
+            history = await self._get_historical_performance_batch("adset", entity_ids)
+            roas, counts = self._pack_history(history, entity_ids, "roas")
             
-            # Check if ROAS is below threshold
-            if roas < threshold:
-                # Check for consistent underperformance
-                is_consistent = await self._check_consistent_underperformance(
-                    entity["entity_id"],
-                    threshold
-                )
-                
-                if is_consistent:
-                    entity["days_underperforming"] = self.min_days_for_trend
-                    underperforming.append(entity)
+            # Last min_days_for_trend days with data must all be below threshold
+            n = self.min_days_for_trend
+            if roas.shape[1] < n:
+                consistent = np.zeros(len(candidates), dtype=bool)
+            else:
+                last = np.clip(counts - n, 0, None)[:, None] + np.arange(n)
+                recent = np.take_along_axis(roas, last, axis=1)
+                consistent = (counts >= n) & np.all(recent < threshold, axis=1)
+
+        underperforming = []
+        for entity, is_consistent in zip(candidates, consistent):
+            if is_consistent:
+                entity["days_underperforming"] = self.min_days_for_trend
+                underperforming.append(entity)
         
         return underperforming
     
@@ -200,6 +221,9 @@ class RecommendationEngine:
         """
         Detect creative fatigue by analyzing CTR trends.
         
+        CTR history for all ads is fetched in one batch; baseline and
+        decline are computed for every ad at once.
+
         Args:
             entities: List of ad metrics
             decline_threshold: Minimum CTR decline percentage to flag (default 30%)
@@ -207,110 +231,130 @@ class RecommendationEngine:
         Returns:
             List of ads showing creative fatigue
         """
-        fatigued = []
+        if not entities or not self.mcp_client:
+            return []
         
-        for entity in entities:
-            # Get historical CTR data
-            ctr_trend = await self._get_ctr_trend(entity["entity_id"])
-            
-            # Need at least min_days_for_trend + 1 data points (baseline + recent)
-            if ctr_trend and len(ctr_trend) > self.min_days_for_trend:
-                # Calculate decline
-                recent_ctr = ctr_trend[-1]
-                baseline_ctr = sum(ctr_trend[:self.min_days_for_trend]) / self.min_days_for_trend
-                
-                if baseline_ctr > 0:
-                    decline = (baseline_ctr - recent_ctr) / baseline_ctr
-                    
-                    # Use small epsilon for floating-point comparison
-                    if decline >= decline_threshold - 1e-9:
-                        entity["ctr_decline_pct"] = decline * 100
-                        entity["baseline_ctr"] = baseline_ctr
-                        entity["recent_ctr"] = recent_ctr
-                        fatigued.append(entity)
+        entity_ids = [e["entity_id"] for e in entities]
+        history = await self._get_historical_performance_batch("ad", entity_ids)
+        ctr, counts = self._pack_history(history, entity_ids, "ctr")
+
+        n = self.min_days_for_trend
+        # Need at least min_days_for_trend + 1 data points (baseline + recent)
+        if ctr.shape[1] <= n:
+            return []
+
+        baseline = ctr[:, :n].mean(axis=1)
+        recent = np.take_along_axis(ctr, np.maximum(counts - 1, 0)[:, None], axis=1)[:, 0]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            decline = (baseline - recent) / baseline
+
+        # Use small epsilon for floating-point comparison
+        flagged = (counts > n) & (baseline > 0) & (decline >= decline_threshold - 1e-9)
+
+        fatigued = []
+        for i in np.flatnonzero(flagged):
+            entity = entities[i]
+            entity["ctr_decline_pct"] = float(decline[i]) * 100
+            entity["baseline_ctr"] = float(baseline[i])
+            entity["recent_ctr"] = float(recent[i])
+            fatigued.append(entity)
         
         return fatigued
     
-    async def _check_consistent_underperformance(
-        self,
-        entity_id: str,
-        threshold: float
-    ) -> bool:
+    @staticmethod
+    def _pack_history(
+        history: dict[str, dict[str, np.ndarray]],
+        entity_ids: list[str],
+        metric: str
+    ) -> tuple[np.ndarray, np.ndarray]:
         """
-        Check if an entity has been consistently underperforming.
+        Stack one metric for many entities into a matrix of data points.
+
+        Each row holds the entity's days with data in date order, moved to
+        the front and padded with NaN, so column i is the entity's i-th
+        data point.
         
         Args:
-            entity_id: Entity identifier
-            threshold: ROAS threshold
+            history: Output of _get_historical_performance_batch
+            entity_ids: Row order
+            metric: Metric column to stack
         
         Returns:
-            True if consistently underperforming for min_days_for_trend days
+            (matrix of shape (entities, days), data points per entity)
         """
-        if not self.mcp_client:
-            # If no MCP client, assume consistent (for testing)
-            return True
-        
-        # Get historical performance
-        historical = await self._get_historical_performance(entity_id)
-        
-        if len(historical) < self.min_days_for_trend:
-            return False
-        
-        # Check last N days
-        recent = historical[-self.min_days_for_trend:]
-        return all(day.get("roas", 0) < threshold for day in recent)
+        width = max(
+            (len(columns.get(metric, ())) for columns in history.values()),
+            default=0
+        )
+        matrix = np.full((len(entity_ids), width), np.nan)
+        for row, entity_id in enumerate(entity_ids):
+            values = history.get(entity_id, {}).get(metric)
+            if values is not None and len(values):
+                matrix[row, -len(values):] = values
+
+        missing = np.isnan(matrix)
+        order = np.argsort(missing, axis=1, kind="stable")
+        packed = np.take_along_axis(matrix, order, axis=1)
+        return packed, (~missing).sum(axis=1)
     
-    async def _get_historical_performance(
+    async def _get_historical_performance_batch(
         self,
-        entity_id: str,
+        entity_type: str,
+        entity_ids: list[str],
         days: int = 7
-    ) -> list[dict]:
+    ) -> dict[str, dict[str, np.ndarray]]:
         """
-        Get historical performance data for an entity.
+        Get daily historical performance for many entities.
+
+        Calls the get_entity_history MCP tool once per HISTORY_BATCH_SIZE
+        entities, concurrently.
         
         Args:
-            entity_id: Entity identifier
+            entity_type: Entity type of all entities ("adset" or "ad")
+            entity_ids: Entity identifiers
             days: Number of days to retrieve
         
         Returns:
-            List of daily metrics
+            Mapping of entity ID to {metric: float array over the days},
+            NaN where a day has no data; entities without data are omitted
         """
-        if not self.mcp_client:
-            return []
+        if not self.mcp_client or not entity_ids:
+            return {}
         
         # Calculate date range
         end_date = date.today()
         start_date = end_date - timedelta(days=days)
         
-        try:
-            # Call MCP to get historical metrics
-            result = await self.mcp_client.call_tool(
-                "get_metrics",
-                {
-                    "entity_id": entity_id,
-                    "date_range": {
-                        "start_date": start_date.isoformat(),
-                        "end_date": end_date.isoformat()
-                    }
+        async def fetch(chunk: list[str]) -> dict:
+            params = {
+                "entity_type": entity_type,
+                "entity_ids": chunk,
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat(),
+            }
+            if self.user_id is not None:
+                params["user_id"] = self.user_id
+            try:
+                result = await self.mcp_client.call_tool("get_entity_history", params)
+                return result.get("series", {})
+            except Exception:
+                return {}
+
+        chunks = await asyncio.gather(*(
+            fetch(entity_ids[i:i + HISTORY_BATCH_SIZE])
+            for i in range(0, len(entity_ids), HISTORY_BATCH_SIZE)
+        ))
+
+        history: dict[str, dict[str, np.ndarray]] = {}
+        for series in chunks:
+            for entity_id, columns in series.items():
+                history[entity_id] = {
+                    # None marks days without data and becomes NaN
+                    metric: np.array(values, dtype=float)
+                    for metric, values in columns.items()
                 }
-            )
-            
-            return result.get("metrics", [])
-        except Exception:
-            return []
-    
-    async def _get_ctr_trend(self, entity_id: str) -> list[float]:
-        """
-        Get CTR trend for an ad.
-        
-        Args:
-            entity_id: Ad identifier
-        
-        Returns:
-            List of CTR values over time
-        """
-        historical = await self._get_historical_performance(entity_id)
-        return [day.get("ctr", 0) for day in historical]
+        return history
     
     def _calculate_confidence(
         self,
@@ -2,16 +2,17 @@
 Cache manager for Ad Performance module.
 
 Provides caching functionality for metrics data to reduce API calls
-and improve performance.
+and improve performance. Storage goes through the shared cache layer
+(app.core.cache), which keeps recent entries in process as well.
 
 Requirements: Performance requirements
 """
 
-import json
-from typing import Any
 import structlog
 from redis.asyncio import Redis
 
+from app.core.cache import Cache, CacheSerializationError
+
 logger = structlog.get_logger(__name__)
 
 
@@ -32,6 +33,7 @@ class CacheManager:
         """
         self.redis = redis_client
         self.cache_ttl = 300  # 5 minutes in seconds
+        self.cache = Cache("ad_performance_metrics", redis_client, ttl=self.cache_ttl)
         
         logger.info(
             "cache_manager_initialized",
@@ -67,27 +69,13 @@ class CacheManager:
             cache_key=cache_key,
         )
         
-        try:
-            cached_value = await self.redis.get(cache_key)
-            
-            if cached_value:
-                log.info("cache_hit")
-                metrics = json.loads(cached_value)
-                return metrics
-            else:
-                log.info("cache_miss")
-                return None
-                
-        except json.JSONDecodeError as e:
-            log.warning("cache_parse_error", error=str(e))
-            # Invalidate corrupted cache entry
-            await self.redis.delete(cache_key)
-            return None
-            
-        except Exception as e:
-            log.error("cache_get_error", error=str(e))
-            # Return None on cache errors to allow fallback to source
-            return None
+        # Read errors and corrupted entries come back as misses
+        metrics = await self.cache.get(cache_key)
+        if metrics is not None:
+            log.info("cache_hit")
+        else:
+            log.info("cache_miss")
+        return metrics
     
     async def cache_metrics(
         self,
@@ -122,30 +110,16 @@ class CacheManager:
         )
         
         try:
-            # Serialize data to JSON
-            json_data = json.dumps(data, ensure_ascii=False)
-            
-            # Store in Redis with TTL
-            result = await self.redis.setex(
-                cache_key,
-                self.cache_ttl,
-                json_data,
-            )
-            
-            if result:
-                log.info("cache_set_success")
-                return True
-            else:
-                log.warning("cache_set_failed")
-                return False
-                
-        except (TypeError, ValueError) as e:
+            result = await self.cache.set(cache_key, data, self.cache_ttl)
+        except CacheSerializationError as e:
             log.error("cache_serialization_error", error=str(e))
             return False
-            
-        except Exception as e:
-            log.error("cache_set_error", error=str(e))
-            return False
+
+        if result:
+            log.info("cache_set_success")
+        else:
+            log.warning("cache_set_failed")
+        return result
     
     async def invalidate_cache(
         self,
@@ -184,16 +158,8 @@ class CacheManager:
                 cache_key = self._build_cache_key(user_id, date, platform)
                 pattern = cache_key
             
-            # Find matching keys
-            keys = []
-            async for key in self.redis.scan_iter(match=pattern):
-                keys.append(key)
-            
-            # Delete keys
-            deleted_count = 0
-            if keys:
-                deleted_count = await self.redis.delete(*keys)
-            
+            deleted_count = await self.cache.delete_matching(pattern)
+
             log.info(
                 "cache_invalidation_complete",
                 deleted_count=deleted_count,
@@ -8,11 +8,14 @@ adsets or adjusting budgets based on performance metrics.
 Requirements: 6.1, 6.3, 6.4, 6.5
 """
 
+import asyncio
 import logging
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
+import numpy as np
 import redis.asyncio as redis
 from app.core.redis_client import get_redis
 from app.modules.campaign_automation.adapters.router import PlatformRouter
@@ -26,6 +29,21 @@ from app.services.mcp_client import MCPClient
 
 logger = logging.getLogger(__name__)
 
+# Keys per SCAN, MGET and MSET round trip
+REDIS_BATCH_SIZE = 500
+
+# Entity IDs per get_entity_metrics call
+METRICS_BATCH_SIZE = 500
+
+# Vectorized comparison for each condition operator
+CONDITION_OPERATORS = {
+    "greater_than": np.greater,
+    "less_than": np.less,
+    "equals": np.equal,
+    "greater_than_or_equal": np.greater_equal,
+    "less_than_or_equal": np.less_equal,
+}
+
 
 class RuleEngine:
     """
@@ -55,6 +73,8 @@ class RuleEngine:
         self,
         mcp_client: Optional[MCPClient] = None,
         redis_client: Optional[redis.Redis] = None,
+        fetch_concurrency: int = 8,
+        action_concurrency: int = 16,
     ):
         """
         Initialize Rule Engine.
@@ -62,12 +82,19 @@ class RuleEngine:
         Args:
             mcp_client: MCP client for data access
             redis_client: Redis client for rule storage (optional, will use global if not provided)
+            fetch_concurrency: Maximum concurrent metric requests during check_rules
+            action_concurrency: Maximum concurrent rule actions during check_rules
         """
         self.mcp_client = mcp_client or MCPClient()
         self._redis_client = redis_client
         self.platform_router = PlatformRouter()
         self.rule_prefix = "campaign_automation:rule:"
+        self.checked_prefix = "campaign_automation:rule_checked:"
+        self.user_rules_prefix = "campaign_automation:user_rules:"
         self.log_prefix = "campaign_automation:rule_log:"
+        self.fetch_concurrency = fetch_concurrency
+        self.action_concurrency = action_concurrency
+        self.last_run_stats: dict[str, Any] = {}
     
     async def _get_redis(self) -> redis.Redis:
         """Get Redis client instance."""
@@ -168,7 +195,20 @@ class RuleEngine:
         """
         Check all rules and execute actions when conditions are met.
         
-        This method is called periodically by the Celery task.
+        This method is called periodically by the Celery task. Rules are
+        processed in phases rather than one at a time:
+
+        1. load: rule IDs come from the per-user rule sets (SCAN over the
+           sets when no user is given) and rules are read with MGET
+        2. fetch: targets sharing (user, target type, time range) get their
+           metrics from one get_entity_metrics call per METRICS_BATCH_SIZE IDs
+        3. evaluate: conditions are compared as NumPy arrays, one
+           comparison per operator
+        4. act: matched actions run with bounded concurrency
+        5. persist: last_checked_at is written back with one MSET to
+           per-rule keys, so the rules themselves are never rewritten
+
+        Phase timings and throughput are logged and kept in last_run_stats.
         
         Args:
             user_id: Optional user ID to check rules for specific user
@@ -178,119 +218,349 @@ class RuleEngine:
             
         Validates: Requirements 6.3
         """
-        results = []
+        results: list[dict] = []
+        timings: dict[str, float] = {}
+        started = phase_start = time.perf_counter()
+
+        def end_phase(name: str) -> None:
+            nonlocal phase_start
+            now = time.perf_counter()
+            timings[name] = round((now - phase_start) * 1000, 2)
+            phase_start = now
+
+        rules: list[tuple[str, Rule]] = []
+        matches: list[tuple[Rule, dict]] = []
         
         try:
-            # Get all rules to check
             redis_client = await self._get_redis()
-            if user_id:
-                # Check rules for specific user
-                user_rules_key = f"campaign_automation:user_rules:{user_id}"
-                rule_ids = await redis_client.smembers(user_rules_key)
-            else:
-                # Check all rules
-                rule_keys = await redis_client.keys(f"{self.rule_prefix}*")
-                rule_ids = [key.split(":")[-1] for key in rule_keys]
             
-            logger.info(
-                f"Checking {len(rule_ids)} rules",
-                extra={"user_id": user_id, "rule_count": len(rule_ids)},
-            )
+            rules = await self._load_due_rules(redis_client, user_id)
+            end_phase("load")
             
-            for rule_id in rule_ids:
-                try:
-                    result = await self._check_single_rule(rule_id)
-                    if result:
-                        results.append(result)
-                except Exception as e:
-                    logger.error(
-                        f"Failed to check rule {rule_id}: {e}",
-                        extra={"rule_id": rule_id, "error": str(e)},
-                    )
+            metrics = await self._fetch_rule_metrics(rules)
+            end_phase("fetch")
+
+            matches = await self._match_rule_targets(rules, metrics)
+            end_phase("evaluate")
             
-            return results
+            results = await self._execute_matches(matches)
+            end_phase("act")
+
+            await self._mark_rules_checked(redis_client, rules)
+            end_phase("persist")
             
         except Exception as e:
             logger.error(
                 f"Failed to check rules: {e}",
                 extra={"user_id": user_id, "error": str(e)},
             )
-            return results
+
+        elapsed = time.perf_counter() - started
+        self.last_run_stats = {
+            "rules_checked": len(rules),
+            "targets_matched": len(matches),
+            "actions_taken": sum(len(r["actions_taken"]) for r in results),
+            "elapsed_ms": round(elapsed * 1000, 2),
+            "rules_per_second": round(len(rules) / elapsed, 1) if elapsed > 0 else 0.0,
+            "phase_ms": timings,
+        }
+        logger.info(
+            f"Checked {len(rules)} rules in {self.last_run_stats['elapsed_ms']}ms",
+            extra={"user_id": user_id, **self.last_run_stats},
+        )
+
+        return results
     
-    async def _check_single_rule(self, rule_id: str) -> Optional[dict]:
+    async def _load_due_rules(
+        self,
+        redis_client: redis.Redis,
+        user_id: Optional[str] = None,
+    ) -> list[tuple[str, Rule]]:
         """
-        Check a single rule and execute action if condition is met.
+        Load enabled rules whose check interval has elapsed.
         
         Args:
-            rule_id: Rule ID to check
+            redis_client: Redis client
+            user_id: Optional user ID to load rules for a single user
         
         Returns:
-            dict: Execution result if action was taken, None otherwise
+            list[tuple[str, Rule]]: (owner user ID, rule) pairs
         """
-        # Load rule
-        redis_client = await self._get_redis()
-        rule_key = f"{self.rule_prefix}{rule_id}"
-        rule_data = await redis_client.get(rule_key)
+        owners: dict[str, str] = {}
+
+        if user_id:
+            for rule_id in await redis_client.smembers(
+                f"{self.user_rules_prefix}{user_id}"
+            ):
+                owners[rule_id] = str(user_id)
+        else:
+            # SCAN the per-user sets instead of KEYS over every rule key,
+            # which blocks Redis for the whole keyspace walk
+            cursor = 0
+            while True:
+                cursor, keys = await redis_client.scan(
+                    cursor,
+                    match=f"{self.user_rules_prefix}*",
+                    count=REDIS_BATCH_SIZE,
+                )
+                if keys:
+                    pipe = redis_client.pipeline(transaction=False)
+                    for key in keys:
+                        pipe.smembers(key)
+                    for key, rule_ids in zip(keys, await pipe.execute()):
+                        owner = key[len(self.user_rules_prefix):]
+                        for rule_id in rule_ids:
+                            owners[rule_id] = owner
+                if not cursor:
+                    break
+
+        rule_ids = list(owners)
+        now = datetime.now(timezone.utc)
+        rules: list[tuple[str, Rule]] = []
+
+        for i in range(0, len(rule_ids), REDIS_BATCH_SIZE):
+            chunk = rule_ids[i:i + REDIS_BATCH_SIZE]
+            values = await redis_client.mget(
+                [f"{self.rule_prefix}{rule_id}" for rule_id in chunk]
+                + [f"{self.checked_prefix}{rule_id}" for rule_id in chunk]
+            )
+            for rule_id, rule_data, checked_at in zip(
+                chunk, values[:len(chunk)], values[len(chunk):]
+            ):
+                if not rule_data:
+                    logger.warning(f"Rule not found: {rule_id}")
+                    continue
+                try:
+                    rule = self._load_rule(rule_data, checked_at)
+                except ValueError as e:
+                    logger.error(
+                        f"Failed to load rule {rule_id}: {e}",
+                        extra={"rule_id": rule_id, "error": str(e)},
+                    )
+                    continue
+
+                if not rule.enabled:
+                    continue
+                if rule.last_checked_at and (
+                    now - rule.last_checked_at
+                ).total_seconds() < rule.check_interval:
+                    continue
+
+                rules.append((owners[rule_id], rule))
         
-        if not rule_data:
-            logger.warning(f"Rule not found: {rule_id}")
-            return None
+        return rules
+
+    async def _fetch_rule_metrics(
+        self,
+        rules: list[tuple[str, Rule]],
+    ) -> dict[tuple[str, str, int], dict[str, dict]]:
+        """
+        Fetch metrics for every rule target with batched MCP calls.
         
-        rule = Rule.model_validate_json(rule_data)
+        Targets are grouped by (owner, target type, time range hours) so
+        that all rules looking at the same window share one request.
         
-        # Check if rule is enabled
-        if not rule.enabled:
-            return None
+        Args:
+            rules: (owner user ID, rule) pairs
         
-        # Check if it's time to check this rule
-        if rule.last_checked_at:
-            time_since_check = (
-                datetime.now(timezone.utc) - rule.last_checked_at
-            ).total_seconds()
-            if time_since_check < rule.check_interval:
-                return None
+        Returns:
+            dict: Metrics by entity ID for each (owner, type, hours) group
+        """
+        groups: dict[tuple[str, str, int], set[str]] = {}
+        for owner, rule in rules:
+            hours = self._parse_time_range(rule.condition.time_range)
+            for target in await self._get_rule_targets(rule):
+                groups.setdefault((owner, target["type"], hours), set()).add(
+                    target["id"]
+                )
         
-        # Get targets to check
-        targets = await self._get_rule_targets(rule)
+        end_date = datetime.now(timezone.utc)
+        semaphore = asyncio.Semaphore(self.fetch_concurrency)
+        metrics: dict[tuple[str, str, int], dict[str, dict]] = {
+            group: {} for group in groups
+        }
         
-        # Check condition for each target
-        actions_taken = []
-        for target in targets:
-            if await self._evaluate_condition(rule.condition, target):
-                # Condition met, execute action
-                action_result = await self.execute_rule_action(
-                    rule_id=rule_id,
+        async def fetch(group: tuple[str, str, int], entity_ids: list[str]) -> None:
+            owner, target_type, hours = group
+            async with semaphore:
+                try:
+                    result = await self.mcp_client.call_tool(
+                        "get_entity_metrics",
+                        {
+                            "user_id": owner,
+                            "entity_type": target_type,
+                            "entity_ids": entity_ids,
+                            "start_date": (end_date - timedelta(hours=hours)).isoformat(),
+                            "end_date": end_date.isoformat(),
+                        },
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Failed to fetch metrics: {e}",
+                        extra={
+                            "user_id": owner,
+                            "target_type": target_type,
+                            "target_count": len(entity_ids),
+                            "error": str(e),
+                        },
+                    )
+                    return
+            metrics[group].update(result.get("metrics") or {})
+
+        calls = []
+        for group, ids in groups.items():
+            ids = sorted(ids)
+            for i in range(0, len(ids), METRICS_BATCH_SIZE):
+                calls.append(fetch(group, ids[i:i + METRICS_BATCH_SIZE]))
+        await asyncio.gather(*calls)
+
+        return metrics
+
+    async def _match_rule_targets(
+        self,
+        rules: list[tuple[str, Rule]],
+        metrics: dict[tuple[str, str, int], dict[str, dict]],
+    ) -> list[tuple[Rule, dict]]:
+        """
+        Evaluate every (rule, target) condition in one vectorized pass.
+
+        Missing metrics are NaN, which compares False under every operator,
+        so targets without data never match.
+
+        Args:
+            rules: (owner user ID, rule) pairs
+            metrics: Output of _fetch_rule_metrics
+
+        Returns:
+            list[tuple[Rule, dict]]: Matching (rule, target) pairs in rule order
+        """
+        pairs: list[tuple[Rule, dict]] = []
+        values: list[float] = []
+        thresholds: list[float] = []
+        operators: list[str] = []
+
+        for owner, rule in rules:
+            condition = rule.condition
+            hours = self._parse_time_range(condition.time_range)
+            for target in await self._get_rule_targets(rule):
+                entity = metrics.get((owner, target["type"], hours), {}).get(target["id"])
+                value = entity.get(condition.metric) if entity else None
+                try:
+                    value = float(value) if value is not None else np.nan
+                except (TypeError, ValueError):
+                    value = np.nan
+                pairs.append((rule, target))
+                values.append(value)
+                thresholds.append(float(condition.value))
+                operators.append(condition.operator)
+
+        if not pairs:
+            return []
+
+        value_array = np.array(values, dtype=np.float64)
+        threshold_array = np.array(thresholds, dtype=np.float64)
+        operator_array = np.array(operators)
+        matched = np.zeros(len(pairs), dtype=bool)
+
+        for operator, compare in CONDITION_OPERATORS.items():
+            selected = operator_array == operator
+            if selected.any():
+                matched[selected] = compare(
+                    value_array[selected], threshold_array[selected]
+                )
+
+        unknown = set(operators) - CONDITION_OPERATORS.keys()
+        if unknown:
+            logger.warning(f"Unknown operators: {sorted(unknown)}")
+
+        return [pairs[i] for i in np.flatnonzero(matched)]
+
+    async def _execute_matches(
+        self,
+        matches: list[tuple[Rule, dict]],
+    ) -> list[dict]:
+        """
+        Execute actions for matched targets with bounded concurrency.
+
+        Args:
+            matches: Matching (rule, target) pairs
+
+        Returns:
+            list[dict]: One result per rule that took at least one action
+        """
+        semaphore = asyncio.Semaphore(self.action_concurrency)
+
+        async def execute(rule: Rule, target: dict) -> dict:
+            async with semaphore:
+                return await self.execute_rule_action(
+                    rule_id=rule.rule_id,
                     target_id=target["id"],
                     target_type=target["type"],
                     action=rule.action.model_dump(),
                     platform=target.get("platform", "meta"),
                 )
-                
-                if action_result["status"] == "success":
-                    actions_taken.append({
-                        "target_id": target["id"],
-                        "target_type": target["type"],
-                        "action": rule.action.type,
-                        "result": action_result,
-                    })
-        
-        # Update last checked timestamp
-        rule.last_checked_at = datetime.now(timezone.utc)
-        await redis_client.set(
-            rule_key,
-            rule.model_dump_json(),
-            ex=None,
+
+        action_results = await asyncio.gather(
+            *(execute(rule, target) for rule, target in matches)
         )
         
-        if actions_taken:
-            return {
-                "rule_id": rule_id,
+        results: dict[str, dict] = {}
+        for (rule, target), action_result in zip(matches, action_results):
+            if action_result["status"] != "success":
+                continue
+            result = results.setdefault(rule.rule_id, {
+                "rule_id": rule.rule_id,
                 "rule_name": rule.rule_name,
-                "actions_taken": actions_taken,
+                "actions_taken": [],
                 "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
+            })
+            result["actions_taken"].append({
+                "target_id": target["id"],
+                "target_type": target["type"],
+                "action": rule.action.type,
+                "result": action_result,
+            })
+
+        return list(results.values())
+
+    def _load_rule(self, rule_data: str, checked_at: Optional[str]) -> Rule:
+        """
+        Parse a stored rule and apply its separately stored check time.
+
+        Args:
+            rule_data: Rule JSON
+            checked_at: ISO timestamp from the rule's checked key, if any
         
-        return None
+        Returns:
+            Rule: Parsed rule
+        """
+        rule = Rule.model_validate_json(rule_data)
+        if checked_at:
+            rule.last_checked_at = datetime.fromisoformat(checked_at)
+        return rule
+
+    async def _mark_rules_checked(
+        self,
+        redis_client: redis.Redis,
+        rules: list[tuple[str, Rule]],
+    ) -> None:
+        """
+        Update last_checked_at for checked rules.
+
+        The time goes to a key of its own rather than into the rule JSON,
+        so a rule deleted during the check is not written back.
+
+        Args:
+            redis_client: Redis client
+            rules: (owner user ID, rule) pairs that were checked
+        """
+        checked_at = datetime.now(timezone.utc)
+        for i in range(0, len(rules), REDIS_BATCH_SIZE):
+            mapping = {}
+            for _, rule in rules[i:i + REDIS_BATCH_SIZE]:
+                rule.last_checked_at = checked_at
+                mapping[f"{self.checked_prefix}{rule.rule_id}"] = checked_at.isoformat()
+            await redis_client.mset(mapping)
     
     async def _get_rule_targets(self, rule: Rule) -> list[dict]:
         """
@@ -322,114 +592,6 @@ class RuleEngine:
         
         return targets
     
-    async def _evaluate_condition(
-        self,
-        condition: RuleCondition,
-        target: dict,
-    ) -> bool:
-        """
-        Evaluate if a condition is met for a target.
-        
-        Args:
-            condition: Rule condition to evaluate
-            target: Target (campaign/adset) to evaluate
-        
-        Returns:
-            bool: True if condition is met, False otherwise
-        """
-        try:
-            # Get performance data for target
-            metric_value = await self._get_metric_value(
-                target_id=target["id"],
-                target_type=target["type"],
-                metric=condition.metric,
-                time_range=condition.time_range,
-            )
-            
-            if metric_value is None:
-                return False
-            
-            # Evaluate condition
-            if condition.operator == "greater_than":
-                return metric_value > condition.value
-            elif condition.operator == "less_than":
-                return metric_value < condition.value
-            elif condition.operator == "equals":
-                return metric_value == condition.value
-            elif condition.operator == "greater_than_or_equal":
-                return metric_value >= condition.value
-            elif condition.operator == "less_than_or_equal":
-                return metric_value <= condition.value
-            else:
-                logger.warning(f"Unknown operator: {condition.operator}")
-                return False
-                
-        except Exception as e:
-            logger.error(
-                f"Failed to evaluate condition: {e}",
-                extra={
-                    "target_id": target["id"],
-                    "metric": condition.metric,
-                    "error": str(e),
-                },
-            )
-            return False
-    
-    async def _get_metric_value(
-        self,
-        target_id: str,
-        target_type: str,
-        metric: str,
-        time_range: str,
-    ) -> Optional[float]:
-        """
-        Get metric value for a target from performance data.
-        
-        Args:
-            target_id: Target ID (campaign or adset)
-            target_type: Target type ("campaign" or "adset")
-            metric: Metric name (cpa, roas, ctr, spend, conversions)
-            time_range: Time range (e.g., "24h", "7d")
-        
-        Returns:
-            float: Metric value, or None if not available
-        """
-        try:
-            # Parse time range
-            hours = self._parse_time_range(time_range)
-            start_date = datetime.now(timezone.utc) - timedelta(hours=hours)
-            
-            # Get performance data from MCP
-            # Note: This assumes the MCP tool returns aggregated metrics
-            # In production, this would call the actual MCP tool
-            result = await self.mcp_client.call_tool(
-                "get_reports",
-                {
-                    f"{target_type}_id": target_id,
-                    "date_range": {
-                        "start_date": start_date.isoformat(),
-                        "end_date": datetime.now(timezone.utc).isoformat(),
-                    },
-                    "metrics": [metric],
-                },
-            )
-            
-            if result.get("status") == "success" and result.get("data"):
-                return result["data"].get(metric)
-            
-            return None
-            
-        except Exception as e:
-            logger.error(
-                f"Failed to get metric value: {e}",
-                extra={
-                    "target_id": target_id,
-                    "metric": metric,
-                    "error": str(e),
-                },
-            )
-            return None
-    
     def _parse_time_range(self, time_range: str) -> int:
         """
         Parse time range string to hours.
@@ -708,13 +870,14 @@ class RuleEngine:
         """
         try:
             redis_client = await self._get_redis()
-            rule_key = f"{self.rule_prefix}{rule_id}"
-            rule_data = await redis_client.get(rule_key)
+            rule_data, checked_at = await redis_client.mget(
+                [f"{self.rule_prefix}{rule_id}", f"{self.checked_prefix}{rule_id}"]
+            )
             
             if not rule_data:
                 return None
             
-            rule = Rule.model_validate_json(rule_data)
+            rule = self._load_rule(rule_data, checked_at)
             return rule.model_dump()
             
         except Exception as e:
@@ -767,9 +930,10 @@ class RuleEngine:
         """
         try:
             redis_client = await self._get_redis()
-            # Delete rule
-            rule_key = f"{self.rule_prefix}{rule_id}"
-            await redis_client.delete(rule_key)
+            # Delete rule and its check time
+            await redis_client.delete(
+                f"{self.rule_prefix}{rule_id}", f"{self.checked_prefix}{rule_id}"
+            )
             
             # Remove from user's rule set
             user_rules_key = f"campaign_automation:user_rules:{user_id}"
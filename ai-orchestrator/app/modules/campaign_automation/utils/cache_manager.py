@@ -2,16 +2,18 @@
 Cache manager for Campaign Automation module.
 
 Provides caching functionality for campaign status data to reduce API calls
-and improve performance.
+and improve performance. Storage goes through the shared cache layer
+(app.core.cache), so concurrent requests for one campaign share a fetch.
 
 Requirements: 8.4
 """
 
-import json
 from typing import Any, Callable
 import structlog
 from redis.asyncio import Redis
 
+from app.core.cache import Cache
+
 logger = structlog.get_logger(__name__)
 
 
@@ -32,10 +34,19 @@ class CacheManager:
         """
         self.redis = redis_client
         self.default_ttl = 300  # 5 minutes in seconds
+        # Expired status is served for another 5 minutes while it is refreshed
+        self.stale_ttl = 300
+        self.cache = Cache(
+            "campaign_automation",
+            redis_client,
+            ttl=self.default_ttl,
+            stale_ttl=self.stale_ttl,
+        )
         
         logger.info(
             "cache_manager_initialized",
             default_ttl=self.default_ttl,
+            stale_ttl=self.stale_ttl,
         )
     
     async def get_or_fetch(
@@ -46,8 +57,10 @@ class CacheManager:
     ) -> Any:
         """Get cached data or fetch from source
         
-        Attempts to retrieve data from cache. If not found or expired,
-        executes the fetch function and caches the result.
+        Attempts to retrieve data from cache. On a miss one caller executes
+        the fetch function and caches the result while concurrent callers
+        wait for it. Expired data is returned while it is refreshed in the
+        background, and keeps being returned if the refresh fails.
         
         Args:
             key: Cache key
@@ -67,52 +80,9 @@ class CacheManager:
         )
         
         try:
-            # Try to get from cache
-            cached_value = await self.redis.get(key)
-            
-            if cached_value:
-                log.info("cache_hit")
-                try:
-                    return json.loads(cached_value)
-                except json.JSONDecodeError as e:
-                    log.warning("cache_parse_error", error=str(e))
-                    # Invalidate corrupted cache entry
-                    await self.redis.delete(key)
-            else:
-                log.info("cache_miss")
-            
-        except Exception as e:
-            log.warning("cache_get_error", error=str(e))
-            # Continue to fetch from source on cache errors
-        
-        # Cache miss or error - fetch from source
-        log.info("fetching_from_source")
-        try:
-            data = await fetch_func()
-            
-            # Cache the result
-            try:
-                json_data = json.dumps(data, ensure_ascii=False)
-                await self.redis.setex(key, cache_ttl, json_data)
-                log.info("cache_set_success")
-            except Exception as e:
-                log.warning("cache_set_error", error=str(e))
-                # Continue even if caching fails
-            
-            return data
-            
+            return await self.cache.get_or_fetch(key, fetch_func, cache_ttl)
         except Exception as e:
             log.error("fetch_from_source_failed", error=str(e))
-            # Try to return stale cache as fallback
-            try:
-                stale_value = await self.redis.get(key)
-                if stale_value:
-                    log.warning("returning_stale_cache")
-                    return json.loads(stale_value)
-            except Exception:
-                pass
-            
-            # Re-raise the original error if no fallback available
             raise
     
     async def invalidate(self, pattern: str) -> int:
@@ -133,15 +103,7 @@ class CacheManager:
         log.info("cache_invalidation_start")
         
         try:
-            # Find matching keys
-            keys = []
-            async for key in self.redis.scan_iter(match=pattern):
-                keys.append(key)
-            
-            # Delete keys
-            deleted_count = 0
-            if keys:
-                deleted_count = await self.redis.delete(*keys)
+            deleted_count = await self.cache.delete_matching(pattern)
             
             log.info(
                 "cache_invalidation_complete",
@@ -163,7 +125,7 @@ class CacheManager:
         """Get campaign status with caching
         
         Specialized method for caching campaign status data.
-        Uses a 5-minute TTL and provides fallback to stale cache on errors.
+        Uses a 5-minute TTL and serves stale status while refreshing it.
         
         Args:
             campaign_id: Campaign ID
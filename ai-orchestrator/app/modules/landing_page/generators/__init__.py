@@ -3,8 +3,10 @@ Generators package for Landing Page module.
 
 This package provides generators for creating landing page content:
 - PageGenerator: Main generator for complete landing page structures
+- run_sections: Concurrent section pipeline shared by page and HTML generation
 """
 
 from .page_generator import PageGenerator
+from .pipeline import Section, generation_budget, run_sections
 
-__all__ = ["PageGenerator"]
+__all__ = ["PageGenerator", "Section", "generation_budget", "run_sections"]
@@ -3,10 +3,13 @@ Page Generator for Landing Page module.
 
 This module provides the PageGenerator class for generating landing page
 structures from product information using AI-powered headline optimization.
+Independent sections are generated concurrently and cached per product,
+template and language.
 
 Requirements: 2.1, 2.2, 2.3, 2.4
 """
 
+import hashlib
 import json
 import uuid
 from typing import Literal
@@ -14,6 +17,7 @@ from typing import Literal
 import structlog
 from pydantic import BaseModel
 
+from app.core.cache import Cache
 from app.services.gemini_client import GeminiClient
 
 from ..models import (
@@ -26,6 +30,7 @@ from ..models import (
     Review,
     ThemeConfig,
 )
+from .pipeline import Section, SectionCallback, run_sections
 
 logger = structlog.get_logger(__name__)
 
@@ -82,6 +87,7 @@ class PageGenerator:
     - Review section handling
     - FAQ generation
     - Template-based theming
+    - Concurrent section generation with per-section caching
 
     Requirements: 2.1, 2.2, 2.3, 2.4
     """
@@ -91,14 +97,24 @@ class PageGenerator:
     MAX_FEATURES = 3
     MAX_REVIEWS = 3
     MAX_FAQS = 5
+    SECTION_CACHE_TTL = 24 * 60 * 60  # 1 day
+    PREFIX_SECTION = "landing_page:section"
 
-    def __init__(self, gemini_client: GeminiClient | None = None):
+    def __init__(
+        self,
+        gemini_client: GeminiClient | None = None,
+        section_cache: Cache | None = None,
+    ):
         """Initialize PageGenerator.
 
         Args:
             gemini_client: Gemini client for AI generation. Creates new if None.
+            section_cache: Cache for generated sections. Creates new if None.
         """
         self.gemini = gemini_client or GeminiClient()
+        self.section_cache = section_cache or Cache(
+            "landing_page.sections", ttl=self.SECTION_CACHE_TTL
+        )
 
     async def generate(
         self,
@@ -106,16 +122,20 @@ class PageGenerator:
         template: str = "modern",
         language: str = "en",
         pixel_id: str | None = None,
+        on_section: SectionCallback | None = None,
     ) -> LandingPageContent:
         """生成落地页结构
 
         Generates a complete landing page structure from product information.
+        Hero, features and FAQ are independent LLM calls and run concurrently.
 
         Args:
             product_info: Product information extracted from e-commerce platform
             template: Template name (modern, minimal, vibrant)
             language: Language code (en, es, fr, zh)
             pixel_id: Facebook Pixel ID for tracking
+            on_section: Awaited with (section name, section) as each section
+                completes, for streaming the page to the client
 
         Returns:
             Complete LandingPageContent structure
@@ -141,43 +161,41 @@ class PageGenerator:
             product_title=product_info.title,
         )
 
-        # Generate hero section with AI-optimized headlines
-        hero = await self.generate_hero_section(product_info, template, language)
-
-        # Extract/generate features
-        features = await self.extract_features(product_info, language)
-
-        # Process reviews (limit to top 3)
-        reviews = self._process_reviews(product_info.reviews)
-
-        # Generate FAQ
-        faq = await self._generate_faq(product_info, language)
-
-        # Create CTA section
-        cta = self._create_cta_section(product_info)
-
-        # Get theme config for template
-        theme = self._get_theme_config(template)
+        sections = await run_sections(
+            [
+                # Hero section with AI-optimized headlines
+                Section(
+                    "hero",
+                    lambda: self.generate_hero_section(product_info, template, language),
+                ),
+                # Extract/generate features
+                Section("features", lambda: self.extract_features(product_info, language)),
+                # Generate FAQ
+                Section("faq", lambda: self._generate_faq(product_info, language)),
+                # Process reviews (limit to top 3)
+                Section("reviews", lambda: self._process_reviews(product_info.reviews)),
+                # Create CTA section
+                Section("cta", lambda: self._create_cta_section(product_info)),
+                # Get theme config for template
+                Section("theme", lambda: self._get_theme_config(template)),
+            ],
+            on_section=on_section,
+        )
 
         landing_page = LandingPageContent(
             landing_page_id=landing_page_id,
             template=template,
             language=language,
-            hero=hero,
-            features=features,
-            reviews=reviews,
-            faq=faq,
-            cta=cta,
-            theme=theme,
             pixel_id=pixel_id,
+            **sections,
         )
 
         logger.info(
             "page_generation_complete",
             landing_page_id=landing_page_id,
-            feature_count=len(features),
-            review_count=len(reviews),
-            faq_count=len(faq),
+            feature_count=len(landing_page.features),
+            review_count=len(landing_page.reviews),
+            faq_count=len(landing_page.faq),
         )
 
         return landing_page
@@ -244,7 +262,7 @@ Return a JSON object with: headline, subheadline, cta_text"""
             language=language,
         )
 
-        try:
+        async def generate() -> dict:
             result = await self.gemini.structured_output(
                 messages=[{"role": "user", "content": prompt}],
                 schema=HeroGenerationResult,
@@ -263,7 +281,13 @@ Return a JSON object with: headline, subheadline, cta_text"""
                 headline=hero.headline[:50],
             )
 
-            return hero
+            return hero.model_dump(mode="json")
+
+        try:
+            cache_key = self._section_cache_key("hero", product_info, language, template)
+            return HeroSection.model_validate(
+                await self.section_cache.get_or_fetch(cache_key, generate)
+            )
 
         except Exception as e:
             logger.error("hero_generation_failed", error=str(e))
@@ -334,7 +358,7 @@ Requirements:
 
 Return a JSON object with a "features" array containing objects with: title, description, icon"""
 
-        try:
+        async def generate() -> list[dict]:
             result = await self.gemini.structured_output(
                 messages=[{"role": "user", "content": prompt}],
                 schema=FeatureGenerationResult,
@@ -351,7 +375,14 @@ Return a JSON object with a "features" array containing objects with: title, des
             ]
 
             logger.info("feature_extraction_complete", count=len(features))
-            return features
+            return [feature.model_dump(mode="json") for feature in features]
+
+        try:
+            cache_key = self._section_cache_key(f"features:{count}", product_info, language)
+            return [
+                Feature.model_validate(feature)
+                for feature in await self.section_cache.get_or_fetch(cache_key, generate)
+            ]
 
         except Exception as e:
             logger.error("feature_extraction_failed", error=str(e))
@@ -407,7 +438,7 @@ Requirements:
 
 Return a JSON object with a "faqs" array containing objects with: question, answer"""
 
-        try:
+        async def generate() -> list[dict]:
             result = await self.gemini.structured_output(
                 messages=[{"role": "user", "content": prompt}],
                 schema=FAQGenerationResult,
@@ -422,12 +453,34 @@ Return a JSON object with a "faqs" array containing objects with: question, answ
                 for f in result.faqs[: self.MAX_FAQS]
             ]
 
-            return faqs
+            return [faq.model_dump(mode="json") for faq in faqs]
+
+        try:
+            cache_key = self._section_cache_key("faq", product_info, language)
+            return [
+                FAQItem.model_validate(faq)
+                for faq in await self.section_cache.get_or_fetch(cache_key, generate)
+            ]
 
         except Exception as e:
             logger.error("faq_generation_failed", error=str(e))
             return self._create_fallback_faq(language)
 
+    def _section_cache_key(
+        self,
+        section: str,
+        product_info: ProductInfo,
+        language: str,
+        template: str | None = None,
+    ) -> str:
+        """Build the cache key for a generated section.
+
+        Sections are keyed by a hash of the product information plus the
+        inputs that shape their prompt. Only the hero depends on the template.
+        """
+        product_hash = hashlib.sha256(product_info.model_dump_json().encode()).hexdigest()[:16]
+        return f"{self.PREFIX_SECTION}:{section}:{product_hash}:{template or 'any'}:{language}"
+
     def _create_cta_section(self, product_info: ProductInfo) -> CTASection:
         """Create CTA section from product info."""
         return CTASection(
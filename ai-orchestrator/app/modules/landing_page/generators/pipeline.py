@@ -0,0 +1,115 @@
+"""
+Section pipeline for Landing Page generation.
+
+A landing page is built from sections (hero, features, FAQ, HTML versions,
+...) that are mostly independent LLM calls. run_sections runs them as a
+small dependency graph: every section starts as soon as the sections it
+depends on are done, so a page build takes about as long as its slowest
+chain of sections instead of the sum of all of them.
+
+LLM work is bounded by a concurrency budget shared by every page build in
+the process, and each section is reported through an optional callback as
+soon as it completes so callers can stream partial pages to the client.
+"""
+
+import asyncio
+import inspect
+import weakref
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+# Concurrent section generations across all page builds in the process
+MAX_CONCURRENT_GENERATIONS = 8
+
+SectionCallback = Callable[[str, Any], Awaitable[None]]
+
+_budgets: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@dataclass(frozen=True)
+class Section:
+    """A node in the section graph.
+
+    build receives the results of depends_on as keyword arguments. If it
+    returns an awaitable (an LLM call), the awaitable runs within the
+    shared generation budget; plain values are used as they are.
+    """
+
+    name: str
+    build: Callable[..., Any]
+    depends_on: tuple[str, ...] = ()
+
+
+def generation_budget() -> asyncio.Semaphore:
+    """Get the generation budget shared within the running event loop."""
+    loop = asyncio.get_running_loop()
+    budget = _budgets.get(loop)
+    if budget is None:
+        budget = _budgets[loop] = asyncio.Semaphore(MAX_CONCURRENT_GENERATIONS)
+    return budget
+
+
+async def run_sections(
+    sections: list[Section],
+    on_section: SectionCallback | None = None,
+) -> dict[str, Any]:
+    """Build sections concurrently, respecting their dependencies.
+
+    Args:
+        sections: Sections to build; each may only depend on sections
+            listed before it
+        on_section: Awaited with (name, result) as each section completes.
+            Failures in the callback are logged and do not fail the build.
+
+    Returns:
+        Section results by name, in the order the sections were given
+
+    Raises:
+        ValueError: If a section depends on an unknown or later section
+        Exception: The first error raised by a section build; the other
+            sections still running are cancelled
+    """
+    tasks: dict[str, asyncio.Task] = {}
+
+    async def run(section: Section) -> Any:
+        dependencies = {name: await tasks[name] for name in section.depends_on}
+        result = section.build(**dependencies)
+        if inspect.isawaitable(result):
+            async with generation_budget():
+                result = await result
+
+        if on_section is not None:
+            try:
+                await on_section(section.name, result)
+            except Exception as e:
+                logger.warning("section_callback_failed", section=section.name, error=str(e))
+
+        return result
+
+    seen: set[str] = set()
+    for section in sections:
+        unknown = [name for name in section.depends_on if name not in seen]
+        if unknown:
+            raise ValueError(f"Section {section.name!r} depends on unknown sections {unknown}")
+        seen.add(section.name)
+
+    for section in sections:
+        tasks[section.name] = asyncio.create_task(run(section), name=f"section:{section.name}")
+
+    try:
+        results = await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+
+    return dict(zip(tasks, results))
@@ -118,44 +118,36 @@ class TikTokFetcher:
         # Build cache key
         cache_key = self._build_cache_key(industry, region, time_range, limit)
         
-        # Try cache first
-        if self.cache_manager:
-            cached_data = await self.cache_manager.get(
-                "trending_creatives",
-                cache_key,
-            )
-            if cached_data:
-                log.info("returning_cached_trending_creatives")
-                return TrendingCreativesResponse(**cached_data)
-        
-        # Fetch from API
-        try:
+        async def fetch() -> dict:
             creatives = await self._fetch_trending_creatives(
                 industry=industry,
                 region=region,
                 time_range=time_range,
                 limit=limit,
             )
-            
-            response = TrendingCreativesResponse(
+            log.info(
+                "trending_creatives_fetched",
+                count=len(creatives),
+            )
+            return TrendingCreativesResponse(
                 status="success",
                 creatives=creatives,
                 total=len(creatives),
-            )
-            
-            # Cache the result
+            ).model_dump()
+        
+        try:
+            # Concurrent requests for the same page share one API call
             if self.cache_manager:
-                await self.cache_manager.set_with_stale(
+                data = await self.cache_manager.get_or_fetch(
                     "trending_creatives",
                     cache_key,
-                    response.model_dump(),
+                    fetch,
+                    use_stale_on_error=False,
                 )
+            else:
+                data = await fetch()
             
-            log.info(
-                "trending_creatives_fetched",
-                count=len(creatives),
-            )
-            return response
+            return TrendingCreativesResponse(**data)
             
         except Exception as e:
             log.error("trending_creatives_fetch_failed", error=str(e))
@@ -138,18 +138,7 @@ class TrendsFetcher:
         # Build cache key
         cache_key = self._build_cache_key(keywords, region, time_range)
         
-        # Try cache first
-        if self.cache_manager:
-            cached_data = await self.cache_manager.get(
-                "market_trends",
-                cache_key,
-            )
-            if cached_data:
-                log.info("returning_cached_market_trends")
-                return MarketTrendsResponse(**cached_data)
-        
-        # Fetch from pytrends
-        try:
+        async def fetch() -> dict:
             trends_data = await self._fetch_trends(
                 keywords=keywords,
                 region=region,
@@ -159,26 +148,29 @@ class TrendsFetcher:
             # Build response
             trends = self._build_keyword_trends(trends_data, keywords)
             insights = self._generate_insights(trends_data, keywords)
-            
-            response = MarketTrendsResponse(
+            log.info(
+                "market_trends_fetched",
+                trend_count=len(trends),
+            )
+            return MarketTrendsResponse(
                 status="success",
                 trends=trends,
                 insights=insights,
-            )
-            
-            # Cache the result
+            ).model_dump()
+        
+        try:
+            # Concurrent requests for the same keywords share one pytrends call
             if self.cache_manager:
-                await self.cache_manager.set_with_stale(
+                data = await self.cache_manager.get_or_fetch(
                     "market_trends",
                     cache_key,
-                    response.model_dump(),
+                    fetch,
+                    use_stale_on_error=False,
                 )
+            else:
+                data = await fetch()
             
-            log.info(
-                "market_trends_fetched",
-                trend_count=len(trends),
-            )
-            return response
+            return MarketTrendsResponse(**data)
             
         except Exception as e:
             log.error("market_trends_fetch_failed", error=str(e))
@@ -2,18 +2,21 @@
 Cache manager for Market Insights module.
 
 Provides caching functionality for market data to reduce API calls,
-improve performance, and support degradation scenarios.
+improve performance, and support degradation scenarios. Storage goes
+through the shared cache layer (app.core.cache): each cache type is one
+namespace, and an entry is kept for the stale window after it expires so
+one key serves both normal and degraded reads.
 
 Requirements: 7.1, 7.2, 7.3, 7.4, 7.5
 """
 
-import json
-import time
 from typing import Any, Callable
 
 import structlog
 from redis.asyncio import Redis
 
+from app.core.cache import Cache
+
 logger = structlog.get_logger(__name__)
 
 
@@ -36,6 +39,8 @@ class CacheManager:
     TTL_MARKET_TRENDS = 86400  # 24 hours
     TTL_COMPETITOR_ANALYSIS = 3600  # 1 hour
     TTL_STALE_CACHE = 604800  # 7 days for stale cache fallback
+    # Expired data served without a fetch while it is refreshed
+    STALE_WHILE_REVALIDATE = 3600  # 1 hour
     
     # Cache type to TTL mapping
     TTL_CONFIG = {
@@ -51,6 +56,7 @@ class CacheManager:
             redis_client: Redis client instance
         """
         self.redis = redis_client
+        self._caches: dict[str, Cache] = {}
         
         logger.info(
             "market_insights_cache_manager_initialized",
@@ -59,6 +65,19 @@ class CacheManager:
             ttl_competitor_analysis=self.TTL_COMPETITOR_ANALYSIS,
         )
     
+    def _cache(self, cache_type: str) -> Cache:
+        """Get the shared cache namespace for a cache type."""
+        cache = self._caches.get(cache_type)
+        if cache is None:
+            cache = Cache(
+                f"market_insights.{cache_type}",
+                self.redis,
+                ttl=self.get_ttl_for_type(cache_type),
+                stale_ttl=self.TTL_STALE_CACHE,
+            )
+            self._caches[cache_type] = cache
+        return cache
+    
     async def get(self, cache_type: str, key: str) -> dict | None:
         """Get cached data.
         
@@ -76,24 +95,13 @@ class CacheManager:
         cache_key = self._build_cache_key(cache_type, key)
         log = logger.bind(cache_type=cache_type, cache_key=cache_key)
         
-        try:
-            cached_value = await self.redis.get(cache_key)
-            
-            if cached_value:
-                log.info("cache_hit")
-                try:
-                    return json.loads(cached_value)
-                except json.JSONDecodeError as e:
-                    log.warning("cache_parse_error", error=str(e))
-                    await self.redis.delete(cache_key)
-                    return None
-            
+        # Read errors and corrupted entries come back as misses
+        data = await self._cache(cache_type).get(cache_key)
+        if data is not None:
+            log.info("cache_hit")
+        else:
             log.debug("cache_miss")
-            return None
-            
-        except Exception as e:
-            log.warning("cache_get_error", error=str(e))
-            return None
+        return data
     
     async def set(
         self,
@@ -104,7 +112,8 @@ class CacheManager:
     ) -> bool:
         """Set cached data.
         
-        Stores data in cache with appropriate TTL based on cache type.
+        Stores data in cache with appropriate TTL based on cache type. The
+        entry stays available to get_stale_cache() for 7 days.
         
         Args:
             cache_type: Type of cache (trending_creatives, market_trends, etc.)
@@ -118,7 +127,7 @@ class CacheManager:
         Requirements: 7.1, 7.2, 7.4
         """
         cache_key = self._build_cache_key(cache_type, key)
-        cache_ttl = ttl or self.TTL_CONFIG.get(cache_type, 3600)
+        cache_ttl = ttl or self.get_ttl_for_type(cache_type)
         
         log = logger.bind(
             cache_type=cache_type,
@@ -127,14 +136,14 @@ class CacheManager:
         )
         
         try:
-            json_data = json.dumps(data, ensure_ascii=False)
-            await self.redis.setex(cache_key, cache_ttl, json_data)
-            log.info("cache_set_success")
-            return True
-            
+            result = await self._cache(cache_type).set(cache_key, data, cache_ttl)
         except Exception as e:
             log.warning("cache_set_error", error=str(e))
             return False
+        
+        if result:
+            log.info("cache_set_success")
+        return result
 
     async def get_stale_cache(
         self,
@@ -157,47 +166,21 @@ class CacheManager:
             
         Requirements: 7.5
         """
-        stale_key = self._build_stale_cache_key(cache_type, key)
+        cache_key = self._build_cache_key(cache_type, key)
         max_stale_age = max_age or self.TTL_STALE_CACHE
         
         log = logger.bind(
             cache_type=cache_type,
-            stale_key=stale_key,
+            cache_key=cache_key,
             max_age=max_stale_age,
         )
         
-        try:
-            cached_value = await self.redis.get(stale_key)
-            
-            if cached_value:
-                try:
-                    stale_data = json.loads(cached_value)
-                    cached_at = stale_data.get("cached_at", 0)
-                    age = time.time() - cached_at
-                    
-                    if age < max_stale_age:
-                        log.info(
-                            "stale_cache_hit",
-                            age_seconds=int(age),
-                        )
-                        return stale_data.get("data")
-                    else:
-                        log.debug(
-                            "stale_cache_too_old",
-                            age_seconds=int(age),
-                        )
-                        return None
-                        
-                except json.JSONDecodeError as e:
-                    log.warning("stale_cache_parse_error", error=str(e))
-                    return None
-            
+        data = await self._cache(cache_type).get_stale(cache_key, max_age=max_stale_age)
+        if data is not None:
+            log.info("stale_cache_hit")
+        else:
             log.debug("stale_cache_miss")
-            return None
-            
-        except Exception as e:
-            log.warning("stale_cache_get_error", error=str(e))
-            return None
+        return data
     
     async def set_with_stale(
         self,
@@ -208,8 +191,8 @@ class CacheManager:
     ) -> bool:
         """Set cache with stale backup for degradation.
         
-        Stores data in both normal cache and stale cache.
-        The stale cache is kept longer for fallback scenarios.
+        Every entry is kept for the stale window, so this is the same as
+        set(); kept for existing callers.
         
         Args:
             cache_type: Type of cache
@@ -218,37 +201,16 @@ class CacheManager:
             ttl: Optional custom TTL for normal cache
             
         Returns:
-            True if both caches were set successfully
+            True if the cache was set successfully
             
         Requirements: 7.1, 7.2, 7.4, 7.5
         """
-        log = logger.bind(cache_type=cache_type, key=key)
-        
-        # Set normal cache
-        normal_success = await self.set(cache_type, key, data, ttl)
-        
-        # Set stale cache with timestamp
-        stale_key = self._build_stale_cache_key(cache_type, key)
-        stale_data = {
-            "data": data,
-            "cached_at": time.time(),
-        }
-        
-        try:
-            json_data = json.dumps(stale_data, ensure_ascii=False)
-            await self.redis.setex(stale_key, self.TTL_STALE_CACHE, json_data)
-            log.info("stale_cache_set_success")
-            stale_success = True
-        except Exception as e:
-            log.warning("stale_cache_set_error", error=str(e))
-            stale_success = False
-        
-        return normal_success and stale_success
+        return await self.set(cache_type, key, data, ttl)
     
     async def invalidate(self, cache_type: str, key: str) -> bool:
         """Invalidate cache entry.
         
-        Removes both normal and stale cache entries.
+        Removes the entry, including its stale copy.
         
         Args:
             cache_type: Type of cache
@@ -258,12 +220,11 @@ class CacheManager:
             True if invalidation was successful
         """
         cache_key = self._build_cache_key(cache_type, key)
-        stale_key = self._build_stale_cache_key(cache_type, key)
         
         log = logger.bind(cache_type=cache_type, key=key)
         
         try:
-            await self.redis.delete(cache_key, stale_key)
+            await self._cache(cache_type).delete(cache_key)
             log.info("cache_invalidated")
             return True
         except Exception as e:
@@ -280,9 +241,11 @@ class CacheManager:
     ) -> dict:
         """Get cached data or fetch from source.
         
-        Attempts to retrieve data from cache. If not found or expired,
-        executes the fetch function and caches the result.
-        Falls back to stale cache on fetch errors if enabled.
+        Attempts to retrieve data from cache. Data that expired within the
+        last hour is returned and refreshed in the background. Otherwise one
+        caller executes the fetch function and caches the result while
+        concurrent callers (in any process) wait for it. Falls back to
+        stale cache on fetch errors if enabled.
         
         Args:
             cache_type: Type of cache
@@ -299,23 +262,16 @@ class CacheManager:
             
         Requirements: 7.3, 7.4, 7.5
         """
+        cache_key = self._build_cache_key(cache_type, key)
         log = logger.bind(cache_type=cache_type, key=key)
         
-        # Try normal cache first
-        cached_data = await self.get(cache_type, key)
-        if cached_data is not None:
-            return cached_data
-        
-        # Cache miss - fetch from source
-        log.info("fetching_from_source")
         try:
-            data = await fetch_func()
-            
-            # Cache the result with stale backup
-            await self.set_with_stale(cache_type, key, data, ttl)
-            
-            return data
-            
+            return await self._cache(cache_type).get_or_fetch(
+                cache_key,
+                fetch_func,
+                ttl or self.get_ttl_for_type(cache_type),
+                max_stale=self.STALE_WHILE_REVALIDATE,
+            )
         except Exception as e:
             log.error("fetch_from_source_failed", error=str(e))
             
@@ -341,18 +297,6 @@ class CacheManager:
         """
         return f"market_insights:{cache_type}:{key}"
     
-    def _build_stale_cache_key(self, cache_type: str, key: str) -> str:
-        """Build stale cache key.
-        
-        Args:
-            cache_type: Type of cache
-            key: Key identifier
-            
-        Returns:
-            Full stale cache key string
-        """
-        return f"market_insights:{cache_type}:stale:{key}"
-    
     def get_ttl_for_type(self, cache_type: str) -> int:
         """Get TTL for a cache type.
         
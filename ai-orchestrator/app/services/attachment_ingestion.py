@@ -0,0 +1,233 @@
+"""Concurrent, deduplicated ingestion of chat attachments into Gemini.
+
+Each attachment is streamed from S3 (or its signed download URL) into a
+temporary file while being hashed, so large videos are never held in
+memory, then streamed from that file to the Gemini Files API. Uploaded
+files are cached in Redis by content hash until shortly before Gemini
+deletes them (48 hours after upload), so a file that is re-sent or reused
+in another conversation is uploaded once. A second cache maps the
+attachment's location to its content hash, so re-sent attachments are
+not even downloaded again.
+"""
+
+import asyncio
+import hashlib
+import json
+import tempfile
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import IO, Any
+
+import httpx
+import structlog
+from botocore.exceptions import BotoCoreError, ClientError
+
+from app.core.config import get_settings
+from app.core.redis_client import get_redis
+from app.services.gemini_files import gemini_files_service
+from app.services.s3_client import get_s3_client
+
+logger = structlog.get_logger(__name__)
+
+# Redis keys: content hash -> Gemini file info, location -> content hash
+FILE_KEY_PREFIX = "gemini_file:"
+SOURCE_KEY_PREFIX = "gemini_file_src:"
+
+# Gemini deletes uploaded files after 48 hours; stop reusing them an hour early
+FILE_LIFETIME = 48 * 3600
+EXPIRY_MARGIN = 3600
+
+# Attachments ingested at once per message
+MAX_CONCURRENT_INGESTS = 4
+
+CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_TIMEOUT = 120.0
+
+
+@dataclass(frozen=True)
+class AttachmentSource:
+    """Where an attachment's bytes can be read from.
+
+    s3_key is a key in the creatives bucket, where the platform stores
+    chat attachments; url is a signed download URL used when no key is
+    known.
+    """
+
+    filename: str
+    mime_type: str
+    s3_key: str | None = None
+    url: str | None = None
+    size: int = 0
+
+    @property
+    def location(self) -> str:
+        """Stable identity of the stored object (signed URL params dropped)."""
+        if self.s3_key:
+            return f"s3://{get_settings().s3_bucket_creatives}/{self.s3_key}"
+        return (self.url or "").split("?", 1)[0]
+
+    @property
+    def source_key(self) -> str:
+        raw = f"{self.location}:{self.size}:{self.mime_type}"
+        return SOURCE_KEY_PREFIX + hashlib.sha256(raw.encode()).hexdigest()
+
+
+class _SpooledContent:
+    """Attachment bytes on disk with their SHA-256 and size."""
+
+    def __init__(self, file: IO[bytes]):
+        self.file = file
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    async def write(self, chunk: bytes) -> None:
+        self.sha256.update(chunk)
+        self.size += len(chunk)
+        await asyncio.to_thread(self.file.write, chunk)
+
+    async def reset(self) -> None:
+        """Discard what was written so far."""
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+        await asyncio.to_thread(self.file.seek, 0)
+        await asyncio.to_thread(self.file.truncate)
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        await asyncio.to_thread(self.file.seek, 0)
+        while chunk := await asyncio.to_thread(self.file.read, CHUNK_SIZE):
+            yield chunk
+
+
+def _file_key(content_hash: str, mime_type: str) -> str:
+    return f"{FILE_KEY_PREFIX}{content_hash}:{mime_type}"
+
+
+def _cache_ttl(file_info: dict[str, Any]) -> int:
+    """Seconds a Gemini file can still be referenced safely."""
+    expires_at = file_info.get("expiration_time")
+    remaining = FILE_LIFETIME
+    if expires_at:
+        try:
+            expiry = datetime.fromisoformat(expires_at)
+            remaining = int((expiry - datetime.now(UTC)).total_seconds())
+        except ValueError:
+            logger.warning("gemini_file_expiration_unparseable", expiration_time=expires_at)
+    return max(0, remaining - EXPIRY_MARGIN)
+
+
+async def _cache_get(key: str) -> str | None:
+    try:
+        redis = await get_redis()
+        return await redis.get(key)
+    except Exception as e:
+        logger.warning("gemini_file_cache_read_failed", error=str(e))
+        return None
+
+
+async def _download(source: AttachmentSource, content: _SpooledContent) -> None:
+    """Stream the attachment into content, from S3 or else its URL."""
+    if source.s3_key:
+        try:
+            await _download_s3(source.s3_key, content)
+            return
+        except (BotoCoreError, ClientError) as e:
+            if not source.url:
+                raise
+            logger.warning("attachment_s3_read_failed", filename=source.filename, error=str(e))
+            await content.reset()
+
+    async with httpx.AsyncClient(timeout=DOWNLOAD_TIMEOUT, follow_redirects=True) as client:
+        async with client.stream("GET", source.url) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                await content.write(chunk)
+
+
+async def _download_s3(key: str, content: _SpooledContent) -> None:
+    s3_client = get_s3_client()
+    response = await asyncio.to_thread(
+        s3_client.s3.get_object, Bucket=s3_client.bucket_creatives, Key=key
+    )
+    body = response["Body"]
+    try:
+        while chunk := await asyncio.to_thread(body.read, CHUNK_SIZE):
+            await content.write(chunk)
+    finally:
+        body.close()
+
+
+async def ingest_attachment(source: AttachmentSource) -> dict[str, Any] | None:
+    """Make one attachment available in Gemini, uploading it at most once.
+
+    Returns:
+        Gemini file info (name, uri, ...) or None if it could not be ingested
+    """
+    # Re-sent attachment: resolve to its content hash without downloading
+    content_hash = await _cache_get(source.source_key)
+    if content_hash:
+        cached = await _cache_get(_file_key(content_hash, source.mime_type))
+        if cached:
+            logger.info("gemini_file_reused", filename=source.filename, matched="location")
+            return json.loads(cached)
+
+    with tempfile.TemporaryFile() as file:
+        content = _SpooledContent(file)
+        try:
+            await _download(source, content)
+        except (httpx.HTTPError, BotoCoreError, ClientError) as e:
+            logger.error("attachment_download_failed", filename=source.filename, error=repr(e))
+            return None
+
+        content_hash = content.sha256.hexdigest()
+        file_key = _file_key(content_hash, source.mime_type)
+        cached = await _cache_get(file_key)
+        if cached:
+            file_info = json.loads(cached)
+            logger.info("gemini_file_reused", filename=source.filename, matched="content")
+        else:
+            file_info = await gemini_files_service.upload_stream(
+                content.chunks(), content.size, source.mime_type, source.filename
+            )
+            if not file_info:
+                return None
+
+    ttl = _cache_ttl(file_info)
+    if ttl > 0:
+        try:
+            redis = await get_redis()
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.set(file_key, json.dumps(file_info), ex=ttl)
+                pipe.set(source.source_key, content_hash, ex=ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("gemini_file_cache_write_failed", error=str(e))
+
+    return file_info
+
+
+async def ingest_attachments(
+    sources: list[AttachmentSource],
+    max_concurrency: int = MAX_CONCURRENT_INGESTS,
+) -> list[dict[str, Any] | None]:
+    """Ingest attachments concurrently; results are in input order.
+
+    The same object attached twice is ingested once.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    tasks: dict[str, asyncio.Task] = {}
+
+    async def bounded(source: AttachmentSource) -> dict[str, Any] | None:
+        async with semaphore:
+            try:
+                return await ingest_attachment(source)
+            except Exception as e:
+                logger.error("attachment_ingest_failed", filename=source.filename, error=repr(e))
+                return None
+
+    for source in sources:
+        if source.source_key not in tasks:
+            tasks[source.source_key] = asyncio.create_task(bounded(source))
+
+    await asyncio.gather(*tasks.values())
+    return [tasks[source.source_key].result() for source in sources]
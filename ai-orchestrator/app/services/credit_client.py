@@ -77,10 +77,20 @@ class CreditClient:
     - Exponential backoff retry for transient errors
     - Connection pooling
 
+    Operations that know their cost up front should hold it with
+    reserve_credit and then settle_credit or release_credit it; unlike
+    check_credit + deduct_credit, a reservation does not lock the user's
+    row on the Web Platform.
+
     Example:
         async with CreditClient() as client:
-            await client.check_credit(user_id, estimated_credits=5.0)
-            await client.deduct_credit(user_id, credits=5.0, operation_type="generate_creative")
+            hold = await client.reserve_credit(user_id, credits=5.0, operation_type="generate_creative")
+            try:
+                ...
+            except Exception:
+                await client.release_credit(user_id, hold["reservation_id"])
+                raise
+            await client.settle_credit(user_id, hold["reservation_id"])
     """
 
     def __init__(
@@ -115,6 +125,9 @@ class CreditClient:
         self.check_credit_url = f"{self.base_url}/api/v1/credits/check"
         self.deduct_credit_url = f"{self.base_url}/api/v1/credits/deduct"
         self.refund_credit_url = f"{self.base_url}/api/v1/credits/refund"
+        self.reserve_credit_url = f"{self.base_url}/api/v1/credits/reserve"
+        self.settle_credit_url = f"{self.base_url}/api/v1/credits/settle"
+        self.release_credit_url = f"{self.base_url}/api/v1/credits/release"
         self.balance_url = f"{self.base_url}/api/v1/credits/balance"
 
         # HTTP client
@@ -458,6 +471,145 @@ class CreditClient:
 
         return result
 
+    async def reserve_credit(
+        self,
+        user_id: str,
+        credits: float,
+        operation_type: str,
+        operation_id: str | None = None,
+        ttl_seconds: int | None = None,
+    ) -> dict[str, Any]:
+        """Hold credits before an operation starts.
+
+        One call replaces check_credit + deduct_credit; the hold is
+        settled with settle_credit or dropped with release_credit.
+
+        Args:
+            user_id: User ID
+            credits: Amount of credits to hold
+            operation_type: Type of operation
+            operation_id: Unique operation ID for tracking
+            ttl_seconds: Seconds before an unsettled hold is released
+
+        Returns:
+            Reservation details including reservation_id, available_after
+
+        Raises:
+            InsufficientCreditsError: If user doesn't have enough credits
+            CreditAPIError: If reservation fails
+        """
+        log = logger.bind(
+            user_id=user_id,
+            operation_type=operation_type,
+            credits=credits,
+            operation_id=operation_id,
+        )
+        log.info("credit_reserve_start")
+
+        payload: dict[str, Any] = {
+            "user_id": user_id,
+            "amount": credits,
+            "operation_type": operation_type,
+        }
+
+        if operation_id:
+            payload["operation_id"] = operation_id
+        if ttl_seconds:
+            payload["ttl_seconds"] = ttl_seconds
+
+        result = await self._make_request(
+            "POST",
+            self.reserve_credit_url,
+            json_data=payload,
+        )
+
+        log.info(
+            "credit_reserve_complete",
+            reservation_id=result.get("reservation_id"),
+            available_after=result.get("available_after"),
+        )
+
+        return result
+
+    async def settle_credit(
+        self,
+        user_id: str,
+        reservation_id: str,
+        credits: float | None = None,
+        details: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Deduct the final cost of a reserved operation.
+
+        Args:
+            user_id: User ID
+            reservation_id: ID returned by reserve_credit
+            credits: Final cost (defaults to the reserved amount)
+            details: Additional details (model, tokens, etc.)
+
+        Returns:
+            Settlement details including deducted, balance_after
+
+        Raises:
+            InsufficientCreditsError: If the final cost exceeds the balance
+            CreditAPIError: If settlement fails
+        """
+        log = logger.bind(user_id=user_id, reservation_id=reservation_id, credits=credits)
+        log.info("credit_settle_start")
+
+        payload: dict[str, Any] = {
+            "user_id": user_id,
+            "reservation_id": reservation_id,
+        }
+
+        if credits is not None:
+            payload["amount"] = credits
+        if details:
+            payload["details"] = details
+
+        result = await self._make_request(
+            "POST",
+            self.settle_credit_url,
+            json_data=payload,
+        )
+
+        log.info(
+            "credit_settle_complete",
+            deducted=result.get("deducted"),
+            balance_after=result.get("balance_after"),
+        )
+
+        return result
+
+    async def release_credit(
+        self,
+        user_id: str,
+        reservation_id: str,
+    ) -> dict[str, Any]:
+        """Release a reservation without charging.
+
+        Args:
+            user_id: User ID
+            reservation_id: ID returned by reserve_credit
+
+        Returns:
+            Release confirmation
+
+        Raises:
+            CreditAPIError: If release fails
+        """
+        log = logger.bind(user_id=user_id, reservation_id=reservation_id)
+        log.info("credit_release_start")
+
+        result = await self._make_request(
+            "POST",
+            self.release_credit_url,
+            json_data={"user_id": user_id, "reservation_id": reservation_id},
+        )
+
+        log.info("credit_release_complete")
+
+        return result
+
     async def get_balance(self, user_id: str) -> dict[str, Any]:
         """Get user's current credit balance.
 
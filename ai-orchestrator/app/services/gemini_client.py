@@ -14,6 +14,8 @@ Gemini AI models via langchain-google-genai and google-genai SDK. It includes:
 import asyncio
 import base64
 import httpx
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from typing import Any, TypeVar
 
 import structlog
@@ -23,6 +25,7 @@ from pydantic import BaseModel
 
 from app.core.config import get_settings
 from app.core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from app.core.rate_limiter import get_rate_limiter
 
 # Import langchain types only if needed (for backward compatibility)
 try:
@@ -405,38 +408,21 @@ class GeminiClient:
         contents = self._convert_messages_to_genai(messages)
 
         try:
-            # Use native google-genai SDK for streaming with file support
-            # Create stream in thread to avoid blocking
-            def _create_stream():
-                return client.models.generate_content_stream(
-                    model=self.fast_model_name,
-                    contents=contents,
-                    config=types.GenerateContentConfig(
-                        temperature=temperature if temperature is not None else 0.3,
-                    ),
-                )
-
-            # Get the stream generator
-            stream = await asyncio.to_thread(_create_stream)
-
-            # Sentinel value to indicate end of stream
-            _STREAM_END = object()
-
-            # Iterate through chunks (each next() call may block on network I/O)
-            # Use sentinel pattern instead of catching StopIteration
-            # (StopIteration cannot be raised into asyncio.to_thread)
-            def _get_next_chunk():
-                try:
-                    return next(stream)
-                except StopIteration:
-                    return _STREAM_END
+            # Use the SDK's async client: chunks are read on the event loop,
+            # so a stream no longer costs a thread-pool hop per chunk
+            stream = await client.aio.models.generate_content_stream(
+                model=self.fast_model_name,
+                contents=contents,
+                config=types.GenerateContentConfig(
+                    temperature=temperature if temperature is not None else 0.3,
+                ),
+            )
 
-            while True:
-                chunk = await asyncio.to_thread(_get_next_chunk)
-                if chunk is _STREAM_END:
-                    break
-                if chunk.text:
-                    yield chunk.text
+            # Close the HTTP stream promptly if the consumer stops early
+            async with aclosing(stream):
+                async for chunk in stream:
+                    if chunk.text:
+                        yield chunk.text
 
             log.info("chat_completion_stream_complete")
 
@@ -808,6 +794,9 @@ class GeminiClient:
         Returns:
             Generated image bytes
         """
+        # Shared across replicas; each attempt, retries included, counts
+        await get_rate_limiter("gemini_image").acquire()
+
         client = self._get_genai_client()
 
         # Build content parts
@@ -1035,46 +1024,12 @@ class GeminiClient:
                     video_info = generated_samples[0].get("video", {})
                     video_uri = video_info.get("uri")
 
-                    # Download the video data since the URI requires authentication
-                    video_data_b64 = None
-                    if video_uri:
-                        try:
-                            # The URI format is like: https://generativelanguage.googleapis.com/download/...
-                            # We need to add the API key to download it
-                            download_url = video_uri
-                            if "?" in download_url:
-                                download_url += f"&key={self.api_key}"
-                            else:
-                                download_url += f"?key={self.api_key}"
-
-                            # Use a client with follow_redirects to handle 302
-                            video_response = await client.get(
-                                download_url,
-                                timeout=120.0,  # Longer timeout for video download
-                                follow_redirects=True,
-                            )
-
-                            if video_response.status_code == 200:
-                                video_bytes = video_response.content
-                                video_data_b64 = base64.b64encode(video_bytes).decode("utf-8")
-                                log.info(
-                                    "video_downloaded",
-                                    size=len(video_bytes),
-                                )
-                            else:
-                                log.warning(
-                                    "video_download_failed",
-                                    status_code=video_response.status_code,
-                                )
-                        except Exception as e:
-                            log.warning("video_download_error", error=str(e))
-
+                    # The video itself is fetched with stream_video, so it
+                    # never has to be held in memory
                     return {
                         "status": "completed",
                         "video_uri": video_uri,
                         "video_state": video_info.get("state"),
-                        "video_data_b64": video_data_b64,
-                        "video_bytes": video_bytes if video_data_b64 else None,  # Raw bytes for GCS upload
                     }
 
                 return {"status": "completed", "data": response_data}
@@ -1089,6 +1044,50 @@ class GeminiClient:
         except httpx.RequestError as e:
             raise GeminiAPIError(f"Failed to poll operation: {e}", retryable=True)
 
+    async def stream_video(
+        self,
+        video_uri: str,
+        chunk_size: int = 1024 * 1024,
+    ) -> AsyncIterator[bytes]:
+        """Download a generated video in chunks.
+
+        Args:
+            video_uri: Video URI from poll_video_operation
+            chunk_size: Bytes per yielded chunk
+
+        Yields:
+            bytes: Consecutive chunks of the video file
+
+        Raises:
+            GeminiAPIError: If the download fails
+        """
+        log = logger.bind(video_uri=video_uri[:100])
+        client = await self._get_http_client()
+
+        # The URI requires authentication; add the API key
+        separator = "&" if "?" in video_uri else "?"
+        download_url = f"{video_uri}{separator}key={self.api_key}"
+
+        size = 0
+        try:
+            # Follow redirects to handle 302; longer timeout for video download
+            async with client.stream(
+                "GET", download_url, timeout=120.0, follow_redirects=True
+            ) as response:
+                if response.status_code != 200:
+                    raise GeminiAPIError(
+                        f"Video download failed with status {response.status_code}",
+                        retryable=response.status_code >= 500,
+                    )
+                async for chunk in response.aiter_bytes(chunk_size):
+                    size += len(chunk)
+                    yield chunk
+        except httpx.RequestError as e:
+            log.warning("video_download_error", error=str(e))
+            raise GeminiAPIError(f"Video download failed: {e}", retryable=True)
+
+        log.info("video_downloaded", size=size)
+
     async def analyze_video(
         self,
         video_url: str | None = None,
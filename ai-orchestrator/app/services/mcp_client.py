@@ -310,6 +310,22 @@ class MCPClient:
             MCPToolError: Tool execution failed
             InsufficientCreditsError: Insufficient credits
         """
+        data = await self._post(payload, log, attempt)
+        return self._parse_response(data)
+
+    async def _post(
+        self,
+        payload: dict[str, Any] | list[dict[str, Any]],
+        log: Any,
+        attempt: int,
+    ) -> Any:
+        """POST a JSON-RPC payload and return the decoded response body.
+
+        Raises:
+            MCPConnectionError: Connection failed or server error
+            MCPTimeoutError: Request timed out
+            MCPToolError: Authentication failure or invalid response body
+        """
         client = await self._get_client()
 
         try:
@@ -340,67 +356,174 @@ class MCPClient:
                     code="PERMISSION_DENIED",
                 )
 
-            # Parse JSON-RPC 2.0 response
             try:
-                data = response.json()
+                return response.json()
             except Exception as e:
                 raise MCPToolError(
                     f"Invalid response format: {e}",
                     code="INVALID_RESPONSE",
                 )
 
-            # Check for JSON-RPC error
-            if "error" in data and data["error"] is not None:
-                error = data["error"]
-                error_code = error.get("code", -32000)
-                error_message = error.get("message", "Unknown error")
-                error_data = error.get("data")
-
-                # Map JSON-RPC error codes to MCP error codes
-                if error_code == -32601:
-                    mcp_code = "TOOL_NOT_FOUND"
-                elif error_code == -32602:
-                    mcp_code = "INVALID_PARAMS"
-                elif error_code == -32000:
-                    # Server error - parse from message or data
-                    mcp_code = "EXECUTION_ERROR"
-                    if error_data and isinstance(error_data, dict):
-                        mcp_code = error_data.get("code", "EXECUTION_ERROR")
-                else:
-                    mcp_code = "INTERNAL_ERROR"
-
-                # Check for insufficient credits
-                if "INSUFFICIENT_CREDITS" in str(error_message) or mcp_code == "INSUFFICIENT_CREDITS":
-                    raise InsufficientCreditsError(
-                        message=get_user_friendly_message("INSUFFICIENT_CREDITS"),
-                        required=error_data.get("required") if error_data else None,
-                        available=error_data.get("available") if error_data else None,
-                    )
+        except httpx.TimeoutException as e:
+            raise MCPTimeoutError(f"Request timed out: {e}")
 
-                raise MCPToolError(
-                    message=get_user_friendly_message(mcp_code),
-                    code=mcp_code,
-                    details=error_data if isinstance(error_data, dict) else None,
-                )
+        except httpx.ConnectError as e:
+            raise MCPConnectionError(f"Connection failed: {e}")
 
-            # Success - return result
-            if "result" in data:
-                return data["result"]
+        except httpx.HTTPError as e:
+            raise MCPConnectionError(f"HTTP error: {e}")
+
+    def _parse_response(self, data: Any) -> dict[str, Any]:
+        """Return the result of a JSON-RPC 2.0 response or raise its error.
 
-            # No result or error
+        Raises:
+            MCPToolError: Tool execution failed
+            InsufficientCreditsError: Insufficient credits
+        """
+        if not isinstance(data, dict):
             raise MCPToolError(
-                "Invalid JSON-RPC response: missing result and error",
+                "Invalid JSON-RPC response: expected an object",
                 code="INVALID_RESPONSE",
             )
 
-        except httpx.TimeoutException as e:
-            raise MCPTimeoutError(f"Request timed out: {e}")
+        # Check for JSON-RPC error
+        if "error" in data and data["error"] is not None:
+            error = data["error"]
+            error_code = error.get("code", -32000)
+            error_message = error.get("message", "Unknown error")
+            error_data = error.get("data")
+
+            # Map JSON-RPC error codes to MCP error codes
+            if error_code == -32601:
+                mcp_code = "TOOL_NOT_FOUND"
+            elif error_code == -32602:
+                mcp_code = "INVALID_PARAMS"
+            elif error_code == -32000:
+                # Server error - parse from message or data
+                mcp_code = "EXECUTION_ERROR"
+                if error_data and isinstance(error_data, dict):
+                    mcp_code = error_data.get("code", "EXECUTION_ERROR")
+            else:
+                mcp_code = "INTERNAL_ERROR"
+
+            # Check for insufficient credits
+            if "INSUFFICIENT_CREDITS" in str(error_message) or mcp_code == "INSUFFICIENT_CREDITS":
+                raise InsufficientCreditsError(
+                    message=get_user_friendly_message("INSUFFICIENT_CREDITS"),
+                    required=error_data.get("required") if error_data else None,
+                    available=error_data.get("available") if error_data else None,
+                )
 
-        except httpx.ConnectError as e:
-            raise MCPConnectionError(f"Connection failed: {e}")
+            raise MCPToolError(
+                message=get_user_friendly_message(mcp_code),
+                code=mcp_code,
+                details=error_data if isinstance(error_data, dict) else None,
+            )
 
-        except httpx.HTTPError as e:
-            raise MCPConnectionError(f"HTTP error: {e}")
+        # Success - return result
+        if "result" in data:
+            return data["result"]
+
+        # No result or error
+        raise MCPToolError(
+            "Invalid JSON-RPC response: missing result and error",
+            code="INVALID_RESPONSE",
+        )
+
+    async def call_tools_batch(
+        self,
+        calls: list[tuple[str, dict[str, Any]]],
+        request_id: str | None = None,
+    ) -> list[dict[str, Any] | MCPError]:
+        """Call several MCP tools in one JSON-RPC 2.0 batch request.
+
+        The Web Platform runs the calls in order on one database session
+        and authenticates each user once. Connection errors and timeouts
+        are retried like call_tool; per-call errors are returned in place
+        of the result instead of being raised.
+
+        Args:
+            calls: (tool_name, parameters) pairs
+            request_id: Optional request ID for tracing (used for logging only)
+
+        Returns:
+            Result data or MCPError for each call, in order
+
+        Raises:
+            MCPConnectionError: Connection to MCP server failed
+            MCPTimeoutError: Request timed out
+            MCPToolError: The batch itself was rejected
+        """
+        if not calls:
+            return []
+
+        if request_id is None:
+            request_id = str(uuid.uuid4())[:8]
+
+        ids = []
+        payload = []
+        for tool_name, parameters in calls:
+            self._request_counter += 1
+            ids.append(self._request_counter)
+            payload.append({
+                "jsonrpc": "2.0",
+                "id": self._request_counter,
+                "method": "tools/call",
+                "params": {
+                    "name": tool_name,
+                    "arguments": parameters or {},
+                },
+            })
+
+        log = logger.bind(
+            tools=[tool_name for tool_name, _ in calls],
+            request_id=request_id,
+        )
+        log.info("mcp_batch_start", size=len(calls))
+        start_time = datetime.utcnow()
+
+        for attempt in range(self.max_retries):
+            try:
+                data = await self._post(payload, log, attempt)
+                break
+            except (MCPConnectionError, MCPTimeoutError) as e:
+                if attempt < self.max_retries - 1:
+                    wait_time = self.backoff_base * (self.backoff_factor**attempt)
+                    log.warning(
+                        "mcp_batch_retry",
+                        attempt=attempt + 1,
+                        max_retries=self.max_retries,
+                        wait_seconds=wait_time,
+                        error=str(e),
+                    )
+                    await asyncio.sleep(wait_time)
+                else:
+                    log.error("mcp_batch_failed", attempt=attempt + 1, error=str(e))
+                    raise
+
+        if not isinstance(data, list):
+            # The server rejected the batch as a whole
+            self._parse_response(data)
+            raise MCPToolError(
+                "Invalid JSON-RPC batch response",
+                code="INVALID_RESPONSE",
+            )
+
+        responses = {item.get("id"): item for item in data if isinstance(item, dict)}
+        results: list[dict[str, Any] | MCPError] = []
+        for jsonrpc_id in ids:
+            try:
+                results.append(self._parse_response(responses.get(jsonrpc_id)))
+            except MCPError as e:
+                results.append(e)
+
+        duration_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
+        log.info(
+            "mcp_batch_success",
+            duration_ms=round(duration_ms, 2),
+            errors=sum(isinstance(r, MCPError) for r in results),
+        )
+        return results
 
     # =========================================================================
     # Credit Management Wrappers (Task 2.3)
@@ -561,6 +684,127 @@ class MCPClient:
 
         return result
 
+    async def reserve_credit(
+        self,
+        user_id: str,
+        credits: float,
+        operation_type: str,
+        operation_id: str | None = None,
+        ttl_seconds: int | None = None,
+    ) -> dict[str, Any]:
+        """Hold credits before an operation starts.
+
+        One call replaces check_credit + deduct_credit; the hold is
+        settled with settle_credit or dropped with release_credit.
+
+        Args:
+            user_id: User ID
+            credits: Amount of credits to hold
+            operation_type: Type of operation
+            operation_id: Unique operation ID for tracking
+            ttl_seconds: Seconds before an unsettled hold is released
+
+        Returns:
+            Reservation details including reservation_id, available_after
+
+        Raises:
+            MCPError: If the user has insufficient credits or the call fails
+        """
+        log = logger.bind(
+            user_id=user_id,
+            operation_type=operation_type,
+            credits=credits,
+            operation_id=operation_id,
+        )
+        log.info("credit_reserve_start")
+
+        params: dict[str, Any] = {
+            "amount": credits,
+            "operation_type": operation_type,
+        }
+
+        if operation_id:
+            params["operation_id"] = operation_id
+        if ttl_seconds:
+            params["ttl_seconds"] = ttl_seconds
+
+        result = await self.call_tool("reserve_credit", params)
+
+        log.info(
+            "credit_reserve_complete",
+            reservation_id=result.get("reservation_id"),
+            available_after=result.get("available_after"),
+        )
+
+        return result
+
+    async def settle_credit(
+        self,
+        user_id: str,
+        reservation_id: str,
+        credits: float | None = None,
+        details: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Deduct the final cost of a reserved operation.
+
+        Args:
+            user_id: User ID
+            reservation_id: ID returned by reserve_credit
+            credits: Final cost (defaults to the reserved amount)
+            details: Additional details (model, tokens, etc.)
+
+        Returns:
+            Settlement details including deducted, balance_after
+
+        Raises:
+            MCPError: If settlement fails
+        """
+        log = logger.bind(user_id=user_id, reservation_id=reservation_id, credits=credits)
+        log.info("credit_settle_start")
+
+        params: dict[str, Any] = {"reservation_id": reservation_id}
+
+        if credits is not None:
+            params["amount"] = credits
+        if details:
+            params["details"] = details
+
+        result = await self.call_tool("settle_credit", params)
+
+        log.info(
+            "credit_settle_complete",
+            deducted=result.get("deducted"),
+            balance_after=result.get("balance_after"),
+        )
+
+        return result
+
+    async def release_credit(
+        self,
+        user_id: str,
+        reservation_id: str,
+    ) -> dict[str, Any]:
+        """Release a reservation without charging.
+
+        Args:
+            user_id: User ID
+            reservation_id: ID returned by reserve_credit
+
+        Returns:
+            Release confirmation
+
+        Raises:
+            MCPError: If release fails
+        """
+        log = logger.bind(user_id=user_id, reservation_id=reservation_id)
+        log.info("credit_release_start")
+
+        result = await self.call_tool("release_credit", {"reservation_id": reservation_id})
+
+        log.info("credit_release_complete")
+
+        return result
+
     async def get_credit_balance(self, user_id: str) -> dict[str, Any]:
         """Get user's current credit balance.
 
@@ -1,5 +1,7 @@
 """AWS S3 client for file storage."""
+import asyncio
 import io
+from collections.abc import AsyncIterator
 from typing import Any
 
 import boto3
@@ -10,6 +12,9 @@ from app.core.config import get_settings
 
 logger = structlog.get_logger(__name__)
 
+# Multipart part size for streamed video uploads (S3 minimum is 5 MiB)
+VIDEO_PART_SIZE = 8 * 1024 * 1024
+
 
 class S3Error(Exception):
     """S3 operation error."""
@@ -126,13 +131,8 @@ class S3Client:
         Returns:
             Upload result
         """
-        # Store AI-generated videos in creatives bucket under users/{user_id}/generated/
-        prefix = session_id or "videos"
-        object_name = f"users/{user_id}/generated/{prefix}/{filename}"
-
-        # Ensure metadata includes source
-        upload_metadata = metadata or {}
-        upload_metadata["source"] = "ai-generated"
+        object_name = self._video_object_name(filename, user_id, session_id)
+        upload_metadata = self._video_metadata(metadata)
 
         try:
             # Upload to S3 creatives bucket
@@ -166,6 +166,210 @@ class S3Client:
             logger.error("s3_video_upload_failed", error=error_msg)
             raise S3Error(error_msg)
 
+    def _video_object_name(self, filename: str, user_id: str, session_id: str | None) -> str:
+        """Key for AI-generated videos: users/{user_id}/generated/{session_id}/{filename}."""
+        prefix = session_id or "videos"
+        return f"users/{user_id}/generated/{prefix}/{filename}"
+
+    def _video_metadata(self, metadata: dict | None) -> dict:
+        """Copy metadata, marking the object as AI-generated."""
+        return {**(metadata or {}), "source": "ai-generated"}
+
+    async def upload_video_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+        user_id: str,
+        content_type: str = "video/mp4",
+        session_id: str | None = None,
+        metadata: dict | None = None,
+        part_size: int = VIDEO_PART_SIZE,
+    ) -> dict[str, Any]:
+        """Stream an AI-generated video into the creatives bucket.
+
+        Chunks are collected into parts of part_size bytes and sent as an S3
+        multipart upload. Each part uploads while the next one downloads,
+        so at most two parts are held in memory whatever the video size.
+
+        Args:
+            chunks: Video bytes in download order
+            filename: File name
+            user_id: User ID
+            content_type: Content type
+            session_id: Session ID (optional, defaults to 'videos')
+            metadata: Additional metadata
+            part_size: Multipart part size in bytes
+
+        Returns:
+            Upload result with object_name, bucket, s3_url, size
+
+        Raises:
+            S3Error: If the upload fails; errors from chunks propagate unchanged
+        """
+        object_name = self._video_object_name(filename, user_id, session_id)
+
+        try:
+            upload = await asyncio.to_thread(
+                self.s3.create_multipart_upload,
+                Bucket=self.bucket_creatives,
+                Key=object_name,
+                ContentType=content_type,
+                Metadata=self._video_metadata(metadata),
+            )
+        except ClientError as e:
+            error_msg = f"Video upload failed: {str(e)}"
+            logger.error("s3_video_upload_failed", error=error_msg)
+            raise S3Error(error_msg)
+
+        upload_id = upload["UploadId"]
+        parts: list[dict[str, Any]] = []
+        pending: asyncio.Task | None = None
+        buffer = bytearray()
+        size = 0
+
+        async def upload_part(part_number: int, body: bytes) -> dict[str, Any]:
+            response = await asyncio.to_thread(
+                self.s3.upload_part,
+                Bucket=self.bucket_creatives,
+                Key=object_name,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body,
+            )
+            return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+        async def flush() -> None:
+            nonlocal pending, buffer
+            if pending is not None:
+                parts.append(await pending)
+            part_number = len(parts) + 1
+            pending = asyncio.create_task(upload_part(part_number, bytes(buffer)))
+            buffer = bytearray()
+
+        try:
+            async for chunk in chunks:
+                buffer += chunk
+                size += len(chunk)
+                if len(buffer) >= part_size:
+                    await flush()
+            if buffer or pending is None:
+                await flush()
+            parts.append(await pending)
+
+            await asyncio.to_thread(
+                self.s3.complete_multipart_upload,
+                Bucket=self.bucket_creatives,
+                Key=object_name,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException as e:
+            if pending is not None and not pending.done():
+                pending.cancel()
+            try:
+                await asyncio.to_thread(
+                    self.s3.abort_multipart_upload,
+                    Bucket=self.bucket_creatives,
+                    Key=object_name,
+                    UploadId=upload_id,
+                )
+            except Exception as abort_error:
+                logger.warning("s3_multipart_abort_failed", error=str(abort_error))
+            if isinstance(e, ClientError):
+                error_msg = f"Video upload failed: {str(e)}"
+                logger.error("s3_video_upload_failed", error=error_msg)
+                raise S3Error(error_msg)
+            raise
+
+        logger.info(
+            "s3_video_upload_success",
+            bucket=self.bucket_creatives,
+            object_name=object_name,
+            size=size,
+            parts=len(parts),
+            source="ai-generated",
+        )
+
+        return {
+            "object_name": object_name,
+            "bucket": self.bucket_creatives,
+            "s3_url": f"s3://{self.bucket_creatives}/{object_name}",
+            "size": size,
+        }
+
+    async def copy_video(
+        self,
+        source_uri: str,
+        filename: str,
+        user_id: str,
+        content_type: str = "video/mp4",
+        session_id: str | None = None,
+        metadata: dict | None = None,
+    ) -> dict[str, Any]:
+        """Copy a provider's video output into the creatives bucket server-side.
+
+        Args:
+            source_uri: s3:// URI of the video, or of a prefix holding one .mp4
+            filename: File name
+            user_id: User ID
+            content_type: Content type
+            session_id: Session ID (optional, defaults to 'videos')
+            metadata: Additional metadata
+
+        Returns:
+            Upload result with object_name, bucket, s3_url, size
+
+        Raises:
+            S3Error: If no video is found or the copy fails
+        """
+        if not source_uri.startswith("s3://"):
+            raise S3Error(f"Unsupported video location: {source_uri}")
+        source_bucket, _, source_prefix = source_uri[5:].partition("/")
+        object_name = self._video_object_name(filename, user_id, session_id)
+
+        try:
+            listing = await asyncio.to_thread(
+                self.s3.list_objects_v2, Bucket=source_bucket, Prefix=source_prefix
+            )
+            source = next(
+                (obj for obj in listing.get("Contents", []) if obj["Key"].endswith(".mp4")),
+                None,
+            )
+            if source is None:
+                raise S3Error(f"No video found at {source_uri}")
+
+            # Managed copy: server-side, multipart for large objects
+            await asyncio.to_thread(
+                self.s3.copy,
+                {"Bucket": source_bucket, "Key": source["Key"]},
+                self.bucket_creatives,
+                object_name,
+                ExtraArgs={
+                    "ContentType": content_type,
+                    "Metadata": self._video_metadata(metadata),
+                    "MetadataDirective": "REPLACE",
+                },
+            )
+        except ClientError as e:
+            error_msg = f"Video copy failed: {str(e)}"
+            logger.error("s3_video_copy_failed", error=error_msg, source_uri=source_uri)
+            raise S3Error(error_msg)
+
+        logger.info(
+            "s3_video_copy_success",
+            bucket=self.bucket_creatives,
+            object_name=object_name,
+            size=source["Size"],
+            source_key=source["Key"],
+        )
+
+        return {
+            "object_name": object_name,
+            "bucket": self.bucket_creatives,
+            "s3_url": f"s3://{self.bucket_creatives}/{object_name}",
+            "size": source["Size"],
+        }
+
     def generate_presigned_url(
         self,
         object_name: str,
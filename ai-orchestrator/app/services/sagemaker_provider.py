@@ -13,6 +13,7 @@ from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 from pydantic import BaseModel
 
+from app.core.rate_limiter import get_rate_limiter
 from app.services.model_provider import ModelProvider, ModelProviderError
 
 logger = structlog.get_logger(__name__)
@@ -135,6 +136,8 @@ class SageMakerProvider(ModelProvider):
 
             # Invoke endpoint
             async def _invoke():
+                # Shared across replicas; each attempt, retries included, counts
+                await get_rate_limiter(f"sagemaker:{self.endpoint_name}").acquire()
                 response = self.client.invoke_endpoint(
                     EndpointName=self.endpoint_name,
                     ContentType=content_type,
@@ -0,0 +1,569 @@
+"""Shared tracker for long-running video generation operations.
+
+Video providers finish asynchronously after one to several minutes.
+Instead of every request keeping a coroutine alive that polls its own
+operation, generation registers the operation here and returns a handle
+at once. A single background poller checks every due operation in one
+batch per tick, backing off per operation as it ages, and persists the
+state in Redis so any replica can serve it. Changes are published on a
+per-operation channel that the SSE endpoint and wait() listen on.
+
+Only one replica polls at a time: the poller holds a Redis lock with an
+owner token and renews it before every batch of checks within a tick.
+
+A completed operation is claimed by moving it to "finalizing" and
+pushing its due time out by a lease. Storing the video then runs as its
+own task, off the poll loop; if the process dies before it finishes,
+the lease expires and the next poller finalizes the operation again.
+
+Requirements: Video generation capability
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+import structlog
+
+from app.core.redis_client import get_redis
+from app.services.bedrock_video_client import BedrockVideoClient
+from app.services.gemini_client import GeminiAPIError, GeminiClient, GeminiError
+from app.services.s3_client import S3Error, get_s3_client
+
+logger = structlog.get_logger(__name__)
+
+# Redis keys: operation records, due-time schedule, poller lock, events
+OPERATION_KEY_PREFIX = "video_op:"
+DUE_KEY = "video_ops:due"
+POLLER_LOCK_KEY = "video_ops:poller_lock"
+EVENTS_CHANNEL_PREFIX = "video_op_events:"
+
+# Seconds finished operation records are kept for late readers
+RESULT_TTL = 86400
+
+# Poller timing in seconds
+POLL_TICK = 1.0
+INITIAL_INTERVAL = 5.0
+MAX_INTERVAL = 30.0
+BACKOFF_FACTOR = 1.5
+MAX_AGE = 900.0
+CHECK_TIMEOUT = 30.0
+# Longer than one batch of checks, each bounded by CHECK_TIMEOUT
+LOCK_TTL_MS = 60000
+
+# Seconds a claimed operation may spend storing its video before another
+# poller may take it over, and how often finalization is attempted
+FINALIZE_LEASE = 600.0
+MAX_FINALIZE_ATTEMPTS = 3
+
+# Operations checked per tick, and how many checks run at once
+BATCH_SIZE = 100
+CHECK_CONCURRENCY = 10
+
+TERMINAL_STATUSES = frozenset({"completed", "failed", "timeout"})
+
+# Renew or release the poller lock only while this replica still owns it
+_RENEW_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# Claim a due operation for finalization: move its due time to the end of
+# the lease and store the finalizing record, unless another poller already
+# claimed or finished it. KEYS: due zset, record, events channel.
+# ARGV: handle, now, lease deadline, record payload
+_CLAIM_SCRIPT = """
+local due = redis.call('zscore', KEYS[1], ARGV[1])
+if not due or tonumber(due) > tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('zadd', KEYS[1], ARGV[3], ARGV[1])
+redis.call('set', KEYS[2], ARGV[4])
+redis.call('publish', KEYS[3], ARGV[4])
+return 1
+"""
+
+StatusChecker = Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]
+Finalizer = Callable[[dict[str, Any], dict[str, Any]], Awaitable[dict[str, Any]]]
+
+
+def _operation_key(handle: str) -> str:
+    return OPERATION_KEY_PREFIX + handle
+
+
+def _events_channel(handle: str) -> str:
+    return EVENTS_CHANNEL_PREFIX + handle
+
+
+class VideoOperationTracker:
+    """Tracks in-flight video operations with one shared poller.
+
+    Example:
+        tracker = get_video_operation_tracker()
+        operation = await tracker.register(operation_id, "gemini", user_id="42")
+        final = await tracker.wait(operation["id"], timeout=360)
+    """
+
+    def __init__(
+        self,
+        checkers: dict[str, StatusChecker] | None = None,
+        finalizer: Finalizer | None = None,
+        initial_interval: float = INITIAL_INTERVAL,
+        max_interval: float = MAX_INTERVAL,
+        max_age: float = MAX_AGE,
+    ):
+        """Initialize the tracker.
+
+        Args:
+            checkers: Status check per provider; defaults to Gemini and Bedrock
+            finalizer: Called once per completed operation with the record
+                and the provider's poll result, returns the stored result
+            initial_interval: Seconds before the first status check
+            max_interval: Upper bound for the per-operation check interval
+            max_age: Seconds after which an unfinished operation times out
+        """
+        self.checkers = checkers or {
+            "gemini": self._check_gemini,
+            "bedrock": self._check_bedrock,
+        }
+        self.finalizer = finalizer or self._store_video
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.max_age = max_age
+
+        self._gemini: GeminiClient | None = None
+        self._bedrock: BedrockVideoClient | None = None
+        self._lock_token = uuid.uuid4().hex
+        self._task: asyncio.Task | None = None
+        self._finalizers: dict[str, asyncio.Task] = {}
+
+    async def register(
+        self,
+        operation_id: str,
+        provider: str,
+        *,
+        model: str | None = None,
+        user_id: str | None = None,
+        session_id: str | None = None,
+        filename: str | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Start tracking a provider operation.
+
+        Args:
+            operation_id: Provider operation ID or invocation ARN
+            provider: Key into checkers, e.g. "gemini" or "bedrock"
+            model: Model used for generation (Bedrock polls per model)
+            user_id: Owner of the generated video
+            session_id: Session the video belongs to
+            filename: File name for the stored video
+            metadata: S3 metadata for the stored video
+
+        Returns:
+            Operation record; its "id" is the handle for get, wait and events
+        """
+        if provider not in self.checkers:
+            raise ValueError(f"Unsupported video provider: {provider}")
+
+        now = time.time()
+        record = {
+            "id": f"vop_{uuid.uuid4().hex}",
+            "operation_id": operation_id,
+            "provider": provider,
+            "model": model,
+            "user_id": user_id,
+            "session_id": session_id,
+            "filename": filename,
+            "metadata": metadata or {},
+            "status": "processing",
+            "progress": 0,
+            "checks": 0,
+            "interval": self.initial_interval,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+        redis = await get_redis()
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.set(_operation_key(record["id"]), json.dumps(record))
+            pipe.zadd(DUE_KEY, {record["id"]: now + self.initial_interval})
+            await pipe.execute()
+
+        logger.info(
+            "video_operation_registered",
+            handle=record["id"],
+            operation_id=operation_id,
+            provider=provider,
+        )
+        return record
+
+    async def get(self, handle: str) -> dict[str, Any] | None:
+        """Current record of an operation, or None if unknown or expired."""
+        redis = await get_redis()
+        value = await redis.get(_operation_key(handle))
+        return json.loads(value) if value else None
+
+    async def events(
+        self,
+        handle: str,
+        heartbeat: float | None = None,
+    ) -> AsyncIterator[dict[str, Any] | None]:
+        """Yield the record now and after every change until it finishes.
+
+        Args:
+            handle: Operation handle from register
+            heartbeat: If set, yield None after this many idle seconds
+
+        Raises:
+            KeyError: If the operation is unknown
+        """
+        redis = await get_redis()
+        pubsub = redis.pubsub()
+        # Subscribe before reading so no update between the two is missed
+        await pubsub.subscribe(_events_channel(handle))
+        try:
+            record = await self.get(handle)
+            if record is None:
+                raise KeyError(handle)
+            yield record
+
+            while record["status"] not in TERMINAL_STATUSES:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=heartbeat or POLL_TICK,
+                )
+                if message is None:
+                    if heartbeat:
+                        yield None
+                    continue
+                record = json.loads(message["data"])
+                yield record
+        finally:
+            await pubsub.unsubscribe()
+            await pubsub.aclose()
+
+    async def wait(self, handle: str, timeout: float) -> dict[str, Any]:
+        """Wait until an operation finishes and return its final record.
+
+        Raises:
+            KeyError: If the operation is unknown
+            TimeoutError: If it does not finish within timeout seconds
+        """
+        async with asyncio.timeout(timeout):
+            async for record in self.events(handle):
+                if record["status"] in TERMINAL_STATUSES:
+                    return record
+        raise KeyError(handle)
+
+    async def poll_once(self) -> int:
+        """Check every operation that is due and store the outcomes.
+
+        Returns:
+            Number of operations checked
+        """
+        redis = await get_redis()
+        now = time.time()
+        handles = await redis.zrangebyscore(DUE_KEY, "-inf", now, start=0, num=BATCH_SIZE)
+        if not handles:
+            return 0
+
+        values = await redis.mget([_operation_key(h) for h in handles])
+        records = []
+        for handle, value in zip(handles, values, strict=True):
+            if value is None:
+                # Record expired or was removed; drop it from the schedule
+                await redis.zrem(DUE_KEY, handle)
+            else:
+                records.append(json.loads(value))
+
+        async def check(record: dict[str, Any]) -> None:
+            try:
+                await self._check_operation(record, now)
+            except Exception as e:
+                logger.error(
+                    "video_operation_check_failed",
+                    handle=record["id"],
+                    error=str(e),
+                    exc_info=True,
+                )
+
+        # Renew the lock before each batch so it cannot expire mid-tick
+        # and let another replica check the same operations
+        checked = 0
+        for start in range(0, len(records), CHECK_CONCURRENCY):
+            if not await self.acquire_poller_lock():
+                logger.warning("video_operation_poller_lock_lost", checked=checked)
+                break
+            batch = records[start:start + CHECK_CONCURRENCY]
+            await asyncio.gather(*(check(record) for record in batch))
+            checked += len(batch)
+        return checked
+
+    async def _check_operation(self, record: dict[str, Any], now: float) -> None:
+        """Poll one operation and reschedule, claim or finish it."""
+        if record["status"] == "finalizing":
+            # The lease ran out: the finalizer died or is still running
+            await self._claim(record, record["poll_result"], now)
+            return
+
+        if now - record["created_at"] > self.max_age:
+            await self._finish(record, "timeout", error="Video generation timed out")
+            return
+
+        record["checks"] += 1
+        try:
+            poll_result = await asyncio.wait_for(
+                self.checkers[record["provider"]](record), CHECK_TIMEOUT
+            )
+        except GeminiAPIError as e:
+            if not e.retryable:
+                await self._finish(record, "failed", error=str(e))
+                return
+            poll_result = {"status": "error", "error": str(e)}
+        except (GeminiError, TimeoutError) as e:
+            poll_result = {"status": "error", "error": str(e) or "Status check timed out"}
+
+        status = poll_result.get("status")
+        if status == "completed":
+            await self._claim(record, poll_result, now)
+        elif status == "failed":
+            await self._finish(record, "failed", error=poll_result.get("error"))
+        else:
+            # Still processing, or a transient check error: back off
+            record["progress"] = poll_result.get("progress", record["progress"])
+            record["interval"] = min(self.max_interval, record["interval"] * BACKOFF_FACTOR)
+            await self._save(record, next_check=time.time() + record["interval"])
+
+    async def _claim(
+        self,
+        record: dict[str, Any],
+        poll_result: dict[str, Any],
+        now: float,
+    ) -> None:
+        """Claim a completed operation and finalize it in the background."""
+        handle = record["id"]
+        running = self._finalizers.get(handle)
+        attempts = record.get("finalize_attempts", 0)
+        if running is None and attempts >= MAX_FINALIZE_ATTEMPTS:
+            logger.error("video_operation_finalize_abandoned", handle=handle, attempts=attempts)
+            record["result"] = {"video_url": poll_result.get("video_uri")}
+            await self._finish(record, "completed")
+            return
+
+        record["status"] = "finalizing"
+        record["poll_result"] = poll_result
+        if running is None:
+            record["finalize_attempts"] = attempts + 1
+        record["updated_at"] = time.time()
+
+        redis = await get_redis()
+        claimed = await redis.eval(
+            _CLAIM_SCRIPT,
+            3,
+            DUE_KEY,
+            _operation_key(handle),
+            _events_channel(handle),
+            handle,
+            now,
+            time.time() + FINALIZE_LEASE,
+            json.dumps(record),
+        )
+        # Already claimed elsewhere, or still being stored by this replica
+        if not claimed or running is not None:
+            return
+
+        task = asyncio.create_task(self._finalize(record, poll_result))
+        self._finalizers[handle] = task
+        task.add_done_callback(lambda _: self._finalizers.pop(handle, None))
+
+    async def _finalize(self, record: dict[str, Any], poll_result: dict[str, Any]) -> None:
+        """Store a claimed operation's video and mark it completed."""
+        try:
+            record["result"] = await self.finalizer(record, poll_result)
+        except Exception as e:
+            logger.error("video_operation_finalize_failed", handle=record["id"], error=str(e))
+            record["result"] = {"video_url": poll_result.get("video_uri")}
+        try:
+            await self._finish(record, "completed")
+        except Exception as e:
+            # The lease expires and the next poller finalizes it again
+            logger.error("video_operation_finish_failed", handle=record["id"], error=str(e))
+
+    async def _save(self, record: dict[str, Any], next_check: float) -> None:
+        record["updated_at"] = time.time()
+        payload = json.dumps(record)
+        redis = await get_redis()
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.set(_operation_key(record["id"]), payload)
+            pipe.zadd(DUE_KEY, {record["id"]: next_check}, xx=True)
+            pipe.publish(_events_channel(record["id"]), payload)
+            await pipe.execute()
+
+    async def _finish(
+        self,
+        record: dict[str, Any],
+        status: str,
+        error: str | None = None,
+    ) -> None:
+        redis = await get_redis()
+        if not await redis.zrem(DUE_KEY, record["id"]):
+            return
+
+        record["status"] = status
+        record["updated_at"] = time.time()
+        record.pop("poll_result", None)
+        if error:
+            record["error"] = error
+        payload = json.dumps(record)
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.set(_operation_key(record["id"]), payload, ex=RESULT_TTL)
+            pipe.publish(_events_channel(record["id"]), payload)
+            await pipe.execute()
+
+        logger.info(
+            "video_operation_finished",
+            handle=record["id"],
+            status=status,
+            checks=record["checks"],
+            elapsed=round(record["updated_at"] - record["created_at"], 1),
+        )
+
+    async def _check_gemini(self, record: dict[str, Any]) -> dict[str, Any]:
+        if self._gemini is None:
+            self._gemini = GeminiClient()
+        return await self._gemini.poll_video_operation(record["operation_id"])
+
+    async def _check_bedrock(self, record: dict[str, Any]) -> dict[str, Any]:
+        if self._bedrock is None:
+            self._bedrock = BedrockVideoClient()
+        if record.get("model"):
+            return await self._bedrock.poll_video_operation(
+                record["operation_id"], record["model"]
+            )
+        return await self._bedrock.poll_video_operation(record["operation_id"])
+
+    async def _store_video(
+        self,
+        record: dict[str, Any],
+        poll_result: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Move a finished video into the creatives bucket.
+
+        Bedrock output is copied server-side; Gemini output is streamed
+        from the provider download into a multipart upload.
+        """
+        video_uri = poll_result.get("video_uri")
+        s3_uri = poll_result.get("s3_uri")
+        filename = record.get("filename") or f"{record['id']}.mp4"
+        upload_args = {
+            "filename": filename,
+            "user_id": record.get("user_id") or "anonymous",
+            "content_type": "video/mp4",
+            "session_id": record.get("session_id") or "videos",
+            "metadata": {**record["metadata"], "operation_id": record["operation_id"]},
+        }
+
+        s3_client = get_s3_client()
+        upload_result = None
+        try:
+            if s3_uri:
+                upload_result = await s3_client.copy_video(s3_uri, **upload_args)
+            elif video_uri:
+                if self._gemini is None:
+                    self._gemini = GeminiClient()
+                upload_result = await s3_client.upload_video_stream(
+                    self._gemini.stream_video(video_uri), **upload_args
+                )
+        except (S3Error, GeminiError) as e:
+            logger.warning("s3_upload_failed", handle=record["id"], error=str(e))
+
+        if not upload_result:
+            # Fallback to URI (may require auth)
+            return {"video_url": video_uri}
+
+        return {
+            "attachments": [{
+                "id": f"video_{record['operation_id'][-8:]}",
+                "filename": filename,
+                "contentType": "video/mp4",
+                "size": upload_result["size"],
+                "s3_path": upload_result["object_name"],  # S3 path - frontend will fetch presigned URL
+                "s3Url": upload_result["object_name"],  # Deprecated: for backward compatibility
+                "type": "video",
+            }],
+        }
+
+    async def acquire_poller_lock(self) -> bool:
+        """Take or renew the poller lock; True while this replica owns it."""
+        redis = await get_redis()
+        if await redis.eval(_RENEW_LOCK_SCRIPT, 1, POLLER_LOCK_KEY, self._lock_token, LOCK_TTL_MS):
+            return True
+        return bool(await redis.set(POLLER_LOCK_KEY, self._lock_token, nx=True, px=LOCK_TTL_MS))
+
+    async def run(self) -> None:
+        """Poll due operations until cancelled."""
+        logger.info("video_operation_poller_started")
+        try:
+            while True:
+                try:
+                    if await self.acquire_poller_lock():
+                        await self.poll_once()
+                except Exception as e:
+                    logger.error("video_operation_poll_failed", error=str(e))
+                await asyncio.sleep(POLL_TICK)
+        finally:
+            await self.release_poller_lock()
+
+    async def release_poller_lock(self) -> None:
+        """Release the poller lock if this replica owns it."""
+        try:
+            redis = await get_redis()
+            await redis.eval(_RELEASE_LOCK_SCRIPT, 1, POLLER_LOCK_KEY, self._lock_token)
+        except Exception as e:
+            logger.warning("video_operation_lock_release_failed", error=str(e))
+
+    def start(self) -> None:
+        """Run the poller in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run(), name="video-operation-poller")
+
+    async def stop(self) -> None:
+        """Stop the poller and finalizers, and close provider clients.
+
+        Interrupted finalizations are picked up again by the next poller
+        once their lease expires.
+        """
+        tasks = list(self._finalizers.values())
+        if self._task is not None:
+            tasks.append(self._task)
+            self._task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.release_poller_lock()
+        if self._gemini is not None:
+            await self._gemini.close()
+            self._gemini = None
+
+
+# Global tracker instance
+_tracker: VideoOperationTracker | None = None
+
+
+def get_video_operation_tracker() -> VideoOperationTracker:
+    """Get the shared video operation tracker."""
+    global _tracker
+    if _tracker is None:
+        _tracker = VideoOperationTracker()
+    return _tracker
@@ -17,6 +17,7 @@ from typing import Any
 
 from app.services.gemini_client import GeminiClient, GeminiError
 from app.services.s3_client import S3Client, S3Error, get_s3_client
+from app.services.video_operation_tracker import get_video_operation_tracker
 from app.services.mcp_client import MCPClient, MCPError
 from app.services.bedrock_image_client import BedrockImageClient
 from app.services.bedrock_video_client import BedrockVideoClient
@@ -445,6 +446,9 @@ class GenerateVideoTool(AgentTool):
     Supports text-to-video, image-to-video (with first frame), and interpolation.
     """
 
+    # Seconds to wait for the shared tracker to finish an async operation
+    WAIT_TIMEOUT = 600
+
     def __init__(
         self,
         gemini_client: GeminiClient | None = None,
@@ -788,150 +792,66 @@ class GenerateVideoTool(AgentTool):
 
                 return final_result
 
-            # For async providers (Gemini and Bedrock), poll for completion
+            # For async providers (Gemini and Bedrock), track until completion
             # Bedrock uses invocation_arn, others use operation_id
             operation_id = result.get("operation_id") or result.get("invocation_arn")
             invocation_arn = result.get("invocation_arn")
 
             log.info("video_generation_started_async", operation_id=operation_id)
 
-            # Poll for completion (max 10 minutes with 10 second intervals for Bedrock video)
-            max_attempts = 60 if video_provider != "bedrock" else 60  # 10 min for Bedrock
-            poll_interval = 5 if video_provider != "bedrock" else 10  # 10s for Bedrock
-
-            for attempt in range(max_attempts):
-                # Use appropriate polling based on provider
-                if video_provider == "bedrock":
-                    bedrock_client = BedrockVideoClient()
-                    poll_result = await bedrock_client.poll_video_operation(invocation_arn, video_model)
-                else:
-                    poll_result = await self.gemini_client.poll_video_operation(operation_id)
-
-                if poll_result.get("status") == "completed":
-                    video_uri = poll_result.get("video_uri")
-                    video_bytes = poll_result.get("video_bytes")
-                    s3_uri = poll_result.get("s3_uri")
-
-                    # For Bedrock, download video from S3
-                    if video_provider == "bedrock" and s3_uri and not video_bytes:
-                        try:
-                            import boto3
-                            # Parse S3 URI: s3://bucket/path/to/file.mp4
-                            if s3_uri.startswith("s3://"):
-                                s3_parts = s3_uri[5:].split("/", 1)
-                                bucket = s3_parts[0]
-                                key = s3_parts[1]
-
-                                # List objects to find the actual video file
-                                s3_client_boto = boto3.client("s3")
-                                response = s3_client_boto.list_objects_v2(
-                                    Bucket=bucket,
-                                    Prefix=key,
-                                )
-
-                                # Find the .mp4 file
-                                for obj in response.get("Contents", []):
-                                    if obj["Key"].endswith(".mp4"):
-                                        # Download the video
-                                        obj_response = s3_client_boto.get_object(
-                                            Bucket=bucket,
-                                            Key=obj["Key"],
-                                        )
-                                        video_bytes = obj_response["Body"].read()
-                                        log.info(
-                                            "bedrock_video_downloaded_from_s3",
-                                            bucket=bucket,
-                                            key=obj["Key"],
-                                            size=len(video_bytes),
-                                        )
-                                        break
-                        except Exception as e:
-                            log.error("failed_to_download_bedrock_video", error=str(e))
-
-                    log.info(
-                        "video_generation_complete",
-                        operation_id=operation_id,
-                        video_uri=video_uri[:100] if video_uri else None,
-                        s3_uri=s3_uri[:100] if s3_uri else None,
-                        has_video_bytes=video_bytes is not None,
-                    )
+            # The shared tracker polls the provider and stores the video;
+            # this request only waits for its completion event
+            tracker = get_video_operation_tracker()
+            product_name = product_info.get("name", "video")
+            operation = await tracker.register(
+                invocation_arn or operation_id,
+                "bedrock" if video_provider == "bedrock" else "gemini",
+                model=video_model if video_provider == "bedrock" else None,
+                user_id=user_id or "anonymous",
+                session_id=session_id or "videos",
+                filename=f"{product_name}_{style}_{operation_id[-8:]}.mp4",
+                metadata={
+                    "style": style,
+                    "duration": str(duration),
+                    "aspect_ratio": aspect_ratio,
+                },
+            )
 
-                    result = {
-                        "success": True,
-                        "status": "completed",
-                        "operation_id": operation_id,
-                        "message": "Video generated successfully",
-                    }
-
-                    # Upload video to S3 for persistent public access
-                    if video_bytes:
-                        try:
-                            s3_client = get_s3_client()
-                            product_name = product_info.get("name", "video")
-                            filename = f"{product_name}_{style}_{operation_id[-8:]}.mp4"
-
-                            upload_result = await s3_client.upload_video(
-                                video_bytes=video_bytes,
-                                filename=filename,
-                                user_id=user_id or "anonymous",
-                                content_type="video/mp4",
-                                session_id=session_id or "videos",
-                                metadata={
-                                    "style": style,
-                                    "duration": str(duration),
-                                    "aspect_ratio": aspect_ratio,
-                                    "operation_id": operation_id,
-                                },
-                            )
-
-                            # Return video as attachment (frontend will fetch presigned URL)
-                            result["attachments"] = [{
-                                "id": f"video_{operation_id[-8:]}",
-                                "filename": filename,
-                                "contentType": "video/mp4",
-                                "size": upload_result["size"],
-                                "s3_path": upload_result["object_name"],  # S3 path - frontend will fetch presigned URL
-                                "s3Url": upload_result["object_name"],  # Deprecated: for backward compatibility
-                                "type": "video",
-                            }]
-                            log.info(
-                                "video_uploaded_to_s3",
-                                object_name=upload_result["object_name"],
-                                size=upload_result["size"],
-                            )
-                        except S3Error as e:
-                            log.warning(
-                                "s3_upload_failed",
-                                error=str(e),
-                            )
-                            # Fallback to base64 if S3 upload fails
-                            video_data_b64 = poll_result.get("video_data_b64")
-                            if video_data_b64:
-                                result["video_data_b64"] = video_data_b64
-                                result["video_format"] = "mp4"
-                    elif video_uri:
-                        # Fallback to URI (may require auth)
-                        result["video_url"] = video_uri
-
-                    return result
-
-                # Still processing
-                progress = poll_result.get("progress", 0)
-                log.info(
-                    "video_generation_polling",
-                    attempt=attempt + 1,
-                    progress=progress,
-                )
+            try:
+                operation = await tracker.wait(operation["id"], timeout=self.WAIT_TIMEOUT)
+            except TimeoutError:
+                operation["status"] = "timeout"
+
+            if operation["status"] == "failed":
+                log.warning("video_generation_failed", error=operation.get("error"))
+                return {
+                    "success": False,
+                    "status": "failed",
+                    "operation_id": operation_id,
+                    "message": f"Video generation failed: {operation.get('error')}",
+                }
 
-                await asyncio.sleep(poll_interval)
+            if operation["status"] != "completed":
+                log.warning("video_generation_timeout", operation_id=operation_id)
+                return {
+                    "success": False,
+                    "status": "timeout",
+                    "operation_id": operation_id,
+                    # Tracker handle for /api/v1/video-operations/{handle}
+                    "operation_handle": operation["id"],
+                    "message": (
+                        "Video generation is taking longer than expected. "
+                        f"Check operation {operation['id']} later."
+                    ),
+                }
 
-            # Timeout
-            log.warning("video_generation_timeout", operation_id=operation_id)
+            log.info("video_generation_complete", operation_id=operation_id)
             return {
-                "success": False,
-                "status": "timeout",
+                "success": True,
+                "status": "completed",
                 "operation_id": operation_id,
-                "message": "Video generation timed out. Please check back later.",
+                "message": "Video generated successfully",
+                **operation["result"],
             }
 
         except GeminiError as e:
@@ -11,8 +11,10 @@ They call the module functions directly (not through capability.py).
 """
 
 import structlog
+from collections.abc import Awaitable, Callable
 from typing import Any
 
+from app.modules.landing_page.generators.pipeline import Section, run_sections
 from app.services.gemini_client import GeminiClient, GeminiError
 from app.services.unified_llm_client import UnifiedLLMClient
 from app.services.mcp_client import MCPClient, MCPError
@@ -177,6 +179,10 @@ class GeneratePageContentTool(AgentTool):
             parameters: Tool parameters
             context: Execution context
 
+        Versions are generated concurrently. When the context carries an
+        on_progress callback, each version is passed to it as soon as it is
+        ready.
+
         Returns:
             Generated landing page HTML versions
 
@@ -205,63 +211,39 @@ class GeneratePageContentTool(AgentTool):
         )
         log.info("generate_page_content_start")
 
-        versions = []
+        on_progress = context.get("on_progress") if context else None
         version_labels = ["A", "B", "C", "D", "E"]
+        version_styles = {
+            version_labels[idx] if idx < len(version_labels) else str(idx + 1): style
+            for idx, style in enumerate(styles[:5])  # Max 5 versions
+        }
 
-        for idx, style in enumerate(styles[:5]):  # Max 5 versions
-            version_id = version_labels[idx] if idx < len(version_labels) else str(idx + 1)
-
-            try:
-                # Build generation prompt with product_url and color scheme
-                prompt = self._build_html_prompt(
-                    product_info, product_images, style, language, target_audience, product_url, color_scheme
-                )
-
-                log.info(f"generating_version_{version_id}", style=style)
-
-                # Check if HTML continuation is enabled
-                from app.core.config import get_settings
-                settings = get_settings()
+        async def report_version(version_id: str, version: dict[str, Any]) -> None:
+            if on_progress:
+                await on_progress({"stage": "landing_page_version", **version})
 
-                # Generate using unified LLM client with optional continuation
-                if settings.enable_html_continuation:
-                    html_content = await self._generate_html_with_continuation(
-                        prompt=prompt,
-                        style=style,
+        generated = await run_sections(
+            [
+                Section(
+                    version_id,
+                    lambda version_id=version_id, style=style: self._generate_version(
                         version_id=version_id,
+                        style=style,
+                        product_info=product_info,
+                        product_images=product_images,
+                        language=language,
+                        target_audience=target_audience,
+                        product_url=product_url,
+                        color_scheme=color_scheme,
                         model_preferences=model_preferences,
                         log=log,
-                    )
-                else:
-                    # Simple generation without continuation (faster, uses less tokens)
-                    messages = [{"role": "user", "content": prompt}]
-                    html_content = await self.llm_client.chat_completion(
-                        messages=messages,
-                        temperature=0.7,
-                        model_preferences=model_preferences,
-                    )
-                    html_content = self._clean_html_output(html_content)
-                    log.info(f"html_continuation_disabled", version=version_id)
-
-                style_info = STYLE_GUIDELINES.get(style, STYLE_GUIDELINES["modern"])
-
-                versions.append({
-                    "version_id": version_id,
-                    "html_content": html_content,
-                    "style": style,
-                    "description": style_info["description"],
-                })
-
-                log.info(f"version_{version_id}_generated", style=style, html_length=len(html_content))
-
-            except GeminiError as e:
-                log.error(f"version_{version_id}_failed", style=style, error=str(e))
-                versions.append({
-                    "version_id": version_id,
-                    "html_content": None,
-                    "style": style,
-                    "error": str(e),
-                })
+                    ),
+                )
+                for version_id, style in version_styles.items()
+            ],
+            on_section=report_version,
+        )
+        versions = list(generated.values())
 
         successful_versions = [v for v in versions if v.get("html_content")]
 
@@ -278,6 +260,76 @@ class GeneratePageContentTool(AgentTool):
             "message": f"Generated {len(successful_versions)} landing page versions for AB testing",
         }
 
+    async def _generate_version(
+        self,
+        version_id: str,
+        style: str,
+        product_info: dict[str, Any],
+        product_images: list,
+        language: str,
+        target_audience: str | None,
+        product_url: str,
+        color_scheme: dict[str, Any],
+        model_preferences: dict[str, Any] | None,
+        log: Any,
+    ) -> dict[str, Any]:
+        """Generate one HTML version in the given style.
+
+        Returns:
+            Version object; html_content is None if generation failed
+        """
+        try:
+            # Build generation prompt with product_url and color scheme
+            prompt = self._build_html_prompt(
+                product_info, product_images, style, language, target_audience, product_url, color_scheme
+            )
+
+            log.info(f"generating_version_{version_id}", style=style)
+
+            # Check if HTML continuation is enabled
+            from app.core.config import get_settings
+            settings = get_settings()
+
+            # Generate using unified LLM client with optional continuation
+            if settings.enable_html_continuation:
+                html_content = await self._generate_html_with_continuation(
+                    prompt=prompt,
+                    style=style,
+                    version_id=version_id,
+                    model_preferences=model_preferences,
+                    log=log,
+                )
+            else:
+                # Simple generation without continuation (faster, uses less tokens)
+                messages = [{"role": "user", "content": prompt}]
+                html_content = await self.llm_client.chat_completion(
+                    messages=messages,
+                    temperature=0.7,
+                    model_preferences=model_preferences,
+                )
+                html_content = self._clean_html_output(html_content)
+                log.info(f"html_continuation_disabled", version=version_id)
+
+            style_info = STYLE_GUIDELINES.get(style, STYLE_GUIDELINES["modern"])
+
+            log.info(f"version_{version_id}_generated", style=style, html_length=len(html_content))
+
+            return {
+                "version_id": version_id,
+                "html_content": html_content,
+                "style": style,
+                "description": style_info["description"],
+            }
+
+        except GeminiError as e:
+            log.error(f"version_{version_id}_failed", style=style, error=str(e))
+            return {
+                "version_id": version_id,
+                "html_content": None,
+                "style": style,
+                "error": str(e),
+            }
+
     def _clean_html_output(self, html: str) -> str:
         """Clean up HTML output from LLM.
 
@@ -792,6 +844,7 @@ class GenerateLandingPageTool(AgentTool):
 
         # Get model preferences from context
         model_preferences = context.get("model_preferences") if context else None
+        on_progress = context.get("on_progress") if context else None
 
         # Track if user explicitly specified language (not "auto")
         user_specified_language = language != "auto"
@@ -856,7 +909,8 @@ class GenerateLandingPageTool(AgentTool):
             # Step 3: Generate HTML versions with product_url and color scheme
             log.info("step3_generate_html_versions")
             html_versions = await self._generate_html_versions(
-                product_info, images, styles, language, product_url, color_scheme, log, model_preferences
+                product_info, images, styles, language, product_url, color_scheme, log,
+                model_preferences, on_progress,
             )
 
             if not html_versions:
@@ -1314,8 +1368,9 @@ Output ONLY valid JSON, no explanations."""
         color_scheme: dict[str, Any],
         log: Any,
         model_preferences: dict[str, Any] | None = None,
+        on_progress: Callable[[dict[str, Any]], Awaitable[None]] | None = None,
     ) -> list[dict[str, Any]]:
-        """Generate HTML landing page versions.
+        """Generate HTML landing page versions concurrently.
 
         Args:
             product_info: Product information
@@ -1326,6 +1381,7 @@ Output ONLY valid JSON, no explanations."""
             color_scheme: Color scheme extracted from product images
             log: Logger instance
             model_preferences: User's model preferences
+            on_progress: Awaited with each version as soon as it is generated
 
         Returns:
             List of HTML version objects
@@ -1341,7 +1397,7 @@ Output ONLY valid JSON, no explanations."""
                 "product_url": product_url,
                 "color_scheme": color_scheme,
             },
-            context={"model_preferences": model_preferences},
+            context={"model_preferences": model_preferences, "on_progress": on_progress},
         )
 
         return [v for v in result.get("versions", []) if v.get("html_content")]
@@ -0,0 +1,127 @@
+"""Chat agent setup benchmark.
+
+Measures, per chat request, the time from the "thinking" event to the
+first model token for:
+1. per-request: the previous /chat path, which built a ToolRegistry, all
+   tool factories, a model with its own client and the Strands tool
+   wrappers inside every request
+2. pooled: AgentPool, which shares all of that across requests and only
+   creates the Strands Agent (the conversation) per request
+
+Requests run concurrently against a local fake Gemini streaming server
+(see benchmark_gemini_stream.py), so the numbers show setup overhead and
+event loop contention rather than model speed.
+
+Usage (from ai-orchestrator/):
+    python scripts/benchmark_agent_pool.py --concurrency 1 20 50
+"""
+
+import argparse
+import asyncio
+import functools
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+# Settings require a service token; the benchmark never calls the backend
+os.environ.setdefault("WEB_PLATFORM_SERVICE_TOKEN", "benchmark-token-not-used-000000")
+os.environ.setdefault("GEMINI_API_KEY", "bench")
+
+import structlog  # noqa: E402
+from benchmark_gemini_stream import FakeStreamServer  # noqa: E402
+from google import genai  # noqa: E402
+from google.genai import types  # noqa: E402
+
+from app.core import strands_enhanced_agent  # noqa: E402
+from app.core.agent_pool import AgentPool, build_tool_registry  # noqa: E402
+from app.core.strands_enhanced_agent import StrandsEnhancedReActAgent  # noqa: E402
+
+MODEL = "gemini-2.5-flash"
+
+
+async def first_token(agent: StrandsEnhancedReActAgent, start: float) -> float:
+    """Run one conversation turn; return milliseconds until the first token."""
+    strands_agent = agent._create_strands_agent(agent._get_strands_tools())
+    invocation_state = {"user_id": "bench", "session_id": "bench"}
+    first = None
+    # Drain the whole stream: abandoning it mid-way breaks tracing cleanup
+    async for chunk in strands_agent.stream_async("Hello", invocation_state=invocation_state):
+        if first is None and isinstance(chunk, dict) and chunk.get("data"):
+            first = (time.perf_counter() - start) * 1000
+    return first
+
+
+async def per_request(start: float) -> float:
+    agent = StrandsEnhancedReActAgent(
+        model_provider="gemini", model_name=MODEL, tool_registry=build_tool_registry()
+    )
+    try:
+        return await first_token(agent, start)
+    finally:
+        await agent.close()
+
+
+async def run_scenario(name: str, handle_request, concurrency: int) -> None:
+    """Run concurrent requests and print time-to-first-token percentiles."""
+    latencies: list[float] = []
+
+    async def one() -> None:
+        latencies.append(await handle_request(time.perf_counter()))
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(concurrency)))
+    wall = time.perf_counter() - wall_start
+
+    latencies.sort()
+
+    def pct(q: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * q))]
+
+    print(
+        f"{name:<12} requests={concurrency:<4} wall={wall:6.2f}s  "
+        f"first token p50={pct(0.5):7.1f}ms p95={pct(0.95):7.1f}ms max={latencies[-1]:7.1f}ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 20, 50])
+    parser.add_argument("--chunks", type=int, default=5)
+    parser.add_argument("--interval", type=float, default=0.01, help="seconds between chunks")
+    args = parser.parse_args()
+
+    # Per-request tool registration logs would dominate the output
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    logging.getLogger().setLevel(logging.WARNING)
+
+    server = FakeStreamServer(args.chunks, args.interval)
+    http_options = types.HttpOptions(base_url=await server.start())
+    # Point every client the agent creates at the fake server
+    strands_enhanced_agent.genai.Client = functools.partial(
+        genai.Client, http_options=http_options
+    )
+
+    pool = AgentPool()
+    pool.get_agent("gemini", MODEL)
+
+    async def pooled(start: float) -> float:
+        return await first_token(pool.get_agent("gemini", MODEL), start)
+
+    try:
+        # Warm imports and the fake server before measuring
+        await per_request(time.perf_counter())
+        await pooled(time.perf_counter())
+        for concurrency in args.concurrency:
+            await run_scenario("per-request", per_request, concurrency)
+            await run_scenario("pooled", pooled, concurrency)
+    finally:
+        await pool.close()
+        server.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,208 @@
+"""
+Gemini streaming latency benchmark.
+
+Measures time-to-first-token and inter-chunk latency for:
+1. The previous path (sync SDK stream, one asyncio.to_thread per chunk)
+2. GeminiClient.chat_completion_stream (SDK async client)
+
+Both run against a local fake streamGenerateContent server that emits
+SSE chunks at a fixed interval, so the numbers show client-side overhead
+rather than model speed. Streams that do not finish within --timeout
+(for example while waiting on a thread or pooled connection) count as
+failed.
+
+Usage (from ai-orchestrator/):
+    python scripts/benchmark_gemini_stream.py --concurrency 50 200 --chunks 40
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+# Settings require a service token; the benchmark never calls the backend
+os.environ.setdefault("WEB_PLATFORM_SERVICE_TOKEN", "benchmark-token-not-used-000000")
+
+import structlog  # noqa: E402
+from google import genai  # noqa: E402
+from google.genai import types  # noqa: E402
+
+from app.services.gemini_client import GeminiClient  # noqa: E402
+
+MODEL = "gemini-bench"
+
+
+class FakeStreamServer:
+    """Serves streamGenerateContent as SSE, one chunk every interval seconds."""
+
+    def __init__(self, chunks: int, interval: float) -> None:
+        self.chunks = chunks
+        self.interval = interval
+        self.writers: set[asyncio.StreamWriter] = set()
+        self.server: asyncio.AbstractServer | None = None
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0, limit=2**20)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    def close(self) -> None:
+        """Stop listening and drop open streams so blocked clients unwind."""
+        self.server.close()
+        for writer in list(self.writers):
+            writer.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.writers.add(writer)
+        try:
+            headers = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in headers.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            await reader.readexactly(length)
+
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: text/event-stream\r\n"
+                b"Connection: close\r\n\r\n"
+            )
+            for i in range(self.chunks):
+                await asyncio.sleep(self.interval)
+                payload = {"candidates": [{"content": {"role": "model", "parts": [
+                    {"text": f"token{i} "}
+                ]}}]}
+                writer.write(f"data: {json.dumps(payload)}\r\n\r\n".encode())
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.writers.discard(writer)
+            writer.close()
+
+
+async def legacy_stream(client: genai.Client, contents: list[types.Content]):
+    """Previous chat_completion_stream body: a thread hop for every chunk."""
+    stream = await asyncio.to_thread(
+        client.models.generate_content_stream,
+        model=MODEL,
+        contents=contents,
+        config=types.GenerateContentConfig(temperature=0.3),
+    )
+    end = object()
+
+    def _next():
+        try:
+            return next(stream)
+        except StopIteration:
+            return end
+
+    while True:
+        chunk = await asyncio.to_thread(_next)
+        if chunk is end:
+            break
+        if chunk.text:
+            yield chunk.text
+
+
+async def run_scenario(name: str, open_stream, concurrency: int, timeout: float) -> None:
+    """Run concurrent streams and print TTFT and inter-chunk percentiles."""
+    ttft: list[float] = []
+    gaps: list[float] = []
+
+    async def consume():
+        start = last = time.perf_counter()
+        first = True
+        async for _ in open_stream():
+            now = time.perf_counter()
+            if first:
+                ttft.append((now - start) * 1000)
+                first = False
+            else:
+                gaps.append((now - last) * 1000)
+            last = now
+
+    async def one() -> bool:
+        try:
+            await asyncio.wait_for(consume(), timeout)
+            return True
+        except Exception:
+            return False
+
+    wall_start = time.perf_counter()
+    completed = await asyncio.gather(*(one() for _ in range(concurrency)))
+    wall = time.perf_counter() - wall_start
+    failed = completed.count(False)
+
+    def pct(values: list[float], q: float) -> float:
+        if not values:
+            return float("nan")
+        values = sorted(values)
+        return values[min(len(values) - 1, int(len(values) * q))]
+
+    print(
+        f"{name:<10} streams={concurrency:<4} failed={failed:<4} wall={wall:6.2f}s  "
+        f"ttft p50={pct(ttft, 0.5):7.1f}ms p99={pct(ttft, 0.99):7.1f}ms  "
+        f"gap mean={statistics.fmean(gaps) if gaps else float('nan'):6.1f}ms "
+        f"p99={pct(gaps, 0.99):7.1f}ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--chunks", type=int, default=40)
+    parser.add_argument("--interval", type=float, default=0.02, help="seconds between chunks")
+    parser.add_argument("--timeout", type=float, default=60.0, help="per-stream timeout")
+    args = parser.parse_args()
+
+    # Per-stream start/complete logs would dominate the output
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    server = FakeStreamServer(args.chunks, args.interval)
+    http_options = types.HttpOptions(base_url=await server.start())
+
+    genai_client = genai.Client(api_key="bench", http_options=http_options)
+    gemini = GeminiClient(api_key="bench", fast_model=MODEL)
+    gemini._genai_client = genai_client
+
+    messages = [{"role": "user", "content": "Hello"}]
+    contents = gemini._convert_messages_to_genai(messages)
+
+    print(
+        f"Fake server: {args.chunks} chunks every {args.interval * 1000:.0f}ms "
+        f"(ideal gap {args.interval * 1000:.0f}ms)"
+    )
+    try:
+        for concurrency in args.concurrency:
+            # The async path runs first: legacy streams that time out leave
+            # threads blocked in the default executor
+            await run_scenario(
+                "async",
+                lambda: gemini.chat_completion_stream(messages),
+                concurrency,
+                args.timeout,
+            )
+            await run_scenario(
+                "legacy",
+                lambda: legacy_stream(genai_client, contents),
+                concurrency,
+                args.timeout,
+            )
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(main())
+    # Timed-out legacy streams leave executor threads blocked on the SDK's
+    # connection pool; exit without joining them
+    sys.stdout.flush()
+    os._exit(0)
@@ -0,0 +1,88 @@
+"""
+Tests for CreditChecker.
+
+Tests the reserve → settle / release flow:
+- check_and_reserve holds credits with one reserve_credit call
+- Insufficient credits are reported without raising
+- settle and release act on the reservation ID
+
+Requirements: 9.1, 9.2, 9.3
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.modules.ad_creative.utils import CreditChecker, CreditRefundError
+from app.services.mcp_client import InsufficientCreditsError, MCPToolError
+
+
+@pytest.mark.asyncio
+async def test_check_and_reserve_returns_reservation(mock_mcp_client):
+    """Reserving credits returns the reservation ID and does not check or deduct."""
+    mock_mcp_client.reserve_credit = AsyncMock(
+        return_value={"reservation_id": "res-1", "available_after": "8.5"}
+    )
+    checker = CreditChecker(mcp_client=mock_mcp_client)
+
+    result = await checker.check_and_reserve("user-1", "image_generation", count=3)
+
+    assert result.allowed is True
+    assert result.reservation_id == "res-1"
+    assert result.required_credits == 1.5
+    assert result.available_credits == 8.5
+    kwargs = mock_mcp_client.reserve_credit.await_args.kwargs
+    assert kwargs["credits"] == 1.5
+    assert kwargs["operation_id"].startswith("ad_creative_")
+    mock_mcp_client.check_credit.assert_not_called()
+    mock_mcp_client.deduct_credit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_check_and_reserve_insufficient(mock_mcp_client):
+    """Insufficient credits produce a denied result with error code 6011."""
+    mock_mcp_client.reserve_credit = AsyncMock(
+        side_effect=InsufficientCreditsError(required="5.0", available="1.0")
+    )
+    checker = CreditChecker(mcp_client=mock_mcp_client)
+
+    result = await checker.check_and_reserve("user-1", "image_generation", count=10)
+
+    assert result.allowed is False
+    assert result.reservation_id is None
+    assert result.available_credits == 1.0
+    assert result.error_code == "6011"
+
+
+@pytest.mark.asyncio
+async def test_settle_deducts_reserved_credits(mock_mcp_client):
+    """Settling passes the reservation ID and final cost through."""
+    mock_mcp_client.settle_credit = AsyncMock(
+        return_value={"deducted": "1.0", "balance_after": "9.0"}
+    )
+    checker = CreditChecker(mcp_client=mock_mcp_client)
+
+    result = await checker.settle("user-1", "res-1", credits=1.0)
+
+    assert result == {"reservation_id": "res-1", "amount": 1.0, "balance_after": 9.0}
+    mock_mcp_client.settle_credit.assert_awaited_once_with(
+        user_id="user-1", reservation_id="res-1", credits=1.0, details=None
+    )
+
+
+@pytest.mark.asyncio
+async def test_release_drops_reservation(mock_mcp_client):
+    """Releasing calls release_credit and wraps MCP failures."""
+    mock_mcp_client.release_credit = AsyncMock(return_value={"released": True})
+    checker = CreditChecker(mcp_client=mock_mcp_client)
+
+    result = await checker.release("user-1", "res-1", reason="generation_failed")
+
+    assert result == {"reservation_id": "res-1", "released": True}
+    mock_mcp_client.release_credit.assert_awaited_once_with(
+        user_id="user-1", reservation_id="res-1"
+    )
+
+    mock_mcp_client.release_credit = AsyncMock(side_effect=MCPToolError("boom"))
+    with pytest.raises(CreditRefundError):
+        await checker.release("user-1", "res-1")
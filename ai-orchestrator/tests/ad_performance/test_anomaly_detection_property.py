@@ -239,3 +239,88 @@ async def test_property_6_insufficient_data_returns_none(
     assert result is None, (
         "Should return None when historical data has fewer than 3 points"
     )
+
+
+@given(
+    metric=metric_strategy,
+    sensitivity=sensitivity_strategy,
+    rows=st.lists(
+        st.tuples(
+            historical_values_strategy.filter(lambda v: len(v) >= 5),
+            st.floats(min_value=-6.0, max_value=6.0),
+        ),
+        min_size=1,
+        max_size=10,
+    ),
+)
+@settings(max_examples=100)
+@pytest.mark.asyncio
+async def test_property_6_batch_matches_single_detection(metric, sensitivity, rows):
+    """
+    **Feature: ad-performance, Property 6: Anomaly detection identification**
+
+    For any set of entities, detect_batch flags exactly the entities that
+    detect flags one at a time, with the same expected values. Shorter
+    series are padded with leading NaN.
+
+    **Validates: Requirements 4.1, 4.4, 4.5**
+    """
+    detector = AnomalyDetector()
+    width = max(len(history) for history, _ in rows) + 1
+    values = np.full((len(rows), width), np.nan)
+    expected = {}
+
+    for i, (history, offset) in enumerate(rows):
+        mean = float(np.mean(history))
+        current = mean + offset * float(np.std(history))
+        # Keep the deviation away from the threshold and the mean away from
+        # zero so float rounding cannot flip a decision
+        assume(abs(abs(offset) - detector.sensitivity_thresholds[sensitivity]) > 1e-6)
+        assume(abs(mean) > 1e-6)
+        values[i, width - len(history) - 1:-1] = history
+        values[i, -1] = current
+
+        single = await detector.detect(
+            metric=metric,
+            entity_type="adset",
+            entity_id=f"adset_{i}",
+            entity_name=f"Adset {i}",
+            current_value=current,
+            historical_values=history,
+            sensitivity=sensitivity,
+        )
+        if single is not None:
+            expected[single.entity_id] = single
+
+    anomalies = detector.detect_batch(
+        metric=metric,
+        entity_type="adset",
+        entity_ids=[f"adset_{i}" for i in range(len(rows))],
+        values=values,
+        sensitivity=sensitivity,
+    )
+
+    assert {a.entity_id for a in anomalies} == set(expected)
+    for anomaly in anomalies:
+        single = expected[anomaly.entity_id]
+        assert anomaly.expected_value == pytest.approx(single.expected_value)
+        assert anomaly.severity == single.severity
+
+
+def test_batch_mad_ignores_outlier_in_history():
+    """
+    Test robust scoring is not masked by a past outlier that inflates the
+    standard deviation.
+    """
+    detector = AnomalyDetector()
+    values = np.array([
+        [10.0, 10.5, 9.5, 10.0, 100.0, 10.2, 9.8, 30.0],
+        [10.0, 10.5, 9.5, 10.0, 10.3, 10.2, 9.8, 10.1],
+    ])
+
+    zscore = detector.detect_batch("cpa", "adset", ["a", "b"], values, method="zscore")
+    mad = detector.detect_batch("cpa", "adset", ["a", "b"], values, method="mad")
+
+    assert zscore == []
+    assert [a.entity_id for a in mad] == ["a"]
+    assert mad[0].expected_value == pytest.approx(10.0)
@@ -5,6 +5,7 @@ Property-based tests for creative refresh recommendations.
 **Validates: Requirements 5.4**
 """
 
+import numpy as np
 import pytest
 from hypothesis import given, settings, strategies as st
 from unittest.mock import AsyncMock, MagicMock
@@ -44,10 +45,10 @@ async def test_property_11_creative_fatigue_refresh_recommendation(
     # Create historical trend: baseline for first 3 days, then declining
     ctr_trend = [baseline_ctr] * 3 + [recent_ctr]
     
-    async def mock_get_ctr_trend(*args, **kwargs):
-        return ctr_trend
+    async def mock_get_historical(entity_type, entity_ids, days=7):
+        return {entity_id: {"ctr": np.array(ctr_trend)} for entity_id in entity_ids}
     
-    engine._get_ctr_trend = mock_get_ctr_trend
+    engine._get_historical_performance_batch = mock_get_historical
     engine.mcp_client = mock_mcp
     
     # Create metrics data with ad showing fatigue
@@ -105,13 +106,20 @@ async def test_stable_ctr_does_not_generate_refresh():
     stable_ctr = 0.05
     
     # Mock MCP client
-    async def mock_get_historical(*args, **kwargs):
-        return [
+    async def mock_get_historical(entity_type, entity_ids, days=7):
+        rows = [
             {"ctr": stable_ctr, "roas": 2.5, "spend": 100}
             for _ in range(7)
         ]
+        return {
+            entity_id: {
+                metric: np.array([row[metric] for row in rows])
+                for metric in ("ctr", "roas", "spend")
+            }
+            for entity_id in entity_ids
+        }
     
-    engine._get_historical_performance = mock_get_historical
+    engine._get_historical_performance_batch = mock_get_historical
     engine.mcp_client = AsyncMock()
     
     metrics_data = {
@@ -158,15 +166,22 @@ async def test_detect_creative_fatigue_identifies_declining_ctr():
     recent_ctr = 0.04  # 50% decline
     
     # Mock historical data
-    async def mock_get_historical(*args, **kwargs):
-        return [
+    async def mock_get_historical(entity_type, entity_ids, days=7):
+        rows = [
             {"ctr": baseline_ctr, "roas": 2.5, "spend": 100},
             {"ctr": baseline_ctr, "roas": 2.5, "spend": 100},
             {"ctr": baseline_ctr, "roas": 2.5, "spend": 100},
             {"ctr": recent_ctr, "roas": 2.5, "spend": 100},
         ]
+        return {
+            entity_id: {
+                metric: np.array([row[metric] for row in rows])
+                for metric in ("ctr", "roas", "spend")
+            }
+            for entity_id in entity_ids
+        }
     
-    engine._get_historical_performance = mock_get_historical
+    engine._get_historical_performance_batch = mock_get_historical
     engine.mcp_client = AsyncMock()
     
     entities = [
@@ -197,13 +212,20 @@ async def test_insufficient_data_does_not_trigger_fatigue():
     engine = RecommendationEngine()
     
     # Mock insufficient historical data (less than min_days_for_trend)
-    async def mock_get_historical(*args, **kwargs):
-        return [
+    async def mock_get_historical(entity_type, entity_ids, days=7):
+        rows = [
             {"ctr": 0.05, "roas": 2.5, "spend": 100},
             {"ctr": 0.03, "roas": 2.5, "spend": 100},
         ]
+        return {
+            entity_id: {
+                metric: np.array([row[metric] for row in rows])
+                for metric in ("ctr", "roas", "spend")
+            }
+            for entity_id in entity_ids
+        }
     
-    engine._get_historical_performance = mock_get_historical
+    engine._get_historical_performance_batch = mock_get_historical
     engine.mcp_client = AsyncMock()
     
     entities = [
@@ -6,6 +6,8 @@ Property-based tests for pause recommendations.
 """
 
 import pytest
+from unittest.mock import AsyncMock
+
 from hypothesis import given, settings, strategies as st
 
 from app.modules.ad_performance.analyzers.recommendation_engine import RecommendationEngine
@@ -150,3 +152,44 @@ async def test_identify_underperforming_filters_correctly():
     assert all(e["roas"] < threshold for e in underperforming)
     assert underperforming[0]["entity_id"] in ["1", "2"]
     assert underperforming[1]["entity_id"] in ["1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_identify_underperforming_fetches_history_in_one_call():
+    """
+    Test that history for all candidates comes from one batched MCP call
+    and only the latest days with data decide consistency.
+    """
+    # Arrange
+    mcp_client = AsyncMock()
+    mcp_client.call_tool = AsyncMock(return_value={
+        "entity_type": "adset",
+        "dates": ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"],
+        "series": {
+            # Recovered two days ago, so not consistently low
+            "1": {"roas": [1.0, 1.0, 3.0, 1.0, 1.0]},
+            # Low on every day with data; gaps are skipped
+            "2": {"roas": [3.0, 1.0, None, 1.5, 1.2]},
+            # Only two days of data
+            "3": {"roas": [None, None, None, 1.0, 1.0]},
+        },
+    })
+    engine = RecommendationEngine(mcp_client=mcp_client, user_id="42")
+
+    entities = [
+        {"entity_id": "1", "name": "Low 1", "roas": 1.0, "spend": 100},
+        {"entity_id": "2", "name": "Low 2", "roas": 1.2, "spend": 200},
+        {"entity_id": "3", "name": "New", "roas": 1.0, "spend": 300},
+        {"entity_id": "4", "name": "Good", "roas": 2.5, "spend": 400},
+    ]
+
+    # Act
+    underperforming = await engine.identify_underperforming(entities, 2.0)
+
+    # Assert
+    assert [e["entity_id"] for e in underperforming] == ["2"]
+    mcp_client.call_tool.assert_awaited_once()
+    tool_name, params = mcp_client.call_tool.call_args.args
+    assert tool_name == "get_entity_history"
+    assert params["entity_ids"] == ["1", "2", "3"]
+    assert params["user_id"] == "42"
@@ -5,6 +5,7 @@ Property-based tests for recommendation data completeness.
 **Validates: Requirements 5.1, 5.5, 10.1, 10.2, 10.3, 10.4, 10.5**
 """
 
+import numpy as np
 import pytest
 from hypothesis import given, settings, strategies as st
 from unittest.mock import AsyncMock
@@ -199,15 +200,22 @@ async def test_creative_refresh_has_ctr_improvement():
     recent_ctr = 0.04
     
     # Mock historical data
-    async def mock_get_historical(*args, **kwargs):
-        return [
+    async def mock_get_historical(entity_type, entity_ids, days=7):
+        rows = [
             {"ctr": baseline_ctr, "roas": 2.5, "spend": 100},
             {"ctr": baseline_ctr, "roas": 2.5, "spend": 100},
             {"ctr": baseline_ctr, "roas": 2.5, "spend": 100},
             {"ctr": recent_ctr, "roas": 2.5, "spend": 100},
         ]
+        return {
+            entity_id: {
+                metric: np.array([row[metric] for row in rows])
+                for metric in ("ctr", "roas", "spend")
+            }
+            for entity_id in entity_ids
+        }
     
-    engine._get_historical_performance = mock_get_historical
+    engine._get_historical_performance_batch = mock_get_historical
     engine.mcp_client = AsyncMock()
     
     metrics_data = {
@@ -249,15 +257,22 @@ async def test_all_recommendations_sorted_by_priority():
     engine = RecommendationEngine()
     
     # Mock to return historical data for creative fatigue
-    async def mock_get_historical(*args, **kwargs):
-        return [
+    async def mock_get_historical(entity_type, entity_ids, days=7):
+        rows = [
             {"ctr": 0.08, "roas": 2.5, "spend": 100},
             {"ctr": 0.08, "roas": 2.5, "spend": 100},
             {"ctr": 0.08, "roas": 2.5, "spend": 100},
             {"ctr": 0.04, "roas": 2.5, "spend": 100},
         ]
+        return {
+            entity_id: {
+                metric: np.array([row[metric] for row in rows])
+                for metric in ("ctr", "roas", "spend")
+            }
+            for entity_id in entity_ids
+        }
     
-    engine._get_historical_performance = mock_get_historical
+    engine._get_historical_performance_batch = mock_get_historical
     engine.mcp_client = AsyncMock()
     
     # Create data that generates multiple types of recommendations
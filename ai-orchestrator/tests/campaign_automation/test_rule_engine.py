@@ -5,7 +5,7 @@ Requirements: 6.1, 6.3, 6.4, 6.5
 """
 
 import pytest
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.modules.campaign_automation.engines.rule_engine import RuleEngine
@@ -30,6 +30,9 @@ def mock_redis_client():
     client.set = AsyncMock()
     client.get = AsyncMock()
     client.keys = AsyncMock(return_value=[])
+    client.scan = AsyncMock(return_value=(0, []))
+    client.mget = AsyncMock(return_value=[])
+    client.mset = AsyncMock()
     client.sadd = AsyncMock()
     client.smembers = AsyncMock(return_value=[])
     client.srem = AsyncMock()
@@ -212,10 +215,13 @@ async def test_get_rule(rule_engine, mock_redis_client):
         action=RuleAction(type="pause_adset"),
         applies_to=RuleAppliesTo(campaign_ids=["campaign_123"]),
         enabled=True,
-        created_at=datetime.now(timezone.utc),
+        created_at=datetime.now(UTC),
     )
     
-    mock_redis_client.get = AsyncMock(return_value=rule.model_dump_json())
+    checked_at = datetime(2026, 1, 1, tzinfo=UTC)
+    mock_redis_client.mget = AsyncMock(
+        return_value=[rule.model_dump_json(), checked_at.isoformat()]
+    )
     
     # Act
     result = await rule_engine.get_rule(rule_id)
@@ -224,6 +230,7 @@ async def test_get_rule(rule_engine, mock_redis_client):
     assert result is not None
     assert result["rule_id"] == rule_id
     assert result["rule_name"] == "Test Rule"
+    assert result["last_checked_at"] == checked_at
 
 
 @pytest.mark.asyncio
@@ -234,7 +241,7 @@ async def test_get_rule_not_found(rule_engine, mock_redis_client):
     Validates: Requirements 6.1
     """
     # Arrange
-    mock_redis_client.get = AsyncMock(return_value=None)
+    mock_redis_client.mget = AsyncMock(return_value=[None, None])
     
     # Act
     result = await rule_engine.get_rule("nonexistent_rule")
@@ -315,82 +322,71 @@ async def test_parse_time_range(rule_engine):
     assert rule_engine._parse_time_range("invalid") == 24
 
 
+def make_rule(rule_id, metric, operator, value, adset_ids, **kwargs):
+    """Build a rule on adsets with a 24h condition"""
+    return Rule(
+        rule_id=rule_id,
+        rule_name=rule_id,
+        condition=RuleCondition(metric=metric, operator=operator, value=value, time_range="24h"),
+        action=RuleAction(type="pause_adset"),
+        applies_to=RuleAppliesTo(adset_ids=adset_ids),
+        created_at=datetime.now(UTC),
+        **kwargs,
+    )
+
+
 @pytest.mark.asyncio
-async def test_evaluate_condition_greater_than(rule_engine):
+async def test_match_rule_targets_greater_than(rule_engine):
     """
     Test condition evaluation with greater_than operator.
     
     Validates: Requirements 6.3
     """
     # Arrange
-    condition = RuleCondition(
-        metric="cpa",
-        operator="greater_than",
-        value=50,
-        time_range="24h"
-    )
-    target = {"id": "adset_123", "type": "adset"}
-    
-    # Mock _get_metric_value to return 60
-    rule_engine._get_metric_value = AsyncMock(return_value=60.0)
+    rule = make_rule("rule_cpa", "cpa", "greater_than", 50, ["adset_1", "adset_2"])
+    metrics = {("42", "adset", 24): {"adset_1": {"cpa": 60.0}, "adset_2": {"cpa": 40.0}}}
     
     # Act
-    result = await rule_engine._evaluate_condition(condition, target)
+    matches = await rule_engine._match_rule_targets([("42", rule)], metrics)
     
     # Assert
-    assert result is True
+    assert [target["id"] for _, target in matches] == ["adset_1"]
 
 
 @pytest.mark.asyncio
-async def test_evaluate_condition_less_than(rule_engine):
+async def test_match_rule_targets_less_than(rule_engine):
     """
     Test condition evaluation with less_than operator.
     
     Validates: Requirements 6.3
     """
     # Arrange
-    condition = RuleCondition(
-        metric="roas",
-        operator="less_than",
-        value=2.0,
-        time_range="24h"
-    )
-    target = {"id": "adset_123", "type": "adset"}
-    
-    # Mock _get_metric_value to return 1.5
-    rule_engine._get_metric_value = AsyncMock(return_value=1.5)
+    rule = make_rule("rule_roas", "roas", "less_than", 2.0, ["adset_1", "adset_2"])
+    metrics = {("42", "adset", 24): {"adset_1": {"roas": "1.5"}, "adset_2": {"roas": 2.5}}}
     
     # Act
-    result = await rule_engine._evaluate_condition(condition, target)
+    matches = await rule_engine._match_rule_targets([("42", rule)], metrics)
     
     # Assert
-    assert result is True
+    assert [target["id"] for _, target in matches] == ["adset_1"]
 
 
 @pytest.mark.asyncio
-async def test_evaluate_condition_metric_not_available(rule_engine):
+async def test_match_rule_targets_metric_not_available(rule_engine):
     """
-    Test condition evaluation when metric is not available.
+    Test targets without the metric never match.
     
     Validates: Requirements 6.3
     """
     # Arrange
-    condition = RuleCondition(
-        metric="cpa",
-        operator="greater_than",
-        value=50,
-        time_range="24h"
-    )
-    target = {"id": "adset_123", "type": "adset"}
-    
-    # Mock _get_metric_value to return None
-    rule_engine._get_metric_value = AsyncMock(return_value=None)
+    rule = make_rule("rule_cpa", "cpa", "less_than", 50, ["adset_1", "adset_2", "adset_3"])
+    metrics = {("42", "adset", 24): {"adset_1": {"roas": 1.0}, "adset_2": {"cpa": None}}}
     
     # Act
-    result = await rule_engine._evaluate_condition(condition, target)
+    matches = await rule_engine._match_rule_targets([("42", rule)], metrics)
     
     # Assert
-    assert result is False
+    assert matches == []
 
 
 @pytest.mark.asyncio
@@ -410,5 +406,91 @@ async def test_check_rules_no_rules(rule_engine, mock_redis_client):
     assert len(results) == 0
 
 
+
+@pytest.mark.asyncio
+async def test_check_rules_batches_metrics_and_actions(rule_engine, mock_redis_client, mock_mcp_client):
+    """
+    Test rules sharing a time range are evaluated from one metrics call.
+
+    Validates: Requirements 6.3
+    """
+    # Arrange
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[{"rule_cpa", "rule_roas"}])
+    mock_redis_client.pipeline = MagicMock(return_value=pipe)
+    mock_redis_client.scan = AsyncMock(
+        return_value=(0, ["campaign_automation:user_rules:42"])
+    )
+    rules = {
+        "campaign_automation:rule:rule_cpa": make_rule(
+            "rule_cpa", "cpa", "greater_than", 50, ["adset_1", "adset_2"]
+        ).model_dump_json(),
+        "campaign_automation:rule:rule_roas": make_rule(
+            "rule_roas", "roas", "less_than", 2.0, ["adset_2", "adset_3"]
+        ).model_dump_json(),
+    }
+    mock_redis_client.mget = AsyncMock(side_effect=lambda keys: [rules.get(k) for k in keys])
+    mock_mcp_client.call_tool = AsyncMock(return_value={
+        "entity_type": "adset",
+        "metrics": {
+            "adset_1": {"cpa": "60.00", "roas": 3.0},
+            "adset_2": {"cpa": "40.00", "roas": 1.5},
+        },
+    })
+    rule_engine.execute_rule_action = AsyncMock(return_value={"status": "success"})
+
+    # Act
+    results = await rule_engine.check_rules()
+
+    # Assert
+    mock_mcp_client.call_tool.assert_awaited_once()
+    tool_name, params = mock_mcp_client.call_tool.call_args.args
+    assert tool_name == "get_entity_metrics"
+    assert params["user_id"] == "42"
+    assert params["entity_ids"] == ["adset_1", "adset_2", "adset_3"]
+
+    actions = {
+        (r["rule_id"], a["target_id"]) for r in results for a in r["actions_taken"]
+    }
+    assert actions == {("rule_cpa", "adset_1"), ("rule_roas", "adset_2")}
+    mock_redis_client.keys.assert_not_awaited()
+    mock_redis_client.mset.assert_awaited_once()
+    # Only the check times are written, never the rules themselves
+    assert set(mock_redis_client.mset.call_args.args[0]) == {
+        "campaign_automation:rule_checked:rule_cpa",
+        "campaign_automation:rule_checked:rule_roas",
+    }
+    assert rule_engine.last_run_stats["rules_checked"] == 2
+    assert set(rule_engine.last_run_stats["phase_ms"]) == {
+        "load", "fetch", "evaluate", "act", "persist"
+    }
+
+
+@pytest.mark.asyncio
+async def test_check_rules_skips_recently_checked_rules(rule_engine, mock_redis_client, mock_mcp_client):
+    """
+    Test the separately stored check time decides whether a rule is due.
+
+    Validates: Requirements 6.3
+    """
+    # Arrange
+    mock_redis_client.smembers = AsyncMock(return_value={"rule_cpa"})
+    stored = {
+        "campaign_automation:rule:rule_cpa": make_rule(
+            "rule_cpa", "cpa", "greater_than", 50, ["adset_1"]
+        ).model_dump_json(),
+        "campaign_automation:rule_checked:rule_cpa": datetime.now(UTC).isoformat(),
+    }
+    mock_redis_client.mget = AsyncMock(side_effect=lambda keys: [stored.get(k) for k in keys])
+
+    # Act
+    results = await rule_engine.check_rules(user_id="42")
+
+    # Assert
+    assert results == []
+    mock_mcp_client.call_tool.assert_not_awaited()
+    assert rule_engine.last_run_stats["rules_checked"] == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
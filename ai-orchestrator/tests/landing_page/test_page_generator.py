@@ -0,0 +1,142 @@
+"""
+Tests for PageGenerator.
+
+Tests concurrent section generation including:
+- Independent sections run concurrently and are reported as they complete
+- Generated sections are cached per product and language
+- Fallback sections are not cached
+
+Requirements: 2.1
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import fakeredis
+import pytest
+
+from app.core.cache import Cache
+from app.modules.landing_page.generators import PageGenerator
+from app.modules.landing_page.generators.page_generator import (
+    FAQGenerationResult,
+    FeatureGenerationResult,
+    HeroGenerationResult,
+)
+from app.modules.landing_page.models import ProductInfo
+
+LLM_LATENCY = 0.2
+
+
+@pytest.fixture
+def section_cache():
+    """Create a section cache on an in-memory Redis"""
+    return Cache("test.sections", fakeredis.FakeAsyncRedis(decode_responses=True), ttl=60)
+
+
+@pytest.fixture
+def product_info():
+    return ProductInfo(
+        title="Wireless Headphones",
+        price=99.99,
+        main_image="https://example.com/headphones.jpg",
+        description="Noise cancelling over-ear headphones",
+        features=["40h battery"],
+        source="manual",
+    )
+
+
+def make_gemini() -> MagicMock:
+    """Gemini mock answering each section schema after a fixed latency."""
+    responses = {
+        HeroGenerationResult: HeroGenerationResult(
+            headline="Hear Every Detail",
+            subheadline="Silence the world",
+            cta_text="Buy for $99.99",
+        ),
+        FeatureGenerationResult: FeatureGenerationResult(
+            features=[{"title": "Long battery", "description": "40 hours", "icon": "battery"}]
+        ),
+        FAQGenerationResult: FAQGenerationResult(
+            faqs=[{"question": "Shipping?", "answer": "1-3 days"}]
+        ),
+    }
+
+    async def structured_output(messages, schema, temperature):
+        await asyncio.sleep(LLM_LATENCY)
+        return responses[schema]
+
+    gemini = MagicMock()
+    gemini.structured_output = AsyncMock(side_effect=structured_output)
+    return gemini
+
+
+@pytest.mark.asyncio
+async def test_generate_runs_sections_concurrently(section_cache, product_info):
+    """Test the page takes about as long as its slowest section"""
+    # Arrange
+    gemini = make_gemini()
+    generator = PageGenerator(gemini_client=gemini, section_cache=section_cache)
+    completed = []
+
+    async def on_section(name, section):
+        completed.append(name)
+
+    # Act
+    started = time.monotonic()
+    page = await generator.generate(product_info, template="modern", on_section=on_section)
+    elapsed = time.monotonic() - started
+
+    # Assert
+    assert gemini.structured_output.await_count == 3
+    assert elapsed < 2 * LLM_LATENCY
+    assert page.hero.headline == "Hear Every Detail"
+    assert page.features[0].title == "Long battery"
+    assert page.faq[0].question == "Shipping?"
+    # Local sections are reported first, LLM sections as they finish
+    assert sorted(completed) == ["cta", "faq", "features", "hero", "reviews", "theme"]
+    assert set(completed[3:]) == {"faq", "features", "hero"}
+
+
+@pytest.mark.asyncio
+async def test_generate_reuses_cached_sections(section_cache, product_info):
+    """Test sections are cached by product, template and language"""
+    # Arrange
+    gemini = make_gemini()
+    await PageGenerator(gemini_client=gemini, section_cache=section_cache).generate(
+        product_info, template="modern"
+    )
+    gemini.structured_output.reset_mock()
+
+    # Act: a new generator shares the cache through Redis
+    section_cache._l1.clear()
+    generator = PageGenerator(gemini_client=gemini, section_cache=section_cache)
+    page = await generator.generate(product_info, template="modern")
+    await generator.generate(product_info, template="minimal")
+
+    # Assert: only the hero depends on the template
+    assert page.hero.headline == "Hear Every Detail"
+    assert page.features[0].title == "Long battery"
+    schemas = [call.kwargs["schema"] for call in gemini.structured_output.await_args_list]
+    assert schemas == [HeroGenerationResult]
+    keys = await section_cache.redis.keys("*")
+    assert keys and all(key.startswith("landing_page:section:") for key in keys)
+
+
+@pytest.mark.asyncio
+async def test_fallback_sections_are_not_cached(section_cache, product_info):
+    """Test a failed generation falls back without caching the fallback"""
+    # Arrange
+    failing = MagicMock()
+    failing.structured_output = AsyncMock(side_effect=Exception("API error"))
+    generator = PageGenerator(gemini_client=failing, section_cache=section_cache)
+
+    # Act
+    page = await generator.generate(product_info)
+    generator.gemini = make_gemini()
+    retried = await generator.generate(product_info)
+
+    # Assert
+    assert page.hero.headline == product_info.title
+    assert retried.hero.headline == "Hear Every Detail"
+    assert generator.gemini.structured_output.await_count == 3
@@ -0,0 +1,82 @@
+"""Tests for the shared chat agent pool."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from app.core import agent_pool
+from app.core.agent_pool import AgentPool
+from app.core.config import get_settings
+from app.tools.base import AgentTool, ToolCategory, ToolMetadata
+from app.tools.registry import ToolRegistry
+
+
+class ContextEchoTool(AgentTool):
+    """Returns the execution context it was called with."""
+
+    def __init__(self):
+        super().__init__(ToolMetadata(
+            name="echo_context",
+            description="Echo the execution context",
+            category=ToolCategory.AGENT_CUSTOM,
+            parameters=[],
+        ))
+
+    async def execute(self, parameters: dict, context: dict | None = None):
+        return {"success": True, "context": context}
+
+
+@pytest.fixture
+def pool_and_build(monkeypatch):
+    monkeypatch.setenv("WEB_PLATFORM_SERVICE_TOKEN", "test-token-0000000000000000000000")
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    get_settings.cache_clear()
+
+    registry = ToolRegistry()
+    registry.register(ContextEchoTool())
+    with patch.object(agent_pool, "build_tool_registry", return_value=registry) as build:
+        yield AgentPool(max_agents=2), build
+    get_settings.cache_clear()
+
+
+def test_agents_are_shared_per_provider_and_model(pool_and_build):
+    """Each (provider, model) is built once over one shared registry."""
+    pool, build = pool_and_build
+
+    first = pool.get_agent("gemini", "gemini-2.5-flash")
+    assert pool.get_agent("gemini", "gemini-2.5-flash") is first
+    other = pool.get_agent("gemini", "gemini-2.5-pro")
+
+    assert other is not first
+    assert other.tool_registry is first.tool_registry
+    assert first._get_model() is first._get_model()
+    build.assert_called_once()
+
+    # The least recently used agent is dropped beyond max_agents
+    pool.get_agent("gemini", "gemini-2.5-flash")
+    pool.get_agent("gemini", "gemini-3-pro")
+    assert pool.get_agent("gemini", "gemini-2.5-flash") is first
+    assert pool.get_agent("gemini", "gemini-2.5-pro") is not other
+
+
+async def test_shared_tool_wrappers_read_request_state(pool_and_build):
+    """Tool wrappers take user and session from each call's invocation state."""
+    pool, _ = pool_and_build
+    agent = pool.get_agent("gemini", "gemini-2.5-flash")
+    (wrapper,) = agent._get_strands_tools()
+    assert agent._get_strands_tools()[0] is wrapper
+
+    for user_id in ("alice", "bob"):
+        tool_context = SimpleNamespace(invocation_state={
+            "user_id": user_id,
+            "session_id": f"{user_id}-session",
+            "model_preferences": {"video_generation_provider": "bedrock"},
+        })
+        events = [event async for event in wrapper(tool_context=tool_context)]
+
+        context = events[-1]["context"]
+        assert context["user_id"] == user_id
+        assert context["session_id"] == f"{user_id}-session"
+        assert context["conversation_history"] == []
+        assert context["model_preferences"] == {"video_generation_provider": "bedrock"}
@@ -0,0 +1,111 @@
+"""Tests for concurrent, deduplicated attachment ingestion.
+
+Run with: pytest tests/test_attachment_ingestion.py -v
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import fakeredis
+import pytest
+
+from app.services import attachment_ingestion
+from app.services.attachment_ingestion import AttachmentSource, ingest_attachments
+
+OBJECTS = {
+    "1/chat-attachments/s/a.mp4": [b"video-", b"bytes"],
+    "1/chat-attachments/s/b.mp4": [b"video-bytes"],  # same content, other key
+    "1/chat-attachments/s/c.png": [b"image"],
+}
+
+
+@pytest.fixture
+def fake_redis():
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    async def get_fake_redis():
+        return redis
+
+    with patch.object(attachment_ingestion, "get_redis", get_fake_redis):
+        yield redis
+
+
+@pytest.fixture
+def storage():
+    """Fake S3 reads and Gemini uploads, recording each call."""
+    calls = {"downloads": [], "uploads": [], "active": 0, "max_active": 0}
+
+    async def download_s3(key, content):
+        calls["downloads"].append(key)
+        calls["active"] += 1
+        calls["max_active"] = max(calls["max_active"], calls["active"])
+        await asyncio.sleep(0.01)
+        for chunk in OBJECTS[key]:
+            await content.write(chunk)
+        calls["active"] -= 1
+
+    async def upload_stream(chunks, size, mime_type, display_name=None):
+        data = b"".join([chunk async for chunk in chunks])
+        assert len(data) == size
+        calls["uploads"].append(data)
+        name = f"files/{len(calls['uploads'])}"
+        return {"name": name, "uri": f"https://gemini/{name}", "mime_type": mime_type}
+
+    with (
+        patch.object(attachment_ingestion, "_download_s3", download_s3),
+        patch.object(
+            attachment_ingestion.gemini_files_service, "upload_stream", upload_stream
+        ),
+        patch.object(attachment_ingestion, "get_settings"),
+    ):
+        yield calls
+
+
+def _source(key: str, mime_type: str = "video/mp4") -> AttachmentSource:
+    return AttachmentSource(filename=key.rsplit("/", 1)[-1], mime_type=mime_type, s3_key=key)
+
+
+async def test_identical_content_is_uploaded_once(fake_redis, storage):
+    """Files with the same bytes share one Gemini upload."""
+    a, b = _source("1/chat-attachments/s/a.mp4"), _source("1/chat-attachments/s/b.mp4")
+
+    first = await ingest_attachments([a])
+    second = await ingest_attachments([b, a])
+
+    assert storage["uploads"] == [b"video-bytes"]
+    assert first[0]["uri"] == second[0]["uri"] == second[1]["uri"]
+    # a is resolved by location on the second message, without a download
+    assert storage["downloads"] == ["1/chat-attachments/s/a.mp4", "1/chat-attachments/s/b.mp4"]
+
+
+async def test_ingestion_is_concurrent_and_bounded(fake_redis, storage):
+    """Attachments download in parallel up to the limit, in input order."""
+    sources = [
+        _source("1/chat-attachments/s/a.mp4"),
+        _source("1/chat-attachments/s/c.png", "image/png"),
+        _source("1/chat-attachments/s/a.mp4"),
+    ]
+
+    results = await ingest_attachments(sources, max_concurrency=2)
+
+    assert results[0] is results[2]
+    assert results[1]["mime_type"] == "image/png"
+    assert sorted(storage["downloads"]) == [
+        "1/chat-attachments/s/a.mp4",
+        "1/chat-attachments/s/c.png",
+    ]
+    assert storage["max_active"] == 2
+
+
+async def test_cache_respects_gemini_file_expiry(fake_redis, storage):
+    """Files close to their 48h expiry are not cached for reuse."""
+    async def expiring_upload(chunks, size, mime_type, display_name=None):
+        return {"name": "files/x", "uri": "https://gemini/files/x",
+                "expiration_time": "2000-01-01T00:00:00Z"}
+
+    with patch.object(
+        attachment_ingestion.gemini_files_service, "upload_stream", expiring_upload
+    ):
+        await ingest_attachments([_source("1/chat-attachments/s/c.png", "image/png")])
+
+    assert await fake_redis.keys("gemini_file*") == []
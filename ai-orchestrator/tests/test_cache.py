@@ -0,0 +1,52 @@
+"""Tests for the shared two-level cache."""
+
+import time
+from unittest.mock import AsyncMock
+
+import fakeredis
+import pytest
+
+from app.core.cache import Cache, dumps, get_cache_stats
+from app.modules.market_insights.utils.cache_manager import CacheManager
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+async def test_l1_serves_repeat_reads_and_stats_are_recorded(redis):
+    """Repeat reads come from process memory; each namespace counts them."""
+    cache = Cache("test_l1", redis, ttl=60)
+    fetch = AsyncMock(return_value={"trend": [1, 2, 3]})
+
+    assert await cache.get_or_fetch("trend:us", fetch) == {"trend": [1, 2, 3]}
+    redis.get = AsyncMock(side_effect=AssertionError("L1 hit expected"))
+    for _ in range(3):
+        assert await cache.get_or_fetch("trend:us", fetch) == {"trend": [1, 2, 3]}
+
+    fetch.assert_called_once()
+    stats = get_cache_stats()["test_l1"]
+    assert (stats["misses"], stats["l1_hits"], stats["fetches"]) == (1, 3, 1)
+    assert stats["hit_ratio"] == 0.75
+
+
+async def test_market_data_past_revalidate_window_is_refetched(redis):
+    """Old data is not served silently, but is the fallback when the source fails."""
+    manager = CacheManager(redis)
+    await manager.set("market_trends", "fashion", {"trends": ["old"]})
+    key = manager._build_cache_key("market_trends", "fashion")
+    cache = manager._cache("market_trends")
+    entry = await cache.get_entry(key)
+    entry.fresh_until = time.time() - manager.STALE_WHILE_REVALIDATE - 1
+    cache._l1.clear()
+    await redis.set(key, dumps(entry))
+
+    failing = AsyncMock(side_effect=RuntimeError("pytrends down"))
+    assert await manager.get_or_fetch("market_trends", "fashion", failing) == {"trends": ["old"]}
+    failing.assert_called_once()
+    with pytest.raises(RuntimeError):
+        await manager.get_or_fetch("market_trends", "fashion", failing, use_stale_on_error=False)
+
+    fetch = AsyncMock(return_value={"trends": ["new"]})
+    assert await manager.get_or_fetch("market_trends", "fashion", fetch) == {"trends": ["new"]}
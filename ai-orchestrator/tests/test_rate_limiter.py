@@ -0,0 +1,82 @@
+"""Tests for the cluster-wide token-bucket rate limiter."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import fakeredis
+import pytest
+
+from app.core import rate_limiter
+from app.core.rate_limiter import (
+    Priority,
+    RateLimitTimeoutError,
+    TokenBucketLimiter,
+    get_rate_limit_stats,
+    rate_limit_priority,
+)
+from app.core.redis_client import RedisConnectionError
+
+
+@pytest.fixture
+def redis():
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    with patch.object(rate_limiter, "get_redis", AsyncMock(return_value=redis)):
+        yield redis
+
+
+async def test_bucket_is_shared_between_replicas(redis):
+    """Limiters with one name in different processes draw from one bucket."""
+    replicas = [TokenBucketLimiter("shared", rate=0.01, capacity=3) for _ in range(2)]
+
+    granted = [await replicas[i % 2].try_acquire() for i in range(5)]
+
+    assert granted == [True, True, True, False, False]
+
+
+async def test_waiters_are_served_in_order_interactive_first(redis):
+    """Queued waiters get tokens in arrival order, interactive ahead of background."""
+    limiter = TokenBucketLimiter("ordered", rate=20, capacity=1)
+    assert await limiter.try_acquire()  # Empty the bucket
+    served: list[str] = []
+
+    async def wait(label: str, priority: Priority) -> None:
+        await limiter.acquire(priority)
+        served.append(label)
+
+    tasks = [asyncio.create_task(wait("background", Priority.BACKGROUND))]
+    await asyncio.sleep(0.01)
+    with rate_limit_priority(Priority.INTERACTIVE):
+        for i in range(3):
+            tasks.append(asyncio.create_task(wait(f"chat-{i}", None)))
+            await asyncio.sleep(0.005)
+    await asyncio.gather(*tasks)
+
+    assert served == ["chat-0", "chat-1", "chat-2", "background"]
+    stats = get_rate_limit_stats()["ordered"]
+    assert stats["interactive"]["count"] == 4  # try_acquire included
+    assert stats["background"]["count"] == 1
+    assert stats["background"]["avg_seconds"] > stats["interactive"]["avg_seconds"]
+
+
+async def test_timed_out_waiter_leaves_the_queue(redis):
+    """A waiter that gives up does not hold back the ones behind it."""
+    limiter = TokenBucketLimiter("timeout", rate=5, capacity=1)
+    assert await limiter.try_acquire()
+
+    with pytest.raises(RateLimitTimeoutError):
+        await limiter.acquire(timeout=0.05)
+
+    assert await redis.zcard("token_bucket:timeout:queue") == 0
+    assert await limiter.acquire(timeout=1) < 1
+
+
+async def test_falls_back_to_in_process_bucket_without_redis():
+    """Without Redis the same limits apply within the process."""
+    limiter = TokenBucketLimiter("local", rate=50, capacity=2)
+    with patch.object(rate_limiter, "get_redis", AsyncMock(side_effect=RedisConnectionError())):
+        assert await limiter.try_acquire()
+        assert await limiter.try_acquire()
+        assert not await limiter.try_acquire()
+        waited = await limiter.acquire()
+
+    assert 0 < waited < 0.5
@@ -0,0 +1,77 @@
+"""Tests for streaming video uploads in the S3 client.
+
+Run with: pytest tests/test_s3_client.py -v
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from app.services.s3_client import S3Client, S3Error
+
+
+@pytest.fixture
+def client():
+    """S3Client with a mocked boto3 client."""
+    s3_client = S3Client.__new__(S3Client)
+    s3_client.s3 = MagicMock()
+    s3_client.bucket_creatives = "creatives"
+    s3_client.s3.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+    s3_client.s3.upload_part.side_effect = lambda **kwargs: {
+        "ETag": f"etag-{kwargs['PartNumber']}"
+    }
+    return s3_client
+
+
+async def _chunks(*chunks: bytes, error: Exception | None = None):
+    for chunk in chunks:
+        yield chunk
+    if error:
+        raise error
+
+
+async def test_upload_video_stream_sends_parts_in_order(client):
+    """Chunks are grouped into parts of at least part_size bytes."""
+    result = await client.upload_video_stream(
+        _chunks(b"aaa", b"bb", b"cccc", b"d"), "clip.mp4", "42", part_size=4
+    )
+
+    bodies = [call.kwargs["Body"] for call in client.s3.upload_part.call_args_list]
+    assert bodies == [b"aaabb", b"cccc", b"d"]
+    complete = client.s3.complete_multipart_upload.call_args.kwargs
+    assert complete["UploadId"] == "upload-1"
+    assert complete["MultipartUpload"]["Parts"] == [
+        {"PartNumber": 1, "ETag": "etag-1"},
+        {"PartNumber": 2, "ETag": "etag-2"},
+        {"PartNumber": 3, "ETag": "etag-3"},
+    ]
+    assert result["size"] == 10
+    assert result["object_name"] == "users/42/generated/videos/clip.mp4"
+    client.s3.abort_multipart_upload.assert_not_called()
+
+
+async def test_upload_video_stream_aborts_when_download_fails(client):
+    """A failing source aborts the multipart upload and re-raises."""
+    with pytest.raises(RuntimeError):
+        await client.upload_video_stream(
+            _chunks(b"aaaa", error=RuntimeError("connection reset")),
+            "clip.mp4",
+            "42",
+            part_size=4,
+        )
+
+    client.s3.abort_multipart_upload.assert_called_once()
+    client.s3.complete_multipart_upload.assert_not_called()
+
+
+async def test_upload_video_stream_wraps_s3_errors(client):
+    """S3 failures during a part upload surface as S3Error."""
+    client.s3.upload_part.side_effect = ClientError(
+        {"Error": {"Code": "InternalError", "Message": "boom"}}, "UploadPart"
+    )
+
+    with pytest.raises(S3Error):
+        await client.upload_video_stream(_chunks(b"aaaa"), "clip.mp4", "42", part_size=4)
+
+    client.s3.abort_multipart_upload.assert_called_once()
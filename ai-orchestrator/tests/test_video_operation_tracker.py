@@ -0,0 +1,218 @@
+"""Tests for the shared video operation tracker.
+
+Run with: pytest tests/test_video_operation_tracker.py -v
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import fakeredis
+import pytest
+
+from app.services import video_operation_tracker
+from app.services.gemini_client import GeminiAPIError
+from app.services.video_operation_tracker import (
+    CHECK_CONCURRENCY,
+    DUE_KEY,
+    FINALIZE_LEASE,
+    POLLER_LOCK_KEY,
+    VideoOperationTracker,
+)
+
+
+@pytest.fixture
+def fake_redis():
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    async def get_fake_redis():
+        return redis
+
+    with patch.object(video_operation_tracker, "get_redis", get_fake_redis):
+        yield redis
+
+
+def _tracker(statuses: dict[str, list]) -> tuple[VideoOperationTracker, list[str]]:
+    """Tracker whose checker replays statuses per provider operation ID."""
+    checked: list[str] = []
+
+    async def check(record):
+        checked.append(record["operation_id"])
+        outcome = statuses[record["operation_id"]].pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def finalize(record, poll_result):
+        return {"video_url": poll_result["video_uri"]}
+
+    tracker = VideoOperationTracker(
+        checkers={"gemini": check}, finalizer=finalize, initial_interval=2
+    )
+    return tracker, checked
+
+
+async def _make_due(redis) -> None:
+    handles = await redis.zrange(DUE_KEY, 0, -1)
+    if handles:
+        await redis.zadd(DUE_KEY, {handle: 0 for handle in handles})
+
+
+async def test_poll_once_checks_all_due_operations_in_one_batch(fake_redis):
+    """One tick checks every due operation and backs off unfinished ones."""
+    tracker, checked = _tracker({
+        "op-a": [{"status": "processing", "progress": 40}],
+        "op-b": [{"status": "completed", "video_uri": "https://video/b"}],
+    })
+    a = await tracker.register("op-a", "gemini", user_id="1")
+    b = await tracker.register("op-b", "gemini", user_id="1")
+    assert await tracker.poll_once() == 0
+
+    await _make_due(fake_redis)
+    assert await tracker.poll_once() == 2
+
+    assert sorted(checked) == ["op-a", "op-b"]
+    record_a = await tracker.get(a["id"])
+    assert record_a["status"] == "processing"
+    assert record_a["progress"] == 40
+    record_b = await tracker.wait(b["id"], timeout=1)
+    assert record_b["status"] == "completed"
+    assert record_b["result"] == {"video_url": "https://video/b"}
+    assert await fake_redis.zrange(DUE_KEY, 0, -1) == [a["id"]]
+
+    # Nothing is due until op-a's backed-off interval passes
+    assert await tracker.poll_once() == 0
+
+
+async def test_interval_backs_off_and_failures_finish(fake_redis):
+    """Retryable errors back off; permanent provider errors fail the operation."""
+    tracker, _ = _tracker({
+        "op-a": [
+            GeminiAPIError("Failed to poll operation", retryable=True),
+            GeminiAPIError("Video generation failed: blocked", retryable=False),
+        ],
+    })
+    operation = await tracker.register("op-a", "gemini")
+
+    await _make_due(fake_redis)
+    await tracker.poll_once()
+    record = await tracker.get(operation["id"])
+    assert record["status"] == "processing"
+    assert record["interval"] == 3
+    assert await fake_redis.zscore(DUE_KEY, operation["id"]) > time.time() + 2
+
+    await _make_due(fake_redis)
+    await tracker.poll_once()
+    record = await tracker.get(operation["id"])
+    assert record["status"] == "failed"
+    assert "blocked" in record["error"]
+
+
+async def test_wait_is_notified_when_the_poller_finishes(fake_redis):
+    """Waiters receive the final record without polling the provider."""
+    tracker, checked = _tracker({
+        "op-a": [
+            {"status": "processing", "progress": 50},
+            {"status": "completed", "video_uri": "https://video/a"},
+        ],
+    })
+    operation = await tracker.register("op-a", "gemini")
+    waiter = asyncio.create_task(tracker.wait(operation["id"], timeout=5))
+
+    for _ in range(2):
+        await asyncio.sleep(0.05)
+        await _make_due(fake_redis)
+        await tracker.poll_once()
+
+    result = await waiter
+    assert result["status"] == "completed"
+    assert result["result"] == {"video_url": "https://video/a"}
+    assert checked == ["op-a", "op-a"]
+
+
+async def test_finalizing_does_not_block_other_checks(fake_redis):
+    """Storing a video runs off the poll loop under a lease."""
+    release = asyncio.Event()
+    tracker, checked = _tracker({
+        "op-a": [{"status": "completed", "video_uri": "https://video/a"}],
+        "op-b": [{"status": "processing"}],
+    })
+
+    async def slow_finalize(record, poll_result):
+        await release.wait()
+        return {"video_url": poll_result["video_uri"]}
+
+    tracker.finalizer = slow_finalize
+    a = await tracker.register("op-a", "gemini")
+    await tracker.register("op-b", "gemini")
+    await _make_due(fake_redis)
+
+    await asyncio.wait_for(tracker.poll_once(), timeout=1)
+    assert sorted(checked) == ["op-a", "op-b"]
+    record = await tracker.get(a["id"])
+    assert record["status"] == "finalizing"
+    assert await fake_redis.zscore(DUE_KEY, a["id"]) > time.time() + FINALIZE_LEASE - 5
+
+    release.set()
+    record = await tracker.wait(a["id"], timeout=1)
+    assert record["status"] == "completed"
+    assert record["result"] == {"video_url": "https://video/a"}
+    assert "poll_result" not in record
+
+
+async def test_expired_lease_is_finalized_again(fake_redis):
+    """An operation whose finalizer died is finalized by the next poller."""
+    dead, _ = _tracker({"op-a": [{"status": "completed", "video_uri": "https://video/a"}]})
+    never = asyncio.Event()
+
+    async def hang(record, poll_result):
+        await never.wait()
+
+    dead.finalizer = hang
+    operation = await dead.register("op-a", "gemini")
+    await _make_due(fake_redis)
+    await dead.poll_once()
+    await dead.stop()
+    assert (await dead.get(operation["id"]))["status"] == "finalizing"
+
+    # Another replica takes over once the lease has expired
+    survivor, checked = _tracker({})
+    await _make_due(fake_redis)
+    await survivor.poll_once()
+    record = await survivor.wait(operation["id"], timeout=1)
+    assert record["status"] == "completed"
+    assert record["result"] == {"video_url": "https://video/a"}
+    assert record["finalize_attempts"] == 2
+    assert checked == []
+
+
+async def test_only_one_replica_holds_the_poller_lock(fake_redis):
+    """A second tracker cannot poll while the first renews its lock."""
+    first, _ = _tracker({})
+    second, _ = _tracker({})
+
+    assert await first.acquire_poller_lock()
+    assert not await second.acquire_poller_lock()
+    assert await first.acquire_poller_lock()
+
+
+async def test_tick_stops_when_the_lock_is_lost(fake_redis):
+    """The lock is renewed per batch; a tick stops once another replica owns it."""
+    count = CHECK_CONCURRENCY + 5
+    tracker, checked = _tracker({
+        f"op-{i}": [{"status": "processing"}] for i in range(count)
+    })
+    for i in range(count):
+        await tracker.register(f"op-{i}", "gemini")
+    await _make_due(fake_redis)
+
+    checker = tracker.checkers["gemini"]
+
+    async def check_then_lose_lock(record):
+        # The lock expired during the batch and another replica took it
+        await fake_redis.set(POLLER_LOCK_KEY, "other-replica")
+        return await checker(record)
+
+    tracker.checkers["gemini"] = check_then_lose_lock
+    assert await tracker.poll_once() == CHECK_CONCURRENCY
+    assert len(checked) == CHECK_CONCURRENCY
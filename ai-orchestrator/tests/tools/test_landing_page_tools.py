@@ -0,0 +1,41 @@
+"""Tests for landing page tools."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.tools.landing_page_tools import GeneratePageContentTool
+
+
+async def test_versions_are_generated_concurrently_and_streamed():
+    """Each style is generated in parallel and reported as soon as it is ready."""
+    latencies = {"modern": 0.3, "bold": 0.1, "minimal": 0.2}
+
+    async def chat_completion(messages, temperature, model_preferences):
+        style = messages[0]["content"].removeprefix("style: ")
+        await asyncio.sleep(latencies[style])
+        return f"<!DOCTYPE html><html><body>{style}</body></html>"
+
+    llm_client = MagicMock()
+    llm_client.chat_completion = AsyncMock(side_effect=chat_completion)
+    tool = GeneratePageContentTool(llm_client=llm_client)
+    tool._build_html_prompt = lambda info, images, style, *args: f"style: {style}"
+    streamed = []
+
+    async def on_progress(event):
+        streamed.append(event["version_id"])
+
+    settings = MagicMock(enable_html_continuation=False)
+    with patch("app.core.config.get_settings", return_value=settings):
+        started = time.monotonic()
+        result = await tool.execute(
+            parameters={"product_info": {"name": "Lamp"}, "styles": list(latencies)},
+            context={"on_progress": on_progress},
+        )
+        elapsed = time.monotonic() - started
+
+    assert elapsed < 0.5
+    assert [v["version_id"] for v in result["versions"]] == ["A", "B", "C"]
+    assert [v["style"] for v in result["versions"]] == ["modern", "bold", "minimal"]
+    assert streamed == ["B", "C", "A"]
+    assert result["successful_count"] == 3
@@ -0,0 +1,45 @@
+"""Add unique (user, entity, timestamp) key to report_metrics for bulk upserts.
+
+Revision ID: 006_report_metrics_unique_entity
+Revises: b657aff96690
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006_report_metrics_unique_entity'
+down_revision: Union[str, None] = 'b657aff96690'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Drop duplicate rows (keep the newest) so the unique key can be created
+    op.execute(
+        """
+        DELETE older FROM report_metrics AS older
+        JOIN report_metrics AS newer
+          ON older.user_id = newer.user_id
+         AND older.entity_type = newer.entity_type
+         AND older.entity_id = newer.entity_id
+         AND older.timestamp = newer.timestamp
+         AND older.id < newer.id
+        """
+    )
+    op.create_unique_constraint(
+        'uq_report_metrics_user_entity_timestamp',
+        'report_metrics',
+        ['user_id', 'entity_type', 'entity_id', 'timestamp'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        'uq_report_metrics_user_entity_timestamp',
+        'report_metrics',
+        type_='unique',
+    )
@@ -0,0 +1,84 @@
+"""Add report_metrics_rollups table and backfill it from report_metrics.
+
+Revision ID: 007_add_report_metrics_rollups
+Revises: 006_report_metrics_unique_entity
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007_add_report_metrics_rollups'
+down_revision: Union[str, None] = '006_report_metrics_unique_entity'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Bucket start expression per granularity
+BUCKET_EXPRESSIONS = {
+    'hour': "DATE_FORMAT(timestamp, '%Y-%m-%d %H:00:00')",
+    'day': "DATE(timestamp)",
+    'month': "DATE_FORMAT(timestamp, '%Y-%m-01')",
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        'report_metrics_rollups',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('granularity', sa.String(length=10), nullable=False),
+        sa.Column('bucket_start', sa.DateTime(), nullable=False),
+        sa.Column('user_id', sa.BigInteger(), nullable=False),
+        sa.Column('ad_account_id', sa.BigInteger(), nullable=False),
+        sa.Column('entity_type', sa.String(length=50), nullable=False),
+        sa.Column('entity_id', sa.String(length=255), nullable=False),
+        sa.Column('impressions', sa.BigInteger(), nullable=True),
+        sa.Column('clicks', sa.BigInteger(), nullable=True),
+        sa.Column('spend', sa.Numeric(precision=14, scale=2), nullable=True),
+        sa.Column('conversions', sa.BigInteger(), nullable=True),
+        sa.Column('revenue', sa.Numeric(precision=14, scale=2), nullable=True),
+        sa.Column('row_count', sa.Integer(), nullable=True),
+        sa.Column('ctr_sum', sa.Float(), nullable=True),
+        sa.Column('cpc_sum', sa.Numeric(precision=14, scale=2), nullable=True),
+        sa.Column('cpa_sum', sa.Numeric(precision=14, scale=2), nullable=True),
+        sa.Column('roas_sum', sa.Float(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'user_id',
+            'granularity',
+            'bucket_start',
+            'ad_account_id',
+            'entity_type',
+            'entity_id',
+            name='uq_report_metrics_rollups_bucket',
+        ),
+    )
+
+    # Backfill rollups from existing raw rows
+    for granularity, bucket in BUCKET_EXPRESSIONS.items():
+        op.execute(
+            f"""
+            INSERT INTO report_metrics_rollups (
+                granularity, bucket_start, user_id, ad_account_id,
+                entity_type, entity_id, impressions, clicks, spend,
+                conversions, revenue, row_count, ctr_sum, cpc_sum,
+                cpa_sum, roas_sum, updated_at
+            )
+            SELECT
+                '{granularity}', {bucket}, user_id, ad_account_id,
+                entity_type, entity_id, SUM(impressions), SUM(clicks),
+                SUM(spend), SUM(conversions), SUM(revenue), COUNT(*),
+                SUM(ctr), SUM(cpc), SUM(cpa), SUM(roas), UTC_TIMESTAMP()
+            FROM report_metrics
+            GROUP BY {bucket}, user_id, ad_account_id, entity_type, entity_id
+            """
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('report_metrics_rollups')
@@ -0,0 +1,43 @@
+"""Make client_message_id unique per conversation for append-only writes.
+
+Revision ID: 008_message_client_id_unique
+Revises: 007_add_report_metrics_rollups
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008_message_client_id_unique'
+down_revision: Union[str, None] = '007_add_report_metrics_rollups'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Drop duplicate messages (keep the first) so the unique key can be created
+    op.execute(
+        """
+        DELETE newer FROM messages AS newer
+        JOIN messages AS older
+          ON older.conversation_id = newer.conversation_id
+         AND older.client_message_id = newer.client_message_id
+         AND older.id < newer.id
+        """
+    )
+    op.create_unique_constraint(
+        'uq_messages_conversation_client_id',
+        'messages',
+        ['conversation_id', 'client_message_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        'uq_messages_conversation_client_id',
+        'messages',
+        type_='unique',
+    )
@@ -0,0 +1,31 @@
+"""Index creatives by (user_id, file_url) for bucket sync lookups.
+
+Revision ID: 009_creatives_user_file_url
+Revises: 008_message_client_id_unique
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009_creatives_user_file_url'
+down_revision: Union[str, None] = '008_message_client_id_unique'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # file_url is VARCHAR(1024); index a prefix to stay under the key size limit
+    op.create_index(
+        'ix_creatives_user_file_url',
+        'creatives',
+        ['user_id', 'file_url'],
+        mysql_length={'file_url': 255},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_creatives_user_file_url', table_name='creatives')
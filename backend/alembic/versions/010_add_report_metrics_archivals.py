@@ -0,0 +1,42 @@
+"""Record report metrics archival runs.
+
+Revision ID: 010_report_metrics_archivals
+Revises: 009_creatives_user_file_url
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '010_report_metrics_archivals'
+down_revision: Union[str, None] = '009_creatives_user_file_url'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'report_metrics_archivals',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('archived_before', sa.DateTime(), nullable=False),
+        sa.Column('archived_count', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_report_metrics_archivals_archived_before',
+        'report_metrics_archivals',
+        ['archived_before'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_report_metrics_archivals_archived_before',
+        table_name='report_metrics_archivals',
+    )
+    op.drop_table('report_metrics_archivals')
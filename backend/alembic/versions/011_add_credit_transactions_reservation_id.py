@@ -0,0 +1,45 @@
+"""Add credit_transactions.reservation_id for idempotent ledger settlement.
+
+Revision ID: 011_credit_tx_reservation_id
+Revises: 010_report_metrics_archivals
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011_credit_tx_reservation_id'
+down_revision: Union[str, None] = '010_report_metrics_archivals'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'credit_transactions',
+        sa.Column('reservation_id', sa.String(length=32), nullable=True),
+    )
+    # Settlements written before this column existed carry the ID in details
+    op.execute(
+        "UPDATE credit_transactions "
+        "SET reservation_id = JSON_UNQUOTE(JSON_EXTRACT(details, '$.reservation_id')) "
+        "WHERE JSON_EXTRACT(details, '$.reservation_id') IS NOT NULL"
+    )
+    op.create_unique_constraint(
+        'uq_credit_transactions_reservation',
+        'credit_transactions',
+        ['reservation_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        'uq_credit_transactions_reservation',
+        'credit_transactions',
+        type_='unique',
+    )
+    op.drop_column('credit_transactions', 'reservation_id')
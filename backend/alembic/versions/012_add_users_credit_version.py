@@ -0,0 +1,29 @@
+"""Add users.credit_version to order cached balance adjustments.
+
+Revision ID: 012_users_credit_version
+Revises: 011_credit_tx_reservation_id
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '012_users_credit_version'
+down_revision: Union[str, None] = '011_credit_tx_reservation_id'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'users',
+        sa.Column('credit_version', sa.BigInteger(), nullable=False, server_default='0'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'credit_version')
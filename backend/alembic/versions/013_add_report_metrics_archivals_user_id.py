@@ -0,0 +1,39 @@
+"""Scope report metrics archival runs to a user.
+
+Revision ID: 013_archivals_user_id
+Revises: 012_users_credit_version
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '013_archivals_user_id'
+down_revision: Union[str, None] = '012_users_credit_version'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing runs keep a NULL user_id and still apply to every user
+    op.add_column(
+        'report_metrics_archivals',
+        sa.Column('user_id', sa.BigInteger(), nullable=True),
+    )
+    op.create_index(
+        'ix_report_metrics_archivals_user_before',
+        'report_metrics_archivals',
+        ['user_id', 'archived_before'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_report_metrics_archivals_user_before',
+        table_name='report_metrics_archivals',
+    )
+    op.drop_column('report_metrics_archivals', 'user_id')
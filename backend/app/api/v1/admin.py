@@ -14,6 +14,7 @@ from app.schemas.user import (
     AdminUserListResponse,
     UserApprovalRequest,
 )
+from app.services.principal_cache import invalidate_principal_on_commit
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
@@ -112,6 +113,7 @@ async def update_user_approval(
 
     # Update approval status
     user.is_approved = request.approved
+    invalidate_principal_on_commit(db, user.id)
 
     await db.flush()
     await db.commit()
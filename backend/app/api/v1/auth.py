@@ -13,6 +13,7 @@ from app.schemas.auth import (
     UserResponse,
 )
 from app.services.auth import AuthService
+from app.services.principal_cache import invalidate_principal_on_commit
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -158,6 +159,7 @@ async def dev_login(db: DbSession) -> AuthResponse:
     # Dev users are always approved
     if not user.is_approved:
         user.is_approved = True
+        invalidate_principal_on_commit(db, user.id)
         await db.flush()
         await db.commit()
 
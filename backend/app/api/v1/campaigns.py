@@ -3,6 +3,7 @@
 from fastapi import APIRouter, HTTPException, Query, status
 
 from app.api.deps import CurrentUser, DbSession
+from app.core.pagination import InvalidCursorError
 from app.schemas.campaign import (
     AdPlatform,
     CampaignCreate,
@@ -31,6 +32,8 @@ async def list_campaigns(
     platform: AdPlatform | None = Query(None, description="Filter by platform"),
     status: CampaignStatus | None = Query(None, description="Filter by status"),
     ad_account_id: int | None = Query(None, description="Filter by ad account"),
+    cursor: str | None = Query(None, description="Cursor from next_cursor of a previous page"),
+    include_total: bool = Query(False, description="Return a cached total in cursor mode"),
 ) -> CampaignListResponse:
     """List user's campaigns with optional filters and pagination.
 
@@ -45,12 +48,20 @@ async def list_campaigns(
         ad_account_id=ad_account_id,
     )
 
-    result = await service.get_list(
-        user_id=current_user.id,
-        filters=filters,
-        page=page,
-        page_size=page_size,
-    )
+    try:
+        result = await service.get_list(
+            user_id=current_user.id,
+            filters=filters,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
 
     return CampaignListResponse(
         items=[CampaignResponse.model_validate(c) for c in result["campaigns"]],
@@ -58,6 +69,7 @@ async def list_campaigns(
         page=result["page"],
         page_size=result["page_size"],
         has_more=result["has_more"],
+        next_cursor=result["next_cursor"],
     )
 
 
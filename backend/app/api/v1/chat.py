@@ -13,6 +13,7 @@ from pydantic import BaseModel, Field
 
 from app.api.deps import CurrentUser
 from app.core.config import settings
+from app.core.orchestrator_client import orchestrator_client
 from app.services.file_processor import process_temp_attachments, process_attachments
 
 logger = logging.getLogger(__name__)
@@ -150,48 +151,43 @@ async def chat_stream(
     async def generate_stream():
         """Generate streaming response."""
         try:
-            async with httpx.AsyncClient(timeout=settings.ai_orchestrator_timeout) as client:
-                # Prepare request payload
-                # Generate session_id from user_id for conversation continuity
-                session_id = f"session-{current_user.id}-{uuid.uuid4().hex[:8]}"
-
-                payload = {
-                    "messages": processed_messages,
-                    "user_id": str(current_user.id),
-                    "session_id": session_id,
-                }
+            # Prepare request payload
+            # Generate session_id from user_id for conversation continuity
+            session_id = f"session-{current_user.id}-{uuid.uuid4().hex[:8]}"
+
+            payload = {
+                "messages": processed_messages,
+                "user_id": str(current_user.id),
+                "session_id": session_id,
+            }
 
-                # Stream response from AI Orchestrator
-                async with client.stream(
-                    "POST",
-                    f"{settings.ai_orchestrator_url}/api/v1/chat",
-                    json=payload,
-                    headers={
-                        "Content-Type": "application/json",
-                        "Authorization": f"Bearer {settings.ai_orchestrator_service_token}",
-                    },
-                ) as response:
-                    if response.status_code != 200:
-                        error_text = await response.aread()
-                        logger.error(
-                            f"AI Orchestrator error: {response.status_code} - {error_text}"
-                        )
-                        # Send error in Vercel AI SDK format
-                        error_data = {
-                            "error": {
-                                "code": "AI_ORCHESTRATOR_ERROR",
-                                "message": "Failed to get response from AI",
-                            }
+            # Stream response from AI Orchestrator over the shared pool
+            async with orchestrator_client.stream(
+                "POST",
+                "/api/v1/chat",
+                json=payload,
+            ) as response:
+                if response.status_code != 200:
+                    error_text = await response.aread()
+                    logger.error(
+                        f"AI Orchestrator error: {response.status_code} - {error_text}"
+                    )
+                    # Send error in Vercel AI SDK format
+                    error_data = {
+                        "error": {
+                            "code": "AI_ORCHESTRATOR_ERROR",
+                            "message": "Failed to get response from AI",
                         }
-                        yield f"data: {json.dumps(error_data)}\n\n"
-                        return
-
-                    # Stream chunks back to client
-                    async for chunk in response.aiter_text():
-                        if chunk:
-                            # Forward chunk as-is (assuming AI Orchestrator returns
-                            # Vercel AI SDK compatible format)
-                            yield chunk
+                    }
+                    yield f"data: {json.dumps(error_data)}\n\n"
+                    return
+
+                # Stream chunks back to client
+                async for chunk in response.aiter_text():
+                    if chunk:
+                        # Forward chunk as-is (assuming AI Orchestrator returns
+                        # Vercel AI SDK compatible format)
+                        yield chunk
 
         except httpx.TimeoutException:
             logger.error(f"AI Orchestrator timeout for user {current_user.id}")
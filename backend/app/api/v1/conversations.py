@@ -1,19 +1,33 @@
 """REST API endpoints for conversation management."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import CurrentUser, DbSession
+from app.core.pagination import (
+    InvalidCursorError,
+    apply_keyset,
+    build_next_cursor,
+    encode_cursor,
+)
 from app.models.conversation import Conversation
 from app.models.message import Message
 
 router = APIRouter(prefix="/conversations", tags=["conversations"])
 
+# Messages per page when get_conversation is called with cursor or limit
+MESSAGE_PAGE_SIZE = 100
+MAX_MESSAGE_PAGE_SIZE = 500
+
+# Messages accepted by one append request
+MAX_APPEND_MESSAGES = 200
+
 
 def _clean_json_field(value: Any) -> Any:
     """Clean JSON field value - convert string 'null' to None."""
@@ -36,6 +50,14 @@ class MessageCreate(BaseModel):
     attachments: list[dict] | None = Field(None, description="Uploaded file attachments with S3 URLs")
     created_at: datetime | None = Field(None, description="Message timestamp")
 
+    @field_validator("created_at")
+    @classmethod
+    def to_naive_utc(cls, value: datetime | None) -> datetime | None:
+        """Store client timestamps as naive UTC like server timestamps."""
+        if value is not None and value.tzinfo is not None:
+            return value.astimezone(UTC).replace(tzinfo=None)
+        return value
+
 
 class ConversationCreate(BaseModel):
     """Conversation creation model."""
@@ -50,6 +72,14 @@ class ConversationUpdate(BaseModel):
     messages: list[MessageCreate] | None = Field(None, description="Messages to add")
 
 
+class MessageAppend(BaseModel):
+    """Message append model."""
+    messages: list[MessageCreate] = Field(
+        ..., max_length=MAX_APPEND_MESSAGES, description="Messages to append"
+    )
+    title: str | None = Field(None, description="New title")
+
+
 class MessageResponse(BaseModel):
     """Message response model."""
     id: str
@@ -72,6 +102,18 @@ class ConversationResponse(BaseModel):
     messages: list[MessageResponse]
     created_at: datetime
     updated_at: datetime | None
+    # Cursor after the last returned message; pass it back to fetch newer ones
+    next_cursor: str | None = None
+    has_more: bool = False
+
+
+class MessageAppendResponse(BaseModel):
+    """Message append response model."""
+    session_id: str
+    appended: list[MessageResponse]
+    skipped: int
+    cursor: str | None
+    updated_at: datetime | None
 
 
 class ConversationListItem(BaseModel):
@@ -87,10 +129,123 @@ class ConversationListItem(BaseModel):
 class ConversationListResponse(BaseModel):
     """Conversation list response model."""
     conversations: list[ConversationListItem]
-    total: int
+    total: int | None  # None in cursor mode unless include_total is set
     page: int
     page_size: int
     has_more: bool
+    next_cursor: str | None = None
+
+
+def _message_cursor(message_id: int) -> str:
+    """Build a cursor positioned after a message.
+
+    Message cursors follow the auto-increment ID rather than the
+    client-supplied created_at, so a message stored later always sorts
+    after the cursor even if its timestamp is older.
+    """
+    return encode_cursor(message_id, message_id)
+
+
+def _message_response(msg: Message) -> MessageResponse:
+    """Serialize a stored message."""
+    return MessageResponse(
+        id=msg.client_message_id or str(msg.id),
+        role=msg.role,
+        content=msg.content,
+        tool_calls=msg.tool_calls,
+        tool_call_id=msg.tool_call_id,
+        metadata=msg.message_metadata,
+        process_info=msg.process_info,
+        generated_assets=msg.generated_assets,
+        attachments=msg.attachments,
+        created_at=msg.created_at,
+    )
+
+
+def _build_message(conversation_id: int, msg_data: MessageCreate, now: datetime) -> Message:
+    """Create a message row from a client message."""
+    return Message(
+        conversation_id=conversation_id,
+        client_message_id=msg_data.id,
+        role=msg_data.role,
+        content=msg_data.content,
+        tool_calls=_clean_json_field(msg_data.tool_calls),
+        tool_call_id=msg_data.tool_call_id,
+        message_metadata=msg_data.metadata or {},
+        process_info=_clean_json_field(msg_data.process_info),
+        generated_assets=_clean_json_field(msg_data.generated_assets),
+        attachments=_clean_json_field(msg_data.attachments),
+        created_at=msg_data.created_at or now,
+    )
+
+
+async def _get_user_conversation(
+    db: AsyncSession, session_id: str, user_id: int
+) -> Conversation:
+    """Load a conversation owned by the user or raise 404."""
+    result = await db.execute(
+        select(Conversation).where(
+            Conversation.session_id == session_id,
+            Conversation.user_id == user_id,
+        )
+    )
+    conversation = result.scalar_one_or_none()
+
+    if not conversation:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Conversation not found",
+        )
+    return conversation
+
+
+async def _append_messages(
+    db: AsyncSession,
+    conversation: Conversation,
+    messages: list[MessageCreate],
+    now: datetime,
+) -> list[Message]:
+    """Add messages whose client IDs are not stored yet.
+
+    Already stored IDs are found with one IN (...) query for the whole
+    batch; the unique (conversation_id, client_message_id) key catches
+    concurrent writers. The new rows are flushed so they have IDs.
+
+    Returns:
+        The added messages, in request order
+    """
+    batch: dict[str, MessageCreate] = {}
+    for msg_data in messages:
+        batch.setdefault(msg_data.id, msg_data)
+    if not batch:
+        return []
+
+    existing_result = await db.execute(
+        select(Message.client_message_id).where(
+            Message.conversation_id == conversation.id,
+            Message.client_message_id.in_(list(batch)),
+        )
+    )
+    existing = set(existing_result.scalars().all())
+
+    added = [
+        _build_message(conversation.id, msg_data, now)
+        for client_id, msg_data in batch.items()
+        if client_id not in existing
+    ]
+    if added:
+        db.add_all(added)
+        await db.flush()
+    return added
+
+
+async def _last_message_cursor(db: AsyncSession, conversation_id: int) -> str | None:
+    """Build a cursor positioned after the conversation's newest message."""
+    result = await db.execute(
+        select(func.max(Message.id)).where(Message.conversation_id == conversation_id)
+    )
+    last_id = result.scalar()
+    return _message_cursor(last_id) if last_id is not None else None
 
 
 @router.get("", response_model=ConversationListResponse)
@@ -99,19 +254,33 @@ async def list_conversations(
     db: DbSession,
     page: int = 1,
     page_size: int = 20,
+    cursor: str | None = None,
+    include_total: bool = False,
 ) -> ConversationListResponse:
-    """List user's conversations with pagination."""
+    """List user's conversations with pagination.
+
+    Pass next_cursor from a previous response as cursor to page with
+    keyset pagination; the total is then only counted if include_total
+    is set.
+    """
     page_size = min(page_size, 50)
     offset = (page - 1) * page_size
 
+    # MySQL doesn't support NULLS FIRST, use COALESCE instead
+    last_activity = func.coalesce(Conversation.updated_at, Conversation.created_at)
+
     # Count total
-    count_result = await db.execute(
-        select(func.count(Conversation.id)).where(Conversation.user_id == current_user.id)
-    )
-    total = count_result.scalar() or 0
+    total = None
+    if cursor is None or include_total:
+        count_result = await db.execute(
+            select(func.count(Conversation.id)).where(
+                Conversation.user_id == current_user.id
+            )
+        )
+        total = count_result.scalar() or 0
 
     # Get conversations with message count
-    result = await db.execute(
+    query = (
         select(
             Conversation,
             func.count(Message.id).label("message_count")
@@ -119,14 +288,26 @@ async def list_conversations(
         .outerjoin(Message, Message.conversation_id == Conversation.id)
         .where(Conversation.user_id == current_user.id)
         .group_by(Conversation.id)
-        .order_by(
-            # MySQL doesn't support NULLS FIRST, use COALESCE instead
-            func.coalesce(Conversation.updated_at, Conversation.created_at).desc()
-        )
-        .offset(offset)
-        .limit(page_size)
     )
-    rows = result.all()
+    if cursor is not None:
+        try:
+            query = apply_keyset(query, last_activity, Conversation.id, cursor, page_size)
+        except InvalidCursorError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor",
+            )
+        rows = (await db.execute(query)).all()
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+    else:
+        query = (
+            query.order_by(last_activity.desc(), Conversation.id.desc())
+            .offset(offset)
+            .limit(page_size)
+        )
+        rows = (await db.execute(query)).all()
+        has_more = offset + len(rows) < total
 
     conversations = [
         ConversationListItem(
@@ -140,12 +321,18 @@ async def list_conversations(
         for conv, msg_count in rows
     ]
 
+    next_cursor = None
+    if has_more and conversations:
+        last = conversations[-1]
+        next_cursor = encode_cursor(last.updated_at or last.created_at, last.id)
+
     return ConversationListResponse(
         conversations=conversations,
         total=total,
         page=page,
         page_size=page_size,
-        has_more=offset + len(conversations) < total,
+        has_more=has_more,
+        next_cursor=next_cursor,
     )
 
 
@@ -180,24 +367,10 @@ async def create_conversation(
     db.add(conversation)
     await db.flush()
 
-    # Add initial messages
-    messages = []
-    for msg_data in request.messages:
-        message = Message(
-            conversation_id=conversation.id,
-            client_message_id=msg_data.id,
-            role=msg_data.role,
-            content=msg_data.content,
-            tool_calls=_clean_json_field(msg_data.tool_calls),
-            tool_call_id=msg_data.tool_call_id,
-            message_metadata=msg_data.metadata or {},
-            process_info=_clean_json_field(msg_data.process_info),
-            generated_assets=_clean_json_field(msg_data.generated_assets),
-            attachments=_clean_json_field(msg_data.attachments),
-            created_at=msg_data.created_at or now,
-        )
-        db.add(message)
-        messages.append(message)
+    # Add initial messages (duplicate client IDs are kept once)
+    messages = await _append_messages(db, conversation, request.messages, now)
+    messages.sort(key=lambda msg: (msg.created_at, msg.id))
+    next_cursor = _message_cursor(max(msg.id for msg in messages)) if messages else None
 
     await db.commit()
     await db.refresh(conversation)
@@ -206,23 +379,10 @@ async def create_conversation(
         id=conversation.id,
         session_id=conversation.session_id,
         title=conversation.title,
-        messages=[
-            MessageResponse(
-                id=msg.client_message_id or str(msg.id),
-                role=msg.role,
-                content=msg.content,
-                tool_calls=msg.tool_calls,
-                tool_call_id=msg.tool_call_id,
-                metadata=msg.message_metadata,
-                process_info=msg.process_info,
-                generated_assets=msg.generated_assets,
-                attachments=msg.attachments,
-                created_at=msg.created_at,
-            )
-            for msg in messages
-        ],
+        messages=[_message_response(msg) for msg in messages],
         created_at=conversation.created_at,
         updated_at=conversation.updated_at,
+        next_cursor=next_cursor,
     )
 
 
@@ -231,51 +391,103 @@ async def get_conversation(
     session_id: str,
     current_user: CurrentUser,
     db: DbSession,
+    cursor: str | None = None,
+    limit: int | None = None,
 ) -> ConversationResponse:
-    """Get a conversation by session_id."""
-    result = await db.execute(
-        select(Conversation).where(
-            Conversation.session_id == session_id,
-            Conversation.user_id == current_user.id,
+    """Get a conversation by session_id.
+
+    Without cursor or limit all messages are returned. Otherwise up to
+    limit messages stored after cursor are returned in storage order;
+    pass next_cursor back to continue, or to poll for newer messages
+    later.
+    """
+    conversation = await _get_user_conversation(db, session_id, current_user.id)
+
+    query = select(Message).where(Message.conversation_id == conversation.id)
+    has_more = False
+    if cursor is None and limit is None:
+        msg_result = await db.execute(
+            query.order_by(Message.created_at.asc(), Message.id.asc())
         )
-    )
-    conversation = result.scalar_one_or_none()
-
-    if not conversation:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Conversation not found",
+        messages = list(msg_result.scalars().all())
+    else:
+        page_size = min(max(limit or MESSAGE_PAGE_SIZE, 1), MAX_MESSAGE_PAGE_SIZE)
+        try:
+            query = apply_keyset(
+                query, Message.id, Message.id, cursor, page_size, descending=False
+            )
+        except InvalidCursorError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor",
+            )
+        msg_result = await db.execute(query)
+        messages, page_cursor = build_next_cursor(
+            list(msg_result.scalars().all()), page_size, "id"
         )
+        has_more = page_cursor is not None
 
-    # Get messages
-    msg_result = await db.execute(
-        select(Message)
-        .where(Message.conversation_id == conversation.id)
-        .order_by(Message.created_at.asc())
-    )
-    messages = msg_result.scalars().all()
+    if messages:
+        next_cursor = _message_cursor(max(msg.id for msg in messages))
+    else:
+        next_cursor = cursor
 
     return ConversationResponse(
         id=conversation.id,
         session_id=conversation.session_id,
         title=conversation.title,
-        messages=[
-            MessageResponse(
-                id=msg.client_message_id or str(msg.id),
-                role=msg.role,
-                content=msg.content,
-                tool_calls=msg.tool_calls,
-                tool_call_id=msg.tool_call_id,
-                metadata=msg.message_metadata,
-                process_info=msg.process_info,
-                generated_assets=msg.generated_assets,
-                attachments=msg.attachments,
-                created_at=msg.created_at,
-            )
-            for msg in messages
-        ],
+        messages=[_message_response(msg) for msg in messages],
         created_at=conversation.created_at,
         updated_at=conversation.updated_at,
+        next_cursor=next_cursor,
+        has_more=has_more,
+    )
+
+
+@router.post("/{session_id}/messages", response_model=MessageAppendResponse)
+async def append_messages(
+    session_id: str,
+    request: MessageAppend,
+    current_user: CurrentUser,
+    db: DbSession,
+) -> MessageAppendResponse:
+    """Append messages to a conversation.
+
+    Messages whose client IDs are already stored are skipped, so retried
+    saves are safe. Only the newly stored messages are returned, with a
+    cursor positioned after the conversation's newest message for use
+    with get_conversation.
+    """
+    # A concurrent append of the same client IDs fails the unique key;
+    # the retry then skips them as duplicates
+    for attempt in range(2):
+        conversation = await _get_user_conversation(db, session_id, current_user.id)
+        now = datetime.utcnow()
+        try:
+            appended = await _append_messages(db, conversation, request.messages, now)
+            if request.title is not None:
+                conversation.title = request.title
+            if appended:
+                conversation.last_message_at = now
+            conversation.updated_at = now
+            cursor = await _last_message_cursor(db, conversation.id)
+            await db.commit()
+            break
+        except IntegrityError:
+            await db.rollback()
+            if attempt:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Conversation is being updated concurrently, retry",
+                )
+
+    appended.sort(key=lambda msg: (msg.created_at, msg.id))
+    return MessageAppendResponse(
+        session_id=session_id,
+        appended=[_message_response(msg) for msg in appended],
+        skipped=len(request.messages) - len(appended),
+        cursor=cursor,
+        updated_at=now,
     )
 
 
@@ -286,20 +498,12 @@ async def update_conversation(
     current_user: CurrentUser,
     db: DbSession,
 ) -> ConversationResponse:
-    """Update a conversation (title or add messages)."""
-    result = await db.execute(
-        select(Conversation).where(
-            Conversation.session_id == session_id,
-            Conversation.user_id == current_user.id,
-        )
-    )
-    conversation = result.scalar_one_or_none()
+    """Update a conversation (title or add messages).
 
-    if not conversation:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Conversation not found",
-        )
+    Returns the whole conversation; use POST /{session_id}/messages to
+    append messages without reloading the history.
+    """
+    conversation = await _get_user_conversation(db, session_id, current_user.id)
 
     now = datetime.utcnow()
 
@@ -307,34 +511,9 @@ async def update_conversation(
     if request.title is not None:
         conversation.title = request.title
 
-    # Add new messages if provided
+    # Add new messages if provided, skipping already stored client IDs
     if request.messages:
-        for msg_data in request.messages:
-            # Check if message already exists (by client_message_id)
-            existing_msg = await db.execute(
-                select(Message).where(
-                    Message.conversation_id == conversation.id,
-                    Message.client_message_id == msg_data.id,
-                )
-            )
-            if existing_msg.scalar_one_or_none():
-                continue  # Skip duplicate messages
-
-            message = Message(
-                conversation_id=conversation.id,
-                client_message_id=msg_data.id,
-                role=msg_data.role,
-                content=msg_data.content,
-                tool_calls=_clean_json_field(msg_data.tool_calls),
-                tool_call_id=msg_data.tool_call_id,
-                message_metadata=msg_data.metadata or {},
-                process_info=_clean_json_field(msg_data.process_info),
-                generated_assets=_clean_json_field(msg_data.generated_assets),
-                attachments=_clean_json_field(msg_data.attachments),
-                created_at=msg_data.created_at or now,
-            )
-            db.add(message)
-
+        await _append_messages(db, conversation, request.messages, now)
         conversation.last_message_at = now
 
     conversation.updated_at = now
@@ -345,7 +524,7 @@ async def update_conversation(
     msg_result = await db.execute(
         select(Message)
         .where(Message.conversation_id == conversation.id)
-        .order_by(Message.created_at.asc())
+        .order_by(Message.created_at.asc(), Message.id.asc())
     )
     messages = msg_result.scalars().all()
 
@@ -353,23 +532,10 @@ async def update_conversation(
         id=conversation.id,
         session_id=conversation.session_id,
         title=conversation.title,
-        messages=[
-            MessageResponse(
-                id=msg.client_message_id or str(msg.id),
-                role=msg.role,
-                content=msg.content,
-                tool_calls=msg.tool_calls,
-                tool_call_id=msg.tool_call_id,
-                metadata=msg.message_metadata,
-                process_info=msg.process_info,
-                generated_assets=msg.generated_assets,
-                attachments=msg.attachments,
-                created_at=msg.created_at,
-            )
-            for msg in messages
-        ],
+        messages=[_message_response(msg) for msg in messages],
         created_at=conversation.created_at,
         updated_at=conversation.updated_at,
+        next_cursor=_message_cursor(max(msg.id for msg in messages)) if messages else None,
     )
 
 
@@ -380,19 +546,7 @@ async def delete_conversation(
     db: DbSession,
 ) -> None:
     """Delete a conversation and all its messages."""
-    result = await db.execute(
-        select(Conversation).where(
-            Conversation.session_id == session_id,
-            Conversation.user_id == current_user.id,
-        )
-    )
-    conversation = result.scalar_one_or_none()
-
-    if not conversation:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Conversation not found",
-        )
+    conversation = await _get_user_conversation(db, session_id, current_user.id)
 
     await db.delete(conversation)
     await db.commit()
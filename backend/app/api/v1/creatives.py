@@ -5,6 +5,7 @@ import logging
 from fastapi import APIRouter, HTTPException, Query, status
 
 from app.api.deps import CurrentUser, DbSession
+from app.core.pagination import InvalidCursorError
 from app.schemas.creative import (
     BucketFileInfo,
     BucketListResponse,
@@ -46,6 +47,8 @@ async def list_creatives(
     style: str | None = Query(None, description="Filter by style"),
     status: CreativeStatus = Query(CreativeStatus.ACTIVE, description="Filter by status"),
     tags: list[str] | None = Query(None, description="Filter by tags"),
+    cursor: str | None = Query(None, description="Cursor from next_cursor of a previous page"),
+    include_total: bool = Query(False, description="Return a cached total in cursor mode"),
 ) -> CreativeListResponse:
     """List user's creatives with optional filters and pagination."""
     service = CreativeService(db)
@@ -57,12 +60,20 @@ async def list_creatives(
         tags=tags,
     )
 
-    result = await service.get_list(
-        user_id=current_user.id,
-        filters=filters,
-        page=page,
-        page_size=page_size,
-    )
+    try:
+        result = await service.get_list(
+            user_id=current_user.id,
+            filters=filters,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
 
     return CreativeListResponse(
         items=[_add_signed_url(c, service) for c in result["creatives"]],
@@ -70,6 +81,7 @@ async def list_creatives(
         page=result["page"],
         page_size=result["page_size"],
         has_more=result["has_more"],
+        next_cursor=result["next_cursor"],
     )
 
 
@@ -244,13 +256,15 @@ async def list_bucket_files(
         file_types = ["image/", "video/", "audio/"]
 
     # List files from bucket
-    bucket_files = service.list_bucket_files(
+    bucket_files = await service.list_bucket_files(
         user_id=current_user.id,
         file_types=file_types,
     )
 
-    # Get already synced URLs
-    synced_urls = await service.get_synced_file_urls(current_user.id)
+    # Get already synced URLs among the listed files
+    synced_urls = await service.get_synced_file_urls(
+        current_user.id, [f["url"] for f in bucket_files]
+    )
 
     # Mark synced status
     files = []
@@ -291,29 +305,22 @@ async def sync_bucket_files(
     """
     service = CreativeService(db)
 
-    results = []
-    synced_count = 0
-    failed_count = 0
+    sync_results = await service.sync_files_from_bucket(
+        user_id=current_user.id,
+        file_keys=data.file_keys,
+    )
 
-    for file_key in data.file_keys:
-        result = await service.sync_file_from_bucket(
-            user_id=current_user.id,
+    results = [
+        BucketSyncResult(
             file_key=file_key,
+            success=result["success"],
+            creative_id=result.get("creative_id"),
+            error=result.get("error"),
         )
-
-        results.append(
-            BucketSyncResult(
-                file_key=file_key,
-                success=result["success"],
-                creative_id=result.get("creative_id"),
-                error=result.get("error"),
-            )
-        )
-
-        if result["success"]:
-            synced_count += 1
-        else:
-            failed_count += 1
+        for file_key, result in zip(data.file_keys, sync_results, strict=True)
+    ]
+    synced_count = sum(1 for result in results if result.success)
+    failed_count = len(results) - synced_count
 
     # Commit all successful syncs
     if synced_count > 0:
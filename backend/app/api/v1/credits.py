@@ -11,13 +11,23 @@ from app.schemas.credit import (
     CreditCheckRequest,
     CreditCheckResponse,
     CreditHistoryResponse,
+    CreditReleaseRequest,
+    CreditReleaseResponse,
+    CreditReserveRequest,
+    CreditReserveResponse,
+    CreditSettleRequest,
+    CreditSettleResponse,
     CreditTransactionResponse,
+    SystemCreditDeductBatchItem,
+    SystemCreditDeductBatchRequest,
+    SystemCreditDeductBatchResponse,
     SystemCreditDeductRequest,
     SystemCreditDeductResponse,
     SystemCreditRefundRequest,
     SystemCreditRefundResponse,
 )
 from app.services.credit import CreditService, InsufficientCreditsError
+from app.services.credit_ledger import CreditLedger, ReservationNotFoundError
 
 router = APIRouter(prefix="/credits", tags=["credits"])
 
@@ -219,9 +229,7 @@ async def check_credits(
     Authenticated by service token, not user JWT.
     """
     credit_service = CreditService(db)
-    balance = await credit_service.get_balance(int(request.user_id))
-
-    available = balance["total_credits"]
+    available = await credit_service.get_available_credits(int(request.user_id))
     sufficient = available >= request.amount
 
     return CreditCheckResponse(
@@ -320,3 +328,164 @@ async def refund_credits(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={"error": {"code": "INVALID_REQUEST", "message": str(e)}},
         )
+
+
+@router.post("/deduct/batch", response_model=SystemCreditDeductBatchResponse)
+async def deduct_credits_batch(
+    request: SystemCreditDeductBatchRequest,
+    _: ServiceTokenVerified,
+    db: DbSession,
+) -> SystemCreditDeductBatchResponse:
+    """Deduct many token-usage charges in one transaction (system-level).
+
+    Deductions the user cannot afford are reported as failed; the rest
+    are applied.
+    """
+    credit_service = CreditService(db)
+
+    try:
+        transactions = await credit_service.deduct_credits_batch(
+            [
+                {
+                    "user_id": int(item.user_id),
+                    "amount": item.amount,
+                    "operation_type": item.operation_type,
+                    "operation_id": item.operation_id,
+                    "details": item.details,
+                }
+                for item in request.deductions
+            ]
+        )
+        await db.commit()
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": {"code": "INVALID_REQUEST", "message": str(e)}},
+        )
+
+    results = [
+        SystemCreditDeductBatchItem(
+            success=True,
+            operation_id=item.operation_id,
+            transaction_id=transaction.id,
+            deducted=transaction.amount,
+            balance_after=transaction.balance_after,
+        )
+        if transaction is not None
+        else SystemCreditDeductBatchItem(
+            success=False,
+            operation_id=item.operation_id,
+            error="INSUFFICIENT_CREDITS",
+        )
+        for item, transaction in zip(request.deductions, transactions, strict=True)
+    ]
+    succeeded = sum(1 for r in results if r.success)
+
+    return SystemCreditDeductBatchResponse(
+        results=results,
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+    )
+
+
+@router.post("/reserve", response_model=CreditReserveResponse)
+async def reserve_credits(
+    request: CreditReserveRequest,
+    _: ServiceTokenVerified,
+    db: DbSession,
+) -> CreditReserveResponse:
+    """Hold credits before an operation starts (system-level).
+
+    Replaces check + deduct: the hold is settled with the final cost
+    when the operation completes or released when it fails.
+    """
+    ledger = CreditLedger(db)
+
+    try:
+        reservation = await ledger.reserve(
+            user_id=int(request.user_id),
+            amount=request.amount,
+            operation_type=request.operation_type,
+            operation_id=request.operation_id,
+            ttl=request.ttl_seconds,
+        )
+    except InsufficientCreditsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": {
+                    "code": "INSUFFICIENT_CREDITS",
+                    "message": "Credit 余额不足",
+                    "details": {
+                        "required": float(e.required),
+                        "available": float(e.available),
+                    },
+                }
+            },
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": {"code": "INVALID_REQUEST", "message": str(e)}},
+        )
+
+    return CreditReserveResponse(**reservation)
+
+
+@router.post("/settle", response_model=CreditSettleResponse)
+async def settle_credits(
+    request: CreditSettleRequest,
+    _: ServiceTokenVerified,
+    db: DbSession,
+) -> CreditSettleResponse:
+    """Deduct the final cost of a reserved operation (system-level)."""
+    ledger = CreditLedger(db)
+
+    try:
+        result = await ledger.settle(
+            user_id=int(request.user_id),
+            reservation_id=request.reservation_id,
+            amount=request.amount,
+            details=request.details,
+        )
+    except ReservationNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": {"code": "RESERVATION_NOT_FOUND", "message": str(e)}},
+        )
+    except InsufficientCreditsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": {
+                    "code": "INSUFFICIENT_CREDITS",
+                    "message": "Credit 余额不足",
+                    "details": {
+                        "required": float(e.required),
+                        "available": float(e.available),
+                    },
+                }
+            },
+        )
+
+    return CreditSettleResponse(success=True, **result)
+
+
+@router.post("/release", response_model=CreditReleaseResponse)
+async def release_credits(
+    request: CreditReleaseRequest,
+    _: ServiceTokenVerified,
+    db: DbSession,
+) -> CreditReleaseResponse:
+    """Release a reservation without charging (system-level)."""
+    ledger = CreditLedger(db)
+
+    try:
+        await ledger.release(int(request.user_id), request.reservation_id)
+    except ReservationNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": {"code": "RESERVATION_NOT_FOUND", "message": str(e)}},
+        )
+
+    return CreditReleaseResponse(success=True)
@@ -1,17 +1,16 @@
 """Landing page management API endpoints."""
 
-import asyncio
-import base64
 import logging
 import re
+from typing import Annotated
 from urllib.parse import urljoin, urlparse
 
-import httpx
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Header, HTTPException, Query, status
 from fastapi.responses import HTMLResponse, Response
 from pydantic import BaseModel
 
 from app.api.deps import CurrentUser, DbSession
+from app.models.landing_page import LandingPage
 from app.schemas.landing_page import (
     LandingPageCreate,
     LandingPageFilter,
@@ -22,6 +21,12 @@ from app.schemas.landing_page import (
     LandingPageUpdate,
 )
 from app.services.landing_page import LandingPageNotFoundError, LandingPageService
+from app.services.landing_page_preview import (
+    LandingPageContentError,
+    PreviewVersion,
+    render_preview,
+    resolve_preview_version,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -206,68 +211,46 @@ async def publish_landing_page(
         )
 
 
-async def _download_image_as_base64(
-    client: httpx.AsyncClient,
-    url: str,
-) -> tuple[str, str] | None:
-    """Download image and convert to base64 data URI.
-
-    Args:
-        client: HTTP client instance
-        url: Image URL to download
-
-    Returns:
-        Tuple of (original_url, data_uri) or None if download fails
-    """
-    try:
-        response = await client.get(url, follow_redirects=True)
-        response.raise_for_status()
-
-        content_type = response.headers.get("content-type", "image/jpeg")
-        # Clean content type (remove charset, etc.)
-        if ";" in content_type:
-            content_type = content_type.split(";")[0].strip()
-
-        # Ensure valid image content type
-        if not content_type.startswith("image/"):
-            content_type = "image/jpeg"
-
-        image_base64 = base64.b64encode(response.content).decode("utf-8")
-        data_uri = f"data:{content_type};base64,{image_base64}"
-
-        return (url, data_uri)
-    except Exception as e:
-        logger.warning(f"Failed to download image {url[:100]}: {e}")
-        return None
+async def _resolve_preview(
+    db: DbSession,
+    user_id: int,
+    landing_page_id: int,
+    embed_images: bool,
+) -> tuple[LandingPage, PreviewVersion]:
+    """Load an owned landing page and the version its preview would render."""
+    service = LandingPageService(db)
 
+    landing_page = await service.get_by_id(
+        landing_page_id=landing_page_id,
+        user_id=user_id,
+    )
 
-def _extract_image_urls(html: str) -> list[str]:
-    """Extract image URLs from HTML content.
+    if not landing_page:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Landing page {landing_page_id} not found",
+        )
 
-    Args:
-        html: HTML content
+    # Draft and published pages are both read from S3 using s3_key
+    if not landing_page.s3_key:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Landing page has no S3 content",
+        )
 
-    Returns:
-        List of unique image URLs
-    """
-    urls = set()
+    try:
+        version = await resolve_preview_version(landing_page, embed_images)
+    except LandingPageContentError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-    # Match src attributes in img tags
-    img_pattern = r'<img[^>]+src=["\']([^"\']+)["\']'
-    for match in re.finditer(img_pattern, html, re.IGNORECASE):
-        url = match.group(1)
-        # Skip data URIs and relative paths that don't start with http
-        if url.startswith("data:"):
-            continue
-        if url.startswith("http://") or url.startswith("https://"):
-            urls.add(url)
+    return landing_page, version
 
-    # Match url() in CSS (for background images)
-    css_url_pattern = r'url\(["\']?(https?://[^"\')\s]+)["\']?\)'
-    for match in re.finditer(css_url_pattern, html, re.IGNORECASE):
-        urls.add(match.group(1))
 
-    return list(urls)
+async def _render(landing_page: LandingPage, version: PreviewVersion) -> str:
+    try:
+        return await render_preview(landing_page, version)
+    except LandingPageContentError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/{landing_page_id}/preview", response_class=HTMLResponse)
@@ -276,7 +259,8 @@ async def preview_landing_page(
     current_user: CurrentUser,
     landing_page_id: int,
     embed_images: bool = Query(True, description="Download and embed images as base64"),
-) -> HTMLResponse:
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
     """Preview a landing page with embedded images.
 
     This endpoint provides secure preview access for draft pages by:
@@ -284,6 +268,9 @@ async def preview_landing_page(
     2. Fetching HTML from S3 (draft or published path)
     3. Optionally embedding images as base64 data URIs
 
+    Rendered previews are cached per S3 version of the page, and a
+    request whose If-None-Match names the current version gets 304.
+
     Args:
         landing_page_id: Landing page ID
         embed_images: Whether to embed images as base64 (default: True)
@@ -291,75 +278,15 @@ async def preview_landing_page(
     Returns:
         HTMLResponse with the landing page content
     """
-    from app.core.storage import landing_pages_storage
-
-    service = LandingPageService(db)
-
-    landing_page = await service.get_by_id(
-        landing_page_id=landing_page_id,
-        user_id=current_user.id,
+    landing_page, version = await _resolve_preview(
+        db, current_user.id, landing_page_id, embed_images
     )
+    headers = {"ETag": version.etag, "Cache-Control": "private, no-cache"}
+    if version.matches(if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-    if not landing_page:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Landing page {landing_page_id} not found",
-        )
-
-    # For draft pages, read from S3 using s3_key
-    # For published pages, also read from S3 (ensures consistency)
-    if not landing_page.s3_key:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Landing page has no S3 content",
-        )
-
-    # Download HTML content from S3
-    html_bytes = landing_pages_storage.download_file(landing_page.s3_key)
-    if not html_bytes:
-        # Fallback to database content if S3 fails
-        html_content = landing_page.draft_content if landing_page.status == LandingPageStatus.DRAFT.value else landing_page.html_content
-        if not html_content:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Landing page has no HTML content",
-            )
-    else:
-        html_content = html_bytes.decode("utf-8")
-
-    # If embed_images is False, return HTML as-is
-    if not embed_images:
-        return HTMLResponse(content=html_content)
-
-    # Extract image URLs from HTML
-    image_urls = _extract_image_urls(html_content)
-
-    if not image_urls:
-        return HTMLResponse(content=html_content)
-
-    logger.info(f"Preview: Found {len(image_urls)} images to embed for landing page {landing_page_id}")
-
-    # Download images concurrently and convert to base64
-    async with httpx.AsyncClient(
-        timeout=30.0,
-        headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        },
-    ) as client:
-        tasks = [_download_image_as_base64(client, url) for url in image_urls]
-        results = await asyncio.gather(*tasks)
-
-    # Replace image URLs with base64 data URIs
-    for result in results:
-        if result:
-            original_url, data_uri = result
-            # Escape special regex characters in URL
-            escaped_url = re.escape(original_url)
-            html_content = re.sub(escaped_url, data_uri, html_content)
-
-    logger.info(f"Preview: Embedded {sum(1 for r in results if r)} images for landing page {landing_page_id}")
-
-    return HTMLResponse(content=html_content)
+    html_content = await _render(landing_page, version)
+    return HTMLResponse(content=html_content, headers=headers)
 
 
 @router.get("/{landing_page_id}/download")
@@ -372,7 +299,8 @@ async def download_landing_page(
     """Download a landing page as an HTML file.
 
     Returns the HTML content as a downloadable file. By default, images
-    are embedded as base64 data URIs for offline viewing.
+    are embedded as base64 data URIs for offline viewing. Shares the
+    preview render cache.
 
     Args:
         landing_page_id: Landing page ID
@@ -381,63 +309,10 @@ async def download_landing_page(
     Returns:
         HTML file download response
     """
-    from app.core.storage import landing_pages_storage
-
-    service = LandingPageService(db)
-
-    landing_page = await service.get_by_id(
-        landing_page_id=landing_page_id,
-        user_id=current_user.id,
+    landing_page, version = await _resolve_preview(
+        db, current_user.id, landing_page_id, embed_images
     )
-
-    if not landing_page:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Landing page {landing_page_id} not found",
-        )
-
-    # Download from S3 (works for both draft and published)
-    if not landing_page.s3_key:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Landing page has no S3 content",
-        )
-
-    html_bytes = landing_pages_storage.download_file(landing_page.s3_key)
-    if not html_bytes:
-        # Fallback to database
-        html_content = landing_page.draft_content if landing_page.status == LandingPageStatus.DRAFT.value else landing_page.html_content
-        if not html_content:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Landing page has no HTML content",
-            )
-    else:
-        html_content = html_bytes.decode("utf-8")
-
-    # Embed images if requested
-    if embed_images:
-        image_urls = _extract_image_urls(html_content)
-
-        if image_urls:
-            logger.info(f"Download: Found {len(image_urls)} images to embed for landing page {landing_page_id}")
-
-            async with httpx.AsyncClient(
-                timeout=30.0,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                },
-            ) as client:
-                tasks = [_download_image_as_base64(client, url) for url in image_urls]
-                results = await asyncio.gather(*tasks)
-
-            for result in results:
-                if result:
-                    original_url, data_uri = result
-                    escaped_url = re.escape(original_url)
-                    html_content = re.sub(escaped_url, data_uri, html_content)
-
-            logger.info(f"Download: Embedded {sum(1 for r in results if r)} images for landing page {landing_page_id}")
+    html_content = await _render(landing_page, version)
 
     # Generate filename from landing page name
     safe_name = re.sub(r'[^\w\-_\u4e00-\u9fff]', '_', landing_page.name or "landing_page")
@@ -449,6 +324,7 @@ async def download_landing_page(
         media_type="text/html; charset=utf-8",
         headers={
             "Content-Disposition": f'attachment; filename="{filename}"',
+            "ETag": version.etag,
         },
     )
 
@@ -1,8 +1,9 @@
 """MCP API endpoints for AI Agent integration."""
 
+import json
 from typing import Annotated
 
-from fastapi import APIRouter, Header
+from fastapi import APIRouter, Header, Response, status
 
 from app.api.deps import DbSession
 from app.mcp.auth import extract_token_from_header
@@ -20,19 +21,87 @@ from app.mcp.types import (
 router = APIRouter(prefix="/mcp", tags=["MCP"])
 
 
-@router.post("/", response_model=JSONRPCResponse, include_in_schema=False)
-@router.post("", response_model=JSONRPCResponse)
+# Maximum number of requests in one JSON-RPC batch
+MAX_BATCH_SIZE = 50
+
+
+@router.post(
+    "/",
+    response_model=JSONRPCResponse | list[JSONRPCResponse],
+    include_in_schema=False,
+)
+@router.post("", response_model=JSONRPCResponse | list[JSONRPCResponse])
 async def jsonrpc_handler(
-    request: JSONRPCRequest,
+    request: JSONRPCRequest | list[JSONRPCRequest],
     db: DbSession,
     authorization: Annotated[str | None, Header()] = None,
-) -> JSONRPCResponse:
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> JSONRPCResponse | list[JSONRPCResponse] | Response:
     """JSON-RPC 2.0 endpoint for standard MCP protocol.
 
     Supports methods:
     - tools/list: List all available tools
     - tools/call: Execute a tool
+
+    A JSON array of requests is handled as a batch: the calls run in
+    order on one database session and authenticate once per user, and
+    the responses are returned as an array in the same order.
+
+    A single tools/list response carries an ETag for the tool catalog;
+    a request with a matching If-None-Match gets 304 Not Modified.
     """
+    token = extract_token_from_header(authorization)
+    server = MCPServer(db)
+
+    if not isinstance(request, list):
+        if request.method == "tools/list":
+            return _tools_list_response(request, server, if_none_match)
+        return await _handle_request(request, server, token)
+
+    from app.mcp.types import JSONRPCError
+    if not request or len(request) > MAX_BATCH_SIZE:
+        return JSONRPCErrorResponse(
+            id=None,
+            error=JSONRPCError(
+                code=-32600,
+                message=f"Invalid Request: batch must contain 1 to {MAX_BATCH_SIZE} requests",
+            ),
+        )
+
+    return [await _handle_request(item, server, token) for item in request]
+
+
+def _tools_list_response(
+    request: JSONRPCRequest,
+    server: MCPServer,
+    if_none_match: str | None,
+) -> Response:
+    """Return the pre-serialized tool catalog, or 304 if unchanged."""
+    catalog = server.registry.get_catalog()
+    headers = {"ETag": catalog.etag, "Cache-Control": "no-cache"}
+
+    if if_none_match and catalog.etag in {
+        tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+    }:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    # Splice the request ID into the cached result bytes
+    body = (
+        b'{"jsonrpc":"2.0","id":'
+        + json.dumps(request.id).encode()
+        + b',"result":'
+        + catalog.payload
+        + b"}"
+    )
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def _handle_request(
+    request: JSONRPCRequest,
+    server: MCPServer,
+    token: str | None,
+) -> JSONRPCResponse:
+    """Handle a single JSON-RPC request."""
     try:
         method = request.method
         params = request.params or {}
@@ -62,57 +131,11 @@ async def jsonrpc_handler(
                 result={},
             )
 
-        # Handle tools/list method
+        # Handle tools/list method (catalog is compiled at registration)
         elif method == "tools/list":
-            server = MCPServer(db)
-            tools_response = await server.list_tools()
-
-            # Convert tools to standard MCP format with inputSchema
-            mcp_tools = []
-            for tool in tools_response.tools:
-                # Build JSON Schema from parameters
-                properties = {}
-                required = []
-
-                for param in tool.parameters:
-                    param_schema = {
-                        "type": param.type,
-                        "description": param.description,
-                    }
-
-                    # Add enum if present
-                    if param.enum:
-                        param_schema["enum"] = param.enum
-
-                    # Add default if present
-                    if param.default is not None:
-                        param_schema["default"] = param.default
-
-                    properties[param.name] = param_schema
-
-                    if param.required:
-                        required.append(param.name)
-
-                # Build inputSchema
-                input_schema = {
-                    "type": "object",
-                    "properties": properties,
-                }
-
-                if required:
-                    input_schema["required"] = required
-
-                mcp_tools.append({
-                    "name": tool.name,
-                    "description": tool.description,
-                    "inputSchema": input_schema,
-                })
-
             return JSONRPCSuccessResponse(
                 id=request_id,
-                result={
-                    "tools": mcp_tools,
-                },
+                result=server.registry.get_catalog().result,
             )
 
         # Handle tools/call method
@@ -138,8 +161,6 @@ async def jsonrpc_handler(
             )
 
             # Execute via MCP server
-            token = extract_token_from_header(authorization)
-            server = MCPServer(db)
             mcp_response = await server.execute(mcp_request, token=token)
 
             # Convert MCP response to JSON-RPC response
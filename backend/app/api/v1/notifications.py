@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db
+from app.core.pagination import InvalidCursorError, encode_cursor
 from app.models.user import User
 from app.schemas.notification import (
     NotificationListResponse,
@@ -21,6 +22,7 @@ router = APIRouter(prefix="/notifications", tags=["notifications"])
 async def get_notifications(
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
     unread_only: bool = Query(default=False),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
@@ -29,23 +31,43 @@ async def get_notifications(
     Get notifications for the current user.
     
     Returns a paginated list of notifications sorted by creation time (newest first).
+    Pass next_cursor from a previous response as cursor to page without offset.
     """
     service = NotificationService(db)
 
-    notifications = await service.get_notifications(
-        user_id=current_user.id,
-        limit=limit,
-        offset=offset,
-        unread_only=unread_only,
-    )
-
     unread_count = await service.get_unread_count(current_user.id)
     total = await service.get_total_count(current_user.id, unread_only=unread_only)
 
+    if cursor is not None:
+        try:
+            notifications, next_cursor = await service.get_notifications_page(
+                user_id=current_user.id,
+                limit=limit,
+                cursor=cursor,
+                unread_only=unread_only,
+            )
+        except InvalidCursorError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor",
+            )
+    else:
+        notifications = await service.get_notifications(
+            user_id=current_user.id,
+            limit=limit,
+            offset=offset,
+            unread_only=unread_only,
+        )
+        next_cursor = None
+        if notifications and offset + len(notifications) < total:
+            last = notifications[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
     return NotificationListResponse(
         items=[NotificationResponse.model_validate(n) for n in notifications],
         total=total,
         unread_count=unread_count,
+        next_cursor=next_cursor,
     )
 
 
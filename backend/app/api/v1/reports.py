@@ -3,23 +3,29 @@
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, Query, status
+from sqlalchemy.exc import IntegrityError
 
 from app.api.deps import CurrentUser, DbSession
+from app.core.pagination import InvalidCursorError
 from app.schemas.report import (
     AggregatedMetrics,
     ArchivalResult,
     EntityType,
     MetricsBatchCreate,
+    MetricsBulkCreate,
+    MetricsBulkResult,
     MetricsCreate,
     MetricsFilter,
     MetricsListResponse,
     MetricsResponse,
     TrendResponse,
 )
-from app.services.report import ReportService
+from app.services.report import ArchivedPeriodError, ReportService
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
+DUPLICATE_METRICS_DETAIL = "Metrics already exist for this entity and timestamp"
+
 
 @router.get("/metrics", response_model=MetricsListResponse)
 async def list_metrics(
@@ -32,8 +38,14 @@ async def list_metrics(
     entity_id: str | None = Query(None, description="Filter by entity ID"),
     start_date: datetime | None = Query(None, description="Filter by start date"),
     end_date: datetime | None = Query(None, description="Filter by end date"),
+    cursor: str | None = Query(None, description="Cursor from next_cursor of a previous page"),
+    include_total: bool = Query(False, description="Return a cached total in cursor mode"),
 ) -> MetricsListResponse:
-    """List metrics with optional filters and pagination."""
+    """List metrics with optional filters and pagination.
+
+    Pass next_cursor from a previous response as cursor to page with
+    keyset pagination, which stays fast on deep pages.
+    """
     service = ReportService(db)
 
     filters = MetricsFilter(
@@ -44,12 +56,20 @@ async def list_metrics(
         end_date=end_date,
     )
 
-    result = await service.get_metrics(
-        user_id=current_user.id,
-        filters=filters,
-        page=page,
-        page_size=page_size,
-    )
+    try:
+        result = await service.get_metrics(
+            user_id=current_user.id,
+            filters=filters,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
 
     return MetricsListResponse(
         items=[MetricsResponse.model_validate(m) for m in result["metrics"]],
@@ -57,6 +77,7 @@ async def list_metrics(
         page=result["page"],
         page_size=result["page_size"],
         has_more=result["has_more"],
+        next_cursor=result["next_cursor"],
     )
 
 
@@ -70,14 +91,18 @@ async def save_metrics(
     """Save a single metrics record.
 
     This endpoint is used by the Ad Performance module to store
-    metrics data fetched from ad platforms.
+    metrics data fetched from ad platforms. Saving is idempotent: a record
+    that already exists for the same entity and timestamp is overwritten.
     """
     service = ReportService(db)
 
-    metrics = await service.save_metrics(
-        user_id=current_user.id,
-        data=data,
-    )
+    try:
+        metrics = await service.save_metrics(
+            user_id=current_user.id,
+            data=data,
+        )
+    except ArchivedPeriodError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
     await db.commit()
 
@@ -97,20 +122,65 @@ async def save_metrics_batch(
     """Save multiple metrics records in batch.
 
     This endpoint is used for bulk importing metrics data.
-    Maximum 1000 records per request.
+    Maximum 1000 records per request. Like the single-record endpoint,
+    records that already exist for the same entity and timestamp are
+    overwritten.
     """
     service = ReportService(db)
 
-    metrics_list = await service.save_metrics_batch(
-        user_id=current_user.id,
-        metrics_list=data.metrics,
-    )
+    try:
+        metrics_list = await service.save_metrics_batch(
+            user_id=current_user.id,
+            metrics_list=data.metrics,
+        )
+    except ArchivedPeriodError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
     await db.commit()
 
     return [MetricsResponse.model_validate(m) for m in metrics_list]
 
 
+@router.post(
+    "/metrics/bulk",
+    response_model=MetricsBulkResult,
+    status_code=status.HTTP_201_CREATED,
+)
+async def bulk_ingest_metrics(
+    db: DbSession,
+    current_user: CurrentUser,
+    data: MetricsBulkCreate,
+) -> MetricsBulkResult:
+    """Bulk ingest metrics records.
+
+    This endpoint is used by platform syncs to ingest large batches
+    (up to 50000 records per request) with multi-row inserts. Only the
+    number of written rows is returned. Set upsert to overwrite rows
+    that already exist for the same entity and timestamp; without it
+    they are rejected with 409. Rows in an already archived period are
+    rejected with 409 as well.
+    """
+    service = ReportService(db)
+
+    try:
+        count = await service.bulk_insert_metrics(
+            user_id=current_user.id,
+            metrics_list=data.metrics,
+            upsert=data.upsert,
+        )
+    except ArchivedPeriodError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=DUPLICATE_METRICS_DETAIL
+        )
+
+    await db.commit()
+
+    return MetricsBulkResult(count=count, upsert=data.upsert)
+
+
 @router.get("/metrics/{metrics_id}", response_model=MetricsResponse)
 async def get_metrics_by_id(
     db: DbSession,
@@ -212,10 +282,9 @@ async def archive_old_metrics(
 ) -> ArchivalResult:
     """Archive metrics older than threshold.
 
-    This endpoint archives (deletes) detailed metrics older than
-    the specified number of days. Default is 90 days.
-
-    Note: In production, summary data would be preserved before deletion.
+    This endpoint archives detailed metrics older than the specified
+    number of days. Default is 90 days. Raw rows are deleted while their
+    hourly, daily and monthly rollups are kept.
     """
     service = ReportService(db)
 
@@ -8,10 +8,10 @@ from pydantic import BaseModel, Field
 
 from app.api.deps import CurrentUser
 from app.core.storage import (
-    creatives_storage,
-    exports_storage,
-    landing_pages_storage,
-    uploads_storage,
+    async_creatives_storage,
+    async_exports_storage,
+    async_landing_pages_storage,
+    async_uploads_storage,
 )
 
 logger = logging.getLogger(__name__)
@@ -79,10 +79,10 @@ async def generate_presigned_download_url(
 
     # Get storage backend
     storage_backends = {
-        "creatives": creatives_storage,
-        "landing_pages": landing_pages_storage,
-        "exports": exports_storage,
-        "uploads": uploads_storage,
+        "creatives": async_creatives_storage,
+        "landing_pages": async_landing_pages_storage,
+        "exports": async_exports_storage,
+        "uploads": async_uploads_storage,
     }
     storage = storage_backends[request.storage_type]
 
@@ -105,7 +105,7 @@ async def generate_presigned_download_url(
         )
 
     # Check if file exists
-    if not storage.file_exists(request.path):
+    if not await storage.file_exists(request.path):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"File not found: {request.path}",
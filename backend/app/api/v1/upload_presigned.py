@@ -8,7 +8,7 @@ from pydantic import BaseModel, Field
 
 from app.api.deps import CurrentUser
 from app.core.config import settings
-from app.core.storage import creatives_storage
+from app.core.storage import async_creatives_storage, creatives_storage
 
 router = APIRouter(prefix="/uploads/presigned", tags=["uploads"])
 
@@ -245,8 +245,9 @@ async def confirm_upload(
     """
     from app.core.gemini_files import gemini_files_service
 
-    # Verify file exists in uploads storage
-    if not creatives_storage.file_exists(request.fileKey):
+    # Verify file exists in uploads storage (the HEAD also gives the content type)
+    file_info = await async_creatives_storage.get_file_info(request.fileKey)
+    if not file_info:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="File not found",
@@ -260,16 +261,14 @@ async def confirm_upload(
         )
 
     # Download file from S3
-    file_data = creatives_storage.download_file(request.fileKey)
+    file_data = await async_creatives_storage.download_file(request.fileKey)
     if not file_data:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Failed to download file",
         )
 
-    # Get file info for content type
-    file_info = creatives_storage.get_file_info(request.fileKey)
-    content_type = file_info.get("content_type", "application/octet-stream") if file_info else "application/octet-stream"
+    content_type = file_info.get("content_type", "application/octet-stream")
 
     # Get CDN URL
     cdn_url = creatives_storage.get_cdn_url(request.fileKey)
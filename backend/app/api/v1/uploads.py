@@ -7,7 +7,7 @@ from fastapi import APIRouter, File, HTTPException, UploadFile, status
 from pydantic import BaseModel
 
 from app.api.deps import CurrentUser
-from app.core.storage import creatives_storage
+from app.core.storage import async_creatives_storage, creatives_storage
 from app.core.config import settings
 from app.core.gemini_files import gemini_files_service
 
@@ -66,7 +66,7 @@ async def upload_files(
             object_name = f"chat-attachments/{current_user.id}/{file_id}.{ext}"
 
             # Upload to S3 creatives bucket for persistent storage
-            s3_url = creatives_storage.upload_file(
+            s3_url = await async_creatives_storage.upload_file(
                 key=object_name,
                 data=content,
                 content_type=file.content_type or "application/octet-stream",
@@ -363,6 +363,7 @@ async def handle_user_message(
     """
     import httpx
     from app.core.config import settings
+    from app.core.orchestrator_client import orchestrator_client
 
     # Validate message format
     content = message.get("content")
@@ -387,73 +388,63 @@ async def handle_user_message(
     })
 
     try:
-        # Forward to AI Orchestrator
-        async with httpx.AsyncClient(timeout=settings.ai_orchestrator_timeout) as client:
-            # Prepare request payload with user's model preferences
-            payload = {
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": content,
-                    }
-                ],
-                "user_id": str(user.id),
-                "session_id": session_id,
-                "model_preferences": {
-                    "conversational_provider": user.conversational_provider,
-                    "conversational_model": user.conversational_model,
-                },
-            }
-
-            # Build headers with service token
-            headers = {
-                "Content-Type": "application/json",
-            }
-            if settings.ai_orchestrator_service_token:
-                headers["Authorization"] = f"Bearer {settings.ai_orchestrator_service_token}"
-
-            # Send request to AI Orchestrator
-            async with client.stream(
-                "POST",
-                f"{settings.ai_orchestrator_url}/chat",
-                json=payload,
-                headers=headers,
-            ) as response:
-                if response.status_code != 200:
-                    error_text = await response.aread()
-                    logger.error(f"AI Orchestrator error: {response.status_code} - {error_text}")
-                    await websocket.send_json({
-                        "type": "error",
-                        "error": {
-                            "code": "AI_ORCHESTRATOR_ERROR",
-                            "message": "Failed to get response from AI",
-                            "details": error_text.decode() if error_text else None,
-                        },
-                        "timestamp": datetime.now(UTC).isoformat(),
-                    })
-                    return
-
-                # Stream response back to client
-                accumulated_content = ""
-                async for chunk in response.aiter_text():
-                    if chunk:
-                        accumulated_content += chunk
-                        
-                        # Send streaming chunk to client
-                        await websocket.send_json({
-                            "type": "agent_message_chunk",
-                            "message_id": message_id,
-                            "content": chunk,
-                            "timestamp": datetime.now(UTC).isoformat(),
-                        })
-
-                # Send completion message
+        # Prepare request payload with user's model preferences
+        payload = {
+            "messages": [
+                {
+                    "role": "user",
+                    "content": content,
+                }
+            ],
+            "user_id": str(user.id),
+            "session_id": session_id,
+            "model_preferences": {
+                "conversational_provider": user.conversational_provider,
+                "conversational_model": user.conversational_model,
+            },
+        }
+
+        # Forward to AI Orchestrator over the shared pool (sends the service token)
+        async with orchestrator_client.stream(
+            "POST",
+            "/chat",
+            json=payload,
+        ) as response:
+            if response.status_code != 200:
+                error_text = await response.aread()
+                logger.error(f"AI Orchestrator error: {response.status_code} - {error_text}")
                 await websocket.send_json({
-                    "type": "agent_message_complete",
-                    "message_id": message_id,
-                    "full_content": accumulated_content,
+                    "type": "error",
+                    "error": {
+                        "code": "AI_ORCHESTRATOR_ERROR",
+                        "message": "Failed to get response from AI",
+                        "details": error_text.decode() if error_text else None,
+                    },
                     "timestamp": datetime.now(UTC).isoformat(),
                 })
+                return
+
+            # Stream response back to client
+            accumulated_content = ""
+            async for chunk in response.aiter_text():
+                if chunk:
+                    accumulated_content += chunk
+                    
+                    # Send streaming chunk to client
+                    await websocket.send_json({
+                        "type": "agent_message_chunk",
+                        "message_id": message_id,
+                        "content": chunk,
+                        "timestamp": datetime.now(UTC).isoformat(),
+                    })
+
+            # Send completion message
+            await websocket.send_json({
+                "type": "agent_message_complete",
+                "message_id": message_id,
+                "full_content": accumulated_content,
+                "timestamp": datetime.now(UTC).isoformat(),
+            })
 
     except httpx.TimeoutException:
         logger.error(f"AI Orchestrator timeout for session {session_id}")
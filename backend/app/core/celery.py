@@ -39,7 +39,7 @@ celery_app.conf.update(
             "task": "app.tasks.reports.generate_daily_report",
             "schedule": crontab(hour=9, minute=0),
         },
-        # Anomaly detection - Every hour
+        # Anomaly detection - Every hour; alerts are deduped per scored day
         "detect-anomalies": {
             "task": "app.tasks.anomaly_detection.detect_anomalies",
             "schedule": crontab(minute=0),
@@ -49,6 +49,11 @@ celery_app.conf.update(
             "task": "app.tasks.rule_check.check_campaign_rules",
             "schedule": crontab(minute=0, hour="*/6"),
         },
+        # Credit ledger write-behind - Every 10 seconds
+        "flush-credit-settlements": {
+            "task": "app.tasks.credit_settlement.flush_credit_settlements",
+            "schedule": 10.0,
+        },
     },
 )
 
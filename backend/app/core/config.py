@@ -84,6 +84,9 @@ class Settings(BaseSettings):
     s3_bucket_exports: str = "aae-exports"
     s3_bucket_uploads: str = "aae-user-uploads"
     cloudfront_domain: str = Field(default="landing.zmead.com")  # CloudFront CDN domain for landing pages
+    s3_max_workers: int = 16  # threads shared by async S3 calls
+    s3_part_size: int = 8 * 1024 * 1024  # multipart part size for uploads and downloads
+    s3_transfer_concurrency: int = 8  # parts transferred in parallel per object
     
     # AWS Bedrock Configuration
     bedrock_region: str = Field(default="us-west-2")
@@ -136,6 +139,24 @@ class Settings(BaseSettings):
     ai_orchestrator_url: str = "http://localhost:8001"
     ai_orchestrator_timeout: int = 60  # seconds
     ai_orchestrator_service_token: str = Field(default="")
+    ai_orchestrator_max_connections: int = 100
+    ai_orchestrator_max_keepalive_connections: int = 20
+    ai_orchestrator_keepalive_expiry: float = 60.0  # seconds
+    ai_orchestrator_http2: bool = False  # requires the h2 package
+
+    # Credits
+    credit_config_cache_ttl: int = 60  # seconds
+
+    # GDPR data export
+    data_export_chunk_size: int = 1000  # rows fetched per round trip
+    data_export_spool_size: int = 8 * 1024 * 1024  # archive bytes kept in memory
+    data_export_part_size: int = 16 * 1024 * 1024  # S3 multipart part size
+    data_export_upload_concurrency: int = 4
+
+    # MCP principal cache
+    mcp_principal_cache_ttl: int = 60  # seconds, Redis
+    mcp_principal_local_ttl: float = 10.0  # seconds, in-process
+    mcp_principal_cache_size: int = 10000
 
     # Gemini API
     gemini_api_key: str = Field(default="")
@@ -0,0 +1,231 @@
+"""Pooled HTTP client for the AI Orchestrator.
+
+Chat turns, WebSocket messages and Celery tasks share one keep-alive
+connection pool per event loop instead of opening a new connection (and
+TLS handshake) for every request. The FastAPI lifespan closes the pool
+on shutdown.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Time-to-first-byte samples kept for percentiles
+TTFB_SAMPLE_SIZE = 1000
+
+
+class OrchestratorClientMetrics:
+    """In-process counters for orchestrator requests."""
+
+    def __init__(self) -> None:
+        self.requests_total = 0
+        self.requests_failed = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._ttfb: deque[float] = deque(maxlen=TTFB_SAMPLE_SIZE)
+
+    def request_started(self) -> None:
+        self.requests_total += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def request_finished(self, failed: bool) -> None:
+        self.in_flight -= 1
+        if failed:
+            self.requests_failed += 1
+
+    def observe_ttfb(self, seconds: float) -> None:
+        self._ttfb.append(seconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return counters and TTFB percentiles in milliseconds."""
+        samples = sorted(self._ttfb)
+
+        def percentile(p: float) -> float | None:
+            if not samples:
+                return None
+            index = min(len(samples) - 1, int(p * len(samples)))
+            return round(samples[index] * 1000, 2)
+
+        return {
+            "requests_total": self.requests_total,
+            "requests_failed": self.requests_failed,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "ttfb_samples": len(samples),
+            "ttfb_p50_ms": percentile(0.5),
+            "ttfb_p95_ms": percentile(0.95),
+            "ttfb_max_ms": round(samples[-1] * 1000, 2) if samples else None,
+        }
+
+
+class OrchestratorStream:
+    """Streaming orchestrator response that records time to first byte."""
+
+    def __init__(
+        self,
+        response: httpx.Response,
+        started: float,
+        metrics: OrchestratorClientMetrics,
+    ) -> None:
+        self.response = response
+        self._started = started
+        self._metrics = metrics
+
+    @property
+    def status_code(self) -> int:
+        return self.response.status_code
+
+    async def aread(self) -> bytes:
+        return await self.response.aread()
+
+    async def aiter_text(self) -> AsyncIterator[str]:
+        """Iterate decoded chunks, timing the first non-empty one."""
+        first = True
+        async for chunk in self.response.aiter_text():
+            if first and chunk:
+                self._metrics.observe_ttfb(time.perf_counter() - self._started)
+                first = False
+            yield chunk
+
+
+class OrchestratorClient:
+    """Connection-pooled client for AI Orchestrator requests.
+
+    The underlying httpx.AsyncClient is created lazily and recreated when
+    used from a different event loop, since pooled connections cannot be
+    shared between loops (Celery tasks may run on their own loop).
+    """
+
+    def __init__(self) -> None:
+        self.metrics = OrchestratorClientMetrics()
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    def _build_client(self) -> httpx.AsyncClient:
+        headers = {}
+        if settings.ai_orchestrator_service_token:
+            headers["Authorization"] = f"Bearer {settings.ai_orchestrator_service_token}"
+
+        http2 = settings.ai_orchestrator_http2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("h2 is not installed, using HTTP/1.1 for the orchestrator")
+                http2 = False
+
+        return httpx.AsyncClient(
+            base_url=settings.ai_orchestrator_url,
+            headers=headers,
+            timeout=settings.ai_orchestrator_timeout,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=settings.ai_orchestrator_max_connections,
+                max_keepalive_connections=settings.ai_orchestrator_max_keepalive_connections,
+                keepalive_expiry=settings.ai_orchestrator_keepalive_expiry,
+            ),
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Return the pooled client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            # A client from another loop is abandoned, not closed: its
+            # connections belong to that loop
+            self._client = self._build_client()
+            self._client_loop = loop
+        return self._client
+
+    async def request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send a request and read the whole response.
+
+        Args:
+            method: HTTP method
+            path: Path relative to the orchestrator URL
+            **kwargs: Passed to httpx.AsyncClient.request
+
+        Returns:
+            The response
+        """
+        self.metrics.request_started()
+        failed = True
+        try:
+            response = await self.client.request(method, path, **kwargs)
+            failed = response.status_code >= 500
+            return response
+        finally:
+            self.metrics.request_finished(failed)
+
+    async def post(self, path: str, **kwargs: Any) -> httpx.Response:
+        """Send a POST request (see request)."""
+        return await self.request("POST", path, **kwargs)
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        path: str,
+        **kwargs: Any,
+    ) -> AsyncIterator[OrchestratorStream]:
+        """Send a request and stream the response.
+
+        Args:
+            method: HTTP method
+            path: Path relative to the orchestrator URL
+            **kwargs: Passed to httpx.AsyncClient.stream
+
+        Yields:
+            OrchestratorStream over the response
+        """
+        self.metrics.request_started()
+        started = time.perf_counter()
+        failed = True
+        try:
+            async with self.client.stream(method, path, **kwargs) as response:
+                failed = response.status_code >= 500
+                yield OrchestratorStream(response, started, self.metrics)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self.metrics.request_finished(failed)
+
+    def stats(self) -> dict[str, Any]:
+        """Return request metrics and connection pool occupancy."""
+        stats = self.metrics.snapshot()
+        stats["max_connections"] = settings.ai_orchestrator_max_connections
+
+        # httpcore does not expose pool statistics publicly; best effort
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if connections is not None:
+            stats["pool_connections"] = len(connections)
+            stats["pool_idle_connections"] = sum(1 for c in connections if c.is_idle())
+        return stats
+
+    async def close(self) -> None:
+        """Close pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+
+orchestrator_client = OrchestratorClient()
+
+
+async def close_orchestrator_client() -> None:
+    """Close the orchestrator connection pool (app shutdown)."""
+    await orchestrator_client.close()
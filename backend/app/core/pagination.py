@@ -0,0 +1,219 @@
+"""Keyset (cursor) pagination helpers shared by list endpoints.
+
+A cursor encodes the sort key and ID of the last item on a page. The
+next page is fetched with ``WHERE (sort, id) < (cursor_sort, cursor_id)``
+instead of OFFSET, so deep pages cost the same as the first one.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached total count stays valid
+COUNT_CACHE_TTL = 60
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+        super().__init__("Invalid pagination cursor")
+
+
+def encode_cursor(sort_value: Any, item_id: int) -> str:
+    """Encode the sort key and ID of the last item on a page.
+
+    Args:
+        sort_value: Sort column value (datetime, int or str)
+        item_id: Primary key of the item
+
+    Returns:
+        Opaque URL-safe cursor string
+    """
+    if isinstance(sort_value, datetime):
+        payload = {"t": sort_value.isoformat(), "id": item_id}
+    else:
+        payload = {"v": sort_value, "id": item_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Any, int]:
+    """Decode a cursor created by encode_cursor.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (sort_value, item_id)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        if "t" in payload:
+            return datetime.fromisoformat(payload["t"]), int(payload["id"])
+        return payload["v"], int(payload["id"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError(cursor) from e
+
+
+def apply_keyset(
+    query: Select[Any],
+    sort_column: ColumnElement[Any],
+    id_column: ColumnElement[Any],
+    cursor: str | None,
+    limit: int,
+    descending: bool = True,
+) -> Select[Any]:
+    """Order a query by (sort, id) and continue after the cursor.
+
+    One extra row is fetched so callers can tell whether a next page
+    exists; pass the results to build_next_cursor.
+
+    Args:
+        query: Base select with filters applied
+        sort_column: Column or expression to sort by
+        id_column: Unique tiebreaker column (primary key)
+        cursor: Cursor from the previous page, or None for the first page
+        limit: Page size
+        descending: Sort newest first (default) or oldest first
+
+    Returns:
+        Query with keyset condition, ordering and limit applied
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    if cursor:
+        sort_value, last_id = decode_cursor(cursor)
+        if descending:
+            condition = or_(
+                sort_column < sort_value,
+                and_(sort_column == sort_value, id_column < last_id),
+            )
+        else:
+            condition = or_(
+                sort_column > sort_value,
+                and_(sort_column == sort_value, id_column > last_id),
+            )
+        query = query.where(condition)
+
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+
+    return query.limit(limit + 1)
+
+
+def build_next_cursor(
+    items: list[Any],
+    limit: int,
+    sort_attr: str,
+    id_attr: str = "id",
+) -> tuple[list[Any], str | None]:
+    """Trim the extra row fetched by apply_keyset and build the next cursor.
+
+    Args:
+        items: Rows returned by a query built with apply_keyset
+        limit: Page size passed to apply_keyset
+        sort_attr: Attribute holding the sort value on each item
+        id_attr: Attribute holding the ID on each item
+
+    Returns:
+        Tuple of (page items, next cursor or None on the last page)
+    """
+    if len(items) <= limit:
+        return items, None
+
+    items = items[:limit]
+    last = items[-1]
+    return items, encode_cursor(getattr(last, sort_attr), getattr(last, id_attr))
+
+
+async def fetch_keyset_page(
+    db: AsyncSession,
+    query: Select[Any],
+    sort_column: Any,
+    cursor: str | None,
+    limit: int,
+    descending: bool = True,
+) -> tuple[list[Any], str | None]:
+    """Fetch one keyset page of ORM instances.
+
+    Args:
+        db: Database session
+        query: Select of a single mapped entity with filters applied
+        sort_column: Mapped column to sort by; its key must match the
+            instance attribute and the entity must have an ``id`` column
+        cursor: Cursor from the previous page, or None for the first page
+        limit: Page size
+        descending: Sort newest first (default) or oldest first
+
+    Returns:
+        Tuple of (instances, next cursor or None on the last page)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    id_column = sort_column.class_.id
+    query = apply_keyset(query, sort_column, id_column, cursor, limit, descending)
+    result = await db.execute(query)
+    return build_next_cursor(list(result.scalars().all()), limit, sort_column.key)
+
+
+async def cached_count(
+    db: AsyncSession,
+    query: Select[Any],
+    cache_key: str,
+    ttl: int = COUNT_CACHE_TTL,
+) -> int:
+    """Count rows of a query, caching the result in Redis.
+
+    Totals on large listings are expensive and rarely need to be exact,
+    so a count up to ttl seconds old is returned when available.
+
+    Args:
+        db: Database session
+        query: Filtered select (without ordering or limit)
+        cache_key: Key identifying the listing and its filters
+        ttl: Cache lifetime in seconds
+
+    Returns:
+        Total number of rows
+    """
+    key = "count:" + hashlib.sha256(cache_key.encode()).hexdigest()[:32]
+
+    try:
+        redis = await get_redis()
+        cached = await redis.get(key)
+        if cached is not None:
+            return int(cached)
+    except Exception as e:
+        logger.warning(f"Count cache unavailable: {e}")
+        redis = None
+
+    result = await db.execute(select(func.count()).select_from(query.subquery()))
+    total = result.scalar() or 0
+
+    if redis is not None:
+        try:
+            await redis.set(key, total, ex=ttl)
+        except Exception as e:
+            logger.warning(f"Failed to cache count: {e}")
+
+    return total
@@ -1,16 +1,44 @@
 """Rate limiting middleware for API endpoints."""
 
 import logging
+import threading
 import time
+import uuid
 from typing import Callable
 
 from fastapi import HTTPException, Request, Response, status
+from redis.commands.core import AsyncScript
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.core.redis import get_redis
 
 logger = logging.getLogger(__name__)
 
+# Atomic sliding-window check: trim, count, admit and expire in one round trip.
+# Returns {allowed (0/1), count in window, reset timestamp as string}.
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+local count = redis.call('ZCARD', key)
+
+if count >= limit then
+    local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+    local reset = now + window
+    if oldest[2] then
+        reset = tonumber(oldest[2]) + window
+    end
+    return {0, count, tostring(reset)}
+end
+
+redis.call('ZADD', key, now, ARGV[4])
+redis.call('EXPIRE', key, math.ceil(window * 2))
+return {1, count + 1, tostring(now + window)}
+"""
+
 
 class RateLimitExceeded(HTTPException):
     """Exception raised when rate limit is exceeded."""
@@ -23,6 +51,110 @@ class RateLimitExceeded(HTTPException):
         )
 
 
+class LocalTokenBucket:
+    """In-process token buckets keyed by client identifier.
+
+    Requests that take a local token are admitted without touching Redis.
+    Each bucket holds at most ``capacity`` tokens and refills at
+    ``capacity / window`` tokens per second.
+    """
+
+    # Buckets kept before idle ones are dropped
+    MAX_KEYS = 10000
+
+    def __init__(self, capacity: float, window: float) -> None:
+        self.capacity = capacity
+        self.refill_rate = capacity / window
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def try_take(self, key: str) -> bool:
+        """Take one token for key if available."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - updated) * self.refill_rate)
+            if tokens < 1:
+                self._buckets[key] = (tokens, now)
+                return False
+            if len(self._buckets) >= self.MAX_KEYS and key not in self._buckets:
+                self._evict(now)
+            self._buckets[key] = (tokens - 1, now)
+            return True
+
+    def _evict(self, now: float) -> None:
+        """Drop buckets that have refilled completely (idle clients)."""
+        full_after = self.capacity / self.refill_rate
+        self._buckets = {
+            k: v for k, v in self._buckets.items() if now - v[1] < full_after
+        }
+
+
+class SlidingWindowLimiter:
+    """Redis sliding-window limiter checked with a single Lua call.
+
+    Shared by RateLimitMiddleware and the RateLimiter dependency. When
+    local_share is set, that fraction of the limit is served from an
+    in-process token bucket split across ``workers`` processes and the
+    Redis limit is lowered by the same amount, so the total admitted per
+    window never exceeds ``limit``.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        window: int = 60,
+        local_share: float = 0.0,
+        workers: int = 1,
+    ) -> None:
+        """
+        Initialize limiter.
+
+        Args:
+            limit: Maximum requests per window per client
+            window: Window size in seconds
+            local_share: Fraction of the limit admitted locally (0 disables)
+            workers: Number of processes sharing the limit
+        """
+        self.limit = limit
+        self.window = window
+        self.local_bucket: LocalTokenBucket | None = None
+        self.redis_limit = limit
+
+        # Local bucket admits up to capacity plus refill within one window
+        local_per_worker = int(limit * local_share / workers / 2)
+        if local_per_worker >= 1:
+            self.local_bucket = LocalTokenBucket(local_per_worker, window)
+            self.redis_limit = limit - local_per_worker * 2 * workers
+
+        self._script: AsyncScript | None = None
+
+    async def check(self, key: str) -> tuple[bool, int, float]:
+        """
+        Check and record one request for key.
+
+        Returns:
+            tuple of (allowed, requests_in_window, reset_timestamp)
+            requests_in_window is -1 when admitted by the local bucket.
+        """
+        current_time = time.time()
+
+        if self.local_bucket is not None and self.local_bucket.try_take(key):
+            return True, -1, current_time + self.window
+
+        redis = await get_redis()
+        if self._script is None:
+            self._script = redis.register_script(SLIDING_WINDOW_SCRIPT)
+
+        member = f"{current_time}:{uuid.uuid4().hex[:8]}"
+        allowed, count, reset_time = await self._script(
+            keys=[key],
+            args=[current_time, self.window, self.redis_limit, member],
+            client=redis,
+        )
+        return bool(allowed), int(count), float(reset_time)
+
+
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """
     Rate limiting middleware using Redis.
@@ -35,6 +167,8 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         app,
         requests_per_minute: int = 100,
         burst_multiplier: float = 1.5,
+        local_share: float = 0.0,
+        workers: int = 1,
     ) -> None:
         """
         Initialize rate limit middleware.
@@ -43,11 +177,20 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             app: FastAPI application
             requests_per_minute: Maximum requests per minute per user
             burst_multiplier: Allow burst traffic up to this multiplier
+            local_share: Fraction of the burst limit admitted by an
+                in-process token bucket without a Redis call (0 disables)
+            workers: Number of worker processes sharing the limit
         """
         super().__init__(app)
         self.requests_per_minute = requests_per_minute
         self.burst_limit = int(requests_per_minute * burst_multiplier)
         self.window_size = 60  # 1 minute in seconds
+        self.limiter = SlidingWindowLimiter(
+            limit=self.burst_limit,
+            window=self.window_size,
+            local_share=local_share,
+            workers=workers,
+        )
 
     async def dispatch(
         self,
@@ -123,43 +266,23 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         Returns:
             tuple of (allowed, remaining_requests, reset_timestamp)
         """
-        redis = await get_redis()
         current_time = time.time()
-        window_start = current_time - self.window_size
 
         # Redis key for this user's request timestamps
         key = f"rate_limit:{user_id}"
 
         try:
-            # Remove old timestamps outside the window
-            await redis.zremrangebyscore(key, 0, window_start)
-
-            # Count requests in current window
-            request_count = await redis.zcard(key)
-
-            # Check if limit exceeded
-            if request_count >= self.burst_limit:
-                # Get oldest timestamp to calculate reset time
-                oldest = await redis.zrange(key, 0, 0, withscores=True)
-                if oldest:
-                    reset_time = oldest[0][1] + self.window_size
-                else:
-                    reset_time = current_time + self.window_size
-                
-                remaining = 0
-                allowed = False
-            else:
-                # Add current request timestamp
-                await redis.zadd(key, {str(current_time): current_time})
-                
-                # Set expiry on key (cleanup)
-                await redis.expire(key, self.window_size * 2)
-                
-                remaining = self.requests_per_minute - (request_count + 1)
-                reset_time = current_time + self.window_size
-                allowed = True
-
-            return allowed, max(0, remaining), reset_time
+            allowed, request_count, reset_time = await self.limiter.check(key)
+
+            if not allowed:
+                return False, 0, reset_time
+
+            if request_count < 0:
+                # Admitted locally; the window count is unknown
+                return True, self.requests_per_minute, reset_time
+
+            remaining = self.requests_per_minute - request_count
+            return True, max(0, remaining), reset_time
 
         except Exception as e:
             logger.error(f"Redis error in rate limiting: {e}")
@@ -182,6 +305,10 @@ class RateLimiter:
         """Initialize rate limiter with custom limit."""
         self.requests_per_minute = requests_per_minute
         self.window_size = 60
+        self.limiter = SlidingWindowLimiter(
+            limit=requests_per_minute,
+            window=self.window_size,
+        )
 
     async def __call__(
         self,
@@ -198,35 +325,16 @@ class RateLimiter:
             else:
                 user_id = f"ip:{request.client.host}" if request.client else "unknown"
 
-        redis = await get_redis()
-        current_time = time.time()
-        window_start = current_time - self.window_size
-
         # Endpoint-specific key
         endpoint = request.url.path
         key = f"rate_limit:{endpoint}:{user_id}"
 
         try:
-            # Remove old timestamps
-            await redis.zremrangebyscore(key, 0, window_start)
-
-            # Count requests
-            request_count = await redis.zcard(key)
-
-            if request_count >= self.requests_per_minute:
-                # Get reset time
-                oldest = await redis.zrange(key, 0, 0, withscores=True)
-                if oldest:
-                    reset_time = oldest[0][1] + self.window_size
-                else:
-                    reset_time = current_time + self.window_size
-                
-                retry_after = int(reset_time - current_time)
-                raise RateLimitExceeded(retry_after=max(1, retry_after))
+            allowed, _, reset_time = await self.limiter.check(key)
 
-            # Add current request
-            await redis.zadd(key, {str(current_time): current_time})
-            await redis.expire(key, self.window_size * 2)
+            if not allowed:
+                retry_after = int(reset_time - time.time())
+                raise RateLimitExceeded(retry_after=max(1, retry_after))
 
         except RateLimitExceeded:
             raise
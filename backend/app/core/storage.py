@@ -1,12 +1,21 @@
 """Storage utilities for Amazon S3."""
 
+import asyncio
 import logging
-from typing import Any, Protocol
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, BinaryIO, Protocol, TypeVar
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# S3 DeleteObjects accepts at most 1000 keys per request
+DELETE_BATCH_SIZE = 1000
+
 
 class StorageInterface(Protocol):
     """Protocol defining the storage interface that all implementations must follow."""
@@ -185,6 +194,52 @@ class S3Storage:
             logger.error(f"Failed to upload file to S3: {e}")
             return f"s3://{self.bucket_name}/{key}"
 
+    def upload_fileobj(
+        self,
+        key: str,
+        fileobj: BinaryIO,
+        content_type: str,
+        part_size: int = 16 * 1024 * 1024,
+        max_concurrency: int = 4,
+    ) -> str:
+        """Upload a file object to S3 with a parallel multipart upload.
+
+        Only max_concurrency parts of part_size bytes are buffered at a
+        time, so large files are uploaded with bounded memory. This call
+        blocks; run it in a thread from async code.
+
+        Args:
+            key: Object key (path) in the bucket
+            fileobj: Readable binary file positioned at the start
+            content_type: MIME type of the file
+            part_size: Multipart part size in bytes (at least 5 MiB)
+            max_concurrency: Parts uploaded in parallel
+
+        Returns:
+            S3 URI of the uploaded file
+
+        Raises:
+            Exception: If the upload fails
+        """
+        if not self._check_available():
+            return f"s3://{self.bucket_name}/{key}"  # Return expected format but don't upload
+
+        from boto3.s3.transfer import TransferConfig
+
+        self.client.upload_fileobj(
+            fileobj,
+            self.bucket_name,
+            key,
+            ExtraArgs={"ContentType": content_type},
+            Config=TransferConfig(
+                multipart_threshold=part_size,
+                multipart_chunksize=part_size,
+                max_concurrency=max_concurrency,
+                use_threads=True,
+            ),
+        )
+        return f"s3://{self.bucket_name}/{key}"
+
     def delete_file(self, key: str) -> None:
         """Delete file from S3.
 
@@ -292,46 +347,55 @@ class S3Storage:
             return []
 
         try:
-            params: dict[str, Any] = {"Bucket": self.bucket_name}
-            if prefix:
-                params["Prefix"] = prefix
-            if max_results:
-                params["MaxKeys"] = max_results
-
-            response = self.client.list_objects_v2(**params)
-
-            if "Contents" not in response:
-                return []
-
-            files = []
-            for obj in response["Contents"]:
-                # Skip "directory" markers (keys ending with /)
-                if obj["Key"].endswith("/"):
-                    continue
-
-                # Get content type by making a head request
-                try:
-                    head_response = self.client.head_object(
-                        Bucket=self.bucket_name,
-                        Key=obj["Key"],
-                    )
-                    content_type = head_response.get("ContentType", "application/octet-stream")
-                except Exception:
-                    content_type = "application/octet-stream"
-
-                files.append({
-                    "name": obj["Key"],
-                    "size": obj["Size"],
-                    "content_type": content_type,
-                    "updated": obj["LastModified"].isoformat() if obj.get("LastModified") else None,
-                    "url": self.get_public_url(obj["Key"]),
-                })
-
-            return files
+            objects = self._list_objects(prefix, max_results)
         except Exception as e:
             logger.warning(f"Failed to list files in S3 bucket {self.bucket_name}: {e}")
             return []
 
+        files = []
+        for obj in objects:
+            # Get content type by making a head request
+            try:
+                head_response = self.client.head_object(
+                    Bucket=self.bucket_name,
+                    Key=obj["Key"],
+                )
+                content_type = head_response.get("ContentType", "application/octet-stream")
+            except Exception:
+                content_type = "application/octet-stream"
+            files.append(self._object_info(obj, content_type))
+
+        return files
+
+    def _list_objects(
+        self,
+        prefix: str | None = None,
+        max_results: int | None = None,
+    ) -> list[dict]:
+        """List raw object summaries across pages, skipping "directory" markers."""
+        params: dict[str, Any] = {"Bucket": self.bucket_name}
+        if prefix:
+            params["Prefix"] = prefix
+        if max_results:
+            params["PaginationConfig"] = {"MaxItems": max_results}
+
+        objects = []
+        for page in self.client.get_paginator("list_objects_v2").paginate(**params):
+            objects.extend(
+                obj for obj in page.get("Contents", []) if not obj["Key"].endswith("/")
+            )
+        return objects
+
+    def _object_info(self, obj: dict, content_type: str) -> dict:
+        """Build a file info dict from a list_objects_v2 entry."""
+        return {
+            "name": obj["Key"],
+            "size": obj["Size"],
+            "content_type": content_type,
+            "updated": obj["LastModified"].isoformat() if obj.get("LastModified") else None,
+            "url": self.get_public_url(obj["Key"]),
+        }
+
     def get_file_info(self, key: str) -> dict | None:
         """Get file metadata from S3.
 
@@ -356,6 +420,7 @@ class S3Storage:
                 "content_type": response.get("ContentType", "application/octet-stream"),
                 "updated": response.get("LastModified").isoformat() if response.get("LastModified") else None,
                 "url": self.get_public_url(key),
+                "etag": response.get("ETag", "").strip('"') or None,
             }
         except Exception as e:
             logger.warning(f"Failed to get file info for {key}: {e}")
@@ -383,6 +448,334 @@ class S3Storage:
             logger.warning(f"Failed to download file {key}: {e}")
             return None
 
+    def download_range(self, key: str, start: int, end: int | None = None) -> bytes | None:
+        """Download a byte range of a file from S3.
+
+        Args:
+            key: Object key (path) in the bucket
+            start: First byte offset
+            end: Last byte offset, inclusive; None reads to the end of the file
+
+        Returns:
+            Requested bytes or None if not found
+        """
+        if not self._check_available():
+            return None
+
+        byte_range = f"bytes={start}-{'' if end is None else end}"
+        try:
+            response = self.client.get_object(
+                Bucket=self.bucket_name,
+                Key=key,
+                Range=byte_range,
+            )
+            return response["Body"].read()
+        except Exception as e:
+            logger.warning(f"Failed to download {byte_range} of {key}: {e}")
+            return None
+
+    def download_fileobj(
+        self,
+        key: str,
+        fileobj: BinaryIO,
+        part_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 8,
+    ) -> bool:
+        """Download a file from S3 into a file object with parallel ranged GETs.
+
+        This call blocks; run it in a thread from async code.
+
+        Args:
+            key: Object key (path) in the bucket
+            fileobj: Writable, seekable binary file
+            part_size: Bytes fetched per ranged GET
+            max_concurrency: Ranges downloaded in parallel
+
+        Returns:
+            True if the file was downloaded, False otherwise
+        """
+        if not self._check_available():
+            return False
+
+        from boto3.s3.transfer import TransferConfig
+
+        try:
+            self.client.download_fileobj(
+                self.bucket_name,
+                key,
+                fileobj,
+                Config=TransferConfig(
+                    multipart_threshold=part_size,
+                    multipart_chunksize=part_size,
+                    max_concurrency=max_concurrency,
+                    use_threads=True,
+                ),
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to download file {key}: {e}")
+            return False
+
+    def delete_files(self, keys: Iterable[str]) -> int:
+        """Delete many files from S3 with batched DeleteObjects requests.
+
+        Args:
+            keys: Object keys (paths) in the bucket
+
+        Returns:
+            Number of keys S3 reported as deleted
+        """
+        if not self._check_available():
+            return 0
+
+        keys = list(dict.fromkeys(keys))
+        deleted = 0
+        for i in range(0, len(keys), DELETE_BATCH_SIZE):
+            batch = keys[i:i + DELETE_BATCH_SIZE]
+            try:
+                response = self.client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": False},
+                )
+            except Exception as e:
+                logger.error(f"Failed to delete {len(batch)} files from S3: {e}")
+                continue
+            deleted += len(response.get("Deleted", []))
+            for error in response.get("Errors", []):
+                logger.error(f"Failed to delete {error.get('Key')} from S3: {error.get('Message')}")
+        return deleted
+
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Thread pool dedicated to blocking S3 calls.
+
+    Kept apart from the event loop's default executor so slow transfers
+    cannot starve other to_thread users.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.s3_max_workers,
+            thread_name_prefix="s3",
+        )
+    return _executor
+
+
+def shutdown_storage_executor() -> None:
+    """Stop the S3 thread pool, waiting for running transfers."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+
+class AsyncStorageInterface(Protocol):
+    """Protocol for storage implementations safe to await from request handlers."""
+
+    async def upload_file(self, key: str, data: bytes, content_type: str) -> str:
+        """Upload file to storage."""
+        ...
+
+    async def upload_fileobj(self, key: str, fileobj: BinaryIO, content_type: str) -> str:
+        """Upload a file object to storage with a multipart upload."""
+        ...
+
+    async def download_file(self, key: str) -> bytes | None:
+        """Download file content from storage."""
+        ...
+
+    async def download_fileobj(self, key: str, fileobj: BinaryIO) -> bool:
+        """Download a file into a file object with parallel ranged reads."""
+        ...
+
+    async def download_range(self, key: str, start: int, end: int | None = None) -> bytes | None:
+        """Download a byte range of a file."""
+        ...
+
+    async def delete_file(self, key: str) -> None:
+        """Delete file from storage."""
+        ...
+
+    async def delete_files(self, keys: Iterable[str]) -> int:
+        """Delete many files from storage."""
+        ...
+
+    async def file_exists(self, key: str) -> bool:
+        """Check if file exists in storage."""
+        ...
+
+    async def get_file_info(self, key: str) -> dict | None:
+        """Get file metadata."""
+        ...
+
+    async def head_files(self, keys: Iterable[str]) -> dict[str, dict | None]:
+        """Get metadata for many files."""
+        ...
+
+    async def list_files(
+        self,
+        prefix: str | None = None,
+        max_results: int | None = None,
+    ) -> list[dict]:
+        """List files in the bucket with optional prefix filter."""
+        ...
+
+
+class AsyncS3Storage:
+    """Async S3 storage running boto3 calls on a dedicated thread pool.
+
+    boto3 clients are thread-safe, so one S3Storage is shared by all
+    workers. Multipart transfers additionally fan out over boto3's own
+    transfer threads.
+    """
+
+    def __init__(self, storage: S3Storage) -> None:
+        self.storage = storage
+
+    @property
+    def bucket_name(self) -> str:
+        return self.storage.bucket_name
+
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking S3 call on the storage thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), partial(func, *args, **kwargs))
+
+    def generate_presigned_upload_url(
+        self,
+        key: str,
+        content_type: str,
+        expires_in: int = 3600,
+    ) -> dict[str, Any]:
+        """Generate presigned URL for file upload (signed locally, no I/O)."""
+        return self.storage.generate_presigned_upload_url(key, content_type, expires_in)
+
+    def generate_presigned_download_url(self, key: str, expires_in: int = 3600) -> str:
+        """Generate presigned URL for file download (signed locally, no I/O)."""
+        return self.storage.generate_presigned_download_url(key, expires_in)
+
+    def get_cdn_url(self, key: str) -> str:
+        """Get CDN URL for a file."""
+        return self.storage.get_cdn_url(key)
+
+    def get_public_url(self, key: str) -> str:
+        """Get public S3 URL for a file."""
+        return self.storage.get_public_url(key)
+
+    async def upload_file(self, key: str, data: bytes, content_type: str) -> str:
+        """Upload file to S3."""
+        return await self._run(self.storage.upload_file, key, data, content_type)
+
+    async def upload_fileobj(
+        self,
+        key: str,
+        fileobj: BinaryIO,
+        content_type: str,
+        part_size: int | None = None,
+        max_concurrency: int | None = None,
+    ) -> str:
+        """Upload a file object to S3 with a parallel multipart upload.
+
+        Raises:
+            Exception: If the upload fails
+        """
+        return await self._run(
+            self.storage.upload_fileobj,
+            key,
+            fileobj,
+            content_type,
+            part_size=part_size or settings.s3_part_size,
+            max_concurrency=max_concurrency or settings.s3_transfer_concurrency,
+        )
+
+    async def download_file(self, key: str) -> bytes | None:
+        """Download file content from S3."""
+        return await self._run(self.storage.download_file, key)
+
+    async def download_fileobj(
+        self,
+        key: str,
+        fileobj: BinaryIO,
+        part_size: int | None = None,
+        max_concurrency: int | None = None,
+    ) -> bool:
+        """Download a file from S3 into a file object with parallel ranged GETs."""
+        return await self._run(
+            self.storage.download_fileobj,
+            key,
+            fileobj,
+            part_size=part_size or settings.s3_part_size,
+            max_concurrency=max_concurrency or settings.s3_transfer_concurrency,
+        )
+
+    async def download_range(self, key: str, start: int, end: int | None = None) -> bytes | None:
+        """Download a byte range of a file from S3."""
+        return await self._run(self.storage.download_range, key, start, end)
+
+    async def make_public(self, key: str) -> str:
+        """Make a file publicly accessible and return its public URL."""
+        return await self._run(self.storage.make_public, key)
+
+    async def delete_file(self, key: str) -> None:
+        """Delete file from S3."""
+        await self._run(self.storage.delete_file, key)
+
+    async def delete_files(self, keys: Iterable[str]) -> int:
+        """Delete many files from S3, up to 1000 keys per request."""
+        return await self._run(self.storage.delete_files, list(keys))
+
+    async def file_exists(self, key: str) -> bool:
+        """Check if file exists in S3."""
+        return await self._run(self.storage.file_exists, key)
+
+    async def get_file_info(self, key: str) -> dict | None:
+        """Get file metadata from S3."""
+        return await self._run(self.storage.get_file_info, key)
+
+    async def head_files(self, keys: Iterable[str]) -> dict[str, dict | None]:
+        """Get metadata for many files with concurrent HEAD requests.
+
+        Returns:
+            Mapping of key to file info, or None for missing files
+        """
+        keys = list(dict.fromkeys(keys))
+        infos = await asyncio.gather(*(self.get_file_info(key) for key in keys))
+        return dict(zip(keys, infos, strict=True))
+
+    async def list_objects(
+        self,
+        prefix: str | None = None,
+        max_results: int | None = None,
+    ) -> list[dict]:
+        """List raw object summaries (Key, Size, LastModified, ETag) without HEADs."""
+        if not self.storage._check_available():
+            return []
+
+        try:
+            return await self._run(self.storage._list_objects, prefix, max_results)
+        except Exception as e:
+            logger.warning(f"Failed to list files in S3 bucket {self.bucket_name}: {e}")
+            return []
+
+    async def list_files(
+        self,
+        prefix: str | None = None,
+        max_results: int | None = None,
+    ) -> list[dict]:
+        """List files in the S3 bucket, fetching content types concurrently."""
+        objects = await self.list_objects(prefix, max_results)
+        infos = await self.head_files(obj["Key"] for obj in objects)
+        return [
+            self.storage._object_info(
+                obj,
+                (infos.get(obj["Key"]) or {}).get("content_type", "application/octet-stream"),
+            )
+            for obj in objects
+        ]
+
 
 # Pre-configured S3 storage instances
 creatives_storage = S3Storage(settings.s3_bucket_creatives)
@@ -399,6 +792,12 @@ s3_landing_pages_storage = landing_pages_storage
 s3_exports_storage = exports_storage
 s3_uploads_storage = uploads_storage
 
+# Async views of the same buckets for use from request handlers
+async_creatives_storage = AsyncS3Storage(creatives_storage)
+async_landing_pages_storage = AsyncS3Storage(landing_pages_storage)
+async_exports_storage = AsyncS3Storage(exports_storage)
+async_uploads_storage = AsyncS3Storage(uploads_storage)
+
 
 def get_storage_backend(storage_type: str = "creatives") -> S3Storage:
     """Get S3 storage backend instance.
@@ -2,6 +2,7 @@
 
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
 
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
@@ -19,8 +20,18 @@ from app.core.exception_handlers import (
     http_exception_handler,
     validation_exception_handler,
 )
+from app.core.orchestrator_client import close_orchestrator_client, orchestrator_client
 from app.core.rate_limit import RateLimitMiddleware
 from app.core.redis import close_redis
+from app.core.storage import shutdown_storage_executor
+from app.services.credit_config_cache import (
+    start_invalidation_listener,
+    stop_invalidation_listener,
+)
+from app.services.principal_cache import (
+    start_principal_listener,
+    stop_principal_listener,
+)
 
 
 @asynccontextmanager
@@ -28,8 +39,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan handler."""
     # Startup
     await init_db()
+    start_invalidation_listener()
+    start_principal_listener()
     yield
     # Shutdown
+    await stop_invalidation_listener()
+    await stop_principal_listener()
+    await close_orchestrator_client()
+    shutdown_storage_executor()
     await close_db()
     await close_redis()
 
@@ -82,6 +99,12 @@ async def health_check() -> dict[str, str]:
     return {"status": "healthy", "version": settings.app_version}
 
 
+@app.get("/health/orchestrator")
+async def orchestrator_client_stats() -> dict[str, Any]:
+    """AI Orchestrator connection pool and streaming latency metrics."""
+    return orchestrator_client.stats()
+
+
 @app.get("/")
 async def root() -> dict[str, str]:
     """Root endpoint."""
@@ -6,8 +6,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
 from app.core.security import decode_token
-from app.models.user import User
 from app.services.auth import AuthService
+from app.services.principal_cache import MCPPrincipal, principal_cache
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +42,7 @@ async def authenticate_mcp_request(
     token: str | None,
     db: AsyncSession,
     user_id: str | int | None = None,
-) -> User | None:
+) -> MCPPrincipal | None:
     """Authenticate an MCP request using JWT token or service token.
 
     MCP requests can use either:
@@ -50,7 +50,8 @@ async def authenticate_mcp_request(
     2. Service tokens for service-to-service communication (AI orchestrator)
 
     When using service tokens, user_id should be provided to identify
-    which user the operation is for.
+    which user the operation is for. Users are resolved through the
+    principal cache, so repeated calls for one user skip the database.
 
     Args:
         token: JWT token or service token (without "Bearer " prefix)
@@ -58,7 +59,7 @@ async def authenticate_mcp_request(
         user_id: Optional user ID for service token requests
 
     Returns:
-        Authenticated User or None for service token auth
+        Authenticated principal or None for service token auth
 
     Raises:
         MCPAuthError: If authentication fails
@@ -72,10 +73,11 @@ async def authenticate_mcp_request(
 
         # If user_id is provided, fetch the user
         if user_id:
-            auth_service = AuthService(db)
-            user = await auth_service.get_user_by_id(int(user_id))
-            if user:
-                return user
+            principal = await principal_cache.get(
+                int(user_id), AuthService(db).get_user_by_id
+            )
+            if principal:
+                return principal
 
         # For service token auth without user_id, return None
         # The tool handler should handle this case appropriately
@@ -94,14 +96,15 @@ async def authenticate_mcp_request(
     if not user_id_from_token:
         raise MCPAuthError("认证失败，请重新登录")
 
-    # Get user from database
-    auth_service = AuthService(db)
-    user = await auth_service.get_user_by_id(int(user_id_from_token))
+    # Get user from cache or database
+    principal = await principal_cache.get(
+        int(user_id_from_token), AuthService(db).get_user_by_id
+    )
 
-    if not user:
+    if not principal:
         raise MCPAuthError("认证失败，请重新登录")
 
-    return user
+    return principal
 
 
 def extract_token_from_header(authorization: str | None) -> str | None:
@@ -1,14 +1,85 @@
 """MCP Tool Registry for managing and discovering tools."""
 
+import hashlib
+import json
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from typing import Any
 
 from app.mcp.types import MCPToolDefinition, MCPToolParameter
+from app.mcp.validation import ParamValidator, compile_validator
 
 # Type alias for tool handler functions
 ToolHandler = Callable[..., Awaitable[Any]]
 
 
+@dataclass(frozen=True)
+class CompiledTool:
+    """A tool definition compiled once at registration."""
+
+    definition: MCPToolDefinition
+    # Standard MCP tools/list entry with the JSON Schema inputSchema
+    catalog_entry: dict[str, Any]
+    validator: ParamValidator
+
+
+@dataclass(frozen=True)
+class ToolCatalog:
+    """Serialized tools/list result shared by all requests."""
+
+    result: dict[str, Any]
+    payload: bytes
+    etag: str
+
+
+def build_input_schema(tool_def: MCPToolDefinition) -> dict[str, Any]:
+    """Build the JSON Schema for a tool's parameters."""
+    properties = {}
+    required = []
+
+    for param in tool_def.parameters:
+        param_schema: dict[str, Any] = {
+            "type": param.type,
+            "description": param.description,
+        }
+
+        # Add enum if present
+        if param.enum:
+            param_schema["enum"] = param.enum
+
+        # Add default if present
+        if param.default is not None:
+            param_schema["default"] = param.default
+
+        properties[param.name] = param_schema
+
+        if param.required:
+            required.append(param.name)
+
+    input_schema: dict[str, Any] = {
+        "type": "object",
+        "properties": properties,
+    }
+
+    if required:
+        input_schema["required"] = required
+
+    return input_schema
+
+
+def compile_tool(tool_def: MCPToolDefinition) -> CompiledTool:
+    """Compile a tool definition into its catalog entry and validator."""
+    return CompiledTool(
+        definition=tool_def,
+        catalog_entry={
+            "name": tool_def.name,
+            "description": tool_def.description,
+            "inputSchema": build_input_schema(tool_def),
+        },
+        validator=compile_validator(tool_def),
+    )
+
+
 class ToolRegistry:
     """Registry for MCP tools.
     
@@ -23,6 +94,8 @@ class ToolRegistry:
             cls._instance = super().__new__(cls)
             cls._instance._tools: dict[str, MCPToolDefinition] = {}
             cls._instance._handlers: dict[str, ToolHandler] = {}
+            cls._instance._compiled: dict[str, CompiledTool] = {}
+            cls._instance._catalog: ToolCatalog | None = None
         return cls._instance
 
     @classmethod
@@ -31,6 +104,8 @@ class ToolRegistry:
         if cls._instance:
             cls._instance._tools = {}
             cls._instance._handlers = {}
+            cls._instance._compiled = {}
+            cls._instance._catalog = None
 
     def register(
         self,
@@ -61,6 +136,8 @@ class ToolRegistry:
 
         self._tools[name] = tool_def
         self._handlers[name] = handler
+        self._compiled[name] = compile_tool(tool_def)
+        self._catalog = None
 
     def unregister(self, name: str) -> bool:
         """Unregister a tool.
@@ -74,6 +151,8 @@ class ToolRegistry:
         if name in self._tools:
             del self._tools[name]
             del self._handlers[name]
+            del self._compiled[name]
+            self._catalog = None
             return True
         return False
 
@@ -99,6 +178,40 @@ class ToolRegistry:
         """
         return self._handlers.get(name)
 
+    def get_validator(self, name: str) -> ParamValidator | None:
+        """Get the compiled parameter validator for a tool.
+
+        Args:
+            name: Tool name
+
+        Returns:
+            Validator function or None if not found
+        """
+        compiled = self._compiled.get(name)
+        return compiled.validator if compiled else None
+
+    def get_catalog(self) -> ToolCatalog:
+        """Get the tools/list result for all tools.
+
+        The result is serialized once and reused until a tool is
+        registered or unregistered. The ETag is a hash of the payload.
+
+        Returns:
+            ToolCatalog with the result, its JSON bytes and ETag
+        """
+        if self._catalog is None:
+            result = {
+                "tools": [
+                    self._compiled[t.name].catalog_entry for t in self.list_tools()
+                ]
+            }
+            payload = json.dumps(
+                result, ensure_ascii=False, separators=(",", ":")
+            ).encode()
+            etag = '"' + hashlib.sha256(payload).hexdigest()[:32] + '"'
+            self._catalog = ToolCatalog(result=result, payload=payload, etag=etag)
+        return self._catalog
+
     def list_tools(
         self,
         category: str | None = None,
@@ -13,9 +13,9 @@ from app.mcp.types import (
     MCPResponse,
     MCPToolDefinition,
 )
-from app.mcp.validation import ValidationError, validate_request_params
-from app.models.user import User
+from app.mcp.validation import ValidationError
 from app.services.credit import InsufficientCreditsError
+from app.services.principal_cache import MCPPrincipal
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +38,21 @@ class MCPServer:
         """
         self.db = db
         self.registry = ToolRegistry()
+        # Principals resolved by this server, shared by the calls of a batch
+        self._principals: dict[tuple[str | None, str | None], MCPPrincipal | None] = {}
+
+    async def _authenticate(
+        self,
+        token: str | None,
+        user_id: str | int | None,
+    ) -> MCPPrincipal | None:
+        """Authenticate once per (token, user_id) for this server."""
+        key = (token, None if user_id is None else str(user_id))
+        if key not in self._principals:
+            self._principals[key] = await authenticate_mcp_request(
+                token, self.db, user_id=user_id
+            )
+        return self._principals[key]
 
     async def list_tools(
         self,
@@ -81,12 +96,12 @@ class MCPServer:
                 )
 
             # Authenticate if required
-            user: User | None = None
+            user: MCPPrincipal | None = None
             if tool_def.requires_auth:
                 try:
                     # Extract user_id from request params for service token auth
                     user_id_param = request.params.get("user_id") if request.params else None
-                    user = await authenticate_mcp_request(token, self.db, user_id=user_id_param)
+                    user = await self._authenticate(token, user_id_param)
                 except MCPAuthError as e:
                     return MCPResponse.from_error(
                         code=MCPErrorCode.UNAUTHORIZED,
@@ -96,10 +111,8 @@ class MCPServer:
 
             # Validate parameters
             try:
-                validated_params = validate_request_params(
-                    request.params,
-                    tool_def,
-                )
+                validator = self.registry.get_validator(request.tool)
+                validated_params = validator(request.params)
             except ValidationError as e:
                 return MCPResponse.from_error(
                     code=e.code,
@@ -5,6 +5,9 @@ Implements tools for managing user credits:
 - check_credit: Check if user has sufficient credits
 - deduct_credit: Deduct credits for an operation
 - refund_credit: Refund credits for a failed operation
+- reserve_credit: Hold credits before an operation starts
+- settle_credit: Deduct the final cost of a reserved operation
+- release_credit: Release a reservation for a failed operation
 - get_credit_history: Get credit transaction history
 - get_credit_config: Get current credit configuration
 - estimate_credit: Estimate credit cost for an operation
@@ -19,6 +22,7 @@ from app.mcp.registry import tool
 from app.mcp.types import MCPToolParameter
 from app.schemas.credit import OperationType
 from app.services.credit import CreditService
+from app.services.credit_ledger import CreditLedger
 
 
 @tool(
@@ -201,6 +205,154 @@ async def refund_credit(
     }
 
 
+@tool(
+    name="reserve_credit",
+    description=(
+        "Hold credits for an operation that is about to start. Settle the reservation "
+        "with the final cost when it completes, or release it if it fails. "
+        "Replaces check_credit + deduct_credit."
+    ),
+    parameters=[
+        MCPToolParameter(
+            name="amount",
+            type="number",
+            description="Amount of credits to hold",
+            required=True,
+        ),
+        MCPToolParameter(
+            name="operation_type",
+            type="string",
+            description="Type of operation consuming credits",
+            required=True,
+            enum=[
+                "chat",
+                "image_generation",
+                "video_generation",
+                "landing_page",
+                "competitor_analysis",
+                "optimization_suggestion",
+            ],
+        ),
+        MCPToolParameter(
+            name="operation_id",
+            type="string",
+            description="Unique ID for the operation",
+            required=False,
+        ),
+        MCPToolParameter(
+            name="ttl_seconds",
+            type="integer",
+            description="Seconds before an unsettled hold is released",
+            required=False,
+            default=900,
+        ),
+    ],
+    category="credit",
+)
+async def reserve_credit(
+    user_id: int,
+    db: AsyncSession,
+    amount: float,
+    operation_type: str,
+    operation_id: str | None = None,
+    ttl_seconds: int = 900,
+) -> dict[str, Any]:
+    """Hold credits for an operation."""
+    ledger = CreditLedger(db)
+
+    # This will raise InsufficientCreditsError if not enough credits
+    reservation = await ledger.reserve(
+        user_id=user_id,
+        amount=Decimal(str(amount)),
+        operation_type=OperationType(operation_type),
+        operation_id=operation_id,
+        ttl=max(1, min(ttl_seconds, 86400)),
+    )
+
+    return {
+        "reservation_id": reservation["reservation_id"],
+        "amount": str(reservation["amount"]),
+        "available_after": str(reservation["available_after"]),
+        "expires_at": reservation["expires_at"].isoformat(),
+    }
+
+
+@tool(
+    name="settle_credit",
+    description="Deduct the final cost of a reserved operation and drop the hold.",
+    parameters=[
+        MCPToolParameter(
+            name="reservation_id",
+            type="string",
+            description="Reservation ID returned by reserve_credit",
+            required=True,
+        ),
+        MCPToolParameter(
+            name="amount",
+            type="number",
+            description="Final cost (defaults to the reserved amount)",
+            required=False,
+        ),
+        MCPToolParameter(
+            name="details",
+            type="object",
+            description="Additional details (model, tokens, etc.)",
+            required=False,
+        ),
+    ],
+    category="credit",
+)
+async def settle_credit(
+    user_id: int,
+    db: AsyncSession,
+    reservation_id: str,
+    amount: float | None = None,
+    details: dict | None = None,
+) -> dict[str, Any]:
+    """Settle a credit reservation."""
+    ledger = CreditLedger(db)
+
+    result = await ledger.settle(
+        user_id=user_id,
+        reservation_id=reservation_id,
+        amount=Decimal(str(amount)) if amount is not None else None,
+        details=details,
+    )
+
+    return {
+        "reservation_id": reservation_id,
+        "deducted": str(result["deducted"]),
+        "from_gifted": str(result["from_gifted"]),
+        "from_purchased": str(result["from_purchased"]),
+        "balance_after": str(result["balance_after"]),
+    }
+
+
+@tool(
+    name="release_credit",
+    description="Release a credit reservation without charging, e.g. when the operation failed.",
+    parameters=[
+        MCPToolParameter(
+            name="reservation_id",
+            type="string",
+            description="Reservation ID returned by reserve_credit",
+            required=True,
+        ),
+    ],
+    category="credit",
+)
+async def release_credit(
+    user_id: int,
+    db: AsyncSession,
+    reservation_id: str,
+) -> dict[str, Any]:
+    """Release a credit reservation."""
+    ledger = CreditLedger(db)
+    await ledger.release(user_id, reservation_id)
+
+    return {"reservation_id": reservation_id, "released": True}
+
+
 @tool(
     name="get_credit_history",
     description="Get the user's credit transaction history with pagination.",
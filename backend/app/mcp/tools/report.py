@@ -3,11 +3,13 @@
 Implements tools for managing advertising performance data:
 - get_reports: Get paginated metrics with filtering
 - get_metrics: Get aggregated metrics for a time period
+- get_entity_metrics: Get per-entity totals for many entities at once
+- get_entity_history: Get aligned daily series for many entities at once
 - save_metrics: Save metrics data from ad platforms
 - analyze_performance: Get trend analysis data
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from typing import Any
 
@@ -68,6 +70,14 @@ from app.services.report import ReportService
             description="End date (ISO format: YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)",
             required=False,
         ),
+        MCPToolParameter(
+            name="cursor",
+            type="string",
+            description=(
+                "next_cursor from a previous call, for fast deep pagination (page is ignored)"
+            ),
+            required=False,
+        ),
     ],
     category="report",
 )
@@ -81,6 +91,7 @@ async def get_reports(
     entity_id: str | None = None,
     start_date: str | None = None,
     end_date: str | None = None,
+    cursor: str | None = None,
 ) -> dict[str, Any]:
     """Get paginated report metrics."""
     # Validate page_size
@@ -109,6 +120,7 @@ async def get_reports(
         filters=filters,
         page=page,
         page_size=page_size,
+        cursor=cursor,
     )
 
     # Convert to serializable format
@@ -141,6 +153,7 @@ async def get_reports(
         "page": result["page"],
         "page_size": result["page_size"],
         "has_more": result["has_more"],
+        "next_cursor": result["next_cursor"],
     }
 
 
@@ -217,6 +230,166 @@ async def get_metrics(
     }
 
 
+@tool(
+    name="get_entity_metrics",
+    description=(
+        "Get per-entity totals (impressions, clicks, spend, conversions, revenue) and derived "
+        "CTR, CPC, CPA and ROAS for many campaigns, adsets or ads in one call."
+    ),
+    parameters=[
+        MCPToolParameter(
+            name="entity_type",
+            type="string",
+            description="Entity type of all requested entities",
+            required=True,
+            enum=["campaign", "adset", "ad"],
+        ),
+        MCPToolParameter(
+            name="entity_ids",
+            type="array",
+            description="Entity IDs to summarize (max 1000)",
+            required=True,
+        ),
+        MCPToolParameter(
+            name="start_date",
+            type="string",
+            description="Start date (ISO format). Defaults to 7 days ago.",
+            required=False,
+        ),
+        MCPToolParameter(
+            name="end_date",
+            type="string",
+            description="End date (ISO format). Defaults to now.",
+            required=False,
+        ),
+    ],
+    category="report",
+)
+async def get_entity_metrics(
+    user_id: int,
+    db: AsyncSession,
+    entity_type: str,
+    entity_ids: list[str],
+    start_date: str | None = None,
+    end_date: str | None = None,
+) -> dict[str, Any]:
+    """Get per-entity metric totals."""
+    if len(entity_ids) > 1000:
+        raise ValueError("At most 1000 entity IDs per call")
+
+    # Parse dates
+    parsed_start = None
+    parsed_end = None
+    if start_date:
+        parsed_start = datetime.fromisoformat(start_date.replace("Z", "+00:00"))
+    if end_date:
+        parsed_end = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
+
+    service = ReportService(db)
+    results = await service.get_entity_metrics(
+        user_id=user_id,
+        entity_type=EntityType(entity_type),
+        entity_ids=[str(entity_id) for entity_id in entity_ids],
+        start_date=parsed_start,
+        end_date=parsed_end,
+    )
+
+    return {
+        "entity_type": entity_type,
+        "metrics": {
+            entity_id: {
+                "impressions": m["impressions"],
+                "clicks": m["clicks"],
+                "spend": str(m["spend"]),
+                "conversions": m["conversions"],
+                "revenue": str(m["revenue"]),
+                "ctr": m["ctr"],
+                "cpc": str(m["cpc"]),
+                "cpa": str(m["cpa"]),
+                "roas": m["roas"],
+            }
+            for entity_id, m in results.items()
+        },
+    }
+
+
+@tool(
+    name="get_entity_history",
+    description=(
+        "Get daily history for many campaigns, adsets or ads in one call. Returns a shared "
+        "date axis and, per entity, one numeric column per metric aligned with it; days "
+        "without data are null."
+    ),
+    parameters=[
+        MCPToolParameter(
+            name="entity_type",
+            type="string",
+            description="Entity type of all requested entities",
+            required=True,
+            enum=["campaign", "adset", "ad"],
+        ),
+        MCPToolParameter(
+            name="entity_ids",
+            type="array",
+            description="Entity IDs to fetch (max 1000)",
+            required=True,
+        ),
+        MCPToolParameter(
+            name="start_date",
+            type="string",
+            description="First day (YYYY-MM-DD). Defaults to 7 days before end_date.",
+            required=False,
+        ),
+        MCPToolParameter(
+            name="end_date",
+            type="string",
+            description="Last day, inclusive (YYYY-MM-DD). Defaults to today.",
+            required=False,
+        ),
+    ],
+    category="report",
+)
+async def get_entity_history(
+    user_id: int,
+    db: AsyncSession,
+    entity_type: str,
+    entity_ids: list[str],
+    start_date: str | None = None,
+    end_date: str | None = None,
+) -> dict[str, Any]:
+    """Get columnar daily series for many entities."""
+    if len(entity_ids) > 1000:
+        raise ValueError("At most 1000 entity IDs per call")
+
+    parsed_start = date.fromisoformat(start_date[:10]) if start_date else None
+    parsed_end = date.fromisoformat(end_date[:10]) if end_date else None
+
+    service = ReportService(db)
+    history = await service.get_entity_daily_series(
+        user_id=user_id,
+        entity_type=EntityType(entity_type),
+        entity_ids=[str(entity_id) for entity_id in entity_ids],
+        start_date=parsed_start,
+        end_date=parsed_end,
+    )
+
+    # Columns are plain numbers so clients can load them into arrays directly
+    return {
+        "entity_type": entity_type,
+        "dates": [day.isoformat() for day in history["dates"]],
+        "series": {
+            entity_id: {
+                name: [
+                    float(value) if isinstance(value, Decimal) else value
+                    for value in values
+                ]
+                for name, values in columns.items()
+            }
+            for entity_id, columns in history["series"].items()
+        },
+    }
+
+
 @tool(
     name="save_metrics",
     description="Save metrics data from ad platforms. Used by Ad Performance module to store fetched data.",
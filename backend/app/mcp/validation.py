@@ -1,5 +1,6 @@
 """MCP request validation utilities."""
 
+from collections.abc import Callable
 from typing import Any
 
 from app.mcp.types import MCPErrorCode, MCPToolDefinition, MCPToolParameter
@@ -104,41 +105,127 @@ def validate_enum(value: Any, param: MCPToolParameter) -> Any:
     return value
 
 
+# Validates and coerces a tool's request parameters
+ParamValidator = Callable[[dict[str, Any]], dict[str, Any]]
+
+
+def _coerce_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.lower() in ("true", "1", "yes")
+    return bool(value)
+
+
+def _make_coercer(param: MCPToolParameter) -> Callable[[Any], Any] | None:
+    """Return the coercion function for a parameter type, or None."""
+    if param.type == "string":
+        return str
+    if param.type == "integer":
+        return int
+    if param.type == "number":
+        return float
+    if param.type == "boolean":
+        return _coerce_bool
+    if param.type in ("array", "object"):
+        expected = list if param.type == "array" else dict
+
+        def check_container(value: Any) -> Any:
+            if not isinstance(value, expected):
+                raise ValidationError(
+                    f"Parameter '{param.name}' must be an {param.type}",
+                    details={"parameter": param.name, "expected": param.type},
+                )
+            return value
+
+        return check_container
+    return None
+
+
+def compile_validator(tool_def: MCPToolDefinition) -> ParamValidator:
+    """Compile a tool's parameter definitions into a validator.
+
+    The type dispatch and enum lookups are resolved once, so validating
+    a call is a single pass over precomputed steps. The result matches
+    validate_param_type followed by validate_enum for every parameter.
+
+    Args:
+        tool_def: Tool definition with parameter specs
+
+    Returns:
+        Function validating and coercing request parameters
+
+    Raises:
+        ValidationError: From the returned function, if validation fails
+    """
+    steps = [
+        (
+            param,
+            _make_coercer(param),
+            frozenset(param.enum) if param.enum else None,
+            param.required and param.default is None,
+        )
+        for param in tool_def.parameters
+    ]
+
+    def validate(params: dict[str, Any]) -> dict[str, Any]:
+        validated = {}
+        for param, coerce, enum, required in steps:
+            value = params.get(param.name, param.default)
+
+            if value is None:
+                if required:
+                    raise ValidationError(
+                        f"Required parameter '{param.name}' is missing",
+                        details={"parameter": param.name},
+                    )
+                value = param.default
+            elif coerce is not None:
+                try:
+                    value = coerce(value)
+                except (ValueError, TypeError) as e:
+                    raise ValidationError(
+                        f"Parameter '{param.name}' has invalid type. Expected {param.type}",
+                        details={
+                            "parameter": param.name,
+                            "expected": param.type,
+                            "error": str(e),
+                        },
+                    )
+
+            if enum is not None and value is not None and str(value) not in enum:
+                raise ValidationError(
+                    f"Parameter '{param.name}' must be one of: {', '.join(param.enum)}",
+                    details={
+                        "parameter": param.name,
+                        "allowed_values": param.enum,
+                        "received": str(value),
+                    },
+                )
+
+            validated[param.name] = value
+        return validated
+
+    return validate
+
+
 def validate_request_params(
     params: dict[str, Any],
     tool_def: MCPToolDefinition,
 ) -> dict[str, Any]:
     """Validate request parameters against tool definition.
-    
+
+    Registered tools are validated with the validator compiled by the
+    ToolRegistry; this compiles one for ad hoc definitions.
+
     Args:
         params: Request parameters
         tool_def: Tool definition with parameter specs
-        
+
     Returns:
         Validated and coerced parameters
-        
+
     Raises:
         ValidationError: If validation fails
     """
-    validated = {}
-
-    # Check for unknown parameters
-    known_params = {p.name for p in tool_def.parameters}
-    unknown_params = set(params.keys()) - known_params
-    if unknown_params:
-        # Just ignore unknown params rather than error
-        pass
-
-    # Validate each defined parameter
-    for param in tool_def.parameters:
-        value = params.get(param.name, param.default)
-
-        # Type validation and coercion
-        value = validate_param_type(value, param)
-
-        # Enum validation
-        value = validate_enum(value, param)
-
-        validated[param.name] = value
-
-    return validated
+    return compile_validator(tool_def)(params)
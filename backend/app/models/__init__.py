@@ -11,6 +11,8 @@ from app.models.landing_page import LandingPage
 from app.models.message import Message
 from app.models.notification import Notification
 from app.models.report_metrics import ReportMetrics
+from app.models.report_metrics_archival import ReportMetricsArchival
+from app.models.report_metrics_rollup import ReportMetricsRollup
 from app.models.user import User
 
 __all__ = [
@@ -22,6 +24,8 @@ __all__ = [
     "LandingPage",
     "Message",
     "ReportMetrics",
+    "ReportMetricsArchival",
+    "ReportMetricsRollup",
     "CreditTransaction",
     "Notification",
     "CreditConfig",
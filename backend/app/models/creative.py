@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import BigInteger, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import BigInteger, DateTime, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.mysql import JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -18,7 +18,9 @@ class Creative(Base):
 
     __tablename__ = "creatives"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True
+    )
     user_id: Mapped[int] = mapped_column(
         BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -51,3 +53,13 @@ class Creative(Base):
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="creatives")
+
+    # Synced-status lookups by URL; file_url is too long for a full MySQL key
+    __table_args__ = (
+        Index(
+            "ix_creatives_user_file_url",
+            "user_id",
+            "file_url",
+            mysql_length={"file_url": 255},
+        ),
+    )
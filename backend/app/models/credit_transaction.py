@@ -4,7 +4,16 @@ from datetime import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Numeric, String
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    UniqueConstraint,
+)
 from sqlalchemy.dialects.mysql import JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -19,7 +28,9 @@ class CreditTransaction(Base):
 
     __tablename__ = "credit_transactions"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True
+    )
     user_id: Mapped[int] = mapped_column(
         BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -46,6 +57,8 @@ class CreditTransaction(Base):
         String(100), nullable=True
     )  # 'generate_creative', 'chat', etc.
     operation_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # Credit ledger reservation settled by this transaction, if any
+    reservation_id: Mapped[str | None] = mapped_column(String(32), nullable=True)
     details: Mapped[dict] = mapped_column(JSON, default=dict)  # Model, tokens, etc.
 
     # Metadata
@@ -60,4 +73,6 @@ class CreditTransaction(Base):
     __table_args__ = (
         Index("ix_credit_transactions_user_created", "user_id", "created_at"),
         Index("ix_credit_transactions_type", "type"),
+        # A reservation is settled at most once, even if a flush is retried
+        UniqueConstraint("reservation_id", name="uq_credit_transactions_reservation"),
     )
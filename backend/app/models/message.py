@@ -3,7 +3,16 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, String, Text
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.dialects.mysql import JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
@@ -18,7 +27,9 @@ class Message(Base):
 
     __tablename__ = "messages"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True
+    )
     conversation_id: Mapped[int] = mapped_column(
         BigInteger, ForeignKey("conversations.id", ondelete="CASCADE"),
         nullable=False, index=True
@@ -70,6 +81,11 @@ class Message(Base):
     # Indexes for efficient querying
     __table_args__ = (
         Index("ix_messages_conversation_created", "conversation_id", "created_at"),
+        # Client IDs are unique per conversation so appends are idempotent
+        UniqueConstraint(
+            "conversation_id", "client_message_id",
+            name="uq_messages_conversation_client_id",
+        ),
     )
 
     @validates('process_info', 'tool_calls', 'generated_assets', 'attachments', 'message_metadata')
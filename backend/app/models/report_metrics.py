@@ -3,7 +3,16 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import BigInteger, DateTime, Float, Index, Integer, Numeric, String
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
@@ -14,7 +23,9 @@ class ReportMetrics(Base):
 
     __tablename__ = "report_metrics"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True
+    )
     timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
     user_id: Mapped[int] = mapped_column(BigInteger, nullable=False, index=True)
     ad_account_id: Mapped[int] = mapped_column(BigInteger, nullable=False, index=True)
@@ -53,4 +64,12 @@ class ReportMetrics(Base):
         Index("ix_report_metrics_user_timestamp", "user_id", "timestamp"),
         Index("ix_report_metrics_account_timestamp", "ad_account_id", "timestamp"),
         Index("ix_report_metrics_entity", "entity_type", "entity_id", "timestamp"),
+        # One row per entity per timestamp; target of bulk upserts
+        UniqueConstraint(
+            "user_id",
+            "entity_type",
+            "entity_id",
+            "timestamp",
+            name="uq_report_metrics_user_entity_timestamp",
+        ),
     )
@@ -0,0 +1,34 @@
+"""Report Metrics archival run database model."""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class ReportMetricsArchival(Base):
+    """A run of report metrics archival for one user.
+
+    The user's raw rows older than archived_before were deleted while their
+    rollups were kept. Rows in that period can no longer be subtracted from
+    the rollups, so the user's writes before the latest archived_before are
+    rejected. Runs recorded without a user apply to every user.
+    """
+
+    __tablename__ = "report_metrics_archivals"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True
+    )
+    user_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    archived_before: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    archived_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+
+    __table_args__ = (
+        Index("ix_report_metrics_archivals_user_before", "user_id", "archived_before"),
+    )
@@ -0,0 +1,74 @@
+"""Report Metrics rollup database model."""
+
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Float,
+    Integer,
+    Numeric,
+    String,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class ReportMetricsRollup(Base):
+    """Pre-aggregated report metrics per entity and time bucket.
+
+    Maintained incrementally whenever report_metrics rows are written or
+    deleted. Each row summarizes all raw rows of one entity within one
+    hour, day or month bucket.
+    """
+
+    __tablename__ = "report_metrics_rollups"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True
+    )
+    granularity: Mapped[str] = mapped_column(
+        String(10), nullable=False
+    )  # 'hour', 'day', 'month'
+    bucket_start: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    user_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    ad_account_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    # Entity info
+    entity_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    entity_id: Mapped[str] = mapped_column(String(255), nullable=False)
+
+    # Summed metrics
+    impressions: Mapped[int] = mapped_column(BigInteger, default=0)
+    clicks: Mapped[int] = mapped_column(BigInteger, default=0)
+    spend: Mapped[Decimal] = mapped_column(Numeric(14, 2), default=Decimal("0.00"))
+    conversions: Mapped[int] = mapped_column(BigInteger, default=0)
+    revenue: Mapped[Decimal] = mapped_column(Numeric(14, 2), default=Decimal("0.00"))
+
+    # Sums of per-row derived metrics, so averages match raw-row averages
+    row_count: Mapped[int] = mapped_column(Integer, default=0)
+    ctr_sum: Mapped[float] = mapped_column(Float, default=0.0)
+    cpc_sum: Mapped[Decimal] = mapped_column(Numeric(14, 2), default=Decimal("0.00"))
+    cpa_sum: Mapped[Decimal] = mapped_column(Numeric(14, 2), default=Decimal("0.00"))
+    roas_sum: Mapped[float] = mapped_column(Float, default=0.0)
+
+    # Metadata
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
+
+    # Leading (user_id, granularity, bucket_start) serves range scans
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id",
+            "granularity",
+            "bucket_start",
+            "ad_account_id",
+            "entity_type",
+            "entity_id",
+            name="uq_report_metrics_rollups_bucket",
+        ),
+    )
@@ -39,6 +39,9 @@ class User(Base):
     purchased_credits: Mapped[Decimal] = mapped_column(
         Numeric(10, 2), default=Decimal("0.00")
     )
+    # Bumped by every direct balance change so the credit ledger can tell
+    # which changes a cached balance already includes
+    credit_version: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
 
     # Settings
     language: Mapped[str] = mapped_column(String(10), default="en")
@@ -69,6 +69,8 @@ from app.schemas.report import (
     ArchivalResult,
     EntityType,
     MetricsBatchCreate,
+    MetricsBulkCreate,
+    MetricsBulkResult,
     MetricsCreate,
     MetricsFilter,
     MetricsListResponse,
@@ -143,6 +145,8 @@ __all__ = [
     "ArchivalResult",
     "EntityType",
     "MetricsBatchCreate",
+    "MetricsBulkCreate",
+    "MetricsBulkResult",
     "MetricsCreate",
     "MetricsFilter",
     "MetricsListResponse",
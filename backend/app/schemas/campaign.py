@@ -95,10 +95,11 @@ class CampaignListResponse(BaseModel):
     """Response for listing campaigns."""
 
     items: list[CampaignResponse]
-    total: int
+    total: int | None  # None in cursor mode unless include_total is set
     page: int
     page_size: int
     has_more: bool
+    next_cursor: str | None = None
 
 
 class CampaignFilter(BaseModel):
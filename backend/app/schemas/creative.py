@@ -70,10 +70,11 @@ class CreativeListResponse(BaseModel):
     """Response for listing creatives."""
 
     items: list[CreativeResponse]
-    total: int
+    total: int | None  # None in cursor mode unless include_total is set
     page: int
     page_size: int
     has_more: bool
+    next_cursor: str | None = None
 
 
 class CreativeFilter(BaseModel):
@@ -121,8 +122,8 @@ class BucketSyncRequest(BaseModel):
     file_keys: list[str] = Field(
         ...,
         min_length=1,
-        max_length=50,
-        description="List of file keys to sync (max 50)",
+        max_length=500,
+        description="List of file keys to sync (max 500)",
     )
 
 
@@ -177,3 +177,85 @@ class SystemCreditRefundResponse(BaseModel):
     transaction_id: int | None = None
     refunded: Decimal
     balance_after: Decimal
+
+
+class SystemCreditDeductBatchRequest(BaseModel):
+    """Request to deduct many token-usage charges at once (system-level)."""
+
+    deductions: list[SystemCreditDeductRequest] = Field(
+        ..., min_length=1, max_length=1000, description="Deductions to apply"
+    )
+
+
+class SystemCreditDeductBatchItem(BaseModel):
+    """Result of one deduction in a batch (system-level)."""
+
+    success: bool
+    operation_id: str | None = None
+    transaction_id: int | None = None
+    deducted: Decimal = Decimal("0")
+    balance_after: Decimal | None = None
+    error: str | None = None
+
+
+class SystemCreditDeductBatchResponse(BaseModel):
+    """Response for a batch of deductions (system-level)."""
+
+    results: list[SystemCreditDeductBatchItem]
+    succeeded: int
+    failed: int
+
+
+class CreditReserveRequest(BaseModel):
+    """Request to hold credits before an operation (system-level)."""
+
+    user_id: str = Field(..., description="User ID")
+    amount: Decimal = Field(..., gt=0, description="Amount of credits to hold")
+    operation_type: str = Field(..., description="Type of operation")
+    operation_id: str | None = Field(None, description="Unique operation ID")
+    ttl_seconds: int = Field(
+        900, ge=1, le=86400, description="Seconds before the hold is released"
+    )
+
+
+class CreditReserveResponse(BaseModel):
+    """Response for a credit reservation (system-level)."""
+
+    reservation_id: str
+    amount: Decimal
+    available_after: Decimal
+    expires_at: datetime
+
+
+class CreditSettleRequest(BaseModel):
+    """Request to settle a reservation (system-level)."""
+
+    user_id: str = Field(..., description="User ID")
+    reservation_id: str = Field(..., description="Reservation ID")
+    amount: Decimal | None = Field(
+        None, ge=0, description="Final cost (defaults to the reserved amount)"
+    )
+    details: dict = Field(default_factory=dict, description="Additional details")
+
+
+class CreditSettleResponse(BaseModel):
+    """Response for a settled reservation (system-level)."""
+
+    success: bool
+    deducted: Decimal
+    from_gifted: Decimal
+    from_purchased: Decimal
+    balance_after: Decimal
+
+
+class CreditReleaseRequest(BaseModel):
+    """Request to release a reservation (system-level)."""
+
+    user_id: str = Field(..., description="User ID")
+    reservation_id: str = Field(..., description="Reservation ID")
+
+
+class CreditReleaseResponse(BaseModel):
+    """Response for a released reservation (system-level)."""
+
+    success: bool
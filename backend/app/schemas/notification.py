@@ -29,6 +29,7 @@ class NotificationCategory(str, Enum):
     BUDGET_EXHAUSTED = "budget_exhausted"
     AD_PAUSED = "ad_paused"
     OPTIMIZATION_SUGGESTION = "optimization_suggestion"
+    PERFORMANCE_ANOMALY = "performance_anomaly"
     WEEKLY_SUMMARY = "weekly_summary"
     NEW_FEATURE = "new_feature"
     SYSTEM_MAINTENANCE = "system_maintenance"
@@ -61,6 +62,7 @@ class NotificationListResponse(BaseModel):
     items: list[NotificationResponse]
     total: int
     unread_count: int
+    next_cursor: str | None = None
 
 
 class NotificationUnreadCountResponse(BaseModel):
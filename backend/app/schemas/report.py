@@ -36,6 +36,23 @@ class MetricsBatchCreate(BaseModel):
     metrics: list[MetricsCreate] = Field(..., min_length=1, max_length=1000)
 
 
+class MetricsBulkCreate(BaseModel):
+    """Schema for bulk ingesting metrics (platform syncs)."""
+
+    metrics: list[MetricsCreate] = Field(..., min_length=1, max_length=50000)
+    upsert: bool = Field(
+        default=False,
+        description="Update existing rows with the same entity and timestamp",
+    )
+
+
+class MetricsBulkResult(BaseModel):
+    """Result of a bulk metrics ingest."""
+
+    count: int
+    upsert: bool
+
+
 class MetricsResponse(BaseModel):
     """Metrics response schema."""
 
@@ -65,10 +82,11 @@ class MetricsListResponse(BaseModel):
     """Response for listing metrics."""
 
     items: list[MetricsResponse]
-    total: int
+    total: int | None  # None in cursor mode unless include_total is set
     page: int
     page_size: int
     has_more: bool
+    next_cursor: str | None = None
 
 
 class MetricsFilter(BaseModel):
@@ -1,5 +1,6 @@
 """Account deletion service for GDPR compliance."""
 
+import asyncio
 import logging
 from datetime import UTC, datetime
 from typing import Any
@@ -8,7 +9,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.storage import S3Storage
+from app.core.storage import AsyncS3Storage, S3Storage
 from app.models.ad_account import AdAccount
 from app.models.campaign import Campaign
 from app.models.creative import Creative
@@ -18,6 +19,7 @@ from app.models.notification import Notification
 from app.models.report_metrics import ReportMetrics
 from app.models.user import User
 from app.services.email import EmailService, EmailTemplate
+from app.services.principal_cache import invalidate_principal_on_commit
 
 logger = logging.getLogger(__name__)
 
@@ -34,9 +36,11 @@ class AccountDeletionService:
         """Initialize account deletion service."""
         self.db = db
         self.email_service = EmailService()
-        self.creatives_storage = S3Storage(settings.s3_bucket_creatives)
-        self.landing_pages_storage = S3Storage(settings.s3_bucket_landing_pages)
-        self.exports_storage = S3Storage(settings.s3_bucket_exports)
+        self.creatives_storage = AsyncS3Storage(S3Storage(settings.s3_bucket_creatives))
+        self.landing_pages_storage = AsyncS3Storage(
+            S3Storage(settings.s3_bucket_landing_pages)
+        )
+        self.exports_storage = AsyncS3Storage(S3Storage(settings.s3_bucket_exports))
 
     async def delete_user_account(self, user: User) -> dict[str, Any]:
         """
@@ -93,6 +97,7 @@ class AccountDeletionService:
             # Step 4: Delete database records (with transaction)
             # The User model has cascade="all, delete-orphan" on relationships,
             # so deleting the user will cascade to all related records
+            invalidate_principal_on_commit(self.db, user.id)
             await self.db.delete(user)
             await self.db.flush()
             
@@ -202,31 +207,27 @@ class AccountDeletionService:
         deletion_summary: dict[str, Any]
     ) -> None:
         """Delete all S3 files for a user."""
-        # Delete creative files
-        for key in s3_files["creatives"]:
-            try:
-                self.creatives_storage.delete_file(key)
-                deletion_summary["s3_files_deleted"]["creatives"] += 1
-                logger.debug(f"Deleted creative file: {key}")
-            except Exception as e:
-                logger.warning(f"Failed to delete creative file {key}: {e}")
+        # Delete creative and landing page files in batched requests
+        if s3_files["creatives"]:
+            deleted_count = await self.creatives_storage.delete_files(s3_files["creatives"])
+            deletion_summary["s3_files_deleted"]["creatives"] += deleted_count
+            logger.debug(f"Deleted {deleted_count} creative files")
 
-        # Delete landing page files
-        for key in s3_files["landing_pages"]:
-            try:
-                self.landing_pages_storage.delete_file(key)
-                deletion_summary["s3_files_deleted"]["landing_pages"] += 1
-                logger.debug(f"Deleted landing page file: {key}")
-            except Exception as e:
-                logger.warning(f"Failed to delete landing page file {key}: {e}")
+        if s3_files["landing_pages"]:
+            deleted_count = await self.landing_pages_storage.delete_files(
+                s3_files["landing_pages"]
+            )
+            deletion_summary["s3_files_deleted"]["landing_pages"] += deleted_count
+            logger.debug(f"Deleted {deleted_count} landing page files")
 
         # Delete export files (prefix-based)
         for prefix in s3_files["exports"]:
             try:
                 # List and delete all files with this prefix
-                deleted_count = self._delete_files_by_prefix(
-                    self.exports_storage,
-                    prefix
+                deleted_count = await asyncio.to_thread(
+                    self._delete_files_by_prefix,
+                    self.exports_storage.storage,
+                    prefix,
                 )
                 deletion_summary["s3_files_deleted"]["exports"] += deleted_count
                 logger.debug(f"Deleted {deleted_count} export files with prefix: {prefix}")
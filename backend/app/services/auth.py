@@ -17,6 +17,7 @@ from app.schemas.auth import (
     TokenResponse,
     UserResponse,
 )
+from app.services.principal_cache import invalidate_principal_on_commit
 
 
 class AuthService:
@@ -104,6 +105,7 @@ class AuthService:
             # Auto-approve super admins
             if is_super_admin(user.email) and not user.is_approved:
                 user.is_approved = True
+                invalidate_principal_on_commit(self.db, user.id)
 
             await self.db.flush()
             return user, False
@@ -124,6 +126,7 @@ class AuthService:
             # Auto-approve super admins
             if is_super_admin(existing_user.email) and not existing_user.is_approved:
                 existing_user.is_approved = True
+                invalidate_principal_on_commit(self.db, existing_user.id)
 
             await self.db.flush()
             return existing_user, False
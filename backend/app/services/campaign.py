@@ -6,6 +6,7 @@ from typing import Any
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import cached_count, encode_cursor, fetch_keyset_page
 from app.models.ad_account import AdAccount
 from app.models.campaign import Campaign
 from app.schemas.campaign import (
@@ -136,17 +137,28 @@ class CampaignService:
         filters: CampaignFilter | None = None,
         page: int = 1,
         page_size: int = 20,
+        cursor: str | None = None,
+        include_total: bool = False,
     ) -> dict[str, Any]:
         """Get paginated list of campaigns.
 
+        With a cursor, keyset pagination on (created_at, id) is used and
+        the total is only returned, cached, when include_total is set.
+
         Args:
             user_id: Owner user ID
             filters: Optional filter criteria
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), ignored when cursor is given
             page_size: Number of items per page
+            cursor: Cursor of the previous page for keyset pagination
+            include_total: Return a cached total in cursor mode
 
         Returns:
-            Dictionary with campaigns, total, page, page_size, has_more
+            Dictionary with campaigns, total, page, page_size, has_more,
+            next_cursor
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
         """
         # Base query - exclude deleted campaigns by default
         query = select(Campaign).where(
@@ -167,6 +179,27 @@ class CampaignService:
             if filters.ad_account_id:
                 query = query.where(Campaign.ad_account_id == filters.ad_account_id)
 
+        if cursor is not None:
+            total = None
+            if include_total:
+                filters_key = filters.model_dump_json() if filters else ""
+                total = await cached_count(
+                    self.db, query, f"campaigns:{user_id}:{filters_key}"
+                )
+
+            campaigns, next_cursor = await fetch_keyset_page(
+                self.db, query, Campaign.created_at, cursor, page_size
+            )
+
+            return {
+                "campaigns": campaigns,
+                "total": total,
+                "page": page,
+                "page_size": page_size,
+                "has_more": next_cursor is not None,
+                "next_cursor": next_cursor,
+            }
+
         # Get total count
         count_query = select(func.count()).select_from(query.subquery())
         count_result = await self.db.execute(count_query)
@@ -174,17 +207,27 @@ class CampaignService:
 
         # Apply pagination and ordering
         offset = (page - 1) * page_size
-        query = query.order_by(Campaign.created_at.desc()).offset(offset).limit(page_size)
+        query = (
+            query.order_by(Campaign.created_at.desc(), Campaign.id.desc())
+            .offset(offset)
+            .limit(page_size)
+        )
 
         result = await self.db.execute(query)
         campaigns = list(result.scalars().all())
+        has_more = offset + len(campaigns) < total
 
         return {
             "campaigns": campaigns,
             "total": total,
             "page": page,
             "page_size": page_size,
-            "has_more": offset + len(campaigns) < total,
+            "has_more": has_more,
+            "next_cursor": (
+                encode_cursor(campaigns[-1].created_at, campaigns[-1].id)
+                if has_more and campaigns
+                else None
+            ),
         }
 
 
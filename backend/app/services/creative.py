@@ -1,13 +1,17 @@
 """Creative service for managing advertising assets."""
 
+import json
+import logging
 import uuid
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.storage import creatives_storage
+from app.core.pagination import cached_count, encode_cursor, fetch_keyset_page
+from app.core.redis import get_redis
+from app.core.storage import async_creatives_storage, creatives_storage
 from app.models.creative import Creative
 from app.schemas.creative import (
     CreativeCreate,
@@ -16,6 +20,15 @@ from app.schemas.creative import (
     CreativeUpdate,
 )
 
+logger = logging.getLogger(__name__)
+
+# Redis key prefix for per-user bucket listings (content types + watermark)
+BUCKET_INDEX_KEY_PREFIX = "creative_bucket_index:"
+BUCKET_INDEX_TTL = 7 * 86400
+
+# URLs per IN (...) when checking synced status
+SYNC_LOOKUP_CHUNK_SIZE = 500
+
 
 class CreativeNotFoundError(Exception):
     """Raised when creative is not found."""
@@ -129,17 +142,28 @@ class CreativeService:
         filters: CreativeFilter | None = None,
         page: int = 1,
         page_size: int = 20,
+        cursor: str | None = None,
+        include_total: bool = False,
     ) -> dict[str, Any]:
         """Get paginated list of creatives.
 
+        With a cursor, keyset pagination on (created_at, id) is used and
+        the total is only returned, cached, when include_total is set.
+
         Args:
             user_id: Owner user ID
             filters: Optional filter criteria
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), ignored when cursor is given
             page_size: Number of items per page
+            cursor: Cursor of the previous page for keyset pagination
+            include_total: Return a cached total in cursor mode
 
         Returns:
-            Dictionary with creatives, total, page, page_size, has_more
+            Dictionary with creatives, total, page, page_size, has_more,
+            next_cursor
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
         """
         # Base query
         query = select(Creative).where(Creative.user_id == user_id)
@@ -163,6 +187,27 @@ class CreativeService:
             # Default to active creatives only
             query = query.where(Creative.status == CreativeStatus.ACTIVE.value)
 
+        if cursor is not None:
+            total = None
+            if include_total:
+                filters_key = filters.model_dump_json() if filters else ""
+                total = await cached_count(
+                    self.db, query, f"creatives:{user_id}:{filters_key}"
+                )
+
+            creatives, next_cursor = await fetch_keyset_page(
+                self.db, query, Creative.created_at, cursor, page_size
+            )
+
+            return {
+                "creatives": creatives,
+                "total": total,
+                "page": page,
+                "page_size": page_size,
+                "has_more": next_cursor is not None,
+                "next_cursor": next_cursor,
+            }
+
         # Get total count
         count_query = select(func.count()).select_from(query.subquery())
         count_result = await self.db.execute(count_query)
@@ -170,17 +215,27 @@ class CreativeService:
 
         # Apply pagination and ordering
         offset = (page - 1) * page_size
-        query = query.order_by(Creative.created_at.desc()).offset(offset).limit(page_size)
+        query = (
+            query.order_by(Creative.created_at.desc(), Creative.id.desc())
+            .offset(offset)
+            .limit(page_size)
+        )
 
         result = await self.db.execute(query)
         creatives = list(result.scalars().all())
+        has_more = offset + len(creatives) < total
 
         return {
             "creatives": creatives,
             "total": total,
             "page": page,
             "page_size": page_size,
-            "has_more": offset + len(creatives) < total,
+            "has_more": has_more,
+            "next_cursor": (
+                encode_cursor(creatives[-1].created_at, creatives[-1].id)
+                if has_more and creatives
+                else None
+            ),
         }
 
     async def update(
@@ -248,7 +303,7 @@ class CreativeService:
             try:
                 file_key = self._extract_s3_key(creative.file_url)
                 if file_key:
-                    creatives_storage.delete_file(file_key)
+                    await async_creatives_storage.delete_file(file_key)
             except Exception:
                 # Log but don't fail if S3 deletion fails
                 pass
@@ -352,13 +407,17 @@ class CreativeService:
         )
         return list(result.scalars().all())
 
-    def list_bucket_files(
+    async def list_bucket_files(
         self,
         user_id: int,
         file_types: list[str] | None = None,
     ) -> list[dict]:
         """List files in user's S3 uploads bucket.
 
+        Content types need a HEAD per object, so they are kept in a Redis
+        index per user; only objects modified after the index watermark,
+        or missing from it, are HEADed again.
+
         Args:
             user_id: User ID
             file_types: Optional list of file type prefixes to filter (e.g., ['image/', 'video/'])
@@ -368,7 +427,43 @@ class CreativeService:
         """
         # All creative files are stored in creatives bucket at: users/{user_id}/
         prefix = f"users/{user_id}/"
-        files = creatives_storage.list_files(prefix=prefix)
+        objects = await async_creatives_storage.list_objects(prefix=prefix)
+
+        index = await self._load_bucket_index(user_id)
+        known: dict[str, str] = index.get("content_types", {})
+        watermark = (
+            datetime.fromisoformat(index["watermark"]) if index.get("watermark") else None
+        )
+
+        stale = [
+            obj["Key"]
+            for obj in objects
+            if obj["Key"] not in known
+            or watermark is None
+            or obj["LastModified"] > watermark
+        ]
+        infos = await async_creatives_storage.head_files(stale)
+
+        content_types = {}
+        files = []
+        for obj in objects:
+            key = obj["Key"]
+            if key in infos:
+                info = infos[key] or {}
+                content_types[key] = info.get("content_type", "application/octet-stream")
+            else:
+                content_types[key] = known[key]
+            files.append({
+                "name": key,
+                "size": obj["Size"],
+                "content_type": content_types[key],
+                "updated": obj["LastModified"].isoformat() if obj.get("LastModified") else None,
+                "url": async_creatives_storage.get_public_url(key),
+            })
+
+        if stale or len(content_types) != len(known):
+            latest = max((obj["LastModified"] for obj in objects), default=watermark)
+            await self._save_bucket_index(user_id, content_types, latest)
 
         # Filter by file type if specified
         if file_types:
@@ -382,21 +477,68 @@ class CreativeService:
 
         return files
 
-    async def get_synced_file_urls(self, user_id: int) -> set[str]:
+    async def _load_bucket_index(self, user_id: int) -> dict[str, Any]:
+        """Load the cached content types and watermark for a user's bucket prefix."""
+        try:
+            redis = await get_redis()
+            data = await redis.get(f"{BUCKET_INDEX_KEY_PREFIX}{user_id}")
+            return json.loads(data) if data else {}
+        except Exception as e:
+            logger.warning(f"Failed to load bucket index for user {user_id}: {e}")
+            return {}
+
+    async def _save_bucket_index(
+        self,
+        user_id: int,
+        content_types: dict[str, str],
+        watermark: datetime | None,
+    ) -> None:
+        """Store content types and the newest LastModified seen for a user."""
+        index = {
+            "watermark": watermark.isoformat() if watermark else None,
+            "content_types": content_types,
+        }
+        try:
+            redis = await get_redis()
+            await redis.set(
+                f"{BUCKET_INDEX_KEY_PREFIX}{user_id}",
+                json.dumps(index),
+                ex=BUCKET_INDEX_TTL,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to save bucket index for user {user_id}: {e}")
+
+    async def get_synced_file_urls(
+        self,
+        user_id: int,
+        file_urls: list[str] | None = None,
+    ) -> set[str]:
         """Get set of file URLs that are already synced to database.
 
         Args:
             user_id: User ID
+            file_urls: Only check these URLs (uses the (user_id, file_url)
+                index); None loads every synced URL
 
         Returns:
             Set of file URLs
         """
-        result = await self.db.execute(
+        query = (
             select(Creative.file_url)
             .where(Creative.user_id == user_id)
             .where(Creative.status == CreativeStatus.ACTIVE.value)
         )
-        return {row[0] for row in result.fetchall()}
+        if file_urls is None:
+            result = await self.db.execute(query)
+            return {row[0] for row in result.fetchall()}
+
+        synced: set[str] = set()
+        urls = list(dict.fromkeys(file_urls))
+        for i in range(0, len(urls), SYNC_LOOKUP_CHUNK_SIZE):
+            chunk = urls[i:i + SYNC_LOOKUP_CHUNK_SIZE]
+            result = await self.db.execute(query.where(Creative.file_url.in_(chunk)))
+            synced.update(row[0] for row in result.fetchall())
+        return synced
 
     async def sync_file_from_bucket(
         self,
@@ -412,54 +554,107 @@ class CreativeService:
         Returns:
             Dict with success status and creative_id or error
         """
-        try:
-            # Get file info from creatives bucket
-            file_info = creatives_storage.get_file_info(file_key)
+        return (await self.sync_files_from_bucket(user_id, [file_key]))[0]
 
-            if not file_info:
-                return {"success": False, "error": "File not found in bucket"}
+    async def sync_files_from_bucket(
+        self,
+        user_id: int,
+        file_keys: list[str],
+    ) -> list[dict]:
+        """Sync files from S3 bucket to creatives database in bulk.
+
+        Objects are HEADed concurrently, synced status is checked with one
+        indexed lookup, and new creatives are written with a single
+        multi-row insert.
+
+        Args:
+            user_id: User ID
+            file_keys: S3 file keys
 
+        Returns:
+            Dicts with success status and creative_id or error, one per key
+        """
+        results: dict[str, dict] = {}
+        owned = []
+        for file_key in dict.fromkeys(file_keys):
             # Validate file belongs to user (format: users/{user_id}/...)
-            if not file_key.startswith(f"users/{user_id}/"):
-                return {"success": False, "error": "File does not belong to user"}
-
-            # Check if already synced
-            file_url = file_info["url"]
-            synced_urls = await self.get_synced_file_urls(user_id)
-            if file_url in synced_urls:
-                return {"success": False, "error": "File already synced"}
-
-            # Determine file type from content_type
-            content_type = file_info.get("content_type", "")
-            if content_type.startswith("image/"):
-                file_type = "image"
-            elif content_type.startswith("video/"):
-                file_type = "video"
-            elif content_type.startswith("audio/"):
-                file_type = "audio"
+            if file_key.startswith(f"users/{user_id}/"):
+                owned.append(file_key)
             else:
-                file_type = "image"  # Default to image
-
-            # Extract filename from key for name
-            filename = file_key.split("/")[-1] if "/" in file_key else file_key
-
-            # Create creative record
-            creative = Creative(
-                user_id=user_id,
-                file_url=file_url,
-                cdn_url=file_url,  # Use same URL, or generate CDN URL
-                file_type=file_type,
-                file_size=file_info.get("size", 0),
-                name=filename,
-                status=CreativeStatus.ACTIVE.value,
-                tags=["synced", "ai-generated"],
-            )
+                results[file_key] = {"success": False, "error": "File does not belong to user"}
+
+        # Get file info from creatives bucket
+        infos = await async_creatives_storage.head_files(owned)
+        found = {}
+        for file_key in owned:
+            if infos.get(file_key):
+                found[file_key] = infos[file_key]
+            else:
+                results[file_key] = {"success": False, "error": "File not found in bucket"}
+
+        # Check if already synced
+        synced_urls = await self.get_synced_file_urls(
+            user_id, [info["url"] for info in found.values()]
+        )
+        rows = {}
+        for file_key, info in found.items():
+            if info["url"] in synced_urls:
+                results[file_key] = {"success": False, "error": "File already synced"}
+                continue
+            synced_urls.add(info["url"])
+            rows[file_key] = self._synced_creative_row(user_id, file_key, info)
+
+        if rows:
+            try:
+                await self.db.execute(insert(Creative), list(rows.values()))
+                ids = await self._creative_ids_by_url(
+                    user_id, [row["file_url"] for row in rows.values()]
+                )
+                for file_key, row in rows.items():
+                    results[file_key] = {"success": True, "creative_id": ids.get(row["file_url"])}
+            except Exception as e:
+                for file_key in rows:
+                    results[file_key] = {"success": False, "error": str(e)}
+
+        return [results[file_key] for file_key in file_keys]
+
+    def _synced_creative_row(self, user_id: int, file_key: str, file_info: dict) -> dict:
+        """Build insert values for a creative synced from the bucket."""
+        # Determine file type from content_type
+        content_type = file_info.get("content_type", "")
+        if content_type.startswith("image/"):
+            file_type = "image"
+        elif content_type.startswith("video/"):
+            file_type = "video"
+        elif content_type.startswith("audio/"):
+            file_type = "audio"
+        else:
+            file_type = "image"  # Default to image
 
-            self.db.add(creative)
-            await self.db.flush()
-            await self.db.refresh(creative)
+        # Extract filename from key for name
+        filename = file_key.split("/")[-1] if "/" in file_key else file_key
 
-            return {"success": True, "creative_id": creative.id}
+        return {
+            "user_id": user_id,
+            "file_url": file_info["url"],
+            "cdn_url": file_info["url"],  # Use same URL, or generate CDN URL
+            "file_type": file_type,
+            "file_size": file_info.get("size", 0),
+            "name": filename,
+            "status": CreativeStatus.ACTIVE.value,
+            "tags": ["synced", "ai-generated"],
+        }
 
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+    async def _creative_ids_by_url(self, user_id: int, file_urls: list[str]) -> dict[str, int]:
+        """Map file URLs to the newest active creative ID for a user."""
+        ids: dict[str, int] = {}
+        for i in range(0, len(file_urls), SYNC_LOOKUP_CHUNK_SIZE):
+            result = await self.db.execute(
+                select(Creative.file_url, func.max(Creative.id))
+                .where(Creative.user_id == user_id)
+                .where(Creative.status == CreativeStatus.ACTIVE.value)
+                .where(Creative.file_url.in_(file_urls[i:i + SYNC_LOOKUP_CHUNK_SIZE]))
+                .group_by(Creative.file_url)
+            )
+            ids.update({url: creative_id for url, creative_id in result.all()})
+        return ids
@@ -1,10 +1,12 @@
 """Credit service for managing user credits."""
 
+import asyncio
+import logging
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import event, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.credit_config import CreditConfig
@@ -12,6 +14,16 @@ from app.models.credit_config_log import CreditConfigLog
 from app.models.credit_transaction import CreditTransaction
 from app.models.user import User
 from app.schemas.credit import OperationType, TransactionType
+from app.services.credit_config_cache import (
+    CreditConfigSnapshot,
+    credit_config_cache,
+    schedule_invalidation,
+)
+
+logger = logging.getLogger(__name__)
+
+# Strong references to scheduled cached balance adjustments
+_pending_balance_syncs: set[asyncio.Task[None]] = set()
 
 
 class InsufficientCreditsError(Exception):
@@ -32,12 +44,67 @@ class CreditService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    async def _get_cached_balance(self, user_id: int) -> dict[str, Decimal] | None:
+        """Get the credit ledger's cached balance, or None if unavailable."""
+        from app.services.credit_ledger import CreditLedger
+
+        try:
+            return await CreditLedger(self.db).get_cached_balance(user_id)
+        except Exception as e:
+            logger.warning(f"Cached credit balance unavailable: {e}")
+            return None
+
+    def _sync_cached_balance(
+        self,
+        user: User,
+        gifted_delta: Decimal,
+        purchased_delta: Decimal,
+    ) -> None:
+        """Mirror a balance change into the credit ledger once it commits.
+
+        The user row must be locked. Its credit_version is bumped so the
+        ledger applies the change only to a balance seeded before it;
+        when the adjustment runs relative to seeding does not matter.
+        """
+        from app.services.credit_ledger import CreditLedger
+
+        user.credit_version += 1
+        user_id = user.id
+        credit_version = user.credit_version
+        ledger = CreditLedger(self.db)
+
+        async def adjust() -> None:
+            try:
+                await ledger.adjust_cached_balance(
+                    user_id, gifted_delta, purchased_delta, credit_version
+                )
+            except Exception as e:
+                logger.warning(f"Failed to update cached credit balance: {e}")
+
+        def on_commit(session: Any) -> None:
+            task = asyncio.get_running_loop().create_task(adjust())
+            _pending_balance_syncs.add(task)
+            task.add_done_callback(_pending_balance_syncs.discard)
+
+        event.listen(self.db.sync_session, "after_commit", on_commit, once=True)
+
     async def get_balance(self, user_id: int) -> dict[str, Decimal]:
         """Get user's credit balance.
+
+        Settlements made through the credit ledger are written to the
+        database in batches, so the ledger's cached balance is preferred.
         
         Returns:
             Dictionary with gifted_credits, purchased_credits, and total_credits
         """
+        cached = await self._get_cached_balance(user_id)
+        if cached is not None:
+            return {
+                "gifted_credits": cached["gifted_credits"],
+                "purchased_credits": cached["purchased_credits"],
+                "total_credits": cached["gifted_credits"] + cached["purchased_credits"],
+            }
+
         result = await self.db.execute(
             select(User.gifted_credits, User.purchased_credits)
             .where(User.id == user_id)
@@ -105,6 +172,11 @@ class CreditService:
 
         total_available = user.gifted_credits + user.purchased_credits
 
+        # Ledger settlements and holds not yet written to the database
+        cached = await self._get_cached_balance(user_id)
+        if cached is not None:
+            total_available = min(total_available, cached["available_credits"])
+
         if total_available < amount:
             raise InsufficientCreditsError(required=amount, available=total_available)
 
@@ -123,6 +195,7 @@ class CreditService:
         # Update user balances
         user.gifted_credits -= from_gifted
         user.purchased_credits -= from_purchased
+        self._sync_cached_balance(user, -from_gifted, -from_purchased)
 
         balance_after = user.gifted_credits + user.purchased_credits
 
@@ -144,6 +217,97 @@ class CreditService:
 
         return transaction
 
+    async def deduct_credits_batch(
+        self,
+        deductions: list[dict[str, Any]],
+    ) -> list[CreditTransaction | None]:
+        """Deduct many token-usage charges in one database transaction.
+
+        All affected users are locked with a single SELECT ... FOR UPDATE
+        (in ID order, so concurrent batches cannot deadlock) and every
+        transaction record is written with one flush.
+
+        Args:
+            deductions: Dictionaries with user_id, amount, operation_type and
+                optional operation_id and details
+
+        Returns:
+            One entry per deduction, in order: the CreditTransaction, or None
+            if the user did not have enough credits for it
+        """
+        if any(d["amount"] <= 0 for d in deductions):
+            raise ValueError("Amount must be positive")
+
+        user_ids = sorted({d["user_id"] for d in deductions})
+        result = await self.db.execute(
+            select(User)
+            .where(User.id.in_(user_ids))
+            .order_by(User.id)
+            .with_for_update()
+        )
+        users = {user.id: user for user in result.scalars().all()}
+
+        missing = set(user_ids) - set(users)
+        if missing:
+            raise ValueError(f"Users not found: {sorted(missing)}")
+
+        # Cap by the ledger's view of each user's balance
+        available: dict[int, Decimal] = {}
+        for user_id, user in users.items():
+            available[user_id] = user.gifted_credits + user.purchased_credits
+            cached = await self._get_cached_balance(user_id)
+            if cached is not None:
+                available[user_id] = min(available[user_id], cached["available_credits"])
+
+        transactions: list[CreditTransaction | None] = []
+        deducted: dict[int, list[Decimal]] = {}
+
+        for deduction in deductions:
+            user_id = deduction["user_id"]
+            amount = deduction["amount"]
+            user = users[user_id]
+
+            if available[user_id] < amount:
+                transactions.append(None)
+                continue
+
+            from_gifted = min(max(user.gifted_credits, Decimal("0")), amount)
+            from_purchased = amount - from_gifted
+
+            user.gifted_credits -= from_gifted
+            user.purchased_credits -= from_purchased
+            available[user_id] -= amount
+
+            totals = deducted.setdefault(user_id, [Decimal("0"), Decimal("0")])
+            totals[0] += from_gifted
+            totals[1] += from_purchased
+
+            operation_type = deduction["operation_type"]
+            transaction = CreditTransaction(
+                user_id=user_id,
+                type=TransactionType.DEDUCT.value,
+                amount=amount,
+                from_gifted=from_gifted,
+                from_purchased=from_purchased,
+                balance_after=user.gifted_credits + user.purchased_credits,
+                operation_type=(
+                    operation_type.value
+                    if isinstance(operation_type, OperationType)
+                    else operation_type
+                ),
+                operation_id=deduction.get("operation_id"),
+                details=deduction.get("details") or {},
+            )
+            self.db.add(transaction)
+            transactions.append(transaction)
+
+        for user_id, (from_gifted, from_purchased) in deducted.items():
+            self._sync_cached_balance(users[user_id], -from_gifted, -from_purchased)
+
+        await self.db.flush()
+
+        return transactions
+
     async def refund_credits(
         self,
         user_id: int,
@@ -185,6 +349,7 @@ class CreditService:
 
         # Add to purchased credits (refunds go to purchased)
         user.purchased_credits += amount
+        self._sync_cached_balance(user, Decimal("0"), amount)
 
         balance_after = user.gifted_credits + user.purchased_credits
 
@@ -255,6 +420,7 @@ class CreditService:
             from_gifted = Decimal("0")
             from_purchased = amount
 
+        self._sync_cached_balance(user, from_gifted, from_purchased)
         balance_after = user.gifted_credits + user.purchased_credits
 
         # Create transaction record
@@ -337,8 +503,23 @@ class CreditService:
         Returns:
             True if user has sufficient credits, False otherwise
         """
+        return await self.get_available_credits(user_id) >= required_amount
+
+    async def get_available_credits(self, user_id: int) -> Decimal:
+        """Get credits available to spend, excluding active reservations.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Available credit amount
+        """
+        cached = await self._get_cached_balance(user_id)
+        if cached is not None:
+            return cached["available_credits"]
+
         balance = await self.get_balance(user_id)
-        return balance["total_credits"] >= required_amount
+        return balance["total_credits"]
 
     async def calculate_token_cost(
         self,
@@ -360,33 +541,8 @@ class CreditService:
         Returns:
             Total credit cost
         """
-        config = await self.get_config()
-
-        # Normalize model name for lookup
-        model_lower = model.lower().replace("-", "_").replace(".", "_")
-        
-        # Map model identifiers to rate configuration
-        # Gemini models
-        if model_lower in ["gemini_flash", "gemini_2_5_flash", "gemini_2_0_flash"] or provider == "gemini" and "flash" in model_lower:
-            input_rate = config.gemini_flash_input_rate
-            output_rate = config.gemini_flash_output_rate
-        elif model_lower in ["gemini_pro", "gemini_2_5_pro", "gemini_3_pro", "gemini_2_0_pro"] or provider == "gemini" and "pro" in model_lower:
-            input_rate = config.gemini_pro_input_rate
-            output_rate = config.gemini_pro_output_rate
-        # Bedrock models - use Gemini Pro rates as baseline for now
-        # TODO: Add specific Bedrock model rates to CreditConfig
-        elif provider == "bedrock" or any(x in model_lower for x in ["claude", "qwen", "nova", "anthropic", "amazon"]):
-            # Use Gemini Pro rates for Bedrock models (can be adjusted in config)
-            input_rate = config.gemini_pro_input_rate
-            output_rate = config.gemini_pro_output_rate
-        # SageMaker models - use Gemini Pro rates as baseline
-        elif provider == "sagemaker":
-            input_rate = config.gemini_pro_input_rate
-            output_rate = config.gemini_pro_output_rate
-        else:
-            # Default to Gemini Flash rates for unknown models
-            input_rate = config.gemini_flash_input_rate
-            output_rate = config.gemini_flash_output_rate
+        config = await self.get_config_snapshot()
+        input_rate, output_rate = config.rates_for_model(model, provider)
 
         # Rates are per 1K tokens
         input_cost = (Decimal(input_tokens) / 1000) * input_rate
@@ -406,23 +562,16 @@ class CreditService:
         Returns:
             Credit cost for the operation
         """
-        config = await self.get_config()
+        config = await self.get_config_snapshot()
 
         # Convert enum to string if needed
         op_type = operation_type.value if isinstance(operation_type, OperationType) else operation_type
 
-        rate_map = {
-            OperationType.IMAGE_GENERATION.value: config.image_generation_rate,
-            OperationType.VIDEO_GENERATION.value: config.video_generation_rate,
-            OperationType.LANDING_PAGE.value: config.landing_page_rate,
-            OperationType.COMPETITOR_ANALYSIS.value: config.competitor_analysis_rate,
-            OperationType.OPTIMIZATION_SUGGESTION.value: config.optimization_suggestion_rate,
-        }
-
-        if op_type not in rate_map:
+        rate = config.operation_rates.get(op_type)
+        if rate is None:
             raise ValueError(f"Unknown operation type: {op_type}")
 
-        return rate_map[op_type]
+        return rate
 
     async def get_config(self) -> CreditConfig:
         """Get the current credit configuration.
@@ -443,6 +592,13 @@ class CreditService:
 
         return config
 
+    async def get_config_snapshot(self) -> CreditConfigSnapshot:
+        """Get the current credit configuration from the in-process cache.
+
+        Returns:
+            Immutable snapshot of the active configuration
+        """
+        return await credit_config_cache.get(self.get_config)
 
     async def update_config(
         self,
@@ -503,6 +659,22 @@ class CreditService:
         config.updated_by = updated_by
 
         await self.db.flush()
+
+        # Drop cached snapshots in every worker once the change is committed,
+        # and locally again if it is rolled back
+        credit_config_cache.invalidate()
+        event.listen(
+            self.db.sync_session,
+            "after_commit",
+            lambda session: schedule_invalidation(),
+            once=True,
+        )
+        event.listen(
+            self.db.sync_session,
+            "after_rollback",
+            lambda session: credit_config_cache.invalidate(),
+            once=True,
+        )
         return config
 
     async def get_config_dict(self) -> dict:
@@ -511,7 +683,7 @@ class CreditService:
         Returns:
             Dictionary with all configuration values
         """
-        config = await self.get_config()
+        config = await self.get_config_snapshot()
 
         return {
             "id": config.id,
@@ -0,0 +1,323 @@
+"""In-process cache of the active credit configuration.
+
+Credit checks run on every chat turn and generation, so the active
+CreditConfig is kept in memory as an immutable snapshot instead of being
+selected on every call. Snapshots expire after a short TTL and are
+dropped immediately when any worker publishes an invalidation on the
+Redis channel after committing a configuration change.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.models.credit_config import CreditConfig
+from app.schemas.credit import OperationType
+
+logger = logging.getLogger(__name__)
+
+# Redis channel carrying the new config version after each update
+INVALIDATION_CHANNEL = "credit_config:invalidate"
+
+# Redis counter holding the latest config version
+VERSION_KEY = "credit_config:version"
+
+# Seconds to wait before resubscribing after a pub/sub error
+LISTENER_RETRY_DELAY = 5
+
+# Token rate tiers stored in CreditConfig
+FLASH_TIER = "flash"
+PRO_TIER = "pro"
+
+# Normalized model names with a known rate tier
+MODEL_RATE_TIERS: dict[str, str] = {
+    "gemini_flash": FLASH_TIER,
+    "gemini_2_5_flash": FLASH_TIER,
+    "gemini_2_0_flash": FLASH_TIER,
+    "gemini_pro": PRO_TIER,
+    "gemini_2_5_pro": PRO_TIER,
+    "gemini_3_pro": PRO_TIER,
+    "gemini_2_0_pro": PRO_TIER,
+}
+
+# Model name fragments billed at Bedrock (pro) rates
+BEDROCK_MODEL_MARKERS = ("claude", "qwen", "nova", "anthropic", "amazon")
+
+_MODEL_NAME_TRANSLATION = str.maketrans({"-": "_", ".": "_"})
+
+
+@lru_cache(maxsize=1024)
+def resolve_rate_tier(model: str, provider: str | None = None) -> str:
+    """Resolve the token rate tier for a model.
+
+    Exact model names are looked up in MODEL_RATE_TIERS; other names fall
+    back to provider and name heuristics. Results are memoized per
+    (model, provider) since the set of models in use is small.
+
+    Args:
+        model: Model name or identifier
+        provider: Optional provider name ('gemini', 'bedrock', 'sagemaker')
+
+    Returns:
+        FLASH_TIER or PRO_TIER
+    """
+    model_key = model.lower().translate(_MODEL_NAME_TRANSLATION)
+
+    tier = MODEL_RATE_TIERS.get(model_key)
+    if tier is not None:
+        return tier
+
+    if provider == "gemini":
+        if "flash" in model_key:
+            return FLASH_TIER
+        if "pro" in model_key:
+            return PRO_TIER
+
+    # Bedrock and SageMaker models use Gemini Pro rates as baseline
+    if provider in ("bedrock", "sagemaker") or any(
+        marker in model_key for marker in BEDROCK_MODEL_MARKERS
+    ):
+        return PRO_TIER
+
+    # Default to Gemini Flash rates for unknown models
+    return FLASH_TIER
+
+
+@dataclass(frozen=True)
+class CreditConfigSnapshot:
+    """Immutable copy of a CreditConfig row with precomputed rate tables."""
+
+    id: int
+    version: int
+    gemini_flash_input_rate: Decimal
+    gemini_flash_output_rate: Decimal
+    gemini_pro_input_rate: Decimal
+    gemini_pro_output_rate: Decimal
+    image_generation_rate: Decimal
+    video_generation_rate: Decimal
+    landing_page_rate: Decimal
+    competitor_analysis_rate: Decimal
+    optimization_suggestion_rate: Decimal
+    registration_bonus: Decimal
+    packages: dict[str, Any]
+    updated_at: datetime | None
+    updated_by: str | None
+    token_rates: dict[str, tuple[Decimal, Decimal]] = field(default_factory=dict)
+    operation_rates: dict[str, Decimal] = field(default_factory=dict)
+
+    @classmethod
+    def from_model(cls, config: CreditConfig, version: int) -> "CreditConfigSnapshot":
+        """Build a snapshot from a CreditConfig instance."""
+        return cls(
+            id=config.id,
+            version=version,
+            gemini_flash_input_rate=config.gemini_flash_input_rate,
+            gemini_flash_output_rate=config.gemini_flash_output_rate,
+            gemini_pro_input_rate=config.gemini_pro_input_rate,
+            gemini_pro_output_rate=config.gemini_pro_output_rate,
+            image_generation_rate=config.image_generation_rate,
+            video_generation_rate=config.video_generation_rate,
+            landing_page_rate=config.landing_page_rate,
+            competitor_analysis_rate=config.competitor_analysis_rate,
+            optimization_suggestion_rate=config.optimization_suggestion_rate,
+            registration_bonus=config.registration_bonus,
+            packages=dict(config.packages or {}),
+            updated_at=config.updated_at,
+            updated_by=config.updated_by,
+            token_rates={
+                FLASH_TIER: (
+                    config.gemini_flash_input_rate,
+                    config.gemini_flash_output_rate,
+                ),
+                PRO_TIER: (
+                    config.gemini_pro_input_rate,
+                    config.gemini_pro_output_rate,
+                ),
+            },
+            operation_rates={
+                OperationType.IMAGE_GENERATION.value: config.image_generation_rate,
+                OperationType.VIDEO_GENERATION.value: config.video_generation_rate,
+                OperationType.LANDING_PAGE.value: config.landing_page_rate,
+                OperationType.COMPETITOR_ANALYSIS.value: config.competitor_analysis_rate,
+                OperationType.OPTIMIZATION_SUGGESTION.value: config.optimization_suggestion_rate,
+            },
+        )
+
+    def rates_for_model(
+        self,
+        model: str,
+        provider: str | None = None,
+    ) -> tuple[Decimal, Decimal]:
+        """Return (input_rate, output_rate) per 1K tokens for a model."""
+        return self.token_rates[resolve_rate_tier(model, provider)]
+
+
+class CreditConfigCache:
+    """Versioned TTL cache holding the active credit configuration.
+
+    The version increases on every invalidation. A load that started
+    before an invalidation is returned to its caller but not cached, so
+    a stale row read concurrently with an update is never kept.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._snapshot: CreditConfigSnapshot | None = None
+        self._expires_at = 0.0
+        self._version = 0
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def version(self) -> int:
+        """Current config version known to this process."""
+        return self._version
+
+    def peek(self) -> CreditConfigSnapshot | None:
+        """Return the cached snapshot if it is still fresh."""
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.version != self._version:
+            return None
+        if time.monotonic() >= self._expires_at:
+            return None
+        return snapshot
+
+    async def get(
+        self,
+        loader: Callable[[], Awaitable[CreditConfig]],
+    ) -> CreditConfigSnapshot:
+        """Return the cached snapshot, loading it on a miss.
+
+        Concurrent misses in the same process share a single load.
+
+        Args:
+            loader: Coroutine function returning the active CreditConfig
+
+        Returns:
+            Snapshot of the active configuration
+        """
+        snapshot = self.peek()
+        if snapshot is not None:
+            return snapshot
+
+        async with self._get_lock():
+            snapshot = self.peek()
+            if snapshot is not None:
+                return snapshot
+
+            version = self._version
+            snapshot = CreditConfigSnapshot.from_model(await loader(), version)
+            if version == self._version:
+                self._snapshot = snapshot
+                self._expires_at = time.monotonic() + self.ttl
+            return snapshot
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Return the load lock for the running event loop.
+
+        Celery tasks run each job in a new event loop, and a lock cannot
+        be shared between loops.
+        """
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def invalidate(self, version: int | None = None) -> None:
+        """Drop the cached snapshot.
+
+        Args:
+            version: Version announced by the publishing worker, or None to
+                bump the local version only
+        """
+        if version is None:
+            self._version += 1
+        else:
+            self._version = max(self._version + 1, version)
+        self._snapshot = None
+
+
+credit_config_cache = CreditConfigCache(ttl=settings.credit_config_cache_ttl)
+
+# Strong references to fire-and-forget publish tasks
+_pending_publishes: set[asyncio.Task[None]] = set()
+_listener_task: asyncio.Task[None] | None = None
+
+
+async def publish_invalidation() -> None:
+    """Invalidate the local cache and notify the other workers.
+
+    Call only after the configuration change has been committed.
+    """
+    credit_config_cache.invalidate()
+    try:
+        redis = await get_redis()
+        version = await redis.incr(VERSION_KEY)
+        await redis.publish(INVALIDATION_CHANNEL, str(version))
+    except Exception as e:
+        # Other workers pick up the change when their TTL expires
+        logger.warning(f"Failed to publish credit config invalidation: {e}")
+
+
+def schedule_invalidation() -> None:
+    """Publish an invalidation from synchronous code such as session events."""
+    credit_config_cache.invalidate()
+    task = asyncio.get_running_loop().create_task(publish_invalidation())
+    _pending_publishes.add(task)
+    task.add_done_callback(_pending_publishes.discard)
+
+
+async def _listen() -> None:
+    """Drop the cached snapshot whenever another worker publishes a change."""
+    while True:
+        try:
+            redis = await get_redis()
+            pubsub = redis.pubsub()
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            # Changes published while unsubscribed would otherwise be missed
+            credit_config_cache.invalidate()
+            try:
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        version = int(message["data"])
+                    except (TypeError, ValueError):
+                        version = None
+                    credit_config_cache.invalidate(version)
+            finally:
+                await pubsub.reset()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Credit config invalidation listener error: {e}")
+            await asyncio.sleep(LISTENER_RETRY_DELAY)
+
+
+def start_invalidation_listener() -> None:
+    """Start listening for credit config invalidations (app startup)."""
+    global _listener_task
+    if _listener_task is None or _listener_task.done():
+        _listener_task = asyncio.get_running_loop().create_task(_listen())
+
+
+async def stop_invalidation_listener() -> None:
+    """Stop the invalidation listener (app shutdown)."""
+    global _listener_task
+    if _listener_task is None:
+        return
+    _listener_task.cancel()
+    try:
+        await _listener_task
+    except asyncio.CancelledError:
+        pass
+    _listener_task = None
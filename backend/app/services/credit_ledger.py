@@ -0,0 +1,640 @@
+"""Redis-backed credit ledger with reservation/settle semantics.
+
+Deducting through CreditService.deduct_credits locks the user's row for
+every operation, so parallel generations for one user serialize on it.
+The ledger keeps a per-user balance in Redis instead:
+
+- reserve: atomically hold credits before an operation starts
+- settle: convert a hold into a deduction (possibly for a lower amount)
+- release: drop a hold when the operation fails
+
+Settlements are queued in Redis and written behind to users and
+credit_transactions by flush_settlements, many at a time in a single
+database transaction. Each settlement is written at most once, keyed by
+its reservation ID, so a retried flush does not deduct twice. All
+amounts are kept in Redis as integer hundredths of a credit so they can
+be changed with HINCRBY.
+"""
+
+import json
+import logging
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import datetime
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any
+
+from sqlalchemy import Insert, insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.redis import get_redis
+from app.models.credit_transaction import CreditTransaction
+from app.models.user import User
+from app.schemas.credit import OperationType, TransactionType
+from app.services.credit import CreditService, InsufficientCreditsError
+
+logger = logging.getLogger(__name__)
+
+BALANCE_KEY = "credit_ledger:balance:{user_id}"
+RESERVATION_KEY = "credit_ledger:reservation:{reservation_id}"
+RESERVATION_EXPIRY_KEY = "credit_ledger:reservations"
+PENDING_KEY = "credit_ledger:pending"
+FLUSHING_KEY = "credit_ledger:flushing"
+FLUSH_LOCK_KEY = "credit_ledger:flush_lock"
+
+# Seconds a cached balance (and its reservations) lives without activity.
+# Must stay far above the flush interval: a balance reloaded from the
+# database while settlements are still queued would miss them.
+BALANCE_TTL = 86400
+
+# Default seconds before an unsettled reservation is released
+DEFAULT_RESERVATION_TTL = 900
+
+# Settlements written per flush transaction
+FLUSH_BATCH_SIZE = 500
+
+# Seconds a flush may hold the flush lock
+FLUSH_LOCK_TTL = 60
+
+_CENT = Decimal("0.01")
+
+# KEYS: balance; ARGV: gifted, purchased, ttl, credit version
+SEED_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'gifted', ARGV[1], 'purchased', ARGV[2], 'reserved', 0,
+    'version', ARGV[4])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+
+# KEYS: balance, reservation, expiry zset
+# ARGV: amount, reservation_id, user_id, operation_type, operation_id,
+#       expires_at, ttl
+# Returns {status, available}: 1 reserved, 0 insufficient, -1 not cached
+RESERVE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return {-1, 0}
+end
+local b = redis.call('HMGET', KEYS[1], 'gifted', 'purchased', 'reserved')
+local available = tonumber(b[1]) + tonumber(b[2]) - tonumber(b[3])
+local amount = tonumber(ARGV[1])
+if available < amount then
+    return {0, available}
+end
+redis.call('HINCRBY', KEYS[1], 'reserved', amount)
+redis.call('EXPIRE', KEYS[1], ARGV[7])
+redis.call('HSET', KEYS[2], 'user_id', ARGV[3], 'amount', amount,
+    'operation_type', ARGV[4], 'operation_id', ARGV[5])
+redis.call('EXPIRE', KEYS[2], ARGV[7])
+redis.call('ZADD', KEYS[3], ARGV[6], ARGV[2])
+return {1, available - amount}
+"""
+
+# KEYS: balance, reservation, expiry zset, pending list
+# ARGV: reservation_id, user_id, amount (-1 for the reserved amount),
+#       details JSON, settled_at, ttl
+# Returns {status, from_gifted, from_purchased, balance_after}:
+# 1 settled, 0 insufficient, -1 not cached, -2 unknown reservation
+SETTLE_SCRIPT = """
+local r = redis.call('HMGET', KEYS[2], 'user_id', 'amount', 'operation_type', 'operation_id')
+if not r[1] or r[1] ~= ARGV[2] then
+    return {-2, 0, 0, 0}
+end
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return {-1, 0, 0, 0}
+end
+local held = tonumber(r[2])
+local amount = tonumber(ARGV[3])
+if amount < 0 then
+    amount = held
+end
+local b = redis.call('HMGET', KEYS[1], 'gifted', 'purchased', 'reserved')
+local gifted = tonumber(b[1])
+local purchased = tonumber(b[2])
+local available = gifted + purchased - (tonumber(b[3]) - held)
+if available < amount then
+    return {0, 0, 0, available}
+end
+local from_gifted = math.max(0, math.min(gifted, amount))
+local from_purchased = amount - from_gifted
+redis.call('HINCRBY', KEYS[1], 'reserved', -held)
+redis.call('HINCRBY', KEYS[1], 'gifted', -from_gifted)
+redis.call('HINCRBY', KEYS[1], 'purchased', -from_purchased)
+redis.call('EXPIRE', KEYS[1], ARGV[6])
+redis.call('DEL', KEYS[2])
+redis.call('ZREM', KEYS[3], ARGV[1])
+local balance_after = gifted + purchased - amount
+if amount > 0 then
+    redis.call('RPUSH', KEYS[4], cjson.encode({
+        reservation_id = ARGV[1],
+        user_id = tonumber(ARGV[2]),
+        amount = amount,
+        from_gifted = from_gifted,
+        from_purchased = from_purchased,
+        balance_after = balance_after,
+        operation_type = r[3],
+        operation_id = r[4],
+        details = ARGV[4],
+        settled_at = ARGV[5],
+    }))
+end
+return {1, from_gifted, from_purchased, balance_after}
+"""
+
+# KEYS: balance, reservation, expiry zset; ARGV: reservation_id, user_id
+# Returns 1 released, 0 unknown reservation
+RELEASE_SCRIPT = """
+local r = redis.call('HMGET', KEYS[2], 'user_id', 'amount')
+if not r[1] or r[1] ~= ARGV[2] then
+    redis.call('ZREM', KEYS[3], ARGV[1])
+    return 0
+end
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('HINCRBY', KEYS[1], 'reserved', -tonumber(r[2]))
+end
+redis.call('DEL', KEYS[2])
+redis.call('ZREM', KEYS[3], ARGV[1])
+return 1
+"""
+
+# KEYS: balance; ARGV: gifted delta, purchased delta, credit version
+# A balance seeded at or after the version already includes the change.
+# Returns 1 applied, 0 not cached or already included
+ADJUST_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+local seeded = tonumber(redis.call('HGET', KEYS[1], 'version') or '0')
+if seeded >= tonumber(ARGV[3]) then
+    return 0
+end
+redis.call('HINCRBY', KEYS[1], 'gifted', ARGV[1])
+redis.call('HINCRBY', KEYS[1], 'purchased', ARGV[2])
+return 1
+"""
+
+# KEYS: pending, flushing; ARGV: batch size
+# Moves a batch to the flushing list, or returns the leftover batch of
+# a flush that failed before clearing it.
+CLAIM_SCRIPT = """
+local leftover = redis.call('LRANGE', KEYS[2], 0, -1)
+if #leftover > 0 then
+    return leftover
+end
+local n = tonumber(ARGV[1])
+local items = redis.call('LRANGE', KEYS[1], 0, n - 1)
+if #items == 0 then
+    return items
+end
+redis.call('LTRIM', KEYS[1], #items, -1)
+redis.call('RPUSH', KEYS[2], unpack(items))
+return items
+"""
+
+# KEYS: lock; ARGV: owner token, ttl
+# Returns 1 if the lock is still held by the owner and was extended
+EXTEND_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# KEYS: lock; ARGV: owner token
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class SettlementConflictError(Exception):
+    """Raised when settlements of a batch were written by another flush."""
+
+
+class ReservationNotFoundError(Exception):
+    """Raised when a reservation is unknown, expired or already settled."""
+
+    def __init__(self, reservation_id: str):
+        self.reservation_id = reservation_id
+        self.error_code = 6012
+        super().__init__(f"Credit reservation {reservation_id} not found")
+
+
+def to_cents(amount: Decimal) -> int:
+    """Convert a credit amount to integer hundredths."""
+    return int((amount * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def from_cents(value: int | str) -> Decimal:
+    """Convert integer hundredths back to a credit amount."""
+    return (Decimal(int(value)) / 100).quantize(_CENT)
+
+
+class CreditLedger:
+    """Credit reservations and write-behind settlement through Redis."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _script(self, source: str, keys: list[str], args: list[Any]) -> Any:
+        redis = await get_redis()
+        return await redis.register_script(source)(keys=keys, args=args, client=redis)
+
+    async def _load_balance(self, user_id: int) -> None:
+        """Seed the cached balance from the database if it is not cached."""
+        result = await self.db.execute(
+            select(User.gifted_credits, User.purchased_credits, User.credit_version).where(
+                User.id == user_id
+            )
+        )
+        row = result.first()
+        if not row:
+            raise ValueError(f"User {user_id} not found")
+
+        await self._script(
+            SEED_SCRIPT,
+            [BALANCE_KEY.format(user_id=user_id)],
+            [
+                to_cents(row.gifted_credits or Decimal("0")),
+                to_cents(row.purchased_credits or Decimal("0")),
+                BALANCE_TTL,
+                row.credit_version or 0,
+            ],
+        )
+
+    async def get_cached_balance(self, user_id: int) -> dict[str, Decimal] | None:
+        """Get the Redis-side balance if the user has one cached.
+
+        Returns:
+            Dictionary with gifted_credits, purchased_credits,
+            reserved_credits and available_credits, or None
+        """
+        redis = await get_redis()
+        cached = await redis.hgetall(BALANCE_KEY.format(user_id=user_id))
+        if not cached:
+            return None
+
+        gifted = from_cents(cached["gifted"])
+        purchased = from_cents(cached["purchased"])
+        reserved = from_cents(cached["reserved"])
+        return {
+            "gifted_credits": gifted,
+            "purchased_credits": purchased,
+            "reserved_credits": reserved,
+            "available_credits": gifted + purchased - reserved,
+        }
+
+    async def reserve(
+        self,
+        user_id: int,
+        amount: Decimal,
+        operation_type: OperationType | str,
+        operation_id: str | None = None,
+        ttl: int = DEFAULT_RESERVATION_TTL,
+    ) -> dict[str, Any]:
+        """Hold credits for an operation that is about to start.
+
+        Args:
+            user_id: User ID
+            amount: Amount to hold (must be positive)
+            operation_type: Type of operation consuming credits
+            operation_id: Optional unique ID for the operation
+            ttl: Seconds before the hold is released automatically
+
+        Returns:
+            Dictionary with reservation_id, amount, available_after, expires_at
+
+        Raises:
+            InsufficientCreditsError: If available credits are below amount
+        """
+        if amount <= 0:
+            raise ValueError("Amount must be positive")
+
+        op_type_str = (
+            operation_type.value if isinstance(operation_type, OperationType) else operation_type
+        )
+        reservation_id = uuid.uuid4().hex
+        expires_at = int(time.time()) + ttl
+        keys = [
+            BALANCE_KEY.format(user_id=user_id),
+            RESERVATION_KEY.format(reservation_id=reservation_id),
+            RESERVATION_EXPIRY_KEY,
+        ]
+        args = [
+            to_cents(amount),
+            reservation_id,
+            user_id,
+            op_type_str,
+            operation_id or "",
+            expires_at,
+            BALANCE_TTL,
+        ]
+
+        status, available = await self._script(RESERVE_SCRIPT, keys, args)
+        if status == -1:
+            await self._load_balance(user_id)
+            status, available = await self._script(RESERVE_SCRIPT, keys, args)
+
+        if status != 1:
+            raise InsufficientCreditsError(required=amount, available=from_cents(available))
+
+        return {
+            "reservation_id": reservation_id,
+            "amount": amount,
+            "available_after": from_cents(available),
+            "expires_at": datetime.utcfromtimestamp(expires_at),
+        }
+
+    async def settle(
+        self,
+        user_id: int,
+        reservation_id: str,
+        amount: Decimal | None = None,
+        details: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Deduct the final cost of an operation and drop its hold.
+
+        The deduction is recorded in Redis immediately and written to
+        the database by the next flush_settlements run.
+
+        Args:
+            user_id: User ID that made the reservation
+            reservation_id: ID returned by reserve
+            amount: Final cost; defaults to the reserved amount and may
+                exceed it if the balance covers the difference
+            details: Optional additional details (model, tokens, etc.)
+
+        Returns:
+            Dictionary with deducted, from_gifted, from_purchased, balance_after
+
+        Raises:
+            ReservationNotFoundError: If the reservation does not exist
+            InsufficientCreditsError: If the balance cannot cover amount
+        """
+        if amount is not None and amount < 0:
+            raise ValueError("Amount must not be negative")
+
+        keys = [
+            BALANCE_KEY.format(user_id=user_id),
+            RESERVATION_KEY.format(reservation_id=reservation_id),
+            RESERVATION_EXPIRY_KEY,
+            PENDING_KEY,
+        ]
+        args = [
+            reservation_id,
+            user_id,
+            -1 if amount is None else to_cents(amount),
+            json.dumps(details or {}),
+            datetime.utcnow().isoformat(),
+            BALANCE_TTL,
+        ]
+
+        status, from_gifted, from_purchased, balance = await self._script(
+            SETTLE_SCRIPT, keys, args
+        )
+        if status == -1:
+            await self._load_balance(user_id)
+            status, from_gifted, from_purchased, balance = await self._script(
+                SETTLE_SCRIPT, keys, args
+            )
+
+        if status == -2:
+            raise ReservationNotFoundError(reservation_id)
+        if status == 0:
+            raise InsufficientCreditsError(
+                required=amount or Decimal("0"), available=from_cents(balance)
+            )
+
+        return {
+            "deducted": from_cents(from_gifted + from_purchased),
+            "from_gifted": from_cents(from_gifted),
+            "from_purchased": from_cents(from_purchased),
+            "balance_after": from_cents(balance),
+        }
+
+    async def release(self, user_id: int, reservation_id: str) -> None:
+        """Drop a hold without deducting anything.
+
+        Raises:
+            ReservationNotFoundError: If the reservation does not exist
+        """
+        released = await self._script(
+            RELEASE_SCRIPT,
+            [
+                BALANCE_KEY.format(user_id=user_id),
+                RESERVATION_KEY.format(reservation_id=reservation_id),
+                RESERVATION_EXPIRY_KEY,
+            ],
+            [reservation_id, user_id],
+        )
+        if not released:
+            raise ReservationNotFoundError(reservation_id)
+
+    async def release_expired(self, limit: int = 1000) -> int:
+        """Release reservations that were never settled.
+
+        Returns:
+            Number of reservations released
+        """
+        redis = await get_redis()
+        expired = await redis.zrangebyscore(
+            RESERVATION_EXPIRY_KEY, 0, int(time.time()), start=0, num=limit
+        )
+
+        released = 0
+        for reservation_id in expired:
+            user_id = await redis.hget(
+                RESERVATION_KEY.format(reservation_id=reservation_id), "user_id"
+            )
+            if user_id is None:
+                await redis.zrem(RESERVATION_EXPIRY_KEY, reservation_id)
+                continue
+            try:
+                await self.release(int(user_id), reservation_id)
+                released += 1
+            except ReservationNotFoundError:
+                # Settled concurrently
+                pass
+
+        return released
+
+    async def adjust_cached_balance(
+        self,
+        user_id: int,
+        gifted_delta: Decimal,
+        purchased_delta: Decimal,
+        credit_version: int,
+    ) -> bool:
+        """Apply a committed database balance change to the cached balance.
+
+        Recharges, gifts, refunds and direct deductions change users
+        without going through the ledger; the cached balance (if any)
+        must follow them. The change is skipped if the balance was seeded
+        from a database row that already had its credit_version, so it
+        is applied exactly once however it interleaves with seeding.
+
+        Returns:
+            True if the cached balance was adjusted
+        """
+        return bool(
+            await self._script(
+                ADJUST_SCRIPT,
+                [BALANCE_KEY.format(user_id=user_id)],
+                [to_cents(gifted_delta), to_cents(purchased_delta), credit_version],
+            )
+        )
+
+    async def flush_settlements(self, batch_size: int = FLUSH_BATCH_SIZE) -> int:
+        """Write queued settlements to the database.
+
+        Each batch is applied in one transaction: the affected users are
+        locked with one SELECT ... FOR UPDATE and updated together with
+        a single multi-row INSERT into credit_transactions. Only one
+        flush runs at a time across workers; the lock is extended before
+        every batch and a flush that lost it stops. Settlements already
+        in credit_transactions are skipped, so a batch retried after a
+        failure between commit and dequeue is not applied twice.
+
+        Returns:
+            Number of settlements written
+        """
+        redis = await get_redis()
+        token = uuid.uuid4().hex
+        if not await redis.set(FLUSH_LOCK_KEY, token, nx=True, ex=FLUSH_LOCK_TTL):
+            return 0
+
+        written = 0
+        try:
+            while True:
+                extended = await self._script(
+                    EXTEND_LOCK_SCRIPT, [FLUSH_LOCK_KEY], [token, FLUSH_LOCK_TTL]
+                )
+                if not extended:
+                    logger.warning("Credit ledger flush lock expired; stopping flush")
+                    break
+
+                items = await self._script(
+                    CLAIM_SCRIPT, [PENDING_KEY, FLUSHING_KEY], [batch_size]
+                )
+                if not items:
+                    break
+
+                try:
+                    written += await self._write_settlements(json.loads(item) for item in items)
+                    await self.db.commit()
+                except Exception:
+                    # The batch stays claimed and is retried by the next flush
+                    await self.db.rollback()
+                    raise
+                await redis.delete(FLUSHING_KEY)
+        finally:
+            await self._script(RELEASE_LOCK_SCRIPT, [FLUSH_LOCK_KEY], [token])
+
+        return written
+
+    def _build_settlement_insert(self, rows: list[dict[str, Any]]) -> Insert:
+        """Build a multi-row INSERT that skips already settled reservations."""
+        if self.db.get_bind().dialect.name == "mysql":
+            return insert(CreditTransaction).values(rows).prefix_with("IGNORE")
+
+        # SQLite (tests and local development)
+        return (
+            sqlite_insert(CreditTransaction)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["reservation_id"])
+        )
+
+    async def _write_settlements(self, settlements: Iterable[dict[str, Any]]) -> int:
+        """Apply settlements to user balances and the transaction log.
+
+        The users are locked and each settlement's gifted/purchased split
+        is recomputed against the row, in settlement order, the same way
+        CreditService.deduct_credits splits direct deductions. The split
+        the settle script made from the cached balance can differ when
+        direct deductions ran in between; where it did, the cached
+        balance is corrected to the database's split after commit.
+
+        Returns:
+            Number of settlements written; already written ones are skipped
+
+        Raises:
+            SettlementConflictError: If another flush wrote some of the
+                settlements concurrently; the transaction must be rolled back
+        """
+        settlements = list(settlements)
+        result = await self.db.execute(
+            select(CreditTransaction.reservation_id).where(
+                CreditTransaction.reservation_id.in_(
+                    [entry["reservation_id"] for entry in settlements]
+                )
+            )
+        )
+        written = set(result.scalars())
+        settlements = [entry for entry in settlements if entry["reservation_id"] not in written]
+        if not settlements:
+            return 0
+
+        # Locked in ID order, so concurrent writers cannot deadlock
+        result = await self.db.execute(
+            select(User)
+            .where(User.id.in_(sorted({entry["user_id"] for entry in settlements})))
+            .order_by(User.id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        users = {user.id: user for user in result.scalars()}
+
+        # Gifted credits taken by the settle script minus by the database
+        gifted_drift: dict[int, Decimal] = defaultdict(Decimal)
+        rows = []
+
+        for entry in settlements:
+            user = users.get(entry["user_id"])
+            amount = from_cents(entry["amount"])
+            from_gifted = from_cents(entry["from_gifted"])
+            balance_after = from_cents(entry["balance_after"])
+            if user is not None:
+                from_gifted = min(max(user.gifted_credits, Decimal("0")), amount)
+                user.gifted_credits -= from_gifted
+                user.purchased_credits -= amount - from_gifted
+                balance_after = user.gifted_credits + user.purchased_credits
+                gifted_drift[user.id] += from_cents(entry["from_gifted"]) - from_gifted
+
+            details = json.loads(entry["details"]) if entry["details"] else {}
+            details["reservation_id"] = entry["reservation_id"]
+            rows.append(
+                {
+                    "user_id": entry["user_id"],
+                    "type": TransactionType.DEDUCT.value,
+                    "amount": amount,
+                    "from_gifted": from_gifted,
+                    "from_purchased": amount - from_gifted,
+                    "balance_after": balance_after,
+                    "operation_type": entry["operation_type"] or None,
+                    "operation_id": entry["operation_id"] or None,
+                    "reservation_id": entry["reservation_id"],
+                    "details": details,
+                    "created_at": datetime.fromisoformat(entry["settled_at"]),
+                }
+            )
+
+        # Balances are only updated for rows this statement inserted
+        result = await self.db.execute(self._build_settlement_insert(rows))
+        if result.rowcount != len(rows):
+            raise SettlementConflictError(
+                f"{len(rows) - result.rowcount} settlements were written concurrently"
+            )
+
+        service = CreditService(self.db)
+        for user_id, drift in gifted_drift.items():
+            if drift:
+                service._sync_cached_balance(users[user_id], drift, -drift)
+
+        return len(rows)
@@ -4,16 +4,18 @@ import csv
 import io
 import json
 import logging
+import tempfile
 import zipfile
+from collections.abc import AsyncIterator, Callable, Iterable
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.storage import S3Storage
+from app.core.storage import AsyncS3Storage, S3Storage
 from app.models.ad_account import AdAccount
 from app.models.campaign import Campaign
 from app.models.creative import Creative
@@ -26,15 +28,103 @@ from app.services.email import EmailService, EmailTemplate
 
 logger = logging.getLogger(__name__)
 
+CREDIT_CSV_HEADER = [
+    'Date',
+    'Type',
+    'Amount',
+    'From Gifted',
+    'From Purchased',
+    'Balance After',
+    'Operation Type',
+    'Operation ID',
+    'Details'
+]
+
+METRICS_CSV_HEADER = [
+    'Timestamp',
+    'Ad Account ID',
+    'Entity Type',
+    'Entity ID',
+    'Entity Name',
+    'Impressions',
+    'Clicks',
+    'Spend',
+    'Conversions',
+    'Revenue',
+    'CTR',
+    'CPC',
+    'CPA',
+    'ROAS'
+]
+
+
+@dataclass
+class MetricsTotals:
+    """Running totals for the performance summary."""
+
+    impressions: int = 0
+    clicks: int = 0
+    spend: float = 0.0
+    conversions: int = 0
+    revenue: float = 0.0
+    rows: int = 0
+
+    def add(self, metric: dict[str, Any]) -> None:
+        self.impressions += metric['impressions']
+        self.clicks += metric['clicks']
+        self.spend += metric['spend']
+        self.conversions += metric['conversions']
+        self.revenue += metric['revenue']
+        self.rows += 1
+
+
+def _credit_csv_row(tx: dict[str, Any]) -> list[Any]:
+    return [
+        tx['created_at'],
+        tx['type'],
+        tx['amount'],
+        tx['from_gifted'],
+        tx['from_purchased'],
+        tx['balance_after'],
+        tx['operation_type'] or '',
+        tx['operation_id'] or '',
+        json.dumps(tx['details']) if tx['details'] else ''
+    ]
+
+
+def _metrics_csv_row(metric: dict[str, Any]) -> list[Any]:
+    return [
+        metric['timestamp'],
+        metric['ad_account_id'],
+        metric['entity_type'],
+        metric['entity_id'],
+        metric['entity_name'],
+        metric['impressions'],
+        metric['clicks'],
+        metric['spend'],
+        metric['conversions'],
+        metric['revenue'],
+        metric['ctr'],
+        metric['cpc'],
+        metric['cpa'],
+        metric['roas']
+    ]
+
 
 class DataExportService:
-    """Service for exporting user data (GDPR compliance)."""
+    """Service for exporting user data (GDPR compliance).
+
+    The archive is written entry by entry into a spooled temporary file
+    while rows are streamed from the database in chunks, then uploaded
+    with a parallel multipart upload, so memory use does not grow with
+    the size of the account.
+    """
 
     def __init__(self, db: AsyncSession) -> None:
         """Initialize data export service."""
         self.db = db
         self.email_service = EmailService()
-        self.export_storage = S3Storage(settings.s3_bucket_exports)
+        self.export_storage = AsyncS3Storage(S3Storage(settings.s3_bucket_exports))
 
     async def export_user_data(self, user: User) -> dict[str, Any]:
         """
@@ -44,98 +134,26 @@ class DataExportService:
             dict with export_url and expires_at
         """
         try:
-            # Collect all user data
             logger.info(f"Starting data export for user {user.id}")
-            
-            user_data = await self._collect_user_profile(user)
-            ad_accounts_data = await self._collect_ad_accounts(user.id)
-            credit_history = await self._collect_credit_history(user.id)
-            creatives_data = await self._collect_creatives(user.id)
-            landing_pages_data = await self._collect_landing_pages(user.id)
-            campaigns_data = await self._collect_campaigns(user.id)
-            reports_data = await self._collect_reports(user.id)
-            notifications_data = await self._collect_notifications(user.id)
-            
-            # Create ZIP file in memory
-            zip_buffer = io.BytesIO()
-            
-            with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                # Add README
-                readme_content = self._generate_readme(user)
-                zip_file.writestr('README.txt', readme_content)
-                
-                # Add user profile
-                zip_file.writestr(
-                    'user_profile.json',
-                    json.dumps(user_data, indent=2, default=str)
-                )
-                
-                # Add ad accounts
-                zip_file.writestr(
-                    'ad_accounts.json',
-                    json.dumps(ad_accounts_data, indent=2, default=str)
+
+            with tempfile.SpooledTemporaryFile(
+                max_size=settings.data_export_spool_size
+            ) as archive:
+                await self._write_archive(archive, user)
+                file_size = archive.tell()
+                archive.seek(0)
+
+                # Upload to S3 with 24h expiry
+                timestamp = datetime.now(UTC).strftime('%Y%m%d_%H%M%S')
+                file_key = f"exports/user_{user.id}_{timestamp}.zip"
+
+                await self.export_storage.upload_fileobj(
+                    key=file_key,
+                    fileobj=archive,
+                    content_type='application/zip',
+                    part_size=settings.data_export_part_size,
+                    max_concurrency=settings.data_export_upload_concurrency,
                 )
-                
-                # Add credit history (CSV)
-                credit_csv = self._generate_credit_csv(credit_history)
-                zip_file.writestr('credit_history.csv', credit_csv)
-                
-                # Add creatives metadata
-                if creatives_data:
-                    zip_file.writestr(
-                        'creatives/creatives_metadata.json',
-                        json.dumps(creatives_data, indent=2, default=str)
-                    )
-                    
-                    # Download and add creative files
-                    await self._add_creative_files(zip_file, creatives_data)
-                
-                # Add landing pages
-                if landing_pages_data:
-                    zip_file.writestr(
-                        'landing_pages/landing_pages_metadata.json',
-                        json.dumps(landing_pages_data, indent=2, default=str)
-                    )
-                    
-                    # Add landing page HTML files
-                    await self._add_landing_page_files(zip_file, landing_pages_data)
-                
-                # Add campaigns
-                if campaigns_data:
-                    zip_file.writestr(
-                        'campaigns/campaigns.json',
-                        json.dumps(campaigns_data, indent=2, default=str)
-                    )
-                
-                # Add reports (CSV)
-                if reports_data:
-                    daily_metrics_csv = self._generate_metrics_csv(reports_data)
-                    zip_file.writestr('reports/daily_metrics.csv', daily_metrics_csv)
-                    
-                    # Add performance summary
-                    summary = self._generate_performance_summary(reports_data)
-                    zip_file.writestr(
-                        'reports/performance_summary.csv',
-                        summary
-                    )
-                
-                # Add notifications
-                if notifications_data:
-                    zip_file.writestr(
-                        'notifications.json',
-                        json.dumps(notifications_data, indent=2, default=str)
-                    )
-            
-            # Upload to S3 with 24h expiry
-            zip_buffer.seek(0)
-            timestamp = datetime.now(UTC).strftime('%Y%m%d_%H%M%S')
-            file_key = f"exports/user_{user.id}_{timestamp}.zip"
-            
-            self.export_storage.upload_file(
-                key=file_key,
-                data=zip_buffer.getvalue(),
-                content_type='application/zip'
-            )
             
             # Generate presigned download URL (24 hours)
             download_url = self.export_storage.generate_presigned_download_url(
@@ -145,7 +163,10 @@ class DataExportService:
             
             expires_at = datetime.now(UTC) + timedelta(hours=24)
             
-            logger.info(f"Data export completed for user {user.id}")
+            logger.info(
+                f"Data export completed for user {user.id}",
+                extra={"user_id": user.id, "file_size": file_size},
+            )
             
             # Send email notification
             await self._send_export_ready_email(user, download_url, expires_at)
@@ -153,13 +174,139 @@ class DataExportService:
             return {
                 "download_url": download_url,
                 "expires_at": expires_at.isoformat(),
-                "file_size_mb": len(zip_buffer.getvalue()) / (1024 * 1024),
+                "file_size_mb": file_size / (1024 * 1024),
             }
             
         except Exception as e:
             logger.error(f"Data export failed for user {user.id}: {e}")
             raise
 
+    async def _write_archive(self, archive: IO[bytes], user: User) -> None:
+        """Write the export ZIP into a file, streaming each table."""
+        with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+            # Add README
+            zip_file.writestr('README.txt', self._generate_readme(user))
+
+            # Add user profile
+            zip_file.writestr(
+                'user_profile.json',
+                json.dumps(await self._collect_user_profile(user), indent=2, default=str)
+            )
+
+            # Add ad accounts
+            await self._write_json_entry(
+                zip_file, 'ad_accounts.json', self._iter_ad_accounts(user.id)
+            )
+
+            # Add credit history (CSV)
+            await self._write_csv_entry(
+                zip_file,
+                'credit_history.csv',
+                CREDIT_CSV_HEADER,
+                self._iter_credit_history(user.id),
+                _credit_csv_row,
+            )
+
+            # Add creatives metadata and a note on the files
+            if await self._write_json_entry(
+                zip_file,
+                'creatives/creatives_metadata.json',
+                self._iter_creatives(user.id),
+            ):
+                await self._add_creative_files(zip_file)
+
+            # Add landing pages
+            if await self._write_json_entry(
+                zip_file,
+                'landing_pages/landing_pages_metadata.json',
+                self._iter_landing_pages(user.id),
+            ):
+                await self._add_landing_page_files(zip_file)
+
+            # Add campaigns
+            await self._write_json_entry(
+                zip_file, 'campaigns/campaigns.json', self._iter_campaigns(user.id)
+            )
+
+            # Add reports (CSV) with the summary accumulated while streaming
+            totals = MetricsTotals()
+
+            async def metrics_with_totals() -> AsyncIterator[dict[str, Any]]:
+                async for metric in self._iter_reports(user.id):
+                    totals.add(metric)
+                    yield metric
+
+            if await self._write_csv_entry(
+                zip_file,
+                'reports/daily_metrics.csv',
+                METRICS_CSV_HEADER,
+                metrics_with_totals(),
+                _metrics_csv_row,
+            ):
+                zip_file.writestr(
+                    'reports/performance_summary.csv',
+                    self._summary_csv(totals),
+                )
+
+            # Add notifications
+            await self._write_json_entry(
+                zip_file, 'notifications.json', self._iter_notifications(user.id)
+            )
+
+    async def _write_json_entry(
+        self,
+        zip_file: zipfile.ZipFile,
+        name: str,
+        rows: AsyncIterator[dict[str, Any]],
+    ) -> int:
+        """Stream rows into a JSON array entry.
+
+        Returns:
+            Number of rows written
+        """
+        count = 0
+        with zip_file.open(name, 'w', force_zip64=True) as raw:
+            with io.TextIOWrapper(raw, encoding='utf-8') as entry:
+                entry.write('[')
+                async for row in rows:
+                    entry.write(',\n' if count else '\n')
+                    entry.write(json.dumps(row, indent=2, default=str))
+                    count += 1
+                entry.write('\n]' if count else ']')
+        return count
+
+    async def _write_csv_entry(
+        self,
+        zip_file: zipfile.ZipFile,
+        name: str,
+        header: list[str],
+        rows: AsyncIterator[dict[str, Any]],
+        to_row: Callable[[dict[str, Any]], list[Any]],
+    ) -> int:
+        """Stream rows into a CSV entry.
+
+        Returns:
+            Number of data rows written
+        """
+        count = 0
+        with zip_file.open(name, 'w', force_zip64=True) as raw:
+            with io.TextIOWrapper(raw, encoding='utf-8', newline='') as entry:
+                writer = csv.writer(entry)
+                writer.writerow(header)
+                async for row in rows:
+                    writer.writerow(to_row(row))
+                    count += 1
+        return count
+
+    async def _stream(self, stmt: Select[Any]) -> AsyncIterator[Any]:
+        """Yield ORM rows fetched in chunks through a server-side cursor."""
+        result = await self.db.stream_scalars(
+            stmt.execution_options(yield_per=settings.data_export_chunk_size)
+        )
+        async for partition in result.partitions():
+            for item in partition:
+                yield item
+
     async def _collect_user_profile(self, user: User) -> dict[str, Any]:
         """Collect user profile data."""
         return {
@@ -179,14 +326,11 @@ class DataExportService:
             "last_login_at": user.last_login_at.isoformat() if user.last_login_at else None,
         }
 
-    async def _collect_ad_accounts(self, user_id: int) -> list[dict[str, Any]]:
-        """Collect ad accounts data (without sensitive tokens)."""
+    async def _iter_ad_accounts(self, user_id: int) -> AsyncIterator[dict[str, Any]]:
+        """Stream ad accounts data (without sensitive tokens)."""
         stmt = select(AdAccount).where(AdAccount.user_id == user_id)
-        result = await self.db.execute(stmt)
-        accounts = result.scalars().all()
-        
-        return [
-            {
+        async for acc in self._stream(stmt):
+            yield {
                 "id": acc.id,
                 "platform": acc.platform,
                 "platform_account_id": acc.platform_account_id,
@@ -198,21 +342,16 @@ class DataExportService:
                 "last_synced_at": acc.last_synced_at.isoformat() if acc.last_synced_at else None,
                 "note": "OAuth tokens excluded for security",
             }
-            for acc in accounts
-        ]
 
-    async def _collect_credit_history(self, user_id: int) -> list[dict[str, Any]]:
-        """Collect credit transaction history."""
+    async def _iter_credit_history(self, user_id: int) -> AsyncIterator[dict[str, Any]]:
+        """Stream credit transaction history."""
         stmt = (
             select(CreditTransaction)
             .where(CreditTransaction.user_id == user_id)
             .order_by(CreditTransaction.created_at.desc())
         )
-        result = await self.db.execute(stmt)
-        transactions = result.scalars().all()
-        
-        return [
-            {
+        async for tx in self._stream(stmt):
+            yield {
                 "id": tx.id,
                 "type": tx.type,
                 "amount": float(tx.amount),
@@ -224,21 +363,16 @@ class DataExportService:
                 "details": tx.details,
                 "created_at": tx.created_at.isoformat(),
             }
-            for tx in transactions
-        ]
 
-    async def _collect_creatives(self, user_id: int) -> list[dict[str, Any]]:
-        """Collect creatives metadata."""
+    async def _iter_creatives(self, user_id: int) -> AsyncIterator[dict[str, Any]]:
+        """Stream creatives metadata."""
         stmt = (
             select(Creative)
             .where(Creative.user_id == user_id, Creative.status == 'active')
             .order_by(Creative.created_at.desc())
         )
-        result = await self.db.execute(stmt)
-        creatives = result.scalars().all()
-        
-        return [
-            {
+        async for creative in self._stream(stmt):
+            yield {
                 "id": creative.id,
                 "name": creative.name,
                 "file_url": creative.file_url,
@@ -251,21 +385,16 @@ class DataExportService:
                 "tags": creative.tags,
                 "created_at": creative.created_at.isoformat(),
             }
-            for creative in creatives
-        ]
 
-    async def _collect_landing_pages(self, user_id: int) -> list[dict[str, Any]]:
-        """Collect landing pages data."""
+    async def _iter_landing_pages(self, user_id: int) -> AsyncIterator[dict[str, Any]]:
+        """Stream landing pages data."""
         stmt = (
             select(LandingPage)
             .where(LandingPage.user_id == user_id)
             .order_by(LandingPage.created_at.desc())
         )
-        result = await self.db.execute(stmt)
-        pages = result.scalars().all()
-        
-        return [
-            {
+        async for page in self._stream(stmt):
+            yield {
                 "id": page.id,
                 "name": page.name,
                 "url": page.url,
@@ -277,21 +406,16 @@ class DataExportService:
                 "created_at": page.created_at.isoformat(),
                 "published_at": page.published_at.isoformat() if page.published_at else None,
             }
-            for page in pages
-        ]
 
-    async def _collect_campaigns(self, user_id: int) -> list[dict[str, Any]]:
-        """Collect campaigns data."""
+    async def _iter_campaigns(self, user_id: int) -> AsyncIterator[dict[str, Any]]:
+        """Stream campaigns data."""
         stmt = (
             select(Campaign)
             .where(Campaign.user_id == user_id)
             .order_by(Campaign.created_at.desc())
         )
-        result = await self.db.execute(stmt)
-        campaigns = result.scalars().all()
-        
-        return [
-            {
+        async for campaign in self._stream(stmt):
+            yield {
                 "id": campaign.id,
                 "platform": campaign.platform,
                 "platform_campaign_id": campaign.platform_campaign_id,
@@ -305,22 +429,16 @@ class DataExportService:
                 "landing_page_id": campaign.landing_page_id,
                 "created_at": campaign.created_at.isoformat(),
             }
-            for campaign in campaigns
-        ]
 
-    async def _collect_reports(self, user_id: int) -> list[dict[str, Any]]:
-        """Collect report metrics data."""
+    async def _iter_reports(self, user_id: int) -> AsyncIterator[dict[str, Any]]:
+        """Stream all report metrics data, newest first."""
         stmt = (
             select(ReportMetrics)
             .where(ReportMetrics.user_id == user_id)
             .order_by(ReportMetrics.timestamp.desc())
-            .limit(10000)  # Limit to last 10k records
         )
-        result = await self.db.execute(stmt)
-        metrics = result.scalars().all()
-        
-        return [
-            {
+        async for metric in self._stream(stmt):
+            yield {
                 "timestamp": metric.timestamp.isoformat(),
                 "ad_account_id": metric.ad_account_id,
                 "entity_type": metric.entity_type,
@@ -336,22 +454,16 @@ class DataExportService:
                 "cpa": float(metric.cpa),
                 "roas": metric.roas,
             }
-            for metric in metrics
-        ]
 
-    async def _collect_notifications(self, user_id: int) -> list[dict[str, Any]]:
-        """Collect notifications data."""
+    async def _iter_notifications(self, user_id: int) -> AsyncIterator[dict[str, Any]]:
+        """Stream notifications data."""
         stmt = (
             select(Notification)
             .where(Notification.user_id == user_id)
             .order_by(Notification.created_at.desc())
-            .limit(1000)  # Last 1000 notifications
         )
-        result = await self.db.execute(stmt)
-        notifications = result.scalars().all()
-        
-        return [
-            {
+        async for notif in self._stream(stmt):
+            yield {
                 "id": notif.id,
                 "type": notif.type,
                 "category": notif.category,
@@ -364,8 +476,34 @@ class DataExportService:
                 "sent_via": notif.sent_via,
                 "created_at": notif.created_at.isoformat(),
             }
-            for notif in notifications
-        ]
+
+    async def _collect_ad_accounts(self, user_id: int) -> list[dict[str, Any]]:
+        """Collect ad accounts data (without sensitive tokens)."""
+        return [row async for row in self._iter_ad_accounts(user_id)]
+
+    async def _collect_credit_history(self, user_id: int) -> list[dict[str, Any]]:
+        """Collect credit transaction history."""
+        return [row async for row in self._iter_credit_history(user_id)]
+
+    async def _collect_creatives(self, user_id: int) -> list[dict[str, Any]]:
+        """Collect creatives metadata."""
+        return [row async for row in self._iter_creatives(user_id)]
+
+    async def _collect_landing_pages(self, user_id: int) -> list[dict[str, Any]]:
+        """Collect landing pages data."""
+        return [row async for row in self._iter_landing_pages(user_id)]
+
+    async def _collect_campaigns(self, user_id: int) -> list[dict[str, Any]]:
+        """Collect campaigns data."""
+        return [row async for row in self._iter_campaigns(user_id)]
+
+    async def _collect_reports(self, user_id: int) -> list[dict[str, Any]]:
+        """Collect report metrics data."""
+        return [row async for row in self._iter_reports(user_id)]
+
+    async def _collect_notifications(self, user_id: int) -> list[dict[str, Any]]:
+        """Collect notifications data."""
+        return [row async for row in self._iter_notifications(user_id)]
 
     def _generate_readme(self, user: User) -> str:
         """Generate README file for the export."""
@@ -416,86 +554,31 @@ If you have any questions about this export, please contact support@aae.com
 © 2024 AAE. All rights reserved.
 """
 
-    def _generate_credit_csv(self, transactions: list[dict[str, Any]]) -> str:
+    def _generate_credit_csv(self, transactions: Iterable[dict[str, Any]]) -> str:
         """Generate CSV for credit history."""
         output = io.StringIO()
         writer = csv.writer(output)
-        
-        # Header
-        writer.writerow([
-            'Date',
-            'Type',
-            'Amount',
-            'From Gifted',
-            'From Purchased',
-            'Balance After',
-            'Operation Type',
-            'Operation ID',
-            'Details'
-        ])
-        
-        # Data rows
-        for tx in transactions:
-            writer.writerow([
-                tx['created_at'],
-                tx['type'],
-                tx['amount'],
-                tx['from_gifted'],
-                tx['from_purchased'],
-                tx['balance_after'],
-                tx['operation_type'] or '',
-                tx['operation_id'] or '',
-                json.dumps(tx['details']) if tx['details'] else ''
-            ])
-        
+        writer.writerow(CREDIT_CSV_HEADER)
+        writer.writerows(_credit_csv_row(tx) for tx in transactions)
         return output.getvalue()
 
-    def _generate_metrics_csv(self, metrics: list[dict[str, Any]]) -> str:
+    def _generate_metrics_csv(self, metrics: Iterable[dict[str, Any]]) -> str:
         """Generate CSV for report metrics."""
         output = io.StringIO()
         writer = csv.writer(output)
-        
-        # Header
-        writer.writerow([
-            'Timestamp',
-            'Ad Account ID',
-            'Entity Type',
-            'Entity ID',
-            'Entity Name',
-            'Impressions',
-            'Clicks',
-            'Spend',
-            'Conversions',
-            'Revenue',
-            'CTR',
-            'CPC',
-            'CPA',
-            'ROAS'
-        ])
-        
-        # Data rows
-        for metric in metrics:
-            writer.writerow([
-                metric['timestamp'],
-                metric['ad_account_id'],
-                metric['entity_type'],
-                metric['entity_id'],
-                metric['entity_name'],
-                metric['impressions'],
-                metric['clicks'],
-                metric['spend'],
-                metric['conversions'],
-                metric['revenue'],
-                metric['ctr'],
-                metric['cpc'],
-                metric['cpa'],
-                metric['roas']
-            ])
-        
+        writer.writerow(METRICS_CSV_HEADER)
+        writer.writerows(_metrics_csv_row(metric) for metric in metrics)
         return output.getvalue()
 
-    def _generate_performance_summary(self, metrics: list[dict[str, Any]]) -> str:
+    def _generate_performance_summary(self, metrics: Iterable[dict[str, Any]]) -> str:
         """Generate performance summary CSV."""
+        totals = MetricsTotals()
+        for metric in metrics:
+            totals.add(metric)
+        return self._summary_csv(totals)
+
+    def _summary_csv(self, totals: MetricsTotals) -> str:
+        """Format running metric totals as the performance summary CSV."""
         output = io.StringIO()
         writer = csv.writer(output)
         
@@ -505,27 +588,20 @@ If you have any questions about this export, please contact support@aae.com
             'Value'
         ])
         
-        if not metrics:
+        if not totals.rows:
             return output.getvalue()
         
-        # Calculate totals
-        total_impressions = sum(m['impressions'] for m in metrics)
-        total_clicks = sum(m['clicks'] for m in metrics)
-        total_spend = sum(m['spend'] for m in metrics)
-        total_conversions = sum(m['conversions'] for m in metrics)
-        total_revenue = sum(m['revenue'] for m in metrics)
-        
-        avg_ctr = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0
-        avg_cpc = (total_spend / total_clicks) if total_clicks > 0 else 0
-        avg_cpa = (total_spend / total_conversions) if total_conversions > 0 else 0
-        total_roas = (total_revenue / total_spend) if total_spend > 0 else 0
+        avg_ctr = (totals.clicks / totals.impressions * 100) if totals.impressions > 0 else 0
+        avg_cpc = (totals.spend / totals.clicks) if totals.clicks > 0 else 0
+        avg_cpa = (totals.spend / totals.conversions) if totals.conversions > 0 else 0
+        total_roas = (totals.revenue / totals.spend) if totals.spend > 0 else 0
         
         # Write summary
-        writer.writerow(['Total Impressions', total_impressions])
-        writer.writerow(['Total Clicks', total_clicks])
-        writer.writerow(['Total Spend', f'{total_spend:.2f}'])
-        writer.writerow(['Total Conversions', total_conversions])
-        writer.writerow(['Total Revenue', f'{total_revenue:.2f}'])
+        writer.writerow(['Total Impressions', totals.impressions])
+        writer.writerow(['Total Clicks', totals.clicks])
+        writer.writerow(['Total Spend', f'{totals.spend:.2f}'])
+        writer.writerow(['Total Conversions', totals.conversions])
+        writer.writerow(['Total Revenue', f'{totals.revenue:.2f}'])
         writer.writerow(['Average CTR (%)', f'{avg_ctr:.2f}'])
         writer.writerow(['Average CPC', f'{avg_cpc:.2f}'])
         writer.writerow(['Average CPA', f'{avg_cpa:.2f}'])
@@ -533,11 +609,7 @@ If you have any questions about this export, please contact support@aae.com
         
         return output.getvalue()
 
-    async def _add_creative_files(
-        self,
-        zip_file: zipfile.ZipFile,
-        creatives: list[dict[str, Any]]
-    ) -> None:
+    async def _add_creative_files(self, zip_file: zipfile.ZipFile) -> None:
         """Download and add creative files to ZIP."""
         # Note: In production, this would download files from S3
         # For MVP, we'll just add a note that files are available at their URLs
@@ -546,11 +618,7 @@ If you have any questions about this export, please contact support@aae.com
         note += "Please download them individually from the URLs provided.\n"
         zip_file.writestr('creatives/NOTE.txt', note)
 
-    async def _add_landing_page_files(
-        self,
-        zip_file: zipfile.ZipFile,
-        pages: list[dict[str, Any]]
-    ) -> None:
+    async def _add_landing_page_files(self, zip_file: zipfile.ZipFile) -> None:
         """Add landing page HTML files to ZIP."""
         # Note: In production, this would download HTML from S3
         # For MVP, we'll add a note
@@ -8,14 +8,13 @@ Handles async file operations:
 import logging
 from typing import Any
 
-from app.core.config import settings
 from app.core.gemini_files import gemini_files_service
-from app.core.storage import S3Storage
+from app.core.storage import async_creatives_storage
 
 logger = logging.getLogger(__name__)
 
 # Storage instance - use creatives bucket for all file uploads
-uploads_storage = S3Storage(settings.s3_bucket_creatives)
+uploads_storage = async_creatives_storage
 
 
 class ProcessedAttachment:
@@ -90,22 +89,17 @@ async def process_attachment(
             )
             return None
 
-        # Check if file exists
-        if not uploads_storage.file_exists(storage_path):
-            logger.error(f"File not found: {storage_path}")
-            return None
-
-        # Get file info from S3
-        file_info = uploads_storage.get_file_info(storage_path)
+        # Get file info from S3 (a single HEAD also checks existence)
+        file_info = await uploads_storage.get_file_info(storage_path)
         if not file_info:
-            logger.error(f"Failed to get file info: {storage_path}")
+            logger.error(f"File not found: {storage_path}")
             return None
 
         content_type = file_info.get("content_type", "application/octet-stream")
         file_size = file_info.get("size", 0)
 
         # Download file data for Gemini upload
-        file_data = uploads_storage.download_file(storage_path)
+        file_data = await uploads_storage.download_file(storage_path)
         if not file_data:
             logger.error(f"Failed to download file: {storage_path}")
             return None
@@ -7,7 +7,7 @@ from typing import Any
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.storage import landing_pages_storage
+from app.core.storage import async_landing_pages_storage
 from app.models.landing_page import LandingPage
 from app.schemas.landing_page import (
     LandingPageCreate,
@@ -51,7 +51,7 @@ class LandingPageService:
 
         # Upload draft HTML to S3 immediately
         if data.html_content:
-            landing_pages_storage.upload_file(
+            await async_landing_pages_storage.upload_file(
                 key=draft_s3_key,
                 data=data.html_content.encode("utf-8"),
                 content_type="text/html; charset=utf-8",
@@ -192,7 +192,7 @@ class LandingPageService:
 
             # 同步更新 S3 文件（覆盖同一个文件，不产生新副本）
             if draft_content_changed and landing_page.s3_key:
-                landing_pages_storage.upload_file(
+                await async_landing_pages_storage.upload_file(
                     key=landing_page.s3_key,
                     data=landing_page.draft_content.encode("utf-8"),
                     content_type="text/html; charset=utf-8",
@@ -241,7 +241,7 @@ class LandingPageService:
             # Delete S3 file
             try:
                 if landing_page.s3_key:
-                    landing_pages_storage.delete_file(landing_page.s3_key)
+                    await async_landing_pages_storage.delete_file(landing_page.s3_key)
             except Exception:
                 # Log but don't fail if S3 deletion fails
                 pass
@@ -318,7 +318,7 @@ class LandingPageService:
         published_s3_key = f"users/{user_id}/landing-pages/{unique_id}/index.html"
 
         # Upload HTML to published path (with GA4 tracking if configured)
-        landing_pages_storage.upload_file(
+        await async_landing_pages_storage.upload_file(
             key=published_s3_key,
             data=html_to_publish.encode("utf-8"),
             content_type="text/html; charset=utf-8",
@@ -327,7 +327,7 @@ class LandingPageService:
         # 删除 drafts/ 下的旧文件（节省存储空间）
         if landing_page.s3_key != published_s3_key:
             try:
-                landing_pages_storage.delete_file(landing_page.s3_key)
+                await async_landing_pages_storage.delete_file(landing_page.s3_key)
             except Exception:
                 # Log but don't fail if deletion fails
                 pass
@@ -336,7 +336,7 @@ class LandingPageService:
         landing_page.html_content = landing_page.draft_content  # 复制草稿到已发布版本
         landing_page.status = LandingPageStatus.PUBLISHED.value
         landing_page.s3_key = published_s3_key  # 更新到正式路径
-        landing_page.url = landing_pages_storage.get_cdn_url(published_s3_key)  # 使用 CloudFront URL
+        landing_page.url = async_landing_pages_storage.get_cdn_url(published_s3_key)  # 使用 CloudFront URL
         landing_page.published_at = datetime.utcnow()
         landing_page.updated_at = datetime.utcnow()
 
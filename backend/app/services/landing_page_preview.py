@@ -0,0 +1,248 @@
+"""Rendered landing page previews with inlined images.
+
+Previews used to download the page HTML and every image it references
+on each view. Rendered output is now cached in Redis under the page ID
+and the S3 ETag of its HTML, so an unchanged page costs one HEAD
+request, and clients holding the matching ETag get 304 without any
+render at all. Image data URIs are cached by content digest and shared
+across pages, so common assets are fetched once.
+"""
+
+import asyncio
+import base64
+import hashlib
+import logging
+import re
+from dataclasses import dataclass
+
+import httpx
+
+from app.core.redis import get_redis
+from app.core.storage import async_landing_pages_storage
+from app.models.landing_page import LandingPage
+from app.schemas.landing_page import LandingPageStatus
+
+logger = logging.getLogger(__name__)
+
+# Redis key prefixes: rendered pages, URL -> image digest, digest -> data URI
+RENDER_KEY_PREFIX = "lp_preview:"
+IMAGE_URL_KEY_PREFIX = "lp_image_url:"
+IMAGE_KEY_PREFIX = "lp_image:"
+
+# Seconds rendered previews and inlined images stay cached
+RENDER_CACHE_TTL = 3600
+IMAGE_CACHE_TTL = 86400
+
+IMAGE_FETCH_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+}
+
+_IMG_SRC_PATTERN = re.compile(r'<img[^>]+src=["\']([^"\']+)["\']', re.IGNORECASE)
+_CSS_URL_PATTERN = re.compile(r'url\(["\']?(https?://[^"\')\s]+)["\']?\)', re.IGNORECASE)
+
+
+class LandingPageContentError(Exception):
+    """Raised when a landing page has no HTML in S3 or the database."""
+
+
+@dataclass(frozen=True)
+class PreviewVersion:
+    """Identifies one rendering of a landing page.
+
+    version is the S3 ETag of the page HTML, or a digest of the database
+    copy when S3 has no object (fallback_html then holds that copy).
+    """
+
+    landing_page_id: int
+    version: str
+    embed_images: bool
+    fallback_html: str | None = None
+
+    @property
+    def digest(self) -> str:
+        raw = f"{self.landing_page_id}:{self.version}:{int(self.embed_images)}"
+        return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+    @property
+    def etag(self) -> str:
+        """HTTP ETag for the rendered output."""
+        return f'"{self.digest}"'
+
+    @property
+    def cache_key(self) -> str:
+        return RENDER_KEY_PREFIX + self.digest
+
+    def matches(self, if_none_match: str | None) -> bool:
+        """Whether an If-None-Match header already names this rendering."""
+        if not if_none_match:
+            return False
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return self.etag in tags or "*" in tags
+
+
+def _database_html(landing_page: LandingPage) -> str | None:
+    """HTML stored on the row: the draft for drafts, else the published copy."""
+    if landing_page.status == LandingPageStatus.DRAFT.value:
+        return landing_page.draft_content
+    return landing_page.html_content
+
+
+async def resolve_preview_version(
+    landing_page: LandingPage,
+    embed_images: bool,
+) -> PreviewVersion:
+    """Find which version of the page HTML a preview would render.
+
+    Raises:
+        LandingPageContentError: If the page has no HTML anywhere
+    """
+    info = await async_landing_pages_storage.get_file_info(landing_page.s3_key)
+    if info and info.get("etag"):
+        return PreviewVersion(landing_page.id, info["etag"], embed_images)
+
+    # Fallback to database content if S3 fails
+    html = _database_html(landing_page)
+    if not html:
+        raise LandingPageContentError("Landing page has no HTML content")
+    digest = hashlib.sha256(html.encode("utf-8")).hexdigest()
+    return PreviewVersion(landing_page.id, f"db-{digest}", embed_images, fallback_html=html)
+
+
+async def render_preview(landing_page: LandingPage, version: PreviewVersion) -> str:
+    """Return the rendered HTML for a version, from cache when possible.
+
+    Raises:
+        LandingPageContentError: If the page has no HTML anywhere
+    """
+    try:
+        redis = await get_redis()
+        cached = await redis.get(version.cache_key)
+        if cached is not None:
+            return cached
+    except Exception as e:
+        logger.warning(f"Preview cache read failed for {version.cache_key}: {e}")
+
+    html = version.fallback_html
+    if html is None:
+        html_bytes = await async_landing_pages_storage.download_file(landing_page.s3_key)
+        html = html_bytes.decode("utf-8") if html_bytes else _database_html(landing_page)
+        if not html:
+            raise LandingPageContentError("Landing page has no HTML content")
+
+    if version.embed_images:
+        html = await inline_images(html)
+
+    try:
+        redis = await get_redis()
+        await redis.set(version.cache_key, html, ex=RENDER_CACHE_TTL)
+    except Exception as e:
+        logger.warning(f"Preview cache write failed for {version.cache_key}: {e}")
+
+    return html
+
+
+def extract_image_urls(html: str) -> list[str]:
+    """Extract unique absolute image URLs from <img src> and CSS url()."""
+    urls = set()
+    for match in _IMG_SRC_PATTERN.finditer(html):
+        url = match.group(1)
+        # Skip data URIs and relative paths that don't start with http
+        if url.startswith("http://") or url.startswith("https://"):
+            urls.add(url)
+    for match in _CSS_URL_PATTERN.finditer(html):
+        urls.add(match.group(1))
+    return list(urls)
+
+
+def substitute_urls(html: str, replacements: dict[str, str]) -> str:
+    """Replace every occurrence of each URL in one pass over the HTML."""
+    if not replacements:
+        return html
+    # Longest first so a URL that prefixes another never wins the match
+    pattern = re.compile(
+        "|".join(re.escape(url) for url in sorted(replacements, key=len, reverse=True))
+    )
+    return pattern.sub(lambda match: replacements[match.group(0)], html)
+
+
+async def inline_images(html: str) -> str:
+    """Replace image URLs in the HTML with base64 data URIs."""
+    urls = extract_image_urls(html)
+    if not urls:
+        return html
+
+    data_uris = await _get_image_data_uris(urls)
+    logger.info(f"Preview: Embedded {len(data_uris)} of {len(urls)} images")
+    return substitute_urls(html, data_uris)
+
+
+def _url_key(url: str) -> str:
+    return IMAGE_URL_KEY_PREFIX + hashlib.sha256(url.encode()).hexdigest()
+
+
+async def _get_image_data_uris(urls: list[str]) -> dict[str, str]:
+    """Map image URLs to data URIs, downloading only uncached images."""
+    data_uris: dict[str, str] = {}
+    try:
+        redis = await get_redis()
+        digests = await redis.mget([_url_key(url) for url in urls])
+        known = {url: digest for url, digest in zip(urls, digests, strict=True) if digest}
+        if known:
+            cached = await redis.mget([IMAGE_KEY_PREFIX + d for d in known.values()])
+            data_uris = {
+                url: uri for url, uri in zip(known, cached, strict=True) if uri is not None
+            }
+    except Exception as e:
+        logger.warning(f"Image cache read failed: {e}")
+
+    missing = [url for url in urls if url not in data_uris]
+    if not missing:
+        return data_uris
+
+    async with httpx.AsyncClient(timeout=30.0, headers=IMAGE_FETCH_HEADERS) as client:
+        results = await asyncio.gather(
+            *(_download_image_as_base64(client, url) for url in missing)
+        )
+    downloaded = dict(result for result in results if result)
+    data_uris.update(downloaded)
+
+    if downloaded:
+        try:
+            redis = await get_redis()
+            async with redis.pipeline(transaction=False) as pipe:
+                for url, data_uri in downloaded.items():
+                    digest = hashlib.sha256(data_uri.encode()).hexdigest()
+                    pipe.set(_url_key(url), digest, ex=IMAGE_CACHE_TTL)
+                    pipe.set(IMAGE_KEY_PREFIX + digest, data_uri, ex=IMAGE_CACHE_TTL)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Image cache write failed: {e}")
+
+    return data_uris
+
+
+async def _download_image_as_base64(
+    client: httpx.AsyncClient,
+    url: str,
+) -> tuple[str, str] | None:
+    """Download image and convert to base64 data URI.
+
+    Returns:
+        Tuple of (original_url, data_uri) or None if download fails
+    """
+    try:
+        response = await client.get(url, follow_redirects=True)
+        response.raise_for_status()
+
+        content_type = response.headers.get("content-type", "image/jpeg")
+        # Clean content type (remove charset, etc.)
+        content_type = content_type.split(";")[0].strip()
+        # Ensure valid image content type
+        if not content_type.startswith("image/"):
+            content_type = "image/jpeg"
+
+        image_base64 = base64.b64encode(response.content).decode("utf-8")
+        return (url, f"data:{content_type};base64,{image_base64}")
+    except Exception as e:
+        logger.warning(f"Failed to download image {url[:100]}: {e}")
+        return None
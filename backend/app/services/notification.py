@@ -7,6 +7,7 @@ from enum import Enum
 from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import fetch_keyset_page
 from app.models.notification import Notification
 
 
@@ -33,6 +34,7 @@ class NotificationCategory(str, Enum):
     BUDGET_EXHAUSTED = "budget_exhausted"
     AD_PAUSED = "ad_paused"
     OPTIMIZATION_SUGGESTION = "optimization_suggestion"
+    PERFORMANCE_ANOMALY = "performance_anomaly"
     WEEKLY_SUMMARY = "weekly_summary"
     NEW_FEATURE = "new_feature"
     SYSTEM_MAINTENANCE = "system_maintenance"
@@ -214,10 +216,31 @@ class NotificationService:
         if unread_only:
             stmt = stmt.where(Notification.is_read == False)  # noqa: E712
 
-        stmt = stmt.order_by(Notification.created_at.desc()).limit(limit).offset(offset)
+        stmt = (
+            stmt.order_by(Notification.created_at.desc(), Notification.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_notifications_page(
+        self,
+        user_id: int,
+        limit: int = 50,
+        cursor: str | None = None,
+        unread_only: bool = False,
+    ) -> tuple[list[Notification], str | None]:
+        """Get a keyset page of notifications and the cursor of the next page."""
+        stmt = select(Notification).where(Notification.user_id == user_id)
+
+        if unread_only:
+            stmt = stmt.where(Notification.is_read == False)  # noqa: E712
+
+        return await fetch_keyset_page(
+            self.db, stmt, Notification.created_at, cursor, limit
+        )
+
     async def get_unread_count(self, user_id: int) -> int:
         """Get count of unread notifications for a user."""
         stmt = select(func.count(Notification.id)).where(
@@ -468,3 +491,27 @@ class NotificationService:
             action_url="/dashboard",
             action_text="View Suggestions",
         )
+
+    async def create_performance_anomaly_notification(
+        self,
+        user_id: int,
+        anomalies: list[dict],
+    ) -> Notification:
+        """Create one notification summarizing detected metric anomalies."""
+        lines = [
+            f"{a['entity_type']} {a['entity_name']}: {a['metric'].upper()} "
+            f"{a['deviation']} ({a['severity']})"
+            for a in anomalies[:3]
+        ]
+        if len(anomalies) > 3:
+            lines.append(f"and {len(anomalies) - 3} more")
+        return await self.create_notification(
+            user_id=user_id,
+            notification_type=NotificationType.IMPORTANT,
+            category=NotificationCategory.PERFORMANCE_ANOMALY,
+            title="Performance Anomalies Detected",
+            message="\n".join(lines),
+            action_url="/dashboard",
+            action_text="View Performance",
+            extra_data={"anomalies": anomalies},
+        )
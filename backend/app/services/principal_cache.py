@@ -0,0 +1,233 @@
+"""Short-lived cache of authenticated MCP principals.
+
+An agent turn fires many MCP tool calls for the same user, and each one
+used to load the user row to authenticate. Resolved principals are kept
+in a small in-process LRU backed by Redis, so only the first call of a
+turn (or the first call after the Redis TTL) reaches the database.
+
+Entries are dropped explicitly when a user's approval or active status
+changes; the invalidation is published so every worker drops its local
+copy, and the local TTL bounds staleness if a message is missed.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Redis key prefix for cached principals
+PRINCIPAL_KEY_PREFIX = "mcp_principal:"
+
+# Redis channel carrying the IDs of users whose principal changed
+INVALIDATION_CHANNEL = "mcp_principal:invalidate"
+
+# Seconds to wait before resubscribing after a pub/sub error
+LISTENER_RETRY_DELAY = 5
+
+
+@dataclass(frozen=True)
+class MCPPrincipal:
+    """Authenticated user identity passed to MCP tool handlers.
+
+    Only identity fields are cached; balances and other mutable user
+    data are always read by the tools themselves.
+    """
+
+    id: int
+    email: str
+    is_approved: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "MCPPrincipal":
+        """Build a principal from an active User."""
+        return cls(id=user.id, email=user.email, is_approved=bool(user.is_approved))
+
+
+class PrincipalCache:
+    """Two-level (process LRU + Redis) cache of principals by user ID.
+
+    Invalidation bumps a version; a database load that started before an
+    invalidation is returned to its caller but not cached.
+    """
+
+    def __init__(self, ttl: int, local_ttl: float, max_size: int):
+        self.ttl = ttl
+        self.local_ttl = local_ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[int, tuple[float, MCPPrincipal]] = OrderedDict()
+        self._version = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _get_local(self, user_id: int) -> MCPPrincipal | None:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, principal = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return principal
+
+    def _set_local(self, principal: MCPPrincipal) -> None:
+        self._entries[principal.id] = (time.monotonic() + self.local_ttl, principal)
+        self._entries.move_to_end(principal.id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def get(
+        self,
+        user_id: int,
+        loader: Callable[[int], Awaitable[User | None]],
+    ) -> MCPPrincipal | None:
+        """Return the principal for a user, loading it on a miss.
+
+        Args:
+            user_id: User ID
+            loader: Coroutine function returning the active User or None
+
+        Returns:
+            The principal, or None if the user does not exist or is inactive
+        """
+        principal = self._get_local(user_id)
+        if principal is not None:
+            self.hits += 1
+            return principal
+
+        version = self._version
+        key = f"{PRINCIPAL_KEY_PREFIX}{user_id}"
+        redis = None
+        try:
+            redis = await get_redis()
+            cached = await redis.get(key)
+            if cached is not None:
+                principal = MCPPrincipal(**json.loads(cached))
+        except Exception as e:
+            logger.warning(f"Principal cache unavailable: {e}")
+
+        if principal is None:
+            self.misses += 1
+            user = await loader(user_id)
+            if user is None:
+                return None
+            principal = MCPPrincipal.from_user(user)
+            if redis is not None and version == self._version:
+                try:
+                    await redis.set(key, json.dumps(asdict(principal)), ex=self.ttl)
+                except Exception as e:
+                    logger.warning(f"Failed to cache principal: {e}")
+        else:
+            self.hits += 1
+
+        if version == self._version:
+            self._set_local(principal)
+        return principal
+
+    def drop_local(self, user_id: int | None = None) -> None:
+        """Drop one user's local entry, or all of them."""
+        self._version += 1
+        if user_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(user_id, None)
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters and the local entry count."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+principal_cache = PrincipalCache(
+    ttl=settings.mcp_principal_cache_ttl,
+    local_ttl=settings.mcp_principal_local_ttl,
+    max_size=settings.mcp_principal_cache_size,
+)
+
+# Strong references to fire-and-forget invalidation tasks
+_pending_invalidations: set[asyncio.Task[None]] = set()
+_listener_task: asyncio.Task[None] | None = None
+
+
+async def invalidate_principal(user_id: int) -> None:
+    """Drop a user's cached principal in Redis and in every worker.
+
+    Call only after the user change has been committed.
+    """
+    principal_cache.drop_local(user_id)
+    try:
+        redis = await get_redis()
+        await redis.delete(f"{PRINCIPAL_KEY_PREFIX}{user_id}")
+        await redis.publish(INVALIDATION_CHANNEL, str(user_id))
+    except Exception as e:
+        # Other workers pick up the change when their local TTL expires
+        logger.warning(f"Failed to publish principal invalidation: {e}")
+
+
+def invalidate_principal_on_commit(db: AsyncSession, user_id: int) -> None:
+    """Invalidate a user's principal once the session commits."""
+
+    def on_commit(session: Any) -> None:
+        task = asyncio.get_running_loop().create_task(invalidate_principal(user_id))
+        _pending_invalidations.add(task)
+        task.add_done_callback(_pending_invalidations.discard)
+
+    event.listen(db.sync_session, "after_commit", on_commit, once=True)
+
+
+async def _listen() -> None:
+    """Drop local principals whenever another worker publishes a change."""
+    while True:
+        try:
+            redis = await get_redis()
+            pubsub = redis.pubsub()
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            # Changes published while unsubscribed would otherwise be missed
+            principal_cache.drop_local()
+            try:
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        principal_cache.drop_local(int(message["data"]))
+                    except (TypeError, ValueError):
+                        principal_cache.drop_local()
+            finally:
+                await pubsub.reset()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Principal invalidation listener error: {e}")
+            await asyncio.sleep(LISTENER_RETRY_DELAY)
+
+
+def start_principal_listener() -> None:
+    """Start listening for principal invalidations (app startup)."""
+    global _listener_task
+    if _listener_task is None or _listener_task.done():
+        _listener_task = asyncio.get_running_loop().create_task(_listen())
+
+
+async def stop_principal_listener() -> None:
+    """Stop the invalidation listener (app shutdown)."""
+    global _listener_task
+    if _listener_task is None:
+        return
+    _listener_task.cancel()
+    try:
+        await _listener_task
+    except asyncio.CancelledError:
+        pass
+    _listener_task = None
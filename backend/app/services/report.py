@@ -1,13 +1,17 @@
 """Report metrics service for managing advertising performance data."""
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 from typing import Any
 
-from sqlalchemy import and_, delete, func, select
+from sqlalchemy import Insert, and_, delete, func, insert, or_, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import cached_count, encode_cursor, fetch_keyset_page
 from app.models.report_metrics import ReportMetrics
+from app.models.report_metrics_archival import ReportMetricsArchival
 from app.schemas.report import (
     AggregatedMetrics,
     EntityType,
@@ -15,6 +19,7 @@ from app.schemas.report import (
     MetricsFilter,
     TrendDataPoint,
 )
+from app.services.report_rollup import ReportRollupService, rollup_granularity_for
 
 
 class ReportMetricsNotFoundError(Exception):
@@ -25,11 +30,76 @@ class ReportMetricsNotFoundError(Exception):
         super().__init__(f"Report metrics {metrics_id} not found")
 
 
+class ArchivedPeriodError(Exception):
+    """Raised when metrics are written into an already archived period."""
+
+    def __init__(self, archived_before: datetime):
+        self.archived_before = archived_before
+        super().__init__(
+            f"Metrics before {archived_before.isoformat()} have been archived"
+        )
+
+
+# Rows per multi-row INSERT statement, keeps packets below max_allowed_packet
+BULK_INSERT_CHUNK_SIZE = 1000
+
+# Unique key used to detect existing rows when upserting
+METRICS_UPSERT_KEY = ("user_id", "entity_type", "entity_id", "timestamp")
+
+# Columns overwritten when an upsert hits an existing row
+METRICS_UPSERT_COLUMNS = (
+    "ad_account_id",
+    "entity_name",
+    "impressions",
+    "clicks",
+    "spend",
+    "conversions",
+    "revenue",
+    "ctr",
+    "cpc",
+    "cpa",
+    "roas",
+)
+
+
+# Columns returned per entity by get_entity_daily_series
+ENTITY_SERIES_COLUMNS = (
+    "impressions",
+    "clicks",
+    "spend",
+    "conversions",
+    "revenue",
+    "ctr",
+    "cpc",
+    "cpa",
+    "roas",
+)
+
+# Raw columns needed to add or subtract rows from rollups
+ROLLUP_SOURCE_COLUMNS = (
+    ReportMetrics.timestamp,
+    ReportMetrics.user_id,
+    ReportMetrics.ad_account_id,
+    ReportMetrics.entity_type,
+    ReportMetrics.entity_id,
+    ReportMetrics.impressions,
+    ReportMetrics.clicks,
+    ReportMetrics.spend,
+    ReportMetrics.conversions,
+    ReportMetrics.revenue,
+    ReportMetrics.ctr,
+    ReportMetrics.cpc,
+    ReportMetrics.cpa,
+    ReportMetrics.roas,
+)
+
+
 class ReportService:
     """Service for report metrics operations."""
 
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.rollups = ReportRollupService(db)
 
     def _calculate_derived_metrics(
         self,
@@ -77,66 +147,236 @@ class ReportService:
     ) -> ReportMetrics:
         """Save a single metrics record.
 
+        Saving is idempotent: a record that already exists for the same
+        entity and timestamp is overwritten, as in save_metrics_batch.
+
         Args:
             user_id: Owner user ID
             data: Metrics data to save
 
         Returns:
-            Created ReportMetrics instance
+            Stored ReportMetrics instance
+
+        Raises:
+            ArchivedPeriodError: If the timestamp is in an archived period
         """
-        # Calculate derived metrics
-        derived = self._calculate_derived_metrics(
-            impressions=data.impressions,
-            clicks=data.clicks,
-            spend=data.spend,
-            conversions=data.conversions,
-            revenue=data.revenue,
-        )
+        return (await self.save_metrics_batch(user_id, [data]))[0]
 
-        metrics = ReportMetrics(
-            timestamp=data.timestamp,
-            user_id=user_id,
-            ad_account_id=data.ad_account_id,
-            entity_type=data.entity_type.value,
-            entity_id=data.entity_id,
-            entity_name=data.entity_name,
-            impressions=data.impressions,
-            clicks=data.clicks,
-            spend=data.spend,
-            conversions=data.conversions,
-            revenue=data.revenue,
-            ctr=derived["ctr"],
-            cpc=derived["cpc"],
-            cpa=derived["cpa"],
-            roas=derived["roas"],
+    async def save_metrics_batch(
+        self,
+        user_id: int,
+        metrics_list: list[MetricsCreate],
+    ) -> list[ReportMetrics]:
+        """Save multiple metrics records in batch.
+
+        Records are upserted with bulk_insert_metrics, so saving the same
+        entity and timestamp again overwrites the stored record instead of
+        failing. Repeated keys within metrics_list are collapsed, the last
+        one winning.
+
+        Args:
+            user_id: Owner user ID
+            metrics_list: List of metrics data to save
+
+        Returns:
+            List of stored ReportMetrics instances, one per distinct key
+
+        Raises:
+            ArchivedPeriodError: If any timestamp is in an archived period
+        """
+        await self.bulk_insert_metrics(user_id, metrics_list, upsert=True)
+
+        rows = self._build_metrics_rows(user_id, metrics_list)
+        keys = list(dict.fromkeys((r["entity_type"], r["entity_id"], r["timestamp"]) for r in rows))
+        query = (
+            select(ReportMetrics)
+            .where(
+                ReportMetrics.user_id == user_id,
+                ReportMetrics.entity_id.in_({key[1] for key in keys}),
+                ReportMetrics.timestamp.in_({key[2] for key in keys}),
+            )
+            .execution_options(populate_existing=True)
         )
+        result = await self.db.execute(query)
+        stored = {(m.entity_type, m.entity_id, m.timestamp): m for m in result.scalars()}
+
+        return [stored[key] for key in keys]
 
-        self.db.add(metrics)
-        await self.db.flush()
-        await self.db.refresh(metrics)
+    def _build_metrics_rows(
+        self,
+        user_id: int,
+        metrics_list: list[MetricsCreate],
+    ) -> list[dict[str, Any]]:
+        """Build insert rows for a batch, deriving CTR/CPC/CPA/ROAS in one pass.
 
-        return metrics
+        Args:
+            user_id: Owner user ID
+            metrics_list: List of metrics data
 
-    async def save_metrics_batch(
+        Returns:
+            List of column dictionaries ready for INSERT
+        """
+        created_at = datetime.utcnow()
+        calculate = self._calculate_derived_metrics
+
+        return [
+            {
+                "timestamp": data.timestamp,
+                "user_id": user_id,
+                "ad_account_id": data.ad_account_id,
+                "entity_type": data.entity_type.value,
+                "entity_id": data.entity_id,
+                "entity_name": data.entity_name,
+                "impressions": data.impressions,
+                "clicks": data.clicks,
+                "spend": data.spend,
+                "conversions": data.conversions,
+                "revenue": data.revenue,
+                "created_at": created_at,
+                **calculate(
+                    impressions=data.impressions,
+                    clicks=data.clicks,
+                    spend=data.spend,
+                    conversions=data.conversions,
+                    revenue=data.revenue,
+                ),
+            }
+            for data in metrics_list
+        ]
+
+    def _build_bulk_insert(
+        self,
+        rows: list[dict[str, Any]],
+        upsert: bool,
+    ) -> Insert:
+        """Build a multi-row INSERT, optionally upserting on the entity key.
+
+        Args:
+            rows: Column dictionaries to insert
+            upsert: Whether to update rows that already exist
+
+        Returns:
+            Insert statement for the rows
+        """
+        if not upsert:
+            return insert(ReportMetrics).values(rows)
+
+        dialect = self.db.get_bind().dialect.name
+
+        if dialect == "mysql":
+            stmt = mysql_insert(ReportMetrics).values(rows)
+            return stmt.on_duplicate_key_update(
+                {column: stmt.inserted[column] for column in METRICS_UPSERT_COLUMNS}
+            )
+
+        # SQLite (tests and local development)
+        stmt = sqlite_insert(ReportMetrics).values(rows)
+        return stmt.on_conflict_do_update(
+            index_elements=list(METRICS_UPSERT_KEY),
+            set_={column: stmt.excluded[column] for column in METRICS_UPSERT_COLUMNS},
+        )
+
+    async def bulk_insert_metrics(
         self,
         user_id: int,
         metrics_list: list[MetricsCreate],
-    ) -> list[ReportMetrics]:
-        """Save multiple metrics records in batch.
+        upsert: bool = False,
+        chunk_size: int = BULK_INSERT_CHUNK_SIZE,
+    ) -> int:
+        """Bulk ingest metrics using multi-row INSERT statements.
+
+        Unlike save_metrics_batch, no ORM instances are created or refreshed;
+        rows are written in chunks of chunk_size per statement. Used for
+        platform syncs that ingest tens of thousands of rows at once.
 
         Args:
             user_id: Owner user ID
             metrics_list: List of metrics data to save
+            upsert: Update existing (user, entity, timestamp) rows instead of
+                failing on duplicates. Repeated keys within metrics_list
+                are collapsed, the last one winning.
+            chunk_size: Number of rows per INSERT statement
 
         Returns:
-            List of created ReportMetrics instances
+            Number of rows written
+
+        Raises:
+            ArchivedPeriodError: If any timestamp is in an archived period
         """
-        results = []
-        for data in metrics_list:
-            metrics = await self.save_metrics(user_id, data)
-            results.append(metrics)
-        return results
+        rows = self._build_metrics_rows(user_id, metrics_list)
+        if upsert:
+            # A key repeated within one statement would be subtracted from
+            # the rollups once but added once per occurrence
+            rows = list({tuple(row[c] for c in METRICS_UPSERT_KEY): row for row in rows}.values())
+        await self._check_not_archived(rows)
+
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start : start + chunk_size]
+            if upsert:
+                # Replaced rows must leave the rollups before their new values enter
+                replaced = await self._fetch_existing_rows(user_id, chunk)
+                await self.rollups.apply_rows(replaced, sign=-1)
+            await self.db.execute(self._build_bulk_insert(chunk, upsert))
+            await self.rollups.apply_rows(chunk)
+
+        return len(rows)
+
+    async def _check_not_archived(self, rows: list[dict[str, Any]]) -> None:
+        """Reject rows falling into an archived period.
+
+        Archived raw rows are gone while their rollups remain, so a row
+        written over one could not be subtracted from the rollups first.
 
+        Args:
+            rows: Column dictionaries about to be written
+
+        Raises:
+            ArchivedPeriodError: If any row is older than its user's latest archival
+        """
+        if not rows:
+            return
+
+        user_ids = {r["user_id"] for r in rows}
+        result = await self.db.execute(
+            select(func.max(ReportMetricsArchival.archived_before)).where(
+                or_(
+                    ReportMetricsArchival.user_id.in_(user_ids),
+                    ReportMetricsArchival.user_id.is_(None),
+                )
+            )
+        )
+        archived_before = result.scalar()
+        if archived_before is not None and min(r["timestamp"] for r in rows) < archived_before:
+            raise ArchivedPeriodError(archived_before)
+
+    async def _fetch_existing_rows(
+        self,
+        user_id: int,
+        rows: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Fetch stored rows sharing the upsert key with any of rows.
+
+        Args:
+            user_id: Owner user ID
+            rows: Column dictionaries about to be upserted
+
+        Returns:
+            Column dictionaries of the rows that will be overwritten
+        """
+        keys = {(r["entity_type"], r["entity_id"], r["timestamp"]) for r in rows}
+
+        query = select(*ROLLUP_SOURCE_COLUMNS).where(
+            ReportMetrics.user_id == user_id,
+            ReportMetrics.entity_id.in_({key[1] for key in keys}),
+            ReportMetrics.timestamp.in_({key[2] for key in keys}),
+        )
+        result = await self.db.execute(query)
+
+        return [
+            row._asdict()
+            for row in result.all()
+            if (row.entity_type, row.entity_id, row.timestamp) in keys
+        ]
 
     async def get_metrics(
         self,
@@ -144,17 +384,30 @@ class ReportService:
         filters: MetricsFilter | None = None,
         page: int = 1,
         page_size: int = 20,
+        cursor: str | None = None,
+        include_total: bool = False,
     ) -> dict[str, Any]:
         """Get paginated list of metrics with optional filters.
 
+        Without a cursor, the page is selected by OFFSET and an exact total
+        is returned. With a cursor (from next_cursor of a previous page),
+        keyset pagination on (timestamp, id) is used and the total is only
+        returned, from a short-lived cache, when include_total is set.
+
         Args:
             user_id: Owner user ID
             filters: Optional filter criteria
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), ignored when cursor is given
             page_size: Number of items per page
+            cursor: Cursor of the previous page for keyset pagination
+            include_total: Return a cached total in cursor mode
 
         Returns:
-            Dictionary with metrics, total, page, page_size, has_more
+            Dictionary with metrics, total, page, page_size, has_more,
+            next_cursor
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
         """
         # Base query
         query = select(ReportMetrics).where(ReportMetrics.user_id == user_id)
@@ -176,6 +429,27 @@ class ReportService:
             if filters.end_date is not None:
                 query = query.where(ReportMetrics.timestamp <= filters.end_date)
 
+        if cursor is not None:
+            total = None
+            if include_total:
+                filters_key = filters.model_dump_json() if filters else ""
+                total = await cached_count(
+                    self.db, query, f"report_metrics:{user_id}:{filters_key}"
+                )
+
+            metrics, next_cursor = await fetch_keyset_page(
+                self.db, query, ReportMetrics.timestamp, cursor, page_size
+            )
+
+            return {
+                "metrics": metrics,
+                "total": total,
+                "page": page,
+                "page_size": page_size,
+                "has_more": next_cursor is not None,
+                "next_cursor": next_cursor,
+            }
+
         # Get total count
         count_query = select(func.count()).select_from(query.subquery())
         count_result = await self.db.execute(count_query)
@@ -184,20 +458,26 @@ class ReportService:
         # Apply pagination and ordering
         offset = (page - 1) * page_size
         query = (
-            query.order_by(ReportMetrics.timestamp.desc())
+            query.order_by(ReportMetrics.timestamp.desc(), ReportMetrics.id.desc())
             .offset(offset)
             .limit(page_size)
         )
 
         result = await self.db.execute(query)
         metrics = list(result.scalars().all())
+        has_more = offset + len(metrics) < total
 
         return {
             "metrics": metrics,
             "total": total,
             "page": page,
             "page_size": page_size,
-            "has_more": offset + len(metrics) < total,
+            "has_more": has_more,
+            "next_cursor": (
+                encode_cursor(metrics[-1].timestamp, metrics[-1].id)
+                if has_more and metrics
+                else None
+            ),
         }
 
     async def get_aggregated_metrics(
@@ -226,49 +506,176 @@ class ReportService:
         if start_date is None:
             start_date = end_date - timedelta(days=7)
 
-        # Build query conditions
-        conditions = [
-            ReportMetrics.user_id == user_id,
-            ReportMetrics.timestamp >= start_date,
-            ReportMetrics.timestamp <= end_date,
-        ]
-
-        if ad_account_id is not None:
-            conditions.append(ReportMetrics.ad_account_id == ad_account_id)
-        if entity_type is not None:
-            conditions.append(ReportMetrics.entity_type == entity_type.value)
-
+        # End is inclusive; rollup ranges are half-open
+        buckets = await self.rollups.collect_buckets(
+            user_id=user_id,
+            start=start_date,
+            end=end_date + timedelta(microseconds=1),
+            ad_account_id=ad_account_id,
+            entity_type=entity_type.value if entity_type is not None else None,
+        )
+        totals = self.rollups.merge_buckets(buckets).get(None)
 
-        # Aggregation query
-        query = select(
-            func.sum(ReportMetrics.impressions).label("total_impressions"),
-            func.sum(ReportMetrics.clicks).label("total_clicks"),
-            func.sum(ReportMetrics.spend).label("total_spend"),
-            func.sum(ReportMetrics.conversions).label("total_conversions"),
-            func.sum(ReportMetrics.revenue).label("total_revenue"),
-            func.avg(ReportMetrics.ctr).label("avg_ctr"),
-            func.avg(ReportMetrics.cpc).label("avg_cpc"),
-            func.avg(ReportMetrics.cpa).label("avg_cpa"),
-            func.avg(ReportMetrics.roas).label("avg_roas"),
-        ).where(and_(*conditions))
+        if totals is None or totals["row_count"] == 0:
+            return AggregatedMetrics(period_start=start_date, period_end=end_date)
 
-        result = await self.db.execute(query)
-        row = result.one()
+        row_count = totals["row_count"]
 
         return AggregatedMetrics(
-            total_impressions=row.total_impressions or 0,
-            total_clicks=row.total_clicks or 0,
-            total_spend=row.total_spend or Decimal("0.00"),
-            total_conversions=row.total_conversions or 0,
-            total_revenue=row.total_revenue or Decimal("0.00"),
-            avg_ctr=round(float(row.avg_ctr or 0), 2),
-            avg_cpc=round(Decimal(str(row.avg_cpc or 0)), 2),
-            avg_cpa=round(Decimal(str(row.avg_cpa or 0)), 2),
-            avg_roas=round(float(row.avg_roas or 0), 2),
+            total_impressions=totals["impressions"],
+            total_clicks=totals["clicks"],
+            total_spend=totals["spend"],
+            total_conversions=totals["conversions"],
+            total_revenue=totals["revenue"],
+            avg_ctr=round(float(totals["ctr_sum"]) / row_count, 2),
+            avg_cpc=round(Decimal(str(totals["cpc_sum"])) / row_count, 2),
+            avg_cpa=round(Decimal(str(totals["cpa_sum"])) / row_count, 2),
+            avg_roas=round(float(totals["roas_sum"]) / row_count, 2),
             period_start=start_date,
             period_end=end_date,
         )
 
+    async def get_entity_metrics(
+        self,
+        user_id: int,
+        entity_type: EntityType,
+        entity_ids: list[str],
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Get totals and derived metrics for many entities in one pass.
+
+        Derived metrics are computed from the period totals (e.g. CPA is
+        total spend / total conversions), not averaged per row.
+
+        Args:
+            user_id: Owner user ID
+            entity_type: Entity type of all requested entities
+            entity_ids: Entity IDs to summarize
+            start_date: Start of period (defaults to 7 days ago)
+            end_date: End of period (defaults to now)
+
+        Returns:
+            Mapping of entity ID to impressions, clicks, spend, conversions,
+            revenue, ctr, cpc, cpa and roas; entities without data are omitted
+        """
+        if end_date is None:
+            end_date = datetime.utcnow()
+        if start_date is None:
+            start_date = end_date - timedelta(days=7)
+
+        # End is inclusive; rollup ranges are half-open
+        totals = await self.rollups.collect_entity_totals(
+            user_id=user_id,
+            start=start_date,
+            end=end_date + timedelta(microseconds=1),
+            entity_type=entity_type.value,
+            entity_ids=entity_ids,
+        )
+
+        results: dict[str, dict[str, Any]] = {}
+        for entity_id, sums in totals.items():
+            if sums["row_count"] <= 0:
+                continue
+            spend = Decimal(str(sums["spend"]))
+            revenue = Decimal(str(sums["revenue"]))
+            results[entity_id] = {
+                "impressions": int(sums["impressions"]),
+                "clicks": int(sums["clicks"]),
+                "spend": spend,
+                "conversions": int(sums["conversions"]),
+                "revenue": revenue,
+                **self._calculate_derived_metrics(
+                    impressions=int(sums["impressions"]),
+                    clicks=int(sums["clicks"]),
+                    spend=spend,
+                    conversions=int(sums["conversions"]),
+                    revenue=revenue,
+                ),
+            }
+
+        return results
+
+    async def get_entity_daily_series(
+        self,
+        user_id: int,
+        entity_type: EntityType,
+        entity_ids: list[str] | None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> dict[str, Any]:
+        """Get aligned daily series for many entities in one query.
+
+        Every entity's columns share the returned date axis. Days without
+        data are None in every column so callers can tell them apart from
+        days with zero activity.
+
+        Args:
+            user_id: Owner user ID
+            entity_type: Entity type of all requested entities
+            entity_ids: Entity IDs to fetch, or None for every entity of
+                the type with data in the range
+            start_date: First day (defaults to 7 days before end_date)
+            end_date: Last day, inclusive (defaults to today)
+
+        Returns:
+            Dictionary with 'dates' (list of date) and 'series' mapping
+            entity ID to {metric: list of values aligned with dates};
+            entities without data are omitted
+        """
+        if end_date is None:
+            end_date = datetime.utcnow().date()
+        if start_date is None:
+            start_date = end_date - timedelta(days=7)
+
+        start = datetime.combine(start_date, datetime.min.time())
+        end = datetime.combine(end_date + timedelta(days=1), datetime.min.time())
+        daily = await self.rollups.collect_entity_daily(
+            user_id=user_id,
+            start=start,
+            end=end,
+            entity_type=entity_type.value,
+            entity_ids=entity_ids,
+        )
+
+        dates = [
+            start_date + timedelta(days=i)
+            for i in range((end_date - start_date).days + 1)
+        ]
+        series: dict[str, dict[str, list[Any]]] = {}
+        for entity_id, days in daily.items():
+            columns: dict[str, list[Any]] = {
+                name: [] for name in ENTITY_SERIES_COLUMNS
+            }
+            for day in dates:
+                sums = days.get(datetime.combine(day, datetime.min.time()))
+                if sums is None or sums["row_count"] <= 0:
+                    for values in columns.values():
+                        values.append(None)
+                    continue
+
+                spend = Decimal(str(sums["spend"]))
+                revenue = Decimal(str(sums["revenue"]))
+                row = {
+                    "impressions": int(sums["impressions"]),
+                    "clicks": int(sums["clicks"]),
+                    "spend": spend,
+                    "conversions": int(sums["conversions"]),
+                    "revenue": revenue,
+                    **self._calculate_derived_metrics(
+                        impressions=int(sums["impressions"]),
+                        clicks=int(sums["clicks"]),
+                        spend=spend,
+                        conversions=int(sums["conversions"]),
+                        revenue=revenue,
+                    ),
+                }
+                for name, values in columns.items():
+                    values.append(row[name])
+            series[entity_id] = columns
+
+        return {"dates": dates, "series": series}
+
     async def get_trend_data(
         self,
         user_id: int,
@@ -295,72 +702,40 @@ class ReportService:
         if start_date is None:
             start_date = end_date - timedelta(days=7)
 
-        # Build query conditions
-        conditions = [
-            ReportMetrics.user_id == user_id,
-            ReportMetrics.timestamp >= start_date,
-            ReportMetrics.timestamp <= end_date,
-        ]
-
-        if ad_account_id is not None:
-            conditions.append(ReportMetrics.ad_account_id == ad_account_id)
-
-        # Group by date based on granularity
-        if granularity == "daily":
-            date_trunc = func.date(ReportMetrics.timestamp)
-        elif granularity == "weekly":
-            # MySQL week function
-            date_trunc = func.date(
-                func.date_sub(
-                    ReportMetrics.timestamp,
-                    func.weekday(ReportMetrics.timestamp)
-                )
-            )
-        else:  # monthly
-            date_trunc = func.date_format(ReportMetrics.timestamp, "%Y-%m-01")
+        period = {"daily": "day", "weekly": "week"}.get(granularity, "month")
 
-        # Aggregation query grouped by date
-        query = (
-            select(
-                date_trunc.label("date"),
-                func.sum(ReportMetrics.impressions).label("impressions"),
-                func.sum(ReportMetrics.clicks).label("clicks"),
-                func.sum(ReportMetrics.spend).label("spend"),
-                func.sum(ReportMetrics.conversions).label("conversions"),
-                func.sum(ReportMetrics.revenue).label("revenue"),
-            )
-            .where(and_(*conditions))
-            .group_by(date_trunc)
-            .order_by(date_trunc)
+        # Read the coarsest rollups that still fit within one period
+        # (end is inclusive)
+        buckets = await self.rollups.collect_buckets(
+            user_id=user_id,
+            start=start_date,
+            end=end_date + timedelta(microseconds=1),
+            ad_account_id=ad_account_id,
+            max_granularity=rollup_granularity_for(period),
         )
-
-        result = await self.db.execute(query)
-        rows = result.all()
+        periods = self.rollups.merge_buckets(buckets, period)
 
         trend_data = []
-        for row in rows:
+        for date_value in sorted(periods):
+            row = periods[date_value]
+
             # Calculate derived metrics for each period
             derived = self._calculate_derived_metrics(
-                impressions=row.impressions or 0,
-                clicks=row.clicks or 0,
-                spend=row.spend or Decimal("0.00"),
-                conversions=row.conversions or 0,
-                revenue=row.revenue or Decimal("0.00"),
+                impressions=row["impressions"],
+                clicks=row["clicks"],
+                spend=row["spend"],
+                conversions=row["conversions"],
+                revenue=row["revenue"],
             )
 
-            # Handle date conversion
-            date_value = row.date
-            if isinstance(date_value, str):
-                date_value = datetime.strptime(date_value, "%Y-%m-%d")
-
             trend_data.append(
                 TrendDataPoint(
                     date=date_value,
-                    impressions=row.impressions or 0,
-                    clicks=row.clicks or 0,
-                    spend=row.spend or Decimal("0.00"),
-                    conversions=row.conversions or 0,
-                    revenue=row.revenue or Decimal("0.00"),
+                    impressions=row["impressions"],
+                    clicks=row["clicks"],
+                    spend=row["spend"],
+                    conversions=row["conversions"],
+                    revenue=row["revenue"],
                     ctr=derived["ctr"],
                     cpc=derived["cpc"],
                     cpa=derived["cpa"],
@@ -370,16 +745,18 @@ class ReportService:
 
         return trend_data
 
-
     async def archive_old_metrics(
         self,
         days_threshold: int = 90,
     ) -> dict[str, Any]:
         """Archive metrics older than threshold.
 
-        This method deletes detailed metrics older than the threshold.
-        In a production system, you would first aggregate and store
-        summary data before deletion.
+        Raw rows older than the threshold are deleted. Their totals are
+        already held by the hourly, daily and monthly rollups, which are
+        kept, so trend and summary queries still cover archived periods.
+        The run is recorded per user that lost rows, and that user's later
+        writes into the archived period are rejected because they could no
+        longer be reconciled with the rollups. Other users can still backfill.
 
         Args:
             days_threshold: Number of days after which to archive (default 90)
@@ -389,26 +766,36 @@ class ReportService:
         """
         archive_before = datetime.utcnow() - timedelta(days=days_threshold)
 
-        # Count records to be archived
-        count_query = select(func.count()).where(
-            ReportMetrics.timestamp < archive_before
+        # Count records to be archived per user
+        count_query = (
+            select(ReportMetrics.user_id, func.count())
+            .where(ReportMetrics.timestamp < archive_before)
+            .group_by(ReportMetrics.user_id)
         )
         count_result = await self.db.execute(count_query)
-        archived_count = count_result.scalar() or 0
+        user_counts = dict(count_result.all())
+        archived_count = sum(user_counts.values())
 
         if archived_count > 0:
-            # Delete old records
-            # In production, you would first create summary records
+            # Rollups keep the history; only the raw rows are removed
             delete_query = delete(ReportMetrics).where(
                 ReportMetrics.timestamp < archive_before
             )
             await self.db.execute(delete_query)
+            self.db.add_all(
+                ReportMetricsArchival(
+                    user_id=user_id,
+                    archived_before=archive_before,
+                    archived_count=count,
+                )
+                for user_id, count in user_counts.items()
+            )
             await self.db.flush()
 
         return {
             "archived_count": archived_count,
             "archived_before": archive_before,
-            "summary_created": False,  # Would be True if we created summary records
+            "summary_created": True,
         }
 
     async def get_by_id(
@@ -441,9 +828,14 @@ class ReportService:
         entity_id: str | None = None,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
+        chunk_size: int = BULK_INSERT_CHUNK_SIZE,
     ) -> int:
         """Delete metrics matching criteria.
 
+        Rows are deleted by ID in chunks of chunk_size, each chunk being
+        removed from the rollups as it goes, so a wide delete never holds
+        every matching row in memory.
+
         Args:
             user_id: Owner user ID
             ad_account_id: Optional ad account filter
@@ -451,6 +843,7 @@ class ReportService:
             entity_id: Optional entity ID filter
             start_date: Optional start date filter
             end_date: Optional end date filter
+            chunk_size: Number of rows deleted per statement
 
         Returns:
             Number of deleted records
@@ -468,16 +861,28 @@ class ReportService:
         if end_date is not None:
             conditions.append(ReportMetrics.timestamp <= end_date)
 
-        # Count before delete
-        count_query = select(func.count()).select_from(
-            select(ReportMetrics).where(and_(*conditions)).subquery()
-        )
-        count_result = await self.db.execute(count_query)
-        delete_count = count_result.scalar() or 0
+        delete_count = 0
+        last_id = 0
+        while True:
+            # Load each chunk being deleted so it can be removed from rollups
+            rows_query = (
+                select(ReportMetrics.id, *ROLLUP_SOURCE_COLUMNS)
+                .where(and_(*conditions), ReportMetrics.id > last_id)
+                .order_by(ReportMetrics.id)
+                .limit(chunk_size)
+            )
+            rows_result = await self.db.execute(rows_query)
+            deleted_rows = [row._asdict() for row in rows_result.all()]
+            if not deleted_rows:
+                break
+
+            ids = [row.pop("id") for row in deleted_rows]
+            await self.db.execute(delete(ReportMetrics).where(ReportMetrics.id.in_(ids)))
+            await self.rollups.apply_rows(deleted_rows, sign=-1)
+            delete_count += len(ids)
+            last_id = ids[-1]
 
         if delete_count > 0:
-            delete_query = delete(ReportMetrics).where(and_(*conditions))
-            await self.db.execute(delete_query)
             await self.db.flush()
 
         return delete_count
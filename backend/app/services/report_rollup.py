@@ -0,0 +1,575 @@
+"""Rollup maintenance and range planning for report metrics.
+
+Raw report_metrics rows are summarized into hourly, daily and monthly
+buckets in report_metrics_rollups. Rollups are updated in the same
+transaction as the raw rows, so range queries can read whole buckets
+from the coarsest rollup and only touch raw rows for partial hours at
+the edges of the requested range.
+"""
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import Insert, and_, delete, func, or_, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.report_metrics import ReportMetrics
+from app.models.report_metrics_rollup import ReportMetricsRollup
+
+# Rollup granularities, finest first
+ROLLUP_GRANULARITIES = ("hour", "day", "month")
+
+# Additive columns stored in every rollup bucket
+ROLLUP_SUM_FIELDS = (
+    "impressions",
+    "clicks",
+    "spend",
+    "conversions",
+    "revenue",
+    "row_count",
+    "ctr_sum",
+    "cpc_sum",
+    "cpa_sum",
+    "roas_sum",
+)
+
+# Rollup buckets upserted per INSERT statement
+ROLLUP_CHUNK_SIZE = 1000
+
+
+def truncate_timestamp(value: datetime, granularity: str) -> datetime:
+    """Truncate a timestamp to the start of its bucket.
+
+    Args:
+        value: Timestamp to truncate
+        granularity: 'hour', 'day', 'week' (Monday start) or 'month'
+
+    Returns:
+        Start of the bucket containing value
+    """
+    if granularity == "hour":
+        return value.replace(minute=0, second=0, microsecond=0)
+    day = value.replace(hour=0, minute=0, second=0, microsecond=0)
+    if granularity == "day":
+        return day
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    return day.replace(day=1)
+
+
+def _next_bucket(value: datetime, granularity: str) -> datetime:
+    """Return the start of the bucket following the one starting at value."""
+    if granularity == "hour":
+        return value + timedelta(hours=1)
+    if granularity == "day":
+        return value + timedelta(days=1)
+    if value.month == 12:
+        return value.replace(year=value.year + 1, month=1)
+    return value.replace(month=value.month + 1)
+
+
+def _ceil_timestamp(value: datetime, granularity: str) -> datetime:
+    """Round a timestamp up to the next bucket boundary."""
+    floor = truncate_timestamp(value, granularity)
+    return floor if floor == value else _next_bucket(floor, granularity)
+
+
+def plan_segments(
+    start: datetime,
+    end: datetime,
+    max_granularity: str = "month",
+    level: int = 0,
+) -> list[tuple[str | None, datetime, datetime]]:
+    """Split [start, end) into segments served by the coarsest source.
+
+    Whole months come from the monthly rollup, remaining whole days from
+    the daily rollup, remaining whole hours from the hourly rollup and
+    partial hours from raw rows.
+
+    Args:
+        start: Inclusive range start
+        end: Exclusive range end
+        max_granularity: Coarsest rollup to use. Segments must not be
+            coarser than the periods the caller groups them into, or a
+            whole bucket is attributed to the period of its first day.
+        level: Index into ROLLUP_GRANULARITIES to start from
+
+    Returns:
+        List of (granularity or None for raw rows, start, end) segments
+    """
+    if start >= end:
+        return []
+    top = ROLLUP_GRANULARITIES.index(max_granularity)
+    if level > top:
+        return [(ROLLUP_GRANULARITIES[top], start, end)]
+
+    granularity = ROLLUP_GRANULARITIES[level]
+    inner_start = _ceil_timestamp(start, granularity)
+    inner_end = truncate_timestamp(end, granularity)
+
+    # Not even one whole bucket: serve from the next finer source
+    finer = ROLLUP_GRANULARITIES[level - 1] if level > 0 else None
+    if inner_start >= inner_end:
+        return [(finer, start, end)]
+
+    segments: list[tuple[str | None, datetime, datetime]] = []
+    if start < inner_start:
+        segments.append((finer, start, inner_start))
+    segments.extend(plan_segments(inner_start, inner_end, max_granularity, level + 1))
+    if inner_end < end:
+        segments.append((finer, inner_end, end))
+    return segments
+
+
+def rollup_granularity_for(period: str | None) -> str:
+    """Return the coarsest rollup that can be grouped into period.
+
+    Args:
+        period: Period buckets are merged into ('day', 'week', 'month'),
+            or None for a single total
+
+    Returns:
+        Granularity to pass to plan_segments as max_granularity
+    """
+    # Weeks cross month boundaries, so they are built from days
+    return {"day": "day", "week": "day"}.get(period, "month")
+
+
+def _empty_bucket() -> dict[str, Any]:
+    return {
+        "impressions": 0,
+        "clicks": 0,
+        "spend": Decimal("0.00"),
+        "conversions": 0,
+        "revenue": Decimal("0.00"),
+        "row_count": 0,
+        "ctr_sum": 0.0,
+        "cpc_sum": Decimal("0.00"),
+        "cpa_sum": Decimal("0.00"),
+        "roas_sum": 0.0,
+    }
+
+
+class ReportRollupService:
+    """Service maintaining and querying report metrics rollups."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _build_upsert(self, buckets: list[dict[str, Any]]) -> Insert:
+        """Build a multi-row upsert that adds bucket deltas to existing rows."""
+        table = ReportMetricsRollup.__table__
+        dialect = self.db.get_bind().dialect.name
+
+        if dialect == "mysql":
+            stmt = mysql_insert(ReportMetricsRollup).values(buckets)
+            updates = {f: table.c[f] + stmt.inserted[f] for f in ROLLUP_SUM_FIELDS}
+            updates["updated_at"] = stmt.inserted["updated_at"]
+            return stmt.on_duplicate_key_update(updates)
+
+        # SQLite (tests and local development)
+        stmt = sqlite_insert(ReportMetricsRollup).values(buckets)
+        updates = {f: table.c[f] + stmt.excluded[f] for f in ROLLUP_SUM_FIELDS}
+        updates["updated_at"] = stmt.excluded["updated_at"]
+        return stmt.on_conflict_do_update(
+            index_elements=[
+                "user_id",
+                "granularity",
+                "bucket_start",
+                "ad_account_id",
+                "entity_type",
+                "entity_id",
+            ],
+            set_=updates,
+        )
+
+    async def apply_rows(
+        self,
+        rows: Iterable[dict[str, Any]],
+        sign: int = 1,
+    ) -> int:
+        """Add (sign=1) or subtract (sign=-1) raw rows from all rollups.
+
+        Args:
+            rows: Raw report_metrics column dictionaries
+            sign: 1 when rows were inserted, -1 when they were removed
+
+        Returns:
+            Number of rollup buckets touched
+        """
+        deltas: dict[tuple[Any, ...], dict[str, Any]] = {}
+        user_ids: set[int] = set()
+
+        for row in rows:
+            user_ids.add(row["user_id"])
+            for granularity in ROLLUP_GRANULARITIES:
+                key = (
+                    row["user_id"],
+                    granularity,
+                    truncate_timestamp(row["timestamp"], granularity),
+                    row["ad_account_id"],
+                    row["entity_type"],
+                    row["entity_id"],
+                )
+                bucket = deltas.get(key)
+                if bucket is None:
+                    bucket = deltas[key] = _empty_bucket()
+                bucket["impressions"] += sign * row["impressions"]
+                bucket["clicks"] += sign * row["clicks"]
+                bucket["spend"] += sign * row["spend"]
+                bucket["conversions"] += sign * row["conversions"]
+                bucket["revenue"] += sign * row["revenue"]
+                bucket["row_count"] += sign
+                bucket["ctr_sum"] += sign * row["ctr"]
+                bucket["cpc_sum"] += sign * row["cpc"]
+                bucket["cpa_sum"] += sign * row["cpa"]
+                bucket["roas_sum"] += sign * row["roas"]
+
+        if not deltas:
+            return 0
+
+        updated_at = datetime.utcnow()
+        buckets = [
+            {
+                "user_id": key[0],
+                "granularity": key[1],
+                "bucket_start": key[2],
+                "ad_account_id": key[3],
+                "entity_type": key[4],
+                "entity_id": key[5],
+                "updated_at": updated_at,
+                **sums,
+            }
+            for key, sums in deltas.items()
+        ]
+
+        for start in range(0, len(buckets), ROLLUP_CHUNK_SIZE):
+            chunk = buckets[start : start + ROLLUP_CHUNK_SIZE]
+            await self.db.execute(self._build_upsert(chunk))
+
+        if sign < 0:
+            # Drop buckets whose raw rows have all been removed
+            await self.db.execute(
+                delete(ReportMetricsRollup).where(
+                    ReportMetricsRollup.user_id.in_(user_ids),
+                    ReportMetricsRollup.row_count <= 0,
+                )
+            )
+
+        return len(buckets)
+
+    async def collect_buckets(
+        self,
+        user_id: int,
+        start: datetime,
+        end: datetime,
+        ad_account_id: int | None = None,
+        entity_type: str | None = None,
+        max_granularity: str = "month",
+    ) -> list[tuple[datetime, dict[str, Any]]]:
+        """Collect summed metrics covering [start, end).
+
+        Reads whole buckets from the coarsest rollup available and raw
+        rows only for partial hours at the range edges.
+
+        Args:
+            user_id: Owner user ID
+            start: Inclusive range start
+            end: Exclusive range end
+            ad_account_id: Optional ad account filter
+            entity_type: Optional entity type filter
+            max_granularity: Coarsest rollup to read; see plan_segments
+
+        Returns:
+            List of (bucket start or raw timestamp, summed metrics)
+        """
+        segments = plan_segments(start, end, max_granularity)
+        rollup_segments = [s for s in segments if s[0] is not None]
+        raw_segments = [s for s in segments if s[0] is None]
+
+        results: list[tuple[datetime, dict[str, Any]]] = []
+
+        if rollup_segments:
+            conditions = [ReportMetricsRollup.user_id == user_id]
+            if ad_account_id is not None:
+                conditions.append(ReportMetricsRollup.ad_account_id == ad_account_id)
+            if entity_type is not None:
+                conditions.append(ReportMetricsRollup.entity_type == entity_type)
+            conditions.append(
+                or_(
+                    *(
+                        and_(
+                            ReportMetricsRollup.granularity == granularity,
+                            ReportMetricsRollup.bucket_start >= seg_start,
+                            ReportMetricsRollup.bucket_start < seg_end,
+                        )
+                        for granularity, seg_start, seg_end in rollup_segments
+                    )
+                )
+            )
+
+            query = (
+                select(
+                    ReportMetricsRollup.bucket_start,
+                    *(
+                        func.sum(getattr(ReportMetricsRollup, f)).label(f)
+                        for f in ROLLUP_SUM_FIELDS
+                    ),
+                )
+                .where(and_(*conditions))
+                .group_by(ReportMetricsRollup.bucket_start)
+            )
+            result = await self.db.execute(query)
+            for row in result.all():
+                sums = _empty_bucket()
+                for f in ROLLUP_SUM_FIELDS:
+                    sums[f] = getattr(row, f) or sums[f]
+                results.append((row.bucket_start, sums))
+
+        if raw_segments:
+            conditions = [ReportMetrics.user_id == user_id]
+            if ad_account_id is not None:
+                conditions.append(ReportMetrics.ad_account_id == ad_account_id)
+            if entity_type is not None:
+                conditions.append(ReportMetrics.entity_type == entity_type)
+            conditions.append(
+                or_(
+                    *(
+                        and_(
+                            ReportMetrics.timestamp >= seg_start,
+                            ReportMetrics.timestamp < seg_end,
+                        )
+                        for _, seg_start, seg_end in raw_segments
+                    )
+                )
+            )
+
+            query = select(
+                ReportMetrics.timestamp,
+                ReportMetrics.impressions,
+                ReportMetrics.clicks,
+                ReportMetrics.spend,
+                ReportMetrics.conversions,
+                ReportMetrics.revenue,
+                ReportMetrics.ctr,
+                ReportMetrics.cpc,
+                ReportMetrics.cpa,
+                ReportMetrics.roas,
+            ).where(and_(*conditions))
+            result = await self.db.execute(query)
+            for row in result.all():
+                results.append(
+                    (
+                        row.timestamp,
+                        {
+                            "impressions": row.impressions or 0,
+                            "clicks": row.clicks or 0,
+                            "spend": row.spend or Decimal("0.00"),
+                            "conversions": row.conversions or 0,
+                            "revenue": row.revenue or Decimal("0.00"),
+                            "row_count": 1,
+                            "ctr_sum": row.ctr or 0.0,
+                            "cpc_sum": row.cpc or Decimal("0.00"),
+                            "cpa_sum": row.cpa or Decimal("0.00"),
+                            "roas_sum": row.roas or 0.0,
+                        },
+                    )
+                )
+
+        return results
+
+    async def collect_entity_totals(
+        self,
+        user_id: int,
+        start: datetime,
+        end: datetime,
+        entity_type: str,
+        entity_ids: Iterable[str],
+    ) -> dict[str, dict[str, Any]]:
+        """Sum metrics over [start, end) for many entities at once.
+
+        Uses the same rollup/raw split as collect_buckets, with one query
+        per source grouped by entity instead of one query per entity.
+
+        Args:
+            user_id: Owner user ID
+            start: Inclusive range start
+            end: Exclusive range end
+            entity_type: Entity type of all requested entities
+            entity_ids: Entity IDs to sum
+
+        Returns:
+            Mapping of entity ID to summed metrics; entities without data
+            are omitted
+        """
+        entity_ids = list(entity_ids)
+        segments = plan_segments(start, end)
+        rollup_segments = [s for s in segments if s[0] is not None]
+        raw_segments = [s for s in segments if s[0] is None]
+
+        totals: dict[str, dict[str, Any]] = {}
+
+        def add(entity_id: str, sums: dict[str, Any]) -> None:
+            target = totals.get(entity_id)
+            if target is None:
+                target = totals[entity_id] = _empty_bucket()
+            for f in ROLLUP_SUM_FIELDS:
+                target[f] += sums[f] or 0
+
+        if entity_ids and rollup_segments:
+            query = (
+                select(
+                    ReportMetricsRollup.entity_id,
+                    *(
+                        func.sum(getattr(ReportMetricsRollup, f)).label(f)
+                        for f in ROLLUP_SUM_FIELDS
+                    ),
+                )
+                .where(
+                    ReportMetricsRollup.user_id == user_id,
+                    ReportMetricsRollup.entity_type == entity_type,
+                    ReportMetricsRollup.entity_id.in_(entity_ids),
+                    or_(
+                        *(
+                            and_(
+                                ReportMetricsRollup.granularity == granularity,
+                                ReportMetricsRollup.bucket_start >= seg_start,
+                                ReportMetricsRollup.bucket_start < seg_end,
+                            )
+                            for granularity, seg_start, seg_end in rollup_segments
+                        )
+                    ),
+                )
+                .group_by(ReportMetricsRollup.entity_id)
+            )
+            result = await self.db.execute(query)
+            for row in result.all():
+                add(row.entity_id, {f: getattr(row, f) for f in ROLLUP_SUM_FIELDS})
+
+        if entity_ids and raw_segments:
+            query = (
+                select(
+                    ReportMetrics.entity_id,
+                    func.sum(ReportMetrics.impressions).label("impressions"),
+                    func.sum(ReportMetrics.clicks).label("clicks"),
+                    func.sum(ReportMetrics.spend).label("spend"),
+                    func.sum(ReportMetrics.conversions).label("conversions"),
+                    func.sum(ReportMetrics.revenue).label("revenue"),
+                    func.count().label("row_count"),
+                    func.sum(ReportMetrics.ctr).label("ctr_sum"),
+                    func.sum(ReportMetrics.cpc).label("cpc_sum"),
+                    func.sum(ReportMetrics.cpa).label("cpa_sum"),
+                    func.sum(ReportMetrics.roas).label("roas_sum"),
+                )
+                .where(
+                    ReportMetrics.user_id == user_id,
+                    ReportMetrics.entity_type == entity_type,
+                    ReportMetrics.entity_id.in_(entity_ids),
+                    or_(
+                        *(
+                            and_(
+                                ReportMetrics.timestamp >= seg_start,
+                                ReportMetrics.timestamp < seg_end,
+                            )
+                            for _, seg_start, seg_end in raw_segments
+                        )
+                    ),
+                )
+                .group_by(ReportMetrics.entity_id)
+            )
+            result = await self.db.execute(query)
+            for row in result.all():
+                add(row.entity_id, {f: getattr(row, f) for f in ROLLUP_SUM_FIELDS})
+
+        return totals
+
+    async def collect_entity_daily(
+        self,
+        user_id: int,
+        start: datetime,
+        end: datetime,
+        entity_type: str,
+        entity_ids: Iterable[str] | None = None,
+    ) -> dict[str, dict[datetime, dict[str, Any]]]:
+        """Sum metrics per entity and day over whole days in [start, end).
+
+        Daily rollups already hold every row of their day, including the
+        current one, so a single grouped query over them covers the range.
+
+        Args:
+            user_id: Owner user ID
+            start: Inclusive range start, truncated to its day
+            end: Exclusive range end, rounded up to the next day
+            entity_type: Entity type of all requested entities
+            entity_ids: Entity IDs to sum, or None for every entity of the
+                type with data in the range
+
+        Returns:
+            Mapping of entity ID to {day start: summed metrics}; days and
+            entities without data are omitted
+        """
+        conditions = [
+            ReportMetricsRollup.user_id == user_id,
+            ReportMetricsRollup.entity_type == entity_type,
+            ReportMetricsRollup.granularity == "day",
+            ReportMetricsRollup.bucket_start >= truncate_timestamp(start, "day"),
+            ReportMetricsRollup.bucket_start < _ceil_timestamp(end, "day"),
+        ]
+        if entity_ids is not None:
+            entity_ids = list(entity_ids)
+            if not entity_ids:
+                return {}
+            conditions.append(ReportMetricsRollup.entity_id.in_(entity_ids))
+
+        query = (
+            select(
+                ReportMetricsRollup.entity_id,
+                ReportMetricsRollup.bucket_start,
+                *(
+                    func.sum(getattr(ReportMetricsRollup, f)).label(f)
+                    for f in ROLLUP_SUM_FIELDS
+                ),
+            )
+            .where(and_(*conditions))
+            .group_by(ReportMetricsRollup.entity_id, ReportMetricsRollup.bucket_start)
+        )
+        result = await self.db.execute(query)
+
+        days: dict[str, dict[datetime, dict[str, Any]]] = {}
+        for row in result.all():
+            sums = _empty_bucket()
+            for f in ROLLUP_SUM_FIELDS:
+                sums[f] = getattr(row, f) or sums[f]
+            days.setdefault(row.entity_id, {})[row.bucket_start] = sums
+        return days
+
+    @staticmethod
+    def merge_buckets(
+        buckets: Iterable[tuple[datetime, dict[str, Any]]],
+        granularity: str | None = None,
+    ) -> dict[datetime | None, dict[str, Any]]:
+        """Merge collected buckets into periods.
+
+        Args:
+            buckets: Output of collect_buckets
+            granularity: Period to group by ('day', 'week', 'month'), or
+                None to merge everything into a single total
+
+        Returns:
+            Mapping of period start (None for the total) to summed metrics
+        """
+        merged: dict[datetime | None, dict[str, Any]] = {}
+        for bucket_start, sums in buckets:
+            period = (
+                truncate_timestamp(bucket_start, granularity) if granularity else None
+            )
+            target = merged.get(period)
+            if target is None:
+                target = merged[period] = _empty_bucket()
+            for f in ROLLUP_SUM_FIELDS:
+                target[f] += sums[f]
+        return merged
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
 from app.schemas.user import UserUpdateRequest
+from app.services.principal_cache import invalidate_principal_on_commit
 
 
 class UserService:
@@ -59,6 +60,7 @@ class UserService:
         """
         user.is_active = False
         user.updated_at = datetime.now(UTC)
+        invalidate_principal_on_commit(self.db, user.id)
         await self.db.flush()
         return True
 
@@ -88,19 +90,18 @@ class UserService:
         Request data export for user.
         Returns a job ID that can be used to check status.
         
-        Creates a background task to:
-        1. Collect all user data
-        2. Generate ZIP file
-        3. Upload to S3 with 24h expiry
-        4. Send email notification
+        Queues a Celery job to:
+        1. Stream all user data into a ZIP file
+        2. Upload it to S3 with 24h expiry
+        3. Send email notification
         """
         import uuid
         from app.core.redis import get_redis
         import json
-        import asyncio
+        from app.tasks.data_export import export_user_data
         
         job_id = str(uuid.uuid4())
-        redis = get_redis()
+        redis = await get_redis()
         
         # Store job status in Redis
         job_data = {
@@ -114,55 +115,11 @@ class UserService:
             ex=86400  # 24 hours
         )
         
-        # Trigger background task to generate export
-        asyncio.create_task(self._process_data_export(job_id, user))
+        # Generate the export on a worker, not in the API process
+        export_user_data.delay(job_id, user.id)
         
         return job_id
 
-    async def _process_data_export(self, job_id: str, user: User) -> None:
-        """Process data export in background."""
-        import json
-        from app.core.redis import get_redis
-        from app.services.data_export import DataExportService
-        
-        redis = get_redis()
-        
-        try:
-            # Generate export
-            export_service = DataExportService(self.db)
-            result = await export_service.export_user_data(user)
-            
-            # Update job status
-            job_data = {
-                "user_id": user.id,
-                "status": "completed",
-                "download_url": result["download_url"],
-                "expires_at": result["expires_at"],
-                "file_size_mb": result["file_size_mb"],
-                "completed_at": datetime.now(UTC).isoformat(),
-            }
-            
-            await redis.set(
-                f"export_job:{job_id}",
-                json.dumps(job_data),
-                ex=86400  # 24 hours
-            )
-            
-        except Exception as e:
-            # Update job status with error
-            job_data = {
-                "user_id": user.id,
-                "status": "failed",
-                "error": str(e),
-                "failed_at": datetime.now(UTC).isoformat(),
-            }
-            
-            await redis.set(
-                f"export_job:{job_id}",
-                json.dumps(job_data),
-                ex=86400  # 24 hours
-            )
-
     async def get_export_status(self, user: User, job_id: str) -> dict:
         """
         Get the status of a data export job.
@@ -171,7 +128,7 @@ class UserService:
         from app.core.redis import get_redis
         import json
         
-        redis = get_redis()
+        redis = await get_redis()
         job_data_str = await redis.get(f"export_job:{job_id}")
         
         if not job_data_str:
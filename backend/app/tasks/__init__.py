@@ -1,6 +1,8 @@
 """Celery tasks module."""
 
 from app.tasks.anomaly_detection import detect_anomalies
+from app.tasks.credit_settlement import flush_credit_settlements
+from app.tasks.data_export import export_user_data
 from app.tasks.data_fetch import fetch_ad_data
 from app.tasks.reports import generate_daily_report
 from app.tasks.token_refresh import check_token_expiry, refresh_ad_account_token
@@ -11,4 +13,6 @@ __all__ = [
     "fetch_ad_data",
     "generate_daily_report",
     "detect_anomalies",
+    "flush_credit_settlements",
+    "export_user_data",
 ]
@@ -0,0 +1,64 @@
+"""Credit ledger write-behind background tasks."""
+
+import asyncio
+import logging
+from datetime import UTC, datetime
+
+from celery import shared_task
+
+from app.core.database import async_session_maker
+from app.services.credit_ledger import CreditLedger
+
+logger = logging.getLogger(__name__)
+
+
+async def _flush_credit_settlements_async() -> dict:
+    """
+    Release expired reservations and write queued settlements.
+
+    Settlements made through the credit ledger only update the Redis
+    balance; this task applies them to users and credit_transactions in
+    batched transactions.
+    """
+    async with async_session_maker() as session:
+        ledger = CreditLedger(session)
+        released = await ledger.release_expired()
+        written = await ledger.flush_settlements()
+
+    if released or written:
+        logger.info(
+            "Credit settlements flushed",
+            extra={"settlements_written": written, "reservations_released": released},
+        )
+
+    return {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "status": "success",
+        "settlements_written": written,
+        "reservations_released": released,
+    }
+
+
+@shared_task(
+    name="app.tasks.credit_settlement.flush_credit_settlements",
+    bind=True,
+    max_retries=3,
+    default_retry_delay=10,
+)
+def flush_credit_settlements(self) -> dict:
+    """
+    Celery task to write credit ledger settlements to the database.
+
+    This task is scheduled to run every 10 seconds.
+    """
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+    try:
+        return loop.run_until_complete(_flush_credit_settlements_async())
+    except Exception as e:
+        # Retry on failure
+        raise self.retry(exc=e)
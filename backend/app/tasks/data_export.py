@@ -0,0 +1,81 @@
+"""GDPR data export background tasks."""
+
+import asyncio
+import json
+import logging
+from datetime import UTC, datetime
+
+from celery import shared_task
+from sqlalchemy import select
+
+from app.core.database import async_session_maker
+from app.core.redis import get_redis
+from app.models.user import User
+from app.services.data_export import DataExportService
+
+logger = logging.getLogger(__name__)
+
+# Seconds an export job status is kept in Redis
+EXPORT_JOB_TTL = 86400
+
+
+async def _set_job_status(job_id: str, job_data: dict) -> None:
+    redis = await get_redis()
+    await redis.set(f"export_job:{job_id}", json.dumps(job_data), ex=EXPORT_JOB_TTL)
+
+
+async def _export_user_data_async(job_id: str, user_id: int) -> dict:
+    """
+    Build a user's data export and record the result on the export job.
+
+    The archive is streamed to a spooled temporary file and uploaded with
+    a multipart upload, so the worker's memory use is bounded regardless
+    of account size.
+    """
+    try:
+        async with async_session_maker() as session:
+            result = await session.execute(select(User).where(User.id == user_id))
+            user = result.scalar_one_or_none()
+            if user is None:
+                raise ValueError(f"User {user_id} not found")
+
+            export = await DataExportService(session).export_user_data(user)
+    except Exception as e:
+        await _set_job_status(job_id, {
+            "user_id": user_id,
+            "status": "failed",
+            "error": str(e),
+            "failed_at": datetime.now(UTC).isoformat(),
+        })
+        raise
+
+    await _set_job_status(job_id, {
+        "user_id": user_id,
+        "status": "completed",
+        "download_url": export["download_url"],
+        "expires_at": export["expires_at"],
+        "file_size_mb": export["file_size_mb"],
+        "completed_at": datetime.now(UTC).isoformat(),
+    })
+    return {"job_id": job_id, "status": "completed", **export}
+
+
+@shared_task(
+    name="app.tasks.data_export.export_user_data",
+    bind=True,
+    max_retries=0,
+)
+def export_user_data(self, job_id: str, user_id: int) -> dict:
+    """
+    Celery task to generate a user's GDPR data export.
+
+    Queued by UserService.request_data_export; the job status in Redis is
+    updated when the export completes or fails.
+    """
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+    return loop.run_until_complete(_export_user_data_async(job_id, user_id))
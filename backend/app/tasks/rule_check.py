@@ -4,10 +4,9 @@ import asyncio
 import logging
 from datetime import UTC, datetime
 
-import httpx
 from celery import shared_task
 
-from app.core.config import settings
+from app.core.orchestrator_client import orchestrator_client
 
 logger = logging.getLogger(__name__)
 
@@ -20,43 +19,39 @@ async def _check_campaign_rules_async() -> dict:
     and execute actions when conditions are met.
     """
     try:
-        # Call AI Orchestrator rule check endpoint
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            response = await client.post(
-                f"{settings.ai_orchestrator_url}/api/campaign-automation/check-rules",
-                headers={
-                    "Authorization": f"Bearer {settings.ai_orchestrator_service_token}",
-                    "Content-Type": "application/json",
+        # Call AI Orchestrator rule check endpoint over the shared pool
+        response = await orchestrator_client.post(
+            "/api/campaign-automation/check-rules",
+            timeout=300.0,
+        )
+        
+        if response.status_code == 200:
+            result = response.json()
+            logger.info(
+                "Campaign rules checked successfully",
+                extra={
+                    "rules_checked": result.get("rules_checked", 0),
+                    "actions_taken": result.get("actions_taken", 0),
                 },
             )
+            return {
+                "timestamp": datetime.now(UTC).isoformat(),
+                "status": "success",
+                "message": "Campaign rules checked successfully",
+                "rules_checked": result.get("rules_checked", 0),
+                "actions_taken": result.get("actions_taken", 0),
+            }
+        else:
+            logger.error(
+                f"Failed to check campaign rules: {response.status_code}",
+                extra={"response": response.text},
+            )
+            return {
+                "timestamp": datetime.now(UTC).isoformat(),
+                "status": "error",
+                "message": f"Failed to check rules: {response.status_code}",
+            }
             
-            if response.status_code == 200:
-                result = response.json()
-                logger.info(
-                    "Campaign rules checked successfully",
-                    extra={
-                        "rules_checked": result.get("rules_checked", 0),
-                        "actions_taken": result.get("actions_taken", 0),
-                    },
-                )
-                return {
-                    "timestamp": datetime.now(UTC).isoformat(),
-                    "status": "success",
-                    "message": "Campaign rules checked successfully",
-                    "rules_checked": result.get("rules_checked", 0),
-                    "actions_taken": result.get("actions_taken", 0),
-                }
-            else:
-                logger.error(
-                    f"Failed to check campaign rules: {response.status_code}",
-                    extra={"response": response.text},
-                )
-                return {
-                    "timestamp": datetime.now(UTC).isoformat(),
-                    "status": "error",
-                    "message": f"Failed to check rules: {response.status_code}",
-                }
-                
     except Exception as e:
         logger.error(
             f"Error checking campaign rules: {e}",
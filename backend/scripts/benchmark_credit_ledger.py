@@ -0,0 +1,189 @@
+"""
+Credit deduction throughput benchmark.
+
+Measures deductions/sec for a single user under concurrent load for:
+1. CreditService.deduct_credits (SELECT ... FOR UPDATE per deduction)
+2. CreditLedger reserve + settle (Redis), with write-behind flushes
+3. CreditService.deduct_credits_batch (one transaction per batch)
+
+Usage (from backend/):
+    python scripts/benchmark_credit_ledger.py --user-id 1 --deductions 2000 --concurrency 50
+
+Runs against DATABASE_URL and REDIS_URL from settings and deducts real
+credits from the given user; use a test account. With --fake, runs on
+in-memory SQLite and fakeredis[lua], which only shows relative cost
+since SQLite serializes all writers.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy.ext.asyncio import async_sessionmaker  # noqa: E402
+
+from app.services.credit import CreditService  # noqa: E402
+from app.services.credit_ledger import CreditLedger  # noqa: E402
+
+AMOUNT = Decimal("0.01")
+
+
+async def run_scenario(name, deduct, deductions: int, concurrency: int) -> None:
+    """Run deductions from concurrent workers and print throughput."""
+    counter = iter(range(deductions))
+    failures = 0
+
+    async def worker():
+        nonlocal failures
+        for i in counter:
+            try:
+                await deduct(i)
+            except Exception:
+                failures += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - start
+
+    print(
+        f"{name:<28} {deductions / wall:10.0f} deductions/s  "
+        f"wall={wall:7.2f}s  failures={failures}"
+    )
+
+
+async def setup_fake(user_id: int):
+    """Create an in-memory database with a funded user and a fake Redis."""
+    import fakeredis
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import StaticPool
+
+    from app.core.database import Base
+    from app.models.user import User
+
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_maker() as session:
+        session.add(
+            User(
+                id=user_id,
+                email="bench@example.com",
+                display_name="Bench",
+                oauth_provider="google",
+                oauth_id="bench",
+                gifted_credits=Decimal("0"),
+                purchased_credits=Decimal("1000000"),
+            )
+        )
+        await session.commit()
+
+    return session_maker, fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--user-id", type=int, default=1)
+    parser.add_argument("--deductions", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--fake", action="store_true", help="Use SQLite and fakeredis")
+    args = parser.parse_args()
+
+    if args.fake:
+        session_maker, redis = await setup_fake(args.user_id)
+    else:
+        from app.core.database import async_session_maker as session_maker
+        from app.core.redis import get_redis
+
+        redis = await get_redis()
+
+    async def get_client():
+        return redis
+
+    # SQLite cannot run concurrent write transactions
+    db_guard = asyncio.Lock() if args.fake else contextlib.nullcontext()
+
+    print("=" * 80)
+    print(
+        f"Credit deductions for one user: {args.deductions} deductions, "
+        f"concurrency {args.concurrency}"
+    )
+    print("=" * 80)
+
+    with patch("app.services.credit_ledger.get_redis", get_client):
+
+        async def row_lock(i: int) -> None:
+            async with db_guard, session_maker() as session:
+                await CreditService(session).deduct_credits(
+                    args.user_id, AMOUNT, "chat", operation_id=f"bench-lock-{i}"
+                )
+                await session.commit()
+
+        await run_scenario(
+            "deduct_credits (row lock)", row_lock, args.deductions, args.concurrency
+        )
+
+        # One session for the Redis-only path; it never touches the database
+        async with session_maker() as session:
+            ledger = CreditLedger(session)
+
+            async def reserve_settle(i: int) -> None:
+                reservation = await ledger.reserve(
+                    args.user_id, AMOUNT, "chat", operation_id=f"bench-ledger-{i}"
+                )
+                await ledger.settle(args.user_id, reservation["reservation_id"])
+
+            await run_scenario(
+                "ledger reserve + settle",
+                reserve_settle,
+                args.deductions,
+                args.concurrency,
+            )
+
+            start = time.perf_counter()
+            written = await ledger.flush_settlements()
+            print(
+                f"{'write-behind flush':<28} {written / (time.perf_counter() - start):10.0f} "
+                f"settlements/s  written={written}"
+            )
+
+        batches = max(1, args.deductions // args.batch_size)
+
+        async def batch(i: int) -> None:
+            async with db_guard, session_maker() as session:
+                await CreditService(session).deduct_credits_batch(
+                    [
+                        {
+                            "user_id": args.user_id,
+                            "amount": AMOUNT,
+                            "operation_type": "chat",
+                            "operation_id": f"bench-batch-{i}-{j}",
+                        }
+                        for j in range(args.batch_size)
+                    ]
+                )
+                await session.commit()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(batch(i) for i in range(batches)))
+        wall = time.perf_counter() - start
+        print(
+            f"{'deduct_credits_batch':<28} {batches * args.batch_size / wall:10.0f} "
+            f"deductions/s  wall={wall:7.2f}s  batch_size={args.batch_size}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,128 @@
+"""
+Rate limiter latency benchmark.
+
+Measures the latency the rate limit check adds to each request for:
+1. The previous multi-command check (zremrangebyscore/zcard/zadd/expire)
+2. The atomic Lua sliding-window check (one round trip)
+3. The Lua check with the in-process token bucket pre-check
+
+Usage (from backend/):
+    python scripts/benchmark_rate_limit.py --requests 20000 --concurrency 50
+
+Runs against REDIS_URL from settings. Latencies against an in-process
+stand-in (--fake, requires fakeredis[lua]) only show relative cost.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.rate_limit import SlidingWindowLimiter  # noqa: E402
+
+
+async def legacy_check(redis, key: str, limit: int, window: int) -> bool:
+    """Previous middleware check: four to five separate Redis round trips."""
+    now = time.time()
+    await redis.zremrangebyscore(key, 0, now - window)
+    count = await redis.zcard(key)
+    if count >= limit:
+        await redis.zrange(key, 0, 0, withscores=True)
+        return False
+    await redis.zadd(key, {f"{now}": now})
+    await redis.expire(key, window * 2)
+    return True
+
+
+async def run_scenario(name, check, requests: int, concurrency: int, users: int):
+    """Run requests spread over users and print latency percentiles."""
+    latencies: list[float] = []
+    counter = iter(range(requests))
+
+    async def worker():
+        for i in counter:
+            key = f"bench_rate_limit:{name}:user:{i % users}"
+            start = time.perf_counter()
+            await check(key)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - wall_start
+
+    latencies.sort()
+    p = lambda q: latencies[min(len(latencies) - 1, int(len(latencies) * q))]  # noqa: E731
+    print(
+        f"{name:<22} p50={p(0.50):7.3f}ms  p95={p(0.95):7.3f}ms  "
+        f"p99={p(0.99):7.3f}ms  mean={statistics.mean(latencies):7.3f}ms  "
+        f"throughput={requests / wall:9.0f} req/s"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=150)
+    parser.add_argument("--local-share", type=float, default=0.5)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--fake", action="store_true", help="Use fakeredis")
+    args = parser.parse_args()
+
+    if args.fake:
+        import fakeredis
+
+        redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    else:
+        from app.core.redis import get_redis
+
+        redis = await get_redis()
+
+    async def get_client():
+        return redis
+
+    print("=" * 100)
+    print(
+        f"Rate limit check latency: {args.requests} requests, "
+        f"concurrency {args.concurrency}, {args.users} users, limit {args.limit}/min"
+    )
+    print("=" * 100)
+
+    await run_scenario(
+        "legacy (5 commands)",
+        lambda key: legacy_check(redis, key, args.limit, 60),
+        args.requests,
+        args.concurrency,
+        args.users,
+    )
+
+    with patch("app.core.rate_limit.get_redis", get_client):
+        lua = SlidingWindowLimiter(limit=args.limit)
+        await run_scenario(
+            "lua", lua.check, args.requests, args.concurrency, args.users
+        )
+
+        local = SlidingWindowLimiter(
+            limit=args.limit, local_share=args.local_share, workers=args.workers
+        )
+        await run_scenario(
+            "lua + local bucket",
+            local.check,
+            args.requests,
+            args.concurrency,
+            args.users,
+        )
+
+    # Clean up benchmark keys
+    async for key in redis.scan_iter(match="bench_rate_limit:*"):
+        await redis.delete(key)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+"""Tests for the anomaly detection task."""
+
+from datetime import UTC, date, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.report_metrics_rollup import ReportMetricsRollup
+from app.tasks import anomaly_detection
+
+
+@pytest.fixture
+def fake_redis():
+    """Patch the task onto an in-process Redis."""
+    fakeredis = pytest.importorskip("fakeredis")
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    async def get_fake_redis():
+        return redis
+
+    with patch("app.tasks.anomaly_detection.get_redis", get_fake_redis):
+        yield redis
+
+
+def make_anomaly(entity_id: str) -> dict:
+    return {
+        "entity_type": "campaign",
+        "entity_id": entity_id,
+        "entity_name": entity_id,
+        "metric": "cpa",
+        "deviation": "+80%",
+        "severity": "high",
+    }
+
+
+@pytest.mark.asyncio
+async def test_failed_alert_is_retried(db_session: AsyncSession, test_user, fake_redis) -> None:
+    """Test dedupe keys are released when the notification is not committed."""
+    anomalies = [make_anomaly("c1")]
+    create = AsyncMock(side_effect=[RuntimeError("database went away"), None])
+
+    with patch.object(
+        anomaly_detection.NotificationService, "create_performance_anomaly_notification", create
+    ):
+        with pytest.raises(RuntimeError):
+            await anomaly_detection._send_alerts(db_session, 1, date(2024, 1, 1), anomalies)
+        assert await fake_redis.keys("anomaly_alert:*") == []
+
+        assert await anomaly_detection._send_alerts(db_session, 1, date(2024, 1, 1), anomalies)
+        assert not await anomaly_detection._send_alerts(
+            db_session, 1, date(2024, 1, 1), anomalies
+        )
+
+    assert create.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_entities_are_scored_in_chunks(
+    db_session: AsyncSession, test_user, fake_redis
+) -> None:
+    """Test large tenants are split to stay within the orchestrator's limit."""
+    db_session.add(
+        ReportMetricsRollup(
+            granularity="day",
+            bucket_start=datetime.combine(
+                datetime.now(UTC).date() - timedelta(days=1), datetime.min.time()
+            ),
+            user_id=1,
+            ad_account_id=1,
+            entity_type="campaign",
+            entity_id="c0",
+        )
+    )
+    await db_session.commit()
+
+    columns = {"cpa": [1, 9], "roas": [1, 1], "ctr": [1, 1]}
+    columns.update(conversions=[1, 1], spend=[1, 1], impressions=[1, 1])
+    history = {"series": {f"c{i}": columns for i in range(5)}}
+
+    async def post(path, json):
+        response = MagicMock()
+        response.json.return_value = {"anomalies": [make_anomaly(json["entity_ids"][0])]}
+        return response
+
+    session_maker = MagicMock()
+    session_maker.return_value.__aenter__ = AsyncMock(return_value=db_session)
+    session_maker.return_value.__aexit__ = AsyncMock(return_value=None)
+    client = MagicMock(post=AsyncMock(side_effect=post))
+
+    with (
+        patch.object(anomaly_detection, "MAX_ENTITIES_PER_REQUEST", 2),
+        patch.object(anomaly_detection, "async_session_maker", session_maker),
+        patch.object(anomaly_detection, "orchestrator_client", client),
+        patch.object(
+            anomaly_detection.ReportService,
+            "get_entity_daily_series",
+            AsyncMock(return_value=history),
+        ),
+        patch.object(
+            anomaly_detection.NotificationService,
+            "create_performance_anomaly_notification",
+            AsyncMock(),
+        ) as create,
+    ):
+        result = await anomaly_detection._detect_anomalies_async()
+
+    sent = [call.kwargs["json"] for call in client.post.await_args_list]
+    assert [payload["entity_ids"] for payload in sent] == [["c0", "c1"], ["c2", "c3"], ["c4"]]
+    assert [len(payload["series"]["cpa"]) for payload in sent] == [2, 2, 1]
+    assert result["entities_scanned"] == 5
+    assert result["anomalies_detected"] == 3
+    assert result["alerts_sent"] == 1
+    assert len(create.await_args.args[1]) == 3
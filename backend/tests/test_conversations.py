@@ -0,0 +1,104 @@
+"""Tests for append-only conversation writes and message paging."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.conversations import (
+    ConversationCreate,
+    MessageAppend,
+    MessageCreate,
+    append_messages,
+    create_conversation,
+    get_conversation,
+)
+
+
+def _message(index: int) -> MessageCreate:
+    return MessageCreate(
+        id=f"msg-{index}",
+        role="user" if index % 2 else "assistant",
+        content=f"message {index}",
+        created_at=datetime(2026, 1, 1) + timedelta(seconds=index),
+    )
+
+
+@pytest.mark.asyncio
+async def test_append_skips_stored_ids_and_returns_delta(
+    db_session: AsyncSession, test_user
+) -> None:
+    """Test appends return only new messages and dedupe retried IDs."""
+    created = await create_conversation(
+        ConversationCreate(session_id="s1", messages=[_message(0), _message(1)]),
+        test_user,
+        db_session,
+    )
+
+    result = await append_messages(
+        "s1",
+        MessageAppend(messages=[_message(1), _message(2), _message(3), _message(3)]),
+        test_user,
+        db_session,
+    )
+
+    assert [m.id for m in result.appended] == ["msg-2", "msg-3"]
+    assert result.skipped == 2
+
+    # The cursor from the append continues after the newest message
+    assert (await get_conversation("s1", test_user, db_session, cursor=result.cursor)).messages == []
+
+    delta = await get_conversation("s1", test_user, db_session, cursor=created.next_cursor)
+    assert [m.id for m in delta.messages] == ["msg-2", "msg-3"]
+
+
+@pytest.mark.asyncio
+async def test_get_conversation_pages_from_cursor(
+    db_session: AsyncSession, test_user
+) -> None:
+    """Test message pages follow the cursor without gaps or repeats."""
+    await create_conversation(
+        ConversationCreate(session_id="s2", messages=[_message(i) for i in range(5)]),
+        test_user,
+        db_session,
+    )
+
+    seen = []
+    cursor = None
+    while True:
+        page = await get_conversation("s2", test_user, db_session, cursor=cursor, limit=2)
+        seen.extend(m.id for m in page.messages)
+        cursor = page.next_cursor
+        if not page.has_more:
+            break
+
+    assert seen == [f"msg-{i}" for i in range(5)]
+
+    full = await get_conversation("s2", test_user, db_session)
+    assert len(full.messages) == 5
+    assert full.has_more is False
+
+
+@pytest.mark.asyncio
+async def test_cursor_returns_late_messages_with_older_timestamps(
+    db_session: AsyncSession, test_user
+) -> None:
+    """Test a poller sees messages stored after its cursor whatever their timestamp."""
+    created = await create_conversation(
+        ConversationCreate(session_id="s3", messages=[_message(5)]),
+        test_user,
+        db_session,
+    )
+
+    # Another device saves a message stamped earlier, in UTC+8
+    late = MessageCreate(
+        id="late",
+        role="user",
+        content="sent offline",
+        created_at=datetime(2026, 1, 1, 8, tzinfo=timezone(timedelta(hours=8))),
+    )
+    await append_messages("s3", MessageAppend(messages=[late]), test_user, db_session)
+
+    delta = await get_conversation("s3", test_user, db_session, cursor=created.next_cursor)
+    assert [m.id for m in delta.messages] == ["late"]
+    assert delta.messages[0].created_at == datetime(2026, 1, 1)
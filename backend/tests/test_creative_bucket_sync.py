@@ -0,0 +1,99 @@
+"""Tests for bulk bucket sync and incremental bucket listing."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.creative import Creative
+from app.models.user import User
+from app.services import creative as creative_module
+from app.services.creative import CreativeService
+
+
+def _info(key: str, content_type: str = "image/png") -> dict:
+    return {
+        "name": key,
+        "size": 10,
+        "content_type": content_type,
+        "url": f"https://bucket.s3.amazonaws.com/{key}",
+    }
+
+
+@pytest.fixture
+def storage():
+    storage = AsyncMock()
+    storage.get_public_url = lambda key: f"https://bucket.s3.amazonaws.com/{key}"
+    with patch.object(creative_module, "async_creatives_storage", storage):
+        yield storage
+
+
+@pytest.fixture
+def fake_redis():
+    fakeredis = pytest.importorskip("fakeredis")
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    async def get_fake_redis():
+        return redis
+
+    with patch.object(creative_module, "get_redis", get_fake_redis):
+        yield redis
+
+
+@pytest.mark.asyncio
+async def test_sync_files_from_bucket_bulk_inserts(
+    db_session: AsyncSession, test_user: User, storage: AsyncMock
+) -> None:
+    """Test one sync call creates all new creatives and reports each key."""
+    prefix = f"users/{test_user.id}/"
+    keys = [f"{prefix}a.png", f"{prefix}b.mp4", f"{prefix}missing.png", "users/999/x.png"]
+    storage.head_files.return_value = {
+        keys[0]: _info(keys[0]),
+        keys[1]: _info(keys[1], "video/mp4"),
+        keys[2]: None,
+    }
+    service = CreativeService(db_session)
+
+    results = await service.sync_files_from_bucket(test_user.id, keys)
+
+    assert [r["success"] for r in results] == [True, True, False, False]
+    assert results[2]["error"] == "File not found in bucket"
+    assert results[3]["error"] == "File does not belong to user"
+    storage.head_files.assert_awaited_once_with(keys[:3])
+
+    creatives = (await db_session.execute(select(Creative))).scalars().all()
+    assert {c.id for c in creatives} == {results[0]["creative_id"], results[1]["creative_id"]}
+    assert {c.file_type for c in creatives} == {"image", "video"}
+
+    # Syncing again reports the files as already synced
+    again = await service.sync_files_from_bucket(test_user.id, keys[:2])
+    assert [r["error"] for r in again] == ["File already synced"] * 2
+    count = await db_session.execute(select(func.count()).select_from(Creative))
+    assert count.scalar() == 2
+
+
+@pytest.mark.asyncio
+async def test_list_bucket_files_heads_only_new_objects(
+    db_session: AsyncSession, storage: AsyncMock, fake_redis
+) -> None:
+    """Test repeat listings reuse cached content types below the watermark."""
+    old = {"Key": "users/1/a.png", "Size": 1, "LastModified": datetime(2024, 1, 1, tzinfo=UTC)}
+    new = {"Key": "users/1/b.mp4", "Size": 2, "LastModified": datetime(2024, 1, 2, tzinfo=UTC)}
+    storage.list_objects.return_value = [old]
+    storage.head_files.side_effect = lambda keys: {
+        key: _info(key, "video/mp4" if key.endswith(".mp4") else "image/png")
+        for key in keys
+    }
+    service = CreativeService(db_session)
+
+    await service.list_bucket_files(1)
+    storage.list_objects.return_value = [old, new]
+    files = await service.list_bucket_files(1, file_types=["video/"])
+
+    assert [f["name"] for f in files] == ["users/1/b.mp4"]
+    assert [call.args[0] for call in storage.head_files.call_args_list] == [
+        ["users/1/a.png"],
+        ["users/1/b.mp4"],
+    ]
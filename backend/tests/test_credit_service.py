@@ -0,0 +1,277 @@
+"""Tests for credit service config caching, costs and the credit ledger."""
+
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.credit import OperationType, TransactionType
+from app.services.credit import (
+    CreditService,
+    InsufficientCreditsError,
+    _pending_balance_syncs,
+)
+from app.services.credit_config_cache import (
+    FLASH_TIER,
+    PRO_TIER,
+    credit_config_cache,
+    resolve_rate_tier,
+)
+from app.services.credit_ledger import (
+    BALANCE_KEY,
+    FLUSH_LOCK_KEY,
+    FLUSHING_KEY,
+    CreditLedger,
+    ReservationNotFoundError,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_config_cache():
+    """Start every test with an empty config cache."""
+    credit_config_cache.invalidate()
+    yield
+    credit_config_cache.invalidate()
+
+
+@pytest.mark.parametrize(
+    ("model", "provider", "tier"),
+    [
+        ("gemini-2.5-flash", None, FLASH_TIER),
+        ("gemini-2.5-pro", None, PRO_TIER),
+        ("gemini-exp-flash-lite", "gemini", FLASH_TIER),
+        ("gemini-exp-pro", "gemini", PRO_TIER),
+        ("anthropic.claude-3-sonnet", None, PRO_TIER),
+        ("custom-endpoint", "sagemaker", PRO_TIER),
+        ("unknown-model", None, FLASH_TIER),
+    ],
+)
+def test_resolve_rate_tier(model: str, provider: str | None, tier: str) -> None:
+    """Test model names map to the same tiers as before the lookup table."""
+    assert resolve_rate_tier(model, provider) == tier
+
+
+@pytest.mark.asyncio
+async def test_cost_lookups_share_cached_config(db_session: AsyncSession) -> None:
+    """Test repeated cost lookups load the config only once."""
+    service = CreditService(db_session)
+
+    with patch.object(
+        service, "get_config", AsyncMock(wraps=service.get_config)
+    ) as get_config:
+        cost = await service.calculate_token_cost("gemini-2.5-pro", 2000, 1000)
+        await service.calculate_token_cost("gemini-2.5-flash", 1000, 1000)
+        image_cost = await service.get_operation_cost(OperationType.IMAGE_GENERATION)
+
+    assert cost == Decimal("0.3")
+    assert image_cost == Decimal("0.5")
+    assert get_config.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_update_config_invalidates_after_commit(db_session: AsyncSession) -> None:
+    """Test committed config updates are published and seen by new lookups."""
+    service = CreditService(db_session)
+    assert (await service.get_config_dict())["updated_by"] is None
+
+    publish = AsyncMock()
+    with patch("app.services.credit_config_cache.publish_invalidation", publish):
+        await service.update_config(updated_by="admin")
+        publish.assert_not_awaited()
+
+        await db_session.commit()
+
+    publish.assert_awaited_once()
+    assert (await service.get_config_dict())["updated_by"] == "admin"
+
+    with pytest.raises(ValueError):
+        await service.get_operation_cost("chat")
+
+
+@pytest.fixture
+def fake_redis():
+    """Patch the credit ledger onto an in-process Redis with Lua support."""
+    fakeredis = pytest.importorskip("fakeredis")
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    async def get_fake_redis():
+        return redis
+
+    with patch("app.services.credit_ledger.get_redis", get_fake_redis):
+        yield redis
+
+
+@pytest.mark.asyncio
+async def test_reserve_settle_release_and_flush(
+    db_session: AsyncSession, test_user, fake_redis
+) -> None:
+    """Test reservations hold credits and settlements are written behind."""
+    test_user.gifted_credits = Decimal("5.00")
+    test_user.purchased_credits = Decimal("20.00")
+    await db_session.commit()
+
+    ledger = CreditLedger(db_session)
+    service = CreditService(db_session)
+
+    first = await ledger.reserve(1, Decimal("10"), OperationType.IMAGE_GENERATION)
+    second = await ledger.reserve(1, Decimal("10"), OperationType.VIDEO_GENERATION)
+    assert second["available_after"] == Decimal("5.00")
+
+    with pytest.raises(InsufficientCreditsError):
+        await ledger.reserve(1, Decimal("6"), OperationType.IMAGE_GENERATION)
+
+    settled = await ledger.settle(1, first["reservation_id"], Decimal("8"))
+    assert settled["from_gifted"] == Decimal("5.00")
+    assert settled["from_purchased"] == Decimal("3.00")
+    assert settled["balance_after"] == Decimal("17.00")
+
+    await ledger.release(1, second["reservation_id"])
+    with pytest.raises(ReservationNotFoundError):
+        await ledger.settle(1, second["reservation_id"])
+
+    # Balance reflects the settlement before it reaches the database
+    assert await service.get_available_credits(1) == Decimal("17.00")
+    await db_session.refresh(test_user)
+    assert test_user.purchased_credits == Decimal("20.00")
+
+    assert await ledger.flush_settlements() == 1
+    await db_session.refresh(test_user)
+    assert test_user.gifted_credits == Decimal("0.00")
+    assert test_user.purchased_credits == Decimal("17.00")
+
+    history = await service.get_transaction_history(1)
+    assert history["total"] == 1
+    assert history["transactions"][0].operation_type == "image_generation"
+    assert history["transactions"][0].details["reservation_id"] == first["reservation_id"]
+
+
+@pytest.mark.asyncio
+async def test_flush_is_idempotent_and_respects_lock_owner(
+    db_session: AsyncSession, test_user, fake_redis
+) -> None:
+    """Test a retried flush does not deduct twice and a held lock is left alone."""
+    test_user.gifted_credits = Decimal("0.00")
+    test_user.purchased_credits = Decimal("20.00")
+    await db_session.commit()
+
+    ledger = CreditLedger(db_session)
+    reservation = await ledger.reserve(1, Decimal("5"), OperationType.IMAGE_GENERATION)
+    await ledger.settle(1, reservation["reservation_id"])
+
+    # Another worker holds the lock
+    await fake_redis.set(FLUSH_LOCK_KEY, "other-worker")
+    assert await ledger.flush_settlements() == 0
+    assert await fake_redis.get(FLUSH_LOCK_KEY) == "other-worker"
+    await fake_redis.delete(FLUSH_LOCK_KEY)
+
+    # Committed, but the batch could not be dequeued
+    delete = fake_redis.delete
+
+    async def failing_delete(*keys):
+        if FLUSHING_KEY in keys:
+            raise ConnectionError("Redis went away")
+        return await delete(*keys)
+
+    with patch.object(fake_redis, "delete", failing_delete):
+        with pytest.raises(ConnectionError):
+            await ledger.flush_settlements()
+    assert await fake_redis.exists(FLUSH_LOCK_KEY) == 0
+
+    # The retry skips the settlement that is already written
+    assert await ledger.flush_settlements() == 0
+    assert await fake_redis.llen(FLUSHING_KEY) == 0
+    await db_session.refresh(test_user)
+    assert test_user.purchased_credits == Decimal("15.00")
+    history = await CreditService(db_session).get_transaction_history(1)
+    assert history["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_balance_adjustments_apply_once(
+    db_session: AsyncSession, test_user, fake_redis
+) -> None:
+    """Test direct balance changes reach the cached balance exactly once."""
+    test_user.gifted_credits = Decimal("0.00")
+    test_user.purchased_credits = Decimal("20.00")
+    await db_session.commit()
+
+    ledger = CreditLedger(db_session)
+    service = CreditService(db_session)
+    reservation = await ledger.reserve(1, Decimal("1"), OperationType.IMAGE_GENERATION)
+    await ledger.release(1, reservation["reservation_id"])
+
+    # Seeded before the recharge: the committed change is applied
+    await service.add_credits(1, Decimal("5"), TransactionType.RECHARGE)
+    await db_session.commit()
+    await asyncio.gather(*_pending_balance_syncs)
+    assert (await ledger.get_cached_balance(1))["available_credits"] == Decimal("25.00")
+
+    # Reseeded after the commit: a late adjustment is not applied twice
+    await fake_redis.delete(BALANCE_KEY.format(user_id=1))
+    await ledger._load_balance(1)
+    assert not await ledger.adjust_cached_balance(1, Decimal("0"), Decimal("5"), 1)
+    assert (await ledger.get_cached_balance(1))["available_credits"] == Decimal("25.00")
+
+
+@pytest.mark.asyncio
+async def test_flush_splits_against_direct_deductions(
+    db_session: AsyncSession, test_user, fake_redis
+) -> None:
+    """Test a direct deduction between settle and flush cannot overdraw gifted credits."""
+    test_user.gifted_credits = Decimal("10.00")
+    test_user.purchased_credits = Decimal("20.00")
+    await db_session.commit()
+
+    ledger = CreditLedger(db_session)
+    service = CreditService(db_session)
+    reservation = await ledger.reserve(1, Decimal("10"), OperationType.IMAGE_GENERATION)
+    settled = await ledger.settle(1, reservation["reservation_id"])
+    assert settled["from_gifted"] == Decimal("10.00")
+
+    # The row still has the gifted credits the settlement took
+    direct = await service.deduct_credits(1, Decimal("5"), OperationType.IMAGE_GENERATION)
+    await db_session.commit()
+    await asyncio.gather(*_pending_balance_syncs)
+    assert direct.from_gifted == Decimal("5.00")
+
+    assert await ledger.flush_settlements() == 1
+    await asyncio.gather(*_pending_balance_syncs)
+    await db_session.refresh(test_user)
+    assert test_user.gifted_credits == Decimal("0.00")
+    assert test_user.purchased_credits == Decimal("15.00")
+
+    history = await service.get_transaction_history(1)
+    flushed = next(t for t in history["transactions"] if t.reservation_id)
+    assert flushed.from_gifted == Decimal("5.00")
+    assert flushed.from_purchased == Decimal("5.00")
+    assert flushed.balance_after == Decimal("15.00")
+
+    cached = await ledger.get_cached_balance(1)
+    assert cached["gifted_credits"] == Decimal("0.00")
+    assert cached["purchased_credits"] == Decimal("15.00")
+
+
+@pytest.mark.asyncio
+async def test_deduct_credits_batch(db_session: AsyncSession, test_user) -> None:
+    """Test batched deductions apply in order and skip unaffordable ones."""
+    test_user.gifted_credits = Decimal("1.00")
+    test_user.purchased_credits = Decimal("2.00")
+    await db_session.commit()
+
+    service = CreditService(db_session)
+    with patch.object(service, "_get_cached_balance", AsyncMock(return_value=None)):
+        transactions = await service.deduct_credits_batch(
+            [
+                {"user_id": 1, "amount": Decimal("1.50"), "operation_type": "chat"},
+                {"user_id": 1, "amount": Decimal("2.00"), "operation_type": "chat"},
+                {"user_id": 1, "amount": Decimal("1.50"), "operation_type": "chat"},
+            ]
+        )
+    await db_session.commit()
+
+    assert [t is not None for t in transactions] == [True, False, True]
+    assert transactions[0].from_gifted == Decimal("1.00")
+    assert transactions[0].from_purchased == Decimal("0.50")
+    assert transactions[2].balance_after == Decimal("0.00")
@@ -1,9 +1,18 @@
 """Unit tests for data export service helper methods."""
 
+import io
+import json
+import zipfile
 from datetime import UTC, datetime
 from decimal import Decimal
+from unittest.mock import patch
 
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.report import EntityType, MetricsCreate
 from app.services.data_export import DataExportService
+from app.services.report import ReportService
 
 
 class TestDataExportHelpers:
@@ -111,3 +120,44 @@ class TestDataExportHelpers:
         assert "Total Spend,75.00" in summary
         assert "Total Conversions,15" in summary
         assert "Total Revenue,300.00" in summary
+
+
+@pytest.mark.asyncio
+async def test_write_archive_streams_tables(db_session: AsyncSession, test_user) -> None:
+    """Test the streamed archive holds valid entries and summary totals."""
+    await ReportService(db_session).bulk_insert_metrics(
+        test_user.id,
+        [
+            MetricsCreate(
+                timestamp=datetime(2024, 1, 1, hour),
+                ad_account_id=1,
+                entity_type=EntityType.AD,
+                entity_id="ad_1",
+                entity_name="Ad 1",
+                impressions=1000,
+                clicks=10,
+                spend=Decimal("20.00"),
+                conversions=2,
+                revenue=Decimal("50.00"),
+            )
+            for hour in range(5)
+        ],
+    )
+    await db_session.commit()
+
+    service = DataExportService(db_session)
+    archive = io.BytesIO()
+    with patch("app.services.data_export.settings.data_export_chunk_size", 2):
+        await service._write_archive(archive, test_user)
+
+    with zipfile.ZipFile(archive) as zip_file:
+        names = set(zip_file.namelist())
+        assert json.loads(zip_file.read("ad_accounts.json")) == []
+        assert json.loads(zip_file.read("notifications.json")) == []
+        metrics_csv = zip_file.read("reports/daily_metrics.csv").decode()
+        summary = zip_file.read("reports/performance_summary.csv").decode()
+
+    assert "creatives/NOTE.txt" not in names
+    assert len(metrics_csv.splitlines()) == 6
+    assert "Total Impressions,5000" in summary
+    assert "Overall ROAS,2.50" in summary
@@ -0,0 +1,91 @@
+"""Tests for cached landing page preview rendering."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services import landing_page_preview
+from app.services.landing_page_preview import (
+    PreviewVersion,
+    render_preview,
+    resolve_preview_version,
+    substitute_urls,
+)
+
+HTML = (
+    '<img src="https://cdn.example.com/a.png">'
+    '<img src="https://cdn.example.com/a.png?v=2">'
+    '<div style="background: url(https://cdn.example.com/a.png)"></div>'
+)
+
+
+@pytest.fixture
+def fake_redis():
+    fakeredis = pytest.importorskip("fakeredis")
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    async def get_fake_redis():
+        return redis
+
+    with patch.object(landing_page_preview, "get_redis", get_fake_redis):
+        yield redis
+
+
+def _page(page_id: int = 1) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=page_id, s3_key=f"pages/{page_id}/index.html", status="draft",
+        draft_content=None, html_content=None,
+    )
+
+
+def test_substitute_urls_single_pass_prefers_longest() -> None:
+    """Test a URL that prefixes another does not clobber the longer one."""
+    result = substitute_urls(HTML, {
+        "https://cdn.example.com/a.png": "data:A",
+        "https://cdn.example.com/a.png?v=2": "data:B",
+    })
+
+    assert result == (
+        '<img src="data:A"><img src="data:B">'
+        '<div style="background: url(data:A)"></div>'
+    )
+
+
+def test_preview_version_etag_matching() -> None:
+    """Test ETags depend on the page, S3 version and embed flag."""
+    version = PreviewVersion(1, "abc", True)
+
+    assert version.matches(f'W/{version.etag}, "other"')
+    assert not version.matches('"other"')
+    assert version.etag != PreviewVersion(1, "abc", False).etag
+    assert version.etag != PreviewVersion(2, "abc", True).etag
+
+
+@pytest.mark.asyncio
+async def test_render_is_cached_per_version_and_images_shared(fake_redis) -> None:
+    """Test repeat renders hit the cache and images download once per URL."""
+    storage = AsyncMock()
+    storage.get_file_info.return_value = {"etag": "v1"}
+    storage.download_file.return_value = HTML.encode()
+
+    async def download(client, url):
+        return url, f"data:image/png;base64,{len(url)}"
+
+    with (
+        patch.object(landing_page_preview, "async_landing_pages_storage", storage),
+        patch.object(
+            landing_page_preview, "_download_image_as_base64", side_effect=download
+        ) as downloader,
+    ):
+        version = await resolve_preview_version(_page(1), embed_images=True)
+        first = await render_preview(_page(1), version)
+        again = await render_preview(_page(1), version)
+
+        # A second page with the same images reuses the image cache
+        other = await render_preview(_page(2), await resolve_preview_version(_page(2), True))
+
+    assert first == again == other
+    assert "https://" not in first
+    assert storage.download_file.await_count == 2
+    assert downloader.call_count == 2
@@ -0,0 +1,130 @@
+"""Tests for MCP principal caching, JSON-RPC batches and the tool catalog."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.mcp import jsonrpc_handler
+from app.core.config import get_settings
+from app.mcp.registry import ToolRegistry
+from app.mcp.types import JSONRPCRequest
+from app.mcp.validation import ValidationError, validate_request_params
+from app.services.auth import AuthService
+from app.services.principal_cache import invalidate_principal, principal_cache
+
+SERVICE_TOKEN = "test-service-token"
+
+
+@pytest.fixture(autouse=True)
+def mcp_env(monkeypatch):
+    """Use in-process Redis and a known service token."""
+    fakeredis = pytest.importorskip("fakeredis")
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    async def get_fake_redis():
+        return redis
+
+    monkeypatch.setattr(get_settings(), "ai_orchestrator_service_token", SERVICE_TOKEN)
+    principal_cache.drop_local()
+    with (
+        patch("app.services.principal_cache.get_redis", get_fake_redis),
+        patch("app.services.credit_ledger.get_redis", get_fake_redis),
+    ):
+        yield redis
+    principal_cache.drop_local()
+
+
+def _call(request_id: int, user_id: int) -> JSONRPCRequest:
+    return JSONRPCRequest(
+        id=request_id,
+        method="tools/call",
+        params={"name": "get_credit_balance", "arguments": {"user_id": user_id}},
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_shares_one_principal_lookup(
+    db_session: AsyncSession, test_user
+) -> None:
+    """Test a batch answers every call in order with one user load."""
+    with patch.object(
+        AuthService, "get_user_by_id", autospec=True,
+        side_effect=AuthService.get_user_by_id,
+    ) as get_user:
+        responses = await jsonrpc_handler(
+            [_call(1, test_user.id), _call(2, test_user.id),
+             JSONRPCRequest(id=3, method="unknown")],
+            db_session,
+            authorization=f"Bearer {SERVICE_TOKEN}",
+        )
+
+        # A later request is served from the cache
+        await jsonrpc_handler(
+            _call(4, test_user.id), db_session, authorization=f"Bearer {SERVICE_TOKEN}"
+        )
+
+    assert [r.id for r in responses] == [1, 2, 3]
+    assert "total_credits" in str(responses[0].result)
+    assert responses[2].error.code == -32601
+    assert get_user.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidated_principal_is_reloaded(
+    db_session: AsyncSession, test_user, mcp_env
+) -> None:
+    """Test deactivating a user takes effect after invalidation."""
+    loader = AuthService(db_session).get_user_by_id
+    assert (await principal_cache.get(test_user.id, loader)).id == test_user.id
+    assert await mcp_env.get(f"mcp_principal:{test_user.id}") is not None
+
+    test_user.is_active = False
+    await db_session.commit()
+    assert await principal_cache.get(test_user.id, loader) is not None
+
+    await invalidate_principal(test_user.id)
+    assert await principal_cache.get(test_user.id, loader) is None
+
+
+@pytest.mark.asyncio
+async def test_batch_size_is_limited(db_session: AsyncSession) -> None:
+    """Test empty batches are rejected as invalid requests."""
+    response = await jsonrpc_handler([], db_session, authorization=None)
+    assert response.error.code == -32600
+
+
+@pytest.mark.asyncio
+async def test_tools_list_is_cached_with_etag(db_session: AsyncSession) -> None:
+    """Test tools/list returns the compiled catalog and honours If-None-Match."""
+    request = JSONRPCRequest(id=7, method="tools/list")
+    response = await jsonrpc_handler(request, db_session)
+
+    body = json.loads(response.body)
+    etag = response.headers["etag"]
+    assert body["id"] == 7
+    names = [t["name"] for t in body["result"]["tools"]]
+    assert "get_credit_balance" in names
+
+    not_modified = await jsonrpc_handler(request, db_session, if_none_match=etag)
+    assert not_modified.status_code == 304
+
+    changed = await jsonrpc_handler(request, db_session, if_none_match='"stale"')
+    assert changed.status_code == 200
+
+
+def test_compiled_validator_matches_definitions() -> None:
+    """Test compiled validators coerce types and enforce enums."""
+    validator = ToolRegistry().get_validator("get_entity_metrics")
+    tool_def = ToolRegistry().get_tool("get_entity_metrics")
+    params = {"entity_type": "campaign", "entity_ids": ["1", "2"], "start_date": 20240101}
+
+    assert validator(params) == validate_request_params(params, tool_def)
+    assert validator(params)["start_date"] == "20240101"
+    assert validator(params)["end_date"] is None
+
+    with pytest.raises(ValidationError):
+        validator({**params, "entity_type": "account"})
+    with pytest.raises(ValidationError):
+        validator({**params, "entity_ids": "1"})
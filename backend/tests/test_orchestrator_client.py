@@ -0,0 +1,63 @@
+"""Tests for the pooled AI Orchestrator client."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.orchestrator_client import OrchestratorClient
+
+
+def _mock_client(client: OrchestratorClient, handler) -> httpx.AsyncClient:
+    """Attach an httpx client with a mock transport for the running loop."""
+    mock = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), base_url="http://orchestrator"
+    )
+    client._client = mock
+    client._client_loop = asyncio.get_running_loop()
+    return mock
+
+
+@pytest.mark.asyncio
+async def test_requests_reuse_client_and_record_metrics() -> None:
+    """Test requests share one client and update counters and TTFB."""
+    paths = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path == "/fail":
+            return httpx.Response(503)
+        return httpx.Response(200, text="data: hello\n\n")
+
+    client = OrchestratorClient()
+    mock = _mock_client(client, handler)
+
+    async with client.stream("POST", "/api/v1/chat", json={}) as response:
+        assert client.metrics.in_flight == 1
+        chunks = [chunk async for chunk in response.aiter_text()]
+    await client.post("/fail")
+
+    assert client.client is mock
+    assert paths == ["/api/v1/chat", "/fail"]
+    assert chunks == ["data: hello\n\n"]
+
+    stats = client.stats()
+    assert stats["requests_total"] == 2
+    assert stats["requests_failed"] == 1
+    assert stats["in_flight"] == 0
+    assert stats["ttfb_samples"] == 1
+
+    await client.close()
+
+
+def test_client_is_rebuilt_for_a_new_event_loop() -> None:
+    """Test a client created on one loop is not reused on another."""
+    client = OrchestratorClient()
+
+    async def get_client() -> httpx.AsyncClient:
+        return client.client
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+
+    assert first is not second
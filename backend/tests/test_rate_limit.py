@@ -7,18 +7,25 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi import Request, Response
 from starlette.datastructures import Headers
 
-from app.core.rate_limit import RateLimitMiddleware, RateLimitExceeded
+from app.core.rate_limit import (
+    LocalTokenBucket,
+    RateLimitMiddleware,
+    RateLimitExceeded,
+    SlidingWindowLimiter,
+)
 
 
 @pytest.fixture
-def mock_redis():
+def mock_script():
+    """Create mock sliding-window Lua script returning (allowed, count, reset)."""
+    return AsyncMock(return_value=[1, 1, str(time.time() + 60)])
+
+
+@pytest.fixture
+def mock_redis(mock_script):
     """Create mock Redis client."""
     redis = AsyncMock()
-    redis.zremrangebyscore = AsyncMock()
-    redis.zcard = AsyncMock(return_value=0)
-    redis.zrange = AsyncMock(return_value=[])
-    redis.zadd = AsyncMock()
-    redis.expire = AsyncMock()
+    redis.register_script = MagicMock(return_value=mock_script)
     return redis
 
 
@@ -91,7 +98,7 @@ async def test_dispatch_adds_rate_limit_headers(rate_limit_middleware, mock_requ
     mock_request.state.user_id = 123
     
     with patch('app.core.rate_limit.get_redis', return_value=mock_redis):
-        mock_redis.zcard.return_value = 5
+        mock_redis.register_script.return_value.return_value = [1, 6, "0"]
         
         async def call_next(request):
             return Response(content="OK", status_code=200)
@@ -103,6 +110,7 @@ async def test_dispatch_adds_rate_limit_headers(rate_limit_middleware, mock_requ
         assert "X-RateLimit-Remaining" in response.headers
         assert "X-RateLimit-Reset" in response.headers
         assert response.headers["X-RateLimit-Limit"] == "10"
+        assert response.headers["X-RateLimit-Remaining"] == "4"
 
 
 # Removed: Complex async Redis mocking test
@@ -116,7 +124,9 @@ async def test_dispatch_redis_error_fails_open(rate_limit_middleware, mock_reque
     
     with patch('app.core.rate_limit.get_redis', return_value=mock_redis):
         # Simulate Redis error
-        mock_redis.zcard.side_effect = Exception("Redis connection error")
+        mock_redis.register_script.return_value.side_effect = Exception(
+            "Redis connection error"
+        )
         
         async def call_next(request):
             return Response(content="OK", status_code=200)
@@ -127,5 +137,75 @@ async def test_dispatch_redis_error_fails_open(rate_limit_middleware, mock_reque
         assert response.status_code == 200
 
 
+@pytest.mark.asyncio
+async def test_dispatch_rate_limit_exceeded(rate_limit_middleware, mock_request, mock_redis):
+    """Test that a rejected script result raises 429 with Retry-After."""
+    mock_request.state.user_id = 123
+
+    with patch('app.core.rate_limit.get_redis', return_value=mock_redis):
+        mock_redis.register_script.return_value.return_value = [
+            0, 15, str(time.time() + 30)
+        ]
+
+        async def call_next(request):
+            return Response(content="OK", status_code=200)
+
+        with pytest.raises(RateLimitExceeded) as exc_info:
+            await rate_limit_middleware.dispatch(mock_request, call_next)
+
+        assert exc_info.value.status_code == 429
+        assert 1 <= int(exc_info.value.headers["Retry-After"]) <= 30
+
+
+@pytest.mark.asyncio
+async def test_check_uses_single_script_call(mock_redis, mock_script):
+    """Test that one check is one script invocation against Redis."""
+    limiter = SlidingWindowLimiter(limit=15, window=60)
+
+    with patch('app.core.rate_limit.get_redis', return_value=mock_redis):
+        allowed, count, _ = await limiter.check("rate_limit:user:1")
+
+    assert allowed is True
+    assert count == 1
+    mock_script.assert_awaited_once()
+    assert mock_script.call_args.kwargs["args"][1:3] == [60, 15]
+
+
+@pytest.mark.asyncio
+async def test_local_bucket_absorbs_traffic_and_lowers_redis_limit(mock_redis, mock_script):
+    """Test local tokens skip Redis and the Redis limit keeps the total bound."""
+    limiter = SlidingWindowLimiter(limit=100, window=60, local_share=0.4, workers=2)
+
+    # 100 * 0.4 / 2 workers / 2 (capacity + refill per window) = 10 tokens
+    assert limiter.local_bucket is not None
+    assert limiter.local_bucket.capacity == 10
+    assert limiter.redis_limit == 60
+
+    with patch('app.core.rate_limit.get_redis', return_value=mock_redis):
+        for _ in range(10):
+            allowed, count, _ = await limiter.check("rate_limit:user:1")
+            assert allowed is True
+            assert count == -1
+        mock_script.assert_not_awaited()
+
+        await limiter.check("rate_limit:user:1")
+        mock_script.assert_awaited_once()
+
+
+def test_local_token_bucket_refills():
+    """Test token bucket refills proportionally to elapsed time."""
+    bucket = LocalTokenBucket(capacity=2, window=60)
+
+    with patch('app.core.rate_limit.time.monotonic', return_value=1000.0):
+        assert bucket.try_take("k") is True
+        assert bucket.try_take("k") is True
+        assert bucket.try_take("k") is False
+
+    # Refill rate is 2 tokens per 60s, so one token after 30s
+    with patch('app.core.rate_limit.time.monotonic', return_value=1030.0):
+        assert bucket.try_take("k") is True
+        assert bucket.try_take("k") is False
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
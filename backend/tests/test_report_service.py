@@ -0,0 +1,318 @@
+"""Tests for report metrics service."""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1 import reports
+from app.core.pagination import InvalidCursorError
+from app.models.report_metrics import ReportMetrics
+from app.schemas.report import EntityType, MetricsBatchCreate, MetricsBulkCreate, MetricsCreate
+from app.services.report import ArchivedPeriodError, ReportService
+from app.services.report_rollup import plan_segments
+
+
+def _make_metrics(count: int, clicks: int = 10) -> list[MetricsCreate]:
+    """Build metrics for count distinct ads at the same timestamp."""
+    return [
+        MetricsCreate(
+            timestamp=datetime(2024, 1, 1, 6),
+            ad_account_id=1,
+            entity_type=EntityType.AD,
+            entity_id=f"ad_{i}",
+            entity_name=f"Ad {i}",
+            impressions=1000,
+            clicks=clicks,
+            spend=Decimal("20.00"),
+            conversions=2,
+            revenue=Decimal("50.00"),
+        )
+        for i in range(count)
+    ]
+
+
+async def _count_rows(db: AsyncSession) -> int:
+    result = await db.execute(select(func.count()).select_from(ReportMetrics))
+    return result.scalar() or 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_metrics_writes_all_chunks(db_session: AsyncSession) -> None:
+    """Test bulk insert spans multiple statements and derives metrics."""
+    service = ReportService(db_session)
+
+    count = await service.bulk_insert_metrics(1, _make_metrics(25), chunk_size=10)
+    await db_session.commit()
+
+    assert count == 25
+    assert await _count_rows(db_session) == 25
+
+    row = (
+        await db_session.execute(
+            select(ReportMetrics).where(ReportMetrics.entity_id == "ad_3")
+        )
+    ).scalar_one()
+    assert row.ctr == 1.0
+    assert row.cpc == Decimal("2.00")
+    assert row.cpa == Decimal("10.00")
+    assert row.roas == 2.5
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_metrics_upsert_updates_existing(
+    db_session: AsyncSession,
+) -> None:
+    """Test upsert overwrites rows with the same entity and timestamp."""
+    service = ReportService(db_session)
+
+    await service.bulk_insert_metrics(1, _make_metrics(5), upsert=True)
+    await service.bulk_insert_metrics(1, _make_metrics(5, clicks=40), upsert=True)
+    await db_session.commit()
+
+    assert await _count_rows(db_session) == 5
+
+    result = await db_session.execute(select(ReportMetrics.clicks, ReportMetrics.ctr))
+    assert all(clicks == 40 and ctr == 4.0 for clicks, ctr in result.all())
+
+
+@pytest.mark.asyncio
+async def test_save_metrics_batch_returns_instances(db_session: AsyncSession) -> None:
+    """Test batch save still returns persisted instances with IDs."""
+    service = ReportService(db_session)
+
+    results = await service.save_metrics_batch(1, _make_metrics(3))
+
+    assert len(results) == 3
+    assert all(m.id is not None for m in results)
+    assert results[0].ctr == 1.0
+
+
+@pytest.mark.asyncio
+async def test_repeated_saves_are_idempotent(db_session: AsyncSession, test_user) -> None:
+    """Test single and batch saves overwrite existing rows; plain bulk inserts get 409."""
+    first = await reports.save_metrics(db_session, test_user, _make_metrics(1)[0])
+    again = await reports.save_metrics(db_session, test_user, _make_metrics(1, clicks=30)[0])
+    assert again.id == first.id
+    assert again.clicks == 30
+
+    batch = await reports.save_metrics_batch(
+        db_session, test_user, MetricsBatchCreate(metrics=_make_metrics(2, clicks=40))
+    )
+    assert batch[0].id == first.id
+    assert await _count_rows(db_session) == 2
+
+    summary = await ReportService(db_session).get_aggregated_metrics(
+        test_user.id, start_date=datetime(2023, 12, 1), end_date=datetime(2024, 2, 1)
+    )
+    assert summary.total_clicks == 80
+
+    with pytest.raises(HTTPException) as exc_info:
+        await reports.bulk_ingest_metrics(
+            db_session, test_user, MetricsBulkCreate(metrics=_make_metrics(2))
+        )
+    assert exc_info.value.status_code == 409
+    assert await _count_rows(db_session) == 2
+
+
+def test_plan_segments_uses_coarsest_rollups() -> None:
+    """Test ranges are split into raw edges and hour/day/month buckets."""
+    segments = plan_segments(datetime(2024, 1, 30, 22, 30), datetime(2024, 3, 2, 1, 15))
+
+    assert segments == [
+        (None, datetime(2024, 1, 30, 22, 30), datetime(2024, 1, 30, 23)),
+        ("hour", datetime(2024, 1, 30, 23), datetime(2024, 1, 31)),
+        ("day", datetime(2024, 1, 31), datetime(2024, 2, 1)),
+        ("month", datetime(2024, 2, 1), datetime(2024, 3, 1)),
+        ("day", datetime(2024, 3, 1), datetime(2024, 3, 2)),
+        ("hour", datetime(2024, 3, 2), datetime(2024, 3, 2, 1)),
+        (None, datetime(2024, 3, 2, 1), datetime(2024, 3, 2, 1, 15)),
+    ]
+
+
+def test_plan_segments_caps_granularity() -> None:
+    """Test day periods are never planned from monthly rollups."""
+    segments = plan_segments(datetime(2024, 1, 30), datetime(2024, 3, 2), "day")
+
+    assert segments == [("day", datetime(2024, 1, 30), datetime(2024, 3, 2))]
+
+
+@pytest.mark.asyncio
+async def test_trend_periods_across_months(db_session: AsyncSession) -> None:
+    """Test daily and weekly trends keep days of a whole month apart."""
+    service = ReportService(db_session)
+    days = {datetime(2024, 1, 1, 6): 10, datetime(2024, 1, 17): 20, datetime(2024, 2, 10): 30}
+    metrics = []
+    for timestamp, clicks in days.items():
+        metric = _make_metrics(1, clicks=clicks)[0]
+        metric.timestamp = timestamp
+        metrics.append(metric)
+    await service.bulk_insert_metrics(1, metrics)
+    await db_session.commit()
+
+    start = datetime(2023, 12, 15)
+    end = datetime(2024, 3, 5)
+    daily = await service.get_trend_data(1, start_date=start, end_date=end)
+    weekly = await service.get_trend_data(
+        1, start_date=start, end_date=end, granularity="weekly"
+    )
+    monthly = await service.get_trend_data(
+        1, start_date=start, end_date=end, granularity="monthly"
+    )
+
+    assert [(p.date, p.clicks) for p in daily] == [
+        (datetime(2024, 1, 1), 10),
+        (datetime(2024, 1, 17), 20),
+        (datetime(2024, 2, 10), 30),
+    ]
+    assert [(p.date, p.clicks) for p in weekly] == [
+        (datetime(2024, 1, 1), 10),
+        (datetime(2024, 1, 15), 20),
+        (datetime(2024, 2, 5), 30),
+    ]
+    assert [(p.date, p.clicks) for p in monthly] == [
+        (datetime(2024, 1, 1), 30),
+        (datetime(2024, 2, 1), 30),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_aggregates_and_trend_read_rollups(db_session: AsyncSession) -> None:
+    """Test summary and trend stay correct after upserts, deletes and archival."""
+    service = ReportService(db_session)
+
+    await service.bulk_insert_metrics(1, _make_metrics(4), upsert=True)
+    # Repeated keys in one request: the last one wins, also in the rollups
+    written = await service.bulk_insert_metrics(
+        1, _make_metrics(2, clicks=20) + _make_metrics(2, clicks=40), upsert=True
+    )
+    assert written == 2
+    await service.delete_metrics(1, entity_id="ad_3")
+    await db_session.commit()
+
+    start = datetime(2023, 12, 1)
+    end = datetime(2024, 2, 1)
+    summary = await service.get_aggregated_metrics(1, start_date=start, end_date=end)
+
+    # ad_0, ad_1 at 40 clicks; ad_2 at 10 clicks
+    assert summary.total_impressions == 3000
+    assert summary.total_clicks == 90
+    assert summary.total_spend == Decimal("60.00")
+    assert summary.avg_ctr == 3.0
+
+    # Raw rows are removed but rollups keep the history
+    result = await service.archive_old_metrics(days_threshold=30)
+    await db_session.commit()
+    assert result["archived_count"] == 3
+    assert result["summary_created"] is True
+
+    trend = await service.get_trend_data(1, start_date=start, end_date=end)
+    assert [p.date for p in trend] == [datetime(2024, 1, 1)]
+    assert trend[0].clicks == 90
+    assert trend[0].ctr == 3.0
+
+    # Archived rows can no longer be replaced without skewing the rollups
+    with pytest.raises(ArchivedPeriodError):
+        await service.bulk_insert_metrics(1, _make_metrics(1, clicks=99), upsert=True)
+    with pytest.raises(ArchivedPeriodError):
+        await service.save_metrics(1, _make_metrics(1)[0])
+
+    # Users that had nothing archived can still backfill the period
+    assert await service.bulk_insert_metrics(2, _make_metrics(1), upsert=True) == 1
+
+
+@pytest.mark.asyncio
+async def test_delete_metrics_in_chunks(db_session: AsyncSession) -> None:
+    """Test deletes spanning several chunks remove every row from the rollups."""
+    service = ReportService(db_session)
+    await service.bulk_insert_metrics(1, _make_metrics(5))
+    await service.bulk_insert_metrics(2, _make_metrics(2))
+    await db_session.commit()
+
+    deleted = await service.delete_metrics(1, entity_type=EntityType.AD, chunk_size=2)
+    await db_session.commit()
+
+    assert deleted == 5
+    assert await _count_rows(db_session) == 2
+    summary = await service.get_aggregated_metrics(
+        1, start_date=datetime(2023, 12, 1), end_date=datetime(2024, 2, 1)
+    )
+    assert summary.total_clicks == 0
+
+
+@pytest.mark.asyncio
+async def test_get_metrics_keyset_pagination(db_session: AsyncSession) -> None:
+    """Test cursor pages cover all rows once, including timestamp ties."""
+    service = ReportService(db_session)
+    await service.bulk_insert_metrics(1, _make_metrics(7))
+    await db_session.commit()
+
+    first = await service.get_metrics(1, page_size=3)
+    assert first["total"] == 7
+    assert first["next_cursor"] is not None
+
+    seen = [m.id for m in first["metrics"]]
+    cursor = first["next_cursor"]
+    while cursor:
+        result = await service.get_metrics(1, page_size=3, cursor=cursor)
+        assert result["total"] is None
+        seen.extend(m.id for m in result["metrics"])
+        cursor = result["next_cursor"]
+
+    assert sorted(seen, reverse=True) == seen
+    assert len(set(seen)) == 7
+
+    with pytest.raises(InvalidCursorError):
+        await service.get_metrics(1, cursor="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_get_entity_metrics_groups_by_entity(db_session: AsyncSession) -> None:
+    """Test per-entity totals come back in one call with derived ratios."""
+    service = ReportService(db_session)
+    await service.bulk_insert_metrics(1, _make_metrics(3))
+    await db_session.commit()
+
+    results = await service.get_entity_metrics(
+        1,
+        EntityType.AD,
+        ["ad_0", "ad_2", "ad_missing"],
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2024, 1, 2),
+    )
+
+    assert set(results) == {"ad_0", "ad_2"}
+    assert results["ad_0"]["spend"] == Decimal("20.00")
+    assert results["ad_0"]["cpa"] == Decimal("10.00")
+    assert results["ad_2"]["roas"] == 2.5
+
+
+@pytest.mark.asyncio
+async def test_get_entity_daily_series_aligns_days(db_session: AsyncSession) -> None:
+    """Test daily series share one date axis with gaps as None."""
+    service = ReportService(db_session)
+    later = _make_metrics(1, clicks=20)
+    later[0].timestamp = datetime(2024, 1, 3, 12)
+    await service.bulk_insert_metrics(1, _make_metrics(2) + later)
+    await db_session.commit()
+
+    result = await service.get_entity_daily_series(
+        1,
+        EntityType.AD,
+        ["ad_0", "ad_1", "ad_missing"],
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 1, 3),
+    )
+
+    assert result["dates"] == [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3)]
+    assert set(result["series"]) == {"ad_0", "ad_1"}
+    assert result["series"]["ad_0"]["ctr"] == [1.0, None, 2.0]
+    assert result["series"]["ad_1"]["spend"] == [Decimal("20.00"), None, None]
+
+    everything = await service.get_entity_daily_series(
+        1, EntityType.AD, None, start_date=date(2024, 1, 3), end_date=date(2024, 1, 3)
+    )
+    assert list(everything["series"]) == ["ad_0"]
@@ -0,0 +1,91 @@
+"""Tests for the async S3 storage backend."""
+
+import io
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.storage import AsyncS3Storage, S3Storage
+
+BUCKET = "test-bucket"
+
+
+@pytest.fixture
+def aws_available(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.core.aws_clients.is_aws_available", lambda: True)
+
+
+@pytest.fixture
+def s3_storage(aws_available: None, monkeypatch: pytest.MonkeyPatch):
+    """S3Storage backed by moto's in-memory S3."""
+    moto = pytest.importorskip("moto")
+    import boto3
+
+    for name in ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY"):
+        monkeypatch.setenv(name, "testing")
+
+    with moto.mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        storage = S3Storage(BUCKET)
+        storage._client = client
+        yield storage
+
+
+@pytest.mark.asyncio
+async def test_multipart_round_trip_and_ranged_read(s3_storage: S3Storage) -> None:
+    """Test multipart upload, parallel download and byte ranges agree."""
+    storage = AsyncS3Storage(s3_storage)
+    payload = bytes(range(256)) * (48 * 1024)  # 12 MiB, three 5 MiB parts
+
+    await storage.upload_fileobj(
+        "big.bin", io.BytesIO(payload), "application/octet-stream",
+        part_size=5 * 1024 * 1024,
+    )
+    out = io.BytesIO()
+    assert await storage.download_fileobj("big.bin", out, part_size=5 * 1024 * 1024)
+
+    assert out.getvalue() == payload
+    assert await storage.download_range("big.bin", 10, 19) == payload[10:20]
+    assert await storage.download_range("big.bin", len(payload) - 4) == payload[-4:]
+
+
+@pytest.mark.asyncio
+async def test_batch_head_list_and_delete(s3_storage: S3Storage) -> None:
+    """Test batch HEAD, listing with content types and batch delete."""
+    storage = AsyncS3Storage(s3_storage)
+    await storage.upload_file("users/1/a.png", b"a", "image/png")
+    await storage.upload_file("users/1/b.mp4", b"bb", "video/mp4")
+
+    infos = await storage.head_files(["users/1/a.png", "users/1/missing"])
+    assert infos["users/1/a.png"]["size"] == 1
+    assert infos["users/1/missing"] is None
+
+    files = await storage.list_files(prefix="users/1/")
+    assert {f["name"]: f["content_type"] for f in files} == {
+        "users/1/a.png": "image/png",
+        "users/1/b.mp4": "video/mp4",
+    }
+
+    assert await storage.delete_files(["users/1/a.png", "users/1/b.mp4"]) == 2
+    assert await storage.list_files(prefix="users/1/") == []
+
+
+@pytest.mark.asyncio
+async def test_delete_files_batches_requests(aws_available: None) -> None:
+    """Test keys are deduplicated and sent at most 1000 per request."""
+    storage = S3Storage(BUCKET)
+    storage._client = MagicMock()
+    storage._client.delete_objects.side_effect = lambda **kw: {
+        "Deleted": kw["Delete"]["Objects"]
+    }
+
+    keys = [f"k{i}" for i in range(2500)] + ["k0"]
+    deleted = await AsyncS3Storage(storage).delete_files(keys)
+
+    assert deleted == 2500
+    sizes = [
+        len(call.kwargs["Delete"]["Objects"])
+        for call in storage._client.delete_objects.call_args_list
+    ]
+    assert sizes == [1000, 1000, 500]
@@ -24,6 +24,9 @@ interface ConversationResponse {
   updated_at: string | null;
 }
 
+// Messages accepted by one append request (backend MAX_APPEND_MESSAGES)
+const MAX_APPEND_MESSAGES = 200;
+
 interface ConversationListResponse {
   conversations: Array<{
     id: number;
@@ -163,12 +166,20 @@ export function useConversationSync() {
             : new Date().toISOString(),
       }));
 
-      await api.patch(`/conversations/${sessionId}`, {
-        title,
-        messages: messagesToSave.length > 0 ? messagesToSave : undefined,
-      });
+      // Append-only: the response carries just the new messages, not the history.
+      // Large backlogs are sent in batches the backend accepts; progress is
+      // recorded per batch so a failed batch is retried from where it stopped.
+      let offset = 0;
+      do {
+        const batch = messagesToSave.slice(offset, offset + MAX_APPEND_MESSAGES);
+        await api.post(`/conversations/${sessionId}/messages`, {
+          title: offset === 0 ? title : undefined,
+          messages: batch,
+        });
+        offset += batch.length;
+        lastSyncedMessagesRef.current.set(sessionId, lastSyncedCount + offset);
+      } while (offset < messagesToSave.length);
 
-      lastSyncedMessagesRef.current.set(sessionId, messages.length);
       markSessionSynced(sessionId);
     } catch (error: any) {
       if (error.response?.status === 404) {